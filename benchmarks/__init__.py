@@ -0,0 +1,25 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Benchmarks of the host side of mapping, loading and reading back.
+
+The benchmarks follow the conventions of `asv`_, so can be run with\
+``asv run`` from the top of the repository.  They can also be run without\
+asv, timing each benchmark and measuring the peak memory it allocates, with::
+
+    python -m benchmarks [--quick] [-k PATTERN]
+
+.. _asv: https://asv.readthedocs.io/
+"""
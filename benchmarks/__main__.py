@@ -0,0 +1,115 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Runs the benchmarks without asv, printing the time and peak memory of\
+    each benchmark for each of its parameters
+"""
+
+from __future__ import print_function
+import argparse
+import importlib
+import inspect
+import itertools
+import os
+import pkgutil
+import timeit
+import tracemalloc
+
+_TIME_PREFIX = "time_"
+_PEAKMEM_PREFIX = "peakmem_"
+_N_REPEATS = 3
+
+
+def _get_benchmark_classes():
+    path = os.path.dirname(os.path.abspath(__file__))
+    for _, name, _ in pkgutil.iter_modules([path]):
+        if not name.startswith("bench_"):
+            continue
+        module = importlib.import_module("benchmarks." + name)
+        for cls_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ == module.__name__ and \
+                    not cls_name.startswith("_"):
+                yield name, cls
+
+
+def _get_params(cls, quick):
+    """ The combinations of parameters of a benchmark class, following asv\
+        in that a single parameter can be given as a plain list
+    """
+    params = getattr(cls, "params", None)
+    if params is None:
+        return [()]
+    if len(getattr(cls, "param_names", ())) <= 1:
+        params = [params]
+    if quick:
+        params = [values[:1] for values in params]
+    return list(itertools.product(*params))
+
+
+def _run(benchmark, method_name, params):
+    method = getattr(benchmark, method_name)
+    if method_name.startswith(_TIME_PREFIX):
+        seconds = min(timeit.repeat(
+            lambda: method(*params), number=1, repeat=_N_REPEATS))
+        return "{:.4f} s".format(seconds)
+    tracemalloc.start()
+    try:
+        method(*params)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return "{:.1f} MiB".format(peak / (1024.0 * 1024.0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--quick", action="store_true",
+        help="only run the smallest parameters of each benchmark")
+    parser.add_argument(
+        "-k", dest="pattern", default="",
+        help="only run benchmarks whose name contains this")
+    args = parser.parse_args()
+
+    for module_name, cls in _get_benchmark_classes():
+        methods = sorted(
+            name for name in dir(cls)
+            if name.startswith((_TIME_PREFIX, _PEAKMEM_PREFIX)))
+        for method_name in methods:
+            full_name = "{}.{}.{}".format(
+                module_name, cls.__name__, method_name)
+            if args.pattern not in full_name:
+                continue
+            for params in _get_params(cls, args.quick):
+                benchmark = cls()
+                try:
+                    if hasattr(benchmark, "setup"):
+                        benchmark.setup(*params)
+                    result = _run(benchmark, method_name, params)
+                except NotImplementedError:
+                    # As in asv, a benchmark can skip parameters it can't do
+                    continue
+                except Exception as e:  # pylint: disable=broad-except
+                    # As in asv, a failure doesn't stop the other benchmarks
+                    result = "failed ({})".format(type(e).__name__)
+                finally:
+                    if hasattr(benchmark, "teardown"):
+                        benchmark.teardown(*params)
+                print("{:<65} {:<28} {:>12}".format(
+                    full_name, ", ".join(str(p) for p in params), result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Benchmarks of gathering connections read back into PyNN formats
+"""
+
+import numpy
+from spynnaker.pyNN.models.neuron import ConnectionHolder
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    AbstractSynapseDynamics)
+from .common import POST_ATOMS, SYNAPSE_SCALES
+
+# The number of synapses in each chunk added, as if read from one core
+_CHUNK_SIZE = 10000
+
+
+class ConnectionHolderData(object):
+    """ Adding connections to a :py:class:`ConnectionHolder` and getting\
+        them back as a list or as matrices
+    """
+    params = (["list", "matrix"], SYNAPSE_SCALES)
+    param_names = ["format", "n_synapses"]
+    timeout = 600
+
+    def setup(self, data_format, n_synapses):
+        rng = numpy.random.RandomState(1)
+        self.n_pre_atoms = max(1, n_synapses // POST_ATOMS)
+        connections = numpy.zeros(
+            n_synapses, dtype=AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
+        connections["source"], connections["target"] = numpy.divmod(
+            numpy.arange(n_synapses), POST_ATOMS)
+        connections["weight"] = rng.gamma(2.0, 0.25, n_synapses)
+        connections["delay"] = rng.randint(1, 16, n_synapses)
+        self.chunks = [
+            connections[i:i + _CHUNK_SIZE]
+            for i in range(0, n_synapses, _CHUNK_SIZE)]
+        self.as_list = data_format == "list"
+
+    def __get_data(self):
+        holder = ConnectionHolder(
+            ["weight", "delay"], self.as_list, self.n_pre_atoms, POST_ATOMS)
+        for chunk in self.chunks:
+            holder.add_connections(chunk)
+        holder.finish()
+        return holder[0]
+
+    def time_connection_holder(self, data_format, n_synapses):
+        self.__get_data()
+
+    def peakmem_connection_holder(self, data_format, n_synapses):
+        self.__get_data()
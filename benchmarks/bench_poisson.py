@@ -0,0 +1,62 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Benchmarks of writing the rates of Poisson spike sources
+"""
+
+import numpy
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.spike_source import SpikeSourcePoisson
+from spynnaker.pyNN.models.spike_source.spike_source_poisson_machine_vertex \
+    import SpikeSourcePoissonMachineVertex
+from unittests.mocks import MockSimulator
+from .common import MACHINE_TIME_STEP, SpecFile
+
+_REGIONS = SpikeSourcePoissonMachineVertex.POISSON_SPIKE_SOURCE_REGIONS
+
+
+class WritePoissonRates(object):
+    """ Writing the rates region of a slice of Poisson sources, each with\
+        its own rate
+    """
+    params = [1000, 10000, 100000]
+    param_names = ["n_neurons"]
+    timeout = 600
+
+    def setup(self, n_neurons):
+        MockSimulator.setup()
+        rates = numpy.random.RandomState(1).uniform(0.0, 100.0, n_neurons)
+        self.vertex = SpikeSourcePoisson(rate=list(rates)).create_vertex(
+            n_neurons, "poisson", None, 1, None)
+        self.vertex_slice = Slice(0, n_neurons - 1)
+        self.rates_bytes = self.vertex.get_rates_bytes(self.vertex_slice)
+
+    def __write(self):
+        # pylint: disable=protected-access
+        spec_file = SpecFile()
+        try:
+            spec_file.spec.reserve_memory_region(
+                _REGIONS.RATES_REGION.value, self.rates_bytes)
+            self.vertex._write_poisson_rates(
+                spec_file.spec, self.vertex_slice, MACHINE_TIME_STEP, 0)
+            spec_file.spec.end_specification()
+        finally:
+            spec_file.close()
+
+    def time_write_poisson_rates(self, n_neurons):
+        self.__write()
+
+    def peakmem_write_poisson_rates(self, n_neurons):
+        self.__write()
@@ -0,0 +1,135 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Benchmarks of turning recorded data into spikes and matrices
+"""
+
+import math
+import numpy
+from pacman.model.graphs.common import GraphMapper, Slice
+from pacman.model.graphs.machine import SimpleMachineVertex
+from data_specification.enums import DataType
+from spinn_front_end_common.utilities.constants import BITS_PER_WORD
+from spynnaker.pyNN.models.common import NeuronRecorder
+from unittests.mocks import MockSimulator
+from .common import (
+    MACHINE_TIME_STEP, MockBufferManager, SimpleApplicationVertex,
+    get_placements)
+
+_N_NEURONS = [100, 1000, 10000]
+_NEURONS_PER_CORE = 256
+_N_TIME_STEPS = 1000
+_SPIKE_PROBABILITY = 0.01
+_REGION = 0
+_BITS_PER_WORD = int(BITS_PER_WORD)
+
+
+class _RecordedPopulation(object):
+    """ A population split over cores, with a recorder recording everything
+    """
+
+    def __init__(self, n_neurons):
+        MockSimulator.setup()
+        self.app_vertex = SimpleApplicationVertex(n_neurons, "recorded")
+        self.graph_mapper = GraphMapper()
+        for lo_atom in range(0, n_neurons, _NEURONS_PER_CORE):
+            vertex_slice = Slice(
+                lo_atom, min(lo_atom + _NEURONS_PER_CORE, n_neurons) - 1)
+            self.graph_mapper.add_vertex_mapping(
+                SimpleMachineVertex(resources=None), vertex_slice,
+                self.app_vertex)
+        self.machine_vertices = list(
+            self.graph_mapper.get_machine_vertices(self.app_vertex))
+        self.placements = get_placements(self.machine_vertices)
+        self.recorder = NeuronRecorder(
+            ["v"], {"v": DataType.S1615}, ["spikes"], n_neurons)
+        self.recorder.set_recording("v", True)
+        self.recorder.set_recording("spikes", True)
+
+    def buffer_manager(self, make_rows):
+        """ A buffer manager holding the rows made for each core
+
+        :param make_rows: \
+            function making the data rows of a slice, without timestamps
+        """
+        rng = numpy.random.RandomState(1)
+        timestamps = numpy.arange(_N_TIME_STEPS, dtype="<u4").reshape(-1, 1)
+        data = dict()
+        for vertex in self.machine_vertices:
+            placement = self.placements.get_placement_of_vertex(vertex)
+            rows = make_rows(rng, self.graph_mapper.get_slice(vertex))
+            data[placement.x, placement.y, placement.p] = bytearray(
+                numpy.hstack((timestamps, rows)).astype("<u4").tobytes())
+        return MockBufferManager(data)
+
+
+def _spike_rows(rng, vertex_slice):
+    n_words = int(math.ceil(vertex_slice.n_atoms / BITS_PER_WORD))
+    spiked = rng.rand(_N_TIME_STEPS, n_words, _BITS_PER_WORD) < \
+        _SPIKE_PROBABILITY
+    # Bit n of each word is the nth neuron it covers
+    return spiked.dot(
+        numpy.left_shift(1, numpy.arange(_BITS_PER_WORD, dtype="uint64")))
+
+
+def _matrix_rows(rng, vertex_slice):
+    return DataType.S1615.encode_as_numpy_int_array(
+        rng.uniform(-70.0, -50.0, (_N_TIME_STEPS, vertex_slice.n_atoms)))
+
+
+class GetSpikes(object):
+    """ :py:meth:`NeuronRecorder.get_spikes` over a whole population
+    """
+    params = _N_NEURONS
+    param_names = ["n_neurons"]
+
+    def setup(self, n_neurons):
+        self.population = _RecordedPopulation(n_neurons)
+        self.buffer_manager = self.population.buffer_manager(_spike_rows)
+
+    def __get_spikes(self):
+        p = self.population
+        return p.recorder.get_spikes(
+            "recorded", self.buffer_manager, _REGION, p.placements,
+            p.graph_mapper, p.app_vertex, "spikes", MACHINE_TIME_STEP)
+
+    def time_get_spikes(self, n_neurons):
+        self.__get_spikes()
+
+    def peakmem_get_spikes(self, n_neurons):
+        self.__get_spikes()
+
+
+class GetMatrixData(object):
+    """ :py:meth:`NeuronRecorder.get_matrix_data` over a whole population
+    """
+    params = _N_NEURONS
+    param_names = ["n_neurons"]
+
+    def setup(self, n_neurons):
+        self.population = _RecordedPopulation(n_neurons)
+        self.buffer_manager = self.population.buffer_manager(_matrix_rows)
+
+    def __get_matrix_data(self):
+        p = self.population
+        return p.recorder.get_matrix_data(
+            "recorded", self.buffer_manager, _REGION, p.placements,
+            p.graph_mapper, p.app_vertex, "v", _N_TIME_STEPS)
+
+    def time_get_matrix_data(self, n_neurons):
+        self.__get_matrix_data()
+
+    def peakmem_get_matrix_data(self, n_neurons):
+        self.__get_matrix_data()
@@ -0,0 +1,162 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Benchmarks of generating synapses and writing the synaptic matrices
+"""
+
+from pacman.model.routing_info import BaseKeyAndMask
+from spynnaker.pyNN.models.neuron import SynapticManager
+from spynnaker.pyNN.models.neuron.master_pop_table import (
+    MasterPopTableAsBinarySearch)
+from spynnaker.pyNN.models.neuron.synapse_io import SynapseIORowBased
+from unittests.mocks import MockSimulator
+from .common import (
+    CONNECTORS, MACHINE_TIME_STEP, SYNAPSE_SCALES, SpecFile,
+    SyntheticProjection)
+
+_N_SYNAPSE_TYPES = 2
+_WEIGHT_SCALES = [4096.0, 4096.0]
+_MASTER_POP_REGION = 0
+_SYNAPTIC_MATRIX_REGION = 1
+_DIRECT_MATRIX_REGION = 2
+
+# The size of the master population table region, ample for one entry
+_MASTER_POP_SIZE = 1024
+
+
+class CreateSynapticBlock(object):
+    """ Connectors generating the synapses of a slice pair on the host
+    """
+    params = (sorted(CONNECTORS), SYNAPSE_SCALES)
+    param_names = ["connector", "n_synapses"]
+    timeout = 600
+
+    def setup(self, connector, n_synapses):
+        self.projection = SyntheticProjection(connector, n_synapses)
+
+    def time_create_synaptic_block(self, connector, n_synapses):
+        self.projection.create_synaptic_block()
+
+    def peakmem_create_synaptic_block(self, connector, n_synapses):
+        self.projection.create_synaptic_block()
+
+
+class GetSynapses(object):
+    """ :py:meth:`SynapseIORowBased.get_synapses`, which generates the\
+        synapses of a slice pair and turns them into rows
+    """
+    params = (sorted(CONNECTORS), SYNAPSE_SCALES)
+    param_names = ["connector", "n_synapses"]
+    timeout = 600
+
+    def setup(self, connector, n_synapses):
+        self.projection = SyntheticProjection(connector, n_synapses)
+        self.synapse_io = SynapseIORowBased()
+        self.population_table = MasterPopTableAsBinarySearch()
+
+    def __get_synapses(self):
+        p = self.projection
+        return self.synapse_io.get_synapses(
+            p.synapse_info, p.pre_slices, 0, p.post_slices, 0,
+            p.pre_vertex_slice, p.post_vertex_slice,
+            p.app_edge.n_delay_stages, self.population_table,
+            _N_SYNAPSE_TYPES, _WEIGHT_SCALES, MACHINE_TIME_STEP,
+            p.app_edge, p.machine_edge)
+
+    def time_get_synapses(self, connector, n_synapses):
+        self.__get_synapses()
+
+    def peakmem_get_synapses(self, connector, n_synapses):
+        self.__get_synapses()
+
+
+class WriteSynapticMatrix(object):
+    """ The part of :py:meth:`SynapticManager.write_data_spec` that writes\
+        the synaptic matrix and master population table of a core
+    """
+    params = (sorted(CONNECTORS), SYNAPSE_SCALES)
+    param_names = ["connector", "n_synapses"]
+    timeout = 600
+
+    def setup(self, connector, n_synapses):
+        self.projection = SyntheticProjection(connector, n_synapses)
+        self.synaptic_manager = SynapticManager(
+            n_synapse_types=_N_SYNAPSE_TYPES, ring_buffer_sigma=5.0,
+            spikes_per_second=100.0, config=MockSimulator.setup().config)
+        # pylint: disable=protected-access
+        self.all_syn_block_sz = \
+            self.synaptic_manager._get_synaptic_blocks_size(
+                self.projection.post_vertex_slice, [self.projection.app_edge],
+                MACHINE_TIME_STEP)
+
+    def __write(self):
+        # pylint: disable=protected-access
+        p = self.projection
+        spec_file = SpecFile()
+        try:
+            spec = spec_file.spec
+            spec.reserve_memory_region(_MASTER_POP_REGION, _MASTER_POP_SIZE)
+            spec.reserve_memory_region(
+                _SYNAPTIC_MATRIX_REGION, self.all_syn_block_sz)
+            self.synaptic_manager.\
+                _write_synaptic_matrix_and_master_population_table(
+                    spec, p.post_slices, 0, p.post_vertex,
+                    p.post_vertex_slice, self.all_syn_block_sz,
+                    _WEIGHT_SCALES, _MASTER_POP_REGION,
+                    _SYNAPTIC_MATRIX_REGION, _DIRECT_MATRIX_REGION,
+                    p.routing_info, p.graph_mapper, p.machine_graph,
+                    MACHINE_TIME_STEP)
+            spec.end_specification()
+        finally:
+            spec_file.close()
+
+    def time_write_synaptic_matrix(self, connector, n_synapses):
+        self.__write()
+
+    def peakmem_write_synaptic_matrix(self, connector, n_synapses):
+        self.__write()
+
+
+class MasterPopTable(object):
+    """ Building and writing a master population table with many entries
+    """
+    params = [100, 1000, 10000]
+    param_names = ["n_entries"]
+
+    def setup(self, n_entries):
+        self.keys_and_masks = [
+            BaseKeyAndMask(i << 11, 0xFFFFF800) for i in range(n_entries)]
+        self.table = MasterPopTableAsBinarySearch()
+        # Two counts, then each entry has a key, mask, start and count, and\
+        # one address
+        self.table_size = (n_entries * 4 + 2) * 4
+
+    def time_master_pop_table(self, n_entries):
+        self.table.initialise_table()
+        address = 0
+        for key_and_mask in self.keys_and_masks:
+            address = self.table.get_next_allowed_address(address)
+            self.table.update_master_population_table(
+                address, 255, key_and_mask)
+            address += 1024
+        spec_file = SpecFile()
+        try:
+            spec_file.spec.reserve_memory_region(
+                _MASTER_POP_REGION, self.table_size)
+            self.table.finish_master_pop_table(
+                spec_file.spec, _MASTER_POP_REGION)
+            spec_file.spec.end_specification()
+        finally:
+            spec_file.close()
@@ -0,0 +1,220 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Synthetic slices, graphs and data shared by the benchmarks
+"""
+
+import os
+import tempfile
+import numpy
+from pyNN.random import NumpyRNG, RandomDistribution
+from spinn_utilities.overrides import overrides
+from spinn_storage_handlers import FileDataWriter
+from spinn_machine import SDRAM
+from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.graphs.common import GraphMapper, Slice
+from pacman.model.graphs.machine import MachineGraph, SimpleMachineVertex
+from pacman.model.placements import Placement, Placements
+from pacman.model.resources import ResourceContainer
+from pacman.model.routing_info import (
+    BaseKeyAndMask, PartitionRoutingInfo, RoutingInfo)
+from data_specification import DataSpecificationGenerator
+from spynnaker.pyNN.models.neural_projections import (
+    ProjectionApplicationEdge, ProjectionMachineEdge, SynapseInformation)
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AllToAllConnector, FixedProbabilityConnector, FromListConnector)
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    SynapseDynamicsStatic)
+from spynnaker.pyNN.utilities.utility_calls import get_n_bits
+from unittests.mocks import MockSimulator
+
+#: The numbers of synapses per slice pair benchmarked
+SYNAPSE_SCALES = [1000, 10000, 100000, 1000000]
+
+#: The number of atoms in each post-slice; rows can't be longer than this
+POST_ATOMS = 250
+
+#: The machine time step of the benchmarks in microseconds
+MACHINE_TIME_STEP = 1000
+
+#: The partition of the projection edges
+PARTITION = "SPIKE"
+
+_FIXED_PROBABILITY = 0.1
+
+
+def _all_to_all(n_pre, n_post):
+    # pylint: disable=unused-argument
+    return AllToAllConnector()
+
+
+def _fixed_probability(n_pre, n_post):
+    # pylint: disable=unused-argument
+    return FixedProbabilityConnector(
+        _FIXED_PROBABILITY, rng=NumpyRNG(seed=1))
+
+
+def _from_list(n_pre, n_post):
+    # A random half of all the possible connections
+    rng = numpy.random.RandomState(1)
+    pairs = numpy.column_stack(numpy.divmod(
+        numpy.arange(n_pre * n_post), n_post))
+    return FromListConnector(pairs[rng.rand(len(pairs)) < 0.5])
+
+
+#: The connectors benchmarked, with a function to make each for a number of\
+#: pre- and post-atoms, and the fraction of the possible connections made
+CONNECTORS = {
+    "all_to_all": (_all_to_all, 1.0),
+    "fixed_probability": (_fixed_probability, _FIXED_PROBABILITY),
+    "from_list": (_from_list, 0.5)}
+
+
+class SimpleApplicationVertex(ApplicationVertex):
+    """ An application vertex that is only there to be connected
+    """
+
+    def __init__(self, n_atoms, label=None):
+        super(SimpleApplicationVertex, self).__init__(label)
+        self._n_atoms = n_atoms
+
+    @property
+    @overrides(ApplicationVertex.n_atoms)
+    def n_atoms(self):
+        return self._n_atoms
+
+    @property
+    def size(self):
+        return self._n_atoms
+
+    @overrides(ApplicationVertex.create_machine_vertex)
+    def create_machine_vertex(
+            self, vertex_slice, resources_required, label=None,
+            constraints=None):
+        return SimpleMachineVertex(resources_required, label, constraints)
+
+    @overrides(ApplicationVertex.get_resources_used_by_atoms)
+    def get_resources_used_by_atoms(self, vertex_slice):
+        return ResourceContainer()
+
+
+class SyntheticProjection(object):
+    """ A static projection from one pre-slice to one post-slice with about\
+        the given number of synapses, with the graphs, graph mapper and\
+        routing information around it.  The weights and delays are random,\
+        from distributions that can't be generated on the machine, so the\
+        synapses are always generated on the host.
+    """
+
+    def __init__(self, connector_name, n_synapses):
+        MockSimulator.setup()
+        make_connector, density = CONNECTORS[connector_name]
+        n_post = POST_ATOMS
+        n_pre = max(1, int(round(n_synapses / (n_post * density))))
+
+        self.pre_app_vertex = SimpleApplicationVertex(n_pre, "pre")
+        self.post_app_vertex = SimpleApplicationVertex(n_post, "post")
+        self.pre_vertex = SimpleMachineVertex(resources=None)
+        self.post_vertex = SimpleMachineVertex(resources=None)
+        self.pre_vertex_slice = Slice(0, n_pre - 1)
+        self.post_vertex_slice = Slice(0, n_post - 1)
+        self.pre_slices = [self.pre_vertex_slice]
+        self.post_slices = [self.post_vertex_slice]
+
+        self.connector = make_connector(n_pre, n_post)
+        rng = NumpyRNG(seed=2)
+        self.synapse_info = SynapseInformation(
+            self.connector, self.pre_app_vertex, self.post_app_vertex, False,
+            False, rng, SynapseDynamicsStatic(), 0,
+            RandomDistribution("gamma", k=2.0, theta=0.25, rng=rng),
+            RandomDistribution("uniform", low=1.0, high=15.0, rng=rng))
+        self.connector.set_projection_information(
+            MACHINE_TIME_STEP, self.synapse_info)
+
+        self.app_edge = ProjectionApplicationEdge(
+            self.pre_app_vertex, self.post_app_vertex, self.synapse_info)
+        self.machine_edge = ProjectionMachineEdge(
+            self.app_edge.synapse_information, self.pre_vertex,
+            self.post_vertex)
+
+        self.machine_graph = MachineGraph("Benchmark")
+        self.machine_graph.add_vertex(self.pre_vertex)
+        self.machine_graph.add_vertex(self.post_vertex)
+        self.machine_graph.add_edge(self.machine_edge, PARTITION)
+
+        self.graph_mapper = GraphMapper()
+        self.graph_mapper.add_vertex_mapping(
+            self.pre_vertex, self.pre_vertex_slice, self.pre_app_vertex)
+        self.graph_mapper.add_vertex_mapping(
+            self.post_vertex, self.post_vertex_slice, self.post_app_vertex)
+        self.graph_mapper.add_edge_mapping(self.machine_edge, self.app_edge)
+
+        self.routing_info = RoutingInfo()
+        self.routing_info.add_partition_info(PartitionRoutingInfo(
+            [BaseKeyAndMask(0, (0xFFFFFFFF << get_n_bits(n_pre)) &
+                            0xFFFFFFFF)],
+            self.machine_graph.get_outgoing_edge_partition_starting_at_vertex(
+                self.pre_vertex, PARTITION)))
+
+    def create_synaptic_block(self):
+        """ Generate the synapses of the projection on the host
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.connector.create_synaptic_block(
+            self.pre_slices, 0, self.post_slices, 0, self.pre_vertex_slice,
+            self.post_vertex_slice, self.synapse_info.synapse_type,
+            self.synapse_info)
+
+
+class SpecFile(object):
+    """ A data specification written to a temporary file, which is deleted\
+        when closed
+    """
+
+    def __init__(self):
+        # Add an SDRAM so that regions as big as a chip's can be reserved
+        SDRAM()
+        handle, self.__path = tempfile.mkstemp(suffix=".spec")
+        os.close(handle)
+        self.__writer = FileDataWriter(self.__path)
+        self.spec = DataSpecificationGenerator(self.__writer, None)
+
+    def close(self):
+        self.__writer.close()
+        os.remove(self.__path)
+
+
+def get_placements(machine_vertices):
+    """ Place each vertex on its own core
+
+    :rtype: ~pacman.model.placements.Placements
+    """
+    placements = Placements()
+    for p, vertex in enumerate(machine_vertices):
+        placements.add_placement(Placement(vertex, 0, p // 16, (p % 16) + 1))
+    return placements
+
+
+class MockBufferManager(object):
+    """ Returns fixed recorded data for each placement
+    """
+
+    def __init__(self, data_by_placement):
+        self.__data = data_by_placement
+
+    def get_data_by_placement(self, placement, region):
+        # pylint: disable=unused-argument
+        return self.__data[placement.x, placement.y, placement.p], False
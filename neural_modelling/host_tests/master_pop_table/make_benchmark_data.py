@@ -0,0 +1,86 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Writes a master population table and a stream of spike keys for the\
+    master population table harness, for when no recorded keys are to hand.
+
+Usage: python make_benchmark_data.py TABLE_FILE KEYS_FILE BIT_FIELD_FILE \
+[N_SOURCES [N_KEYS [MISS_FRACTION [ROW_DENSITY]]]]
+"""
+
+import sys
+import numpy
+from pacman.model.routing_info import BaseKeyAndMask
+from spynnaker.pyNN.models.neuron.master_pop_table import (
+    MasterPopTableAsBinarySearch)
+
+#: The number of neurons sending from each source core
+NEURONS_PER_SOURCE = 256
+#: The mask of the keys from a source core
+SOURCE_MASK = 0xFFFFFF00
+
+
+def make_benchmark_data(
+        table_file, keys_file, bit_field_file, n_sources=500, n_keys=1000000,
+        miss_fraction=0.1, row_density=0.5, seed=1):
+    """ Make a table with an entry for each source core, some with more than\
+        one synaptic matrix and some with only empty rows, and a stream of\
+        keys from those sources and from sources not in the table.
+
+    :param str table_file: Where to write the table
+    :param str keys_file: Where to write the keys
+    :param str bit_field_file: Where to write the bit field filter
+    :param int n_sources: The number of source cores in the table
+    :param int n_keys: The number of keys to write
+    :param float miss_fraction: \
+        The fraction of the keys from sources that are not in the table
+    :param float row_density: \
+        The fraction of the rows of each matrix that have synapses
+    :param int seed: The seed of the random numbers
+    """
+    # pylint: disable=too-many-arguments
+    rng = numpy.random.RandomState(seed)
+    table = MasterPopTableAsBinarySearch()
+    table.initialise_table()
+    address = 0
+    for source in range(n_sources):
+        key_and_mask = BaseKeyAndMask(source << 8, SOURCE_MASK)
+        for _ in range(rng.randint(1, 4)):
+            row_length = rng.choice([0, 0, 8, 32, 100, 255])
+            table.update_master_population_table(
+                address, row_length, key_and_mask,
+                rows_with_synapses=(
+                    rng.uniform(size=NEURONS_PER_SOURCE) < row_density
+                    if row_length else None))
+            address = table.get_next_allowed_address(
+                address + NEURONS_PER_SOURCE * (row_length + 3) * 4)
+    table.get_master_population_table_data().tofile(table_file)
+    table.get_bit_field_filter_data().tofile(bit_field_file)
+
+    # Sources after those in the table are missing from it
+    sources = rng.randint(0, n_sources, n_keys)
+    misses = rng.uniform(size=n_keys) < miss_fraction
+    sources[misses] += n_sources
+    keys = (sources << 8) | rng.randint(0, NEURONS_PER_SOURCE, n_keys)
+    keys.astype("<u4").tofile(keys_file)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 4:
+        sys.exit(__doc__)
+    make_benchmark_data(
+        sys.argv[1], sys.argv[2], sys.argv[3], *(
+            float(arg) if i >= 2 else int(arg)
+            for i, arg in enumerate(sys.argv[4:])))
@@ -0,0 +1,286 @@
+/*
+ * Copyright (c) 2017-2019 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Replays a stream of spike keys through the master population table
+//!        lookup on the host, reporting how fast the lookups are and how many
+//!        of them found nothing to transfer.
+//!
+//! Usage: master_pop_table_harness TABLE_FILE KEYS_FILE [N_REPEATS
+//!            [BIT_FIELD_FILE]]
+//!
+//! TABLE_FILE holds the master population table region as written by
+//! MasterPopTableAsBinarySearch.get_master_population_table_data(),
+//! KEYS_FILE holds the keys of the spikes received, in order, and
+//! BIT_FIELD_FILE holds the bit field filter region as written by
+//! MasterPopTableAsBinarySearch.get_bit_field_filter_data(); all are
+//! little-endian 32-bit words.  Without a BIT_FIELD_FILE, no spikes are
+//! filtered.  The results are written to stdout as "name: value" lines.
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <stdint.h>
+#include <time.h>
+#include <neuron/population_table/population_table.h>
+
+//! Where the synaptic matrix is taken to be; never dereferenced
+#define SYNAPTIC_ROWS_BASE 0x60000000
+//! Where the direct matrix is taken to be; never dereferenced
+#define DIRECT_ROWS_BASE 0x00400000
+
+//! The words of a master population table entry, as in the table file
+typedef struct table_entry {
+    uint32_t key;
+    uint32_t mask;
+    uint16_t start;
+    uint16_t count;
+} table_entry;
+
+//! The ways in which a key can be looked up
+typedef enum lookup_result {
+    //! The key matched an entry which has rows to transfer
+    FOUND_ROWS,
+    //! The key didn't match any entry
+    NOT_IN_TABLE,
+    //! The key matched an entry, but none of its rows have any synapses
+    NO_VALID_ROWS,
+    //! The key matched an entry, but the bit field filter dropped it
+    FILTERED
+} lookup_result;
+
+static uint32_t *read_words(const char *filename, uint32_t *n_words) {
+    FILE *file = fopen(filename, "rb");
+    if (file == NULL) {
+        perror(filename);
+        return NULL;
+    }
+    fseek(file, 0, SEEK_END);
+    long n_bytes = ftell(file);
+    fseek(file, 0, SEEK_SET);
+    *n_words = (uint32_t) (n_bytes / sizeof(uint32_t));
+
+    // Always allocate something so that an empty file can be told apart
+    // from an error
+    uint32_t *words = malloc((*n_words + 1) * sizeof(uint32_t));
+    if (words == NULL) {
+        fprintf(stderr, "Could not allocate %ld bytes for %s\n",
+                n_bytes, filename);
+        fclose(file);
+        return NULL;
+    }
+    if (fread(words, sizeof(uint32_t), *n_words, file) != *n_words) {
+        fprintf(stderr, "Could not read %s\n", filename);
+        free(words);
+        words = NULL;
+    }
+    fclose(file);
+    return words;
+}
+
+//! \brief Finds the bit field of each entry in the bit field filter data,
+//!        or NULL for entries that are not filtered
+static const uint32_t **find_bit_fields(
+        const uint32_t *bit_field_data, uint32_t n_bit_field_words) {
+    uint32_t n_entries = bit_field_data[0];
+    const uint32_t **bit_fields = calloc(n_entries + 1, sizeof(uint32_t *));
+    uint32_t next = 1;
+    for (uint32_t i = 0; i < n_entries; i++) {
+        if (next >= n_bit_field_words ||
+                next + 1 + bit_field_data[next] > n_bit_field_words) {
+            free(bit_fields);
+            return NULL;
+        }
+        if (bit_field_data[next] > 0) {
+            bit_fields[i] = &bit_field_data[next + 1];
+        }
+        next += 1 + bit_field_data[next];
+    }
+    return bit_fields;
+}
+
+//! \brief Works out what the lookup of a key should find, independently of
+//!        the code under test and away from the timed replay
+static lookup_result classify_key(
+        const uint32_t *table_data, const uint32_t **bit_fields,
+        uint32_t key) {
+    uint32_t n_entries = table_data[0];
+    const table_entry *entries = (const table_entry *) &table_data[2];
+    const uint32_t *addresses = (const uint32_t *) &entries[n_entries];
+
+    for (uint32_t i = 0; i < n_entries; i++) {
+        if ((key & entries[i].mask) == entries[i].key) {
+            uint32_t neuron_id = key & ~entries[i].mask;
+            if ((bit_fields[i] != NULL) && !(
+                    (bit_fields[i][neuron_id / 32] >> (neuron_id % 32)) & 1)) {
+                return FILTERED;
+            }
+            for (uint32_t j = 0; j < entries[i].count; j++) {
+                uint32_t item = addresses[entries[i].start + j];
+                if ((item & 0x80000000) || (item & 0xFF)) {
+                    return FOUND_ROWS;
+                }
+            }
+            return NO_VALID_ROWS;
+        }
+    }
+    return NOT_IN_TABLE;
+}
+
+//! The processor time used so far, which is what the lookups are timed in
+static double now_seconds(void) {
+    return ((double) clock()) / CLOCKS_PER_SEC;
+}
+
+int main(int argc, char *argv[]) {
+    if (argc < 3 || argc > 5) {
+        fprintf(stderr, "Usage: %s TABLE_FILE KEYS_FILE [N_REPEATS"
+                " [BIT_FIELD_FILE]]\n", argv[0]);
+        return 2;
+    }
+    uint32_t n_repeats = 1;
+    if (argc >= 4) {
+        n_repeats = (uint32_t) strtoul(argv[3], NULL, 10);
+    }
+
+    uint32_t n_table_words, n_keys;
+    uint32_t *table_data = read_words(argv[1], &n_table_words);
+    if (table_data == NULL) {
+        return 1;
+    }
+    if (n_table_words < 2 || n_table_words !=
+            2 + (table_data[0] * sizeof(table_entry) / sizeof(uint32_t)) +
+            table_data[1]) {
+        fprintf(stderr, "%s is not a master population table\n", argv[1]);
+        return 1;
+    }
+    uint32_t *keys = read_words(argv[2], &n_keys);
+    if (keys == NULL) {
+        return 1;
+    }
+
+    // Without a filter, every entry has a bit field of no words
+    uint32_t n_bit_field_words = 1 + table_data[0];
+    uint32_t *bit_field_data;
+    if (argc == 5) {
+        bit_field_data = read_words(argv[4], &n_bit_field_words);
+    } else {
+        bit_field_data = calloc(n_bit_field_words, sizeof(uint32_t));
+        bit_field_data[0] = table_data[0];
+    }
+    if (bit_field_data == NULL) {
+        return 1;
+    }
+    const uint32_t **bit_fields = NULL;
+    if (n_bit_field_words > 0 && bit_field_data[0] == table_data[0]) {
+        bit_fields = find_bit_fields(bit_field_data, n_bit_field_words);
+    }
+    if (bit_fields == NULL) {
+        fprintf(stderr, "The bit field filter doesn't match the table\n");
+        return 1;
+    }
+
+    uint32_t row_max_n_words;
+    if (!population_table_initialise(
+            table_data, (address_t) SYNAPTIC_ROWS_BASE,
+            (address_t) DIRECT_ROWS_BASE, &row_max_n_words)) {
+        return 1;
+    }
+    if (!population_table_load_bit_fields(bit_field_data)) {
+        return 1;
+    }
+
+    // Count the wasted lookups before timing, so that it doesn't count
+    uint32_t n_not_in_table = 0, n_no_valid_rows = 0, n_filtered = 0;
+    for (uint32_t i = 0; i < n_keys; i++) {
+        lookup_result result = classify_key(table_data, bit_fields, keys[i]);
+        if (result == NOT_IN_TABLE) {
+            n_not_in_table++;
+        } else if (result == NO_VALID_ROWS) {
+            n_no_valid_rows++;
+        } else if (result == FILTERED) {
+            n_filtered++;
+        }
+    }
+
+    // Replay the keys, adding up the rows found so that the lookups can't be
+    // optimised away and so that changes to the results can be seen
+    uint64_t n_rows = 0, n_bytes = 0;
+    uint32_t n_empty = 0, checksum = 0;
+    double start_time = now_seconds();
+    for (uint32_t repeat = 0; repeat < n_repeats; repeat++) {
+        for (uint32_t i = 0; i < n_keys; i++) {
+            address_t row_address;
+            size_t n_bytes_to_transfer;
+            spike_t spike = keys[i];
+            if (!population_table_get_first_address(
+                    spike, &row_address, &n_bytes_to_transfer)) {
+                n_empty++;
+                continue;
+            }
+            do {
+                n_rows++;
+                n_bytes += n_bytes_to_transfer;
+                checksum = (checksum * 31) ^
+                        ((uint32_t) (uintptr_t) row_address +
+                        n_bytes_to_transfer);
+            } while (population_table_get_next_address(
+                    &spike, &row_address, &n_bytes_to_transfer));
+        }
+    }
+    double elapsed = now_seconds() - start_time;
+    uint64_t n_lookups = (uint64_t) n_keys * n_repeats;
+
+    printf("entries: %u\n", table_data[0]);
+    printf("addresses: %u\n", table_data[1]);
+    printf("keys: %u\n", n_keys);
+    printf("repeats: %u\n", n_repeats);
+    printf("lookups: %llu\n", (unsigned long long) n_lookups);
+    printf("seconds: %.6f\n", elapsed);
+    printf("lookups_per_second: %.0f\n",
+            (elapsed > 0) ? (n_lookups / elapsed) : 0.0);
+    printf("rows_per_replay: %llu\n",
+            (unsigned long long) (n_rows / (n_repeats ? n_repeats : 1)));
+    printf("bytes_per_replay: %llu\n",
+            (unsigned long long) (n_bytes / (n_repeats ? n_repeats : 1)));
+    printf("empty_lookups_per_replay: %u\n",
+            n_empty / (n_repeats ? n_repeats : 1));
+    printf("not_in_table: %u\n", n_not_in_table);
+    printf("no_valid_rows: %u\n", n_no_valid_rows);
+    printf("filtered: %u\n", n_filtered);
+    printf("checksum: 0x%08x\n", checksum);
+
+    uint32_t n_filtered_packets = population_table_get_filtered_packet_count();
+    free(bit_fields);
+    free(keys);
+    free(table_data);
+
+    // The bit field data is not freed, as the table may still be using it
+    if (n_empty != (n_not_in_table + n_no_valid_rows + n_filtered) *
+            n_repeats) {
+        fprintf(stderr, "The lookups found nothing for %u keys per replay,"
+                " but %u keys have nothing to find\n",
+                n_empty / (n_repeats ? n_repeats : 1),
+                n_not_in_table + n_no_valid_rows + n_filtered);
+        return 1;
+    }
+    if (n_filtered_packets != n_filtered * n_repeats) {
+        fprintf(stderr, "The filter dropped %u packets, but should have"
+                " dropped %u\n", n_filtered_packets, n_filtered * n_repeats);
+        return 1;
+    }
+    return 0;
+}
@@ -0,0 +1,92 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Writes the regions of a neuron core that the spike processing reads, as\
+    built by its data specification, and traces of spikes to replay against\
+    them, for the spike processing simulator.
+
+Usage: python export_images.py DATA_SPEC_FILE PREFIX
+
+The regions are written to PREFIX followed by population_table.bin,\
+synaptic_matrix.bin, direct_matrix.bin and bit_field_filter.bin, which is\
+left out if the core has no bit field filter region.
+"""
+
+import sys
+import numpy
+from data_specification import DataSpecificationExecutor
+from spinn_storage_handlers import FileDataReader
+from spynnaker.pyNN.utilities.constants import POPULATION_BASED_REGIONS
+
+#: The file written for each region, by the region
+REGION_FILES = (
+    (POPULATION_BASED_REGIONS.POPULATION_TABLE, "population_table.bin"),
+    (POPULATION_BASED_REGIONS.SYNAPTIC_MATRIX, "synaptic_matrix.bin"),
+    (POPULATION_BASED_REGIONS.DIRECT_MATRIX, "direct_matrix.bin"),
+    (POPULATION_BASED_REGIONS.BIT_FIELD_FILTER, "bit_field_filter.bin"))
+
+#: The most memory a core's data specification is expected to use
+MAX_MEMORY = 120 * 1024 * 1024
+
+
+def write_images(executor, prefix):
+    """ Write the regions that the spike processing reads from a data\
+        specification that has been executed
+
+    :param ~data_specification.DataSpecificationExecutor executor:
+        The executor that ran the data specification
+    :param str prefix: The start of the name of each file written
+    :return: The names of the files written, by region
+    :rtype: dict(POPULATION_BASED_REGIONS, str)
+    """
+    filenames = dict()
+    for region_id, name in REGION_FILES:
+        region = executor.get_region(region_id.value)
+        if region is None:
+            if region_id == POPULATION_BASED_REGIONS.BIT_FIELD_FILTER:
+                continue
+            # Any other region that is missing has nothing in it
+            data = b""
+        else:
+            data = bytes(region.region_data[:region.max_write_pointer])
+        filenames[region_id] = prefix + name
+        with open(filenames[region_id], "wb") as f:
+            f.write(data)
+    return filenames
+
+
+def write_spike_trace(filename, times_us, keys):
+    """ Write a trace of the spikes received, in the order they arrive
+
+    :param str filename: The file to write
+    :param ~numpy.ndarray times_us:
+        The time at which each spike arrives, in microseconds
+    :param ~numpy.ndarray keys: The multicast key of each spike
+    """
+    times_us = numpy.asarray(times_us, dtype="uint32")
+    order = numpy.argsort(times_us, kind="stable")
+    trace = numpy.empty((len(times_us), 2), dtype="<u4")
+    trace[:, 0] = times_us[order]
+    trace[:, 1] = numpy.asarray(keys, dtype="uint32")[order]
+    trace.tofile(filename)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit(__doc__)
+    spec_executor = DataSpecificationExecutor(
+        FileDataReader(sys.argv[1]), MAX_MEMORY)
+    spec_executor.execute()
+    write_images(spec_executor, sys.argv[2])
@@ -0,0 +1,44 @@
+/*
+ * Copyright (c) 2017-2019 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Allocates memory below 4GB, which is kept apart from the rest of
+//!        the simulator as it needs the GNU extensions to mmap, which clash
+//!        with the spinnaker_tools types
+
+#define _GNU_SOURCE
+#include <stdint.h>
+#include <stdlib.h>
+#include <sys/mman.h>
+#include "sim.h"
+
+void *low_memory_allocate(size_t n_bytes) {
+    void *memory = mmap(
+            NULL, n_bytes, PROT_READ | PROT_WRITE,
+            MAP_PRIVATE | MAP_ANONYMOUS | MAP_32BIT, -1, 0);
+    if (memory != MAP_FAILED) {
+        return memory;
+    }
+
+    // Without MAP_32BIT, malloc might still give low enough memory
+    memory = malloc(n_bytes);
+    if (memory != NULL && (uintptr_t) memory + n_bytes > UINT32_MAX) {
+        free(memory);
+        return NULL;
+    }
+    return memory;
+}
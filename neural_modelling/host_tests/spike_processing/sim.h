@@ -0,0 +1,84 @@
+/*
+ * Copyright (c) 2017-2019 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief What the parts of the spike processing simulator share: the cost
+//!        model of the core, and the counts of the work done
+
+#ifndef _SIM_H_
+#define _SIM_H_
+
+#include <stdint.h>
+#include <stddef.h>
+
+//! The parameters of the simulated core, set from the command line
+typedef struct sim_parameters {
+    //! The number of neurons updated in each timer tick
+    uint32_t n_neurons;
+    //! The length of a timer tick in microseconds
+    uint32_t timestep_us;
+    //! The number of ticks to run for; 0 to run until the trace ends
+    uint32_t n_ticks;
+    //! The number of spikes the incoming spike buffer is asked to hold
+    uint32_t in_spikes_size;
+    //! The clock speed of the core in MHz, which is cycles per microsecond
+    uint32_t cpu_mhz;
+    //! The cycles taken by the FIQ handler of a multicast packet
+    uint32_t cycles_per_packet;
+    //! The cycles taken to look up a spike in the master population table
+    uint32_t cycles_per_lookup;
+    //! The cycles taken to process a row, other than its synapses
+    uint32_t cycles_per_row;
+    //! The cycles taken to process a fixed synapse
+    uint32_t cycles_per_fixed_synapse;
+    //! The cycles taken to process a plastic synapse
+    uint32_t cycles_per_plastic_synapse;
+    //! The cycles taken to update a neuron in the timer tick
+    uint32_t cycles_per_neuron;
+    //! The cycles between a DMA starting and its first data arriving
+    uint32_t dma_setup_cycles;
+    //! The bytes moved by the DMA engine in each cycle
+    uint32_t dma_bytes_per_cycle;
+} sim_parameters;
+
+extern sim_parameters parameters;
+
+//! The number of synaptic rows processed
+extern uint32_t n_rows_processed;
+
+//! The number of synapses processed
+extern uint32_t n_synapses_processed;
+
+//! The number of different words that index the synaptic input
+#define SYNAPTIC_INPUT_SIZE (1 << 16)
+
+//! The sum of the weights of the fixed synapses processed, by the index of
+//! the synapse (its delay, synapse type and neuron), which is what would be
+//! added to the ring buffers over the whole run
+extern uint32_t synaptic_input[SYNAPTIC_INPUT_SIZE];
+
+//! \brief Charge the code running now with some cycles of processing
+//! \param[in] cycles: The cycles taken
+void sim_charge(uint32_t cycles);
+
+//! \brief Allocate memory with an address that fits in 32 bits, as the code
+//!        under test stores addresses in 32-bit integers
+//! \param[in] n_bytes: The number of bytes to allocate
+//! \return The memory, or NULL if it couldn't be allocated
+void *low_memory_allocate(size_t n_bytes);
+
+#endif // _SIM_H_
@@ -0,0 +1,583 @@
+/*
+ * Copyright (c) 2017-2019 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Replays a trace of received spikes through the spike processing
+//!        pipeline of a neuron core on the host, reporting how busy the core
+//!        and its DMA engine are kept and when the incoming spike buffer
+//!        overflows.
+//!
+//! Usage: spike_processing_sim POP_TABLE SYNAPTIC_MATRIX DIRECT_MATRIX
+//!            BIT_FIELDS SPIKE_TRACE [name=value ...]
+//!
+//! POP_TABLE, SYNAPTIC_MATRIX, DIRECT_MATRIX and BIT_FIELDS hold the data of
+//! those regions of the core, as written by export_images.py, with "-" for
+//! BIT_FIELDS to filter no spikes; SPIKE_TRACE holds a pair of words for each
+//! spike received, the time in microseconds and the key, in time order; all
+//! are little-endian 32-bit words.  The name=value pairs set the parameters
+//! of the core in sim_parameters; "ticks_file=FILE" also writes a line of CSV
+//! for each timer tick to FILE, and "input_file=FILE" writes the synaptic
+//! input to FILE, as a little-endian 32-bit sum of weights for each synapse
+//! index.  The results are written to stdout as "name: value" lines.
+//!
+//! The real spike_processing.c and master population table run against a
+//! discrete-event model of the core: multicast packets are handled by FIQ as
+//! they arrive; the user event and DMA done callbacks are queued and run one
+//! at a time when the core is not handling packets, each taking the cycles
+//! charged while it runs; DMAs are done one after another by the engine; and
+//! the timer tick updates the neurons in whatever time is left over.  The
+//! callbacks run without being interrupted, so packets that arrive while one
+//! runs are only seen by the next; this makes the buffer slightly fuller
+//! than on the machine, which errs on the side of reporting overflows.
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <spin1_api.h>
+#include <simulation.h>
+#include <circular_buffer.h>
+#include <neuron/spike_processing.h>
+#include <neuron/population_table/population_table.h>
+#include "sim.h"
+
+//! The most callbacks that can be waiting to run at once
+#define MAX_QUEUED_CALLBACKS 64
+
+//! The most DMAs that can be in progress at once
+#define MAX_QUEUED_DMAS 64
+
+//! A callback waiting to run
+typedef struct queued_callback {
+    callback_t callback;
+    uint arg0;
+    uint arg1;
+    bool is_user_event;
+} queued_callback;
+
+//! A DMA in progress
+typedef struct queued_dma {
+    uint64_t done_time;
+    uint tag;
+    bool is_read;
+} queued_dma;
+
+sim_parameters parameters = {
+    .n_neurons = 256,
+    .timestep_us = 1000,
+    .n_ticks = 0,
+    .in_spikes_size = 256,
+    .cpu_mhz = 200,
+    .cycles_per_packet = 40,
+    .cycles_per_lookup = 150,
+    .cycles_per_row = 100,
+    .cycles_per_fixed_synapse = 16,
+    .cycles_per_plastic_synapse = 120,
+    .cycles_per_neuron = 250,
+    .dma_setup_cycles = 100,
+    .dma_bytes_per_cycle = 2
+};
+
+uint32_t n_rows_processed = 0;
+uint32_t n_synapses_processed = 0;
+
+//! The simulation time step, as used by the spike processing
+uint32_t time = 0;
+
+//! The parameters that can be set from the command line
+static const struct {
+    const char *name;
+    uint32_t *value;
+} parameter_names[] = {
+    {"n_neurons", &parameters.n_neurons},
+    {"timestep_us", &parameters.timestep_us},
+    {"n_ticks", &parameters.n_ticks},
+    {"in_spikes_size", &parameters.in_spikes_size},
+    {"cpu_mhz", &parameters.cpu_mhz},
+    {"cycles_per_packet", &parameters.cycles_per_packet},
+    {"cycles_per_lookup", &parameters.cycles_per_lookup},
+    {"cycles_per_row", &parameters.cycles_per_row},
+    {"cycles_per_fixed_synapse", &parameters.cycles_per_fixed_synapse},
+    {"cycles_per_plastic_synapse", &parameters.cycles_per_plastic_synapse},
+    {"cycles_per_neuron", &parameters.cycles_per_neuron},
+    {"dma_setup_cycles", &parameters.dma_setup_cycles},
+    {"dma_bytes_per_cycle", &parameters.dma_bytes_per_cycle},
+};
+
+//! The callbacks registered for each event
+static callback_t event_callbacks[NUM_EVENTS];
+
+//! The callback registered for DMAs with each tag
+static callback_t dma_callbacks[2];
+
+//! The callbacks waiting to run, in the order they were queued
+static queued_callback callback_queue[MAX_QUEUED_CALLBACKS];
+static uint32_t callback_queue_start = 0;
+static uint32_t n_queued_callbacks = 0;
+
+//! Whether a user event is waiting to run
+static bool user_event_pending = false;
+
+//! The DMAs in progress, in the order they will finish
+static queued_dma dma_queue[MAX_QUEUED_DMAS];
+static uint32_t dma_queue_start = 0;
+static uint32_t n_queued_dmas = 0;
+
+//! When the DMA engine finishes the last DMA given to it
+static uint64_t dma_free_time = 0;
+
+//! The cycle up to which the code running now has been charged
+static uint64_t cost_cursor = 0;
+
+//! The cycle at which the core finishes the packets and callbacks so far
+static uint64_t irq_busy_until = 0;
+
+//! The cycles of neuron updates still to be done by timer ticks
+static uint64_t timer_work_left = 0;
+
+//! The time up to which the timer work has been given the chance to run
+static uint64_t timer_work_time = 0;
+
+//! Counts of what has happened, overall and in the current tick
+typedef struct counts {
+    uint64_t busy_cycles;
+    uint32_t packets_received;
+    uint32_t packets_dropped;
+    uint32_t dma_reads;
+    uint32_t dma_writes;
+    uint64_t dma_bytes;
+} counts;
+
+static counts total_counts;
+static counts tick_counts;
+
+void sim_charge(uint32_t cycles) {
+    cost_cursor += cycles;
+}
+
+bool __real_population_table_get_first_address(
+        spike_t spike, address_t* row_address, size_t* n_bytes_to_transfer);
+
+//! The master population table lookup, charged with its cost
+bool __wrap_population_table_get_first_address(
+        spike_t spike, address_t* row_address, size_t* n_bytes_to_transfer) {
+    sim_charge(parameters.cycles_per_lookup);
+    return __real_population_table_get_first_address(
+            spike, row_address, n_bytes_to_transfer);
+}
+
+//! Get the buffer of spikes received, defined by the spike processing
+circular_buffer get_circular_buffer(void);
+
+static void queue_callback(
+        callback_t callback, uint arg0, uint arg1, bool is_user_event) {
+    if (n_queued_callbacks == MAX_QUEUED_CALLBACKS) {
+        rt_error(RTE_SWERR);
+    }
+    uint32_t index =
+            (callback_queue_start + n_queued_callbacks) % MAX_QUEUED_CALLBACKS;
+    callback_queue[index].callback = callback;
+    callback_queue[index].arg0 = arg0;
+    callback_queue[index].arg1 = arg1;
+    callback_queue[index].is_user_event = is_user_event;
+    n_queued_callbacks++;
+}
+
+uint spin1_dma_transfer(
+        uint tag, void *system_address, void *tcm_address, uint direction,
+        uint length) {
+    if (n_queued_dmas == MAX_QUEUED_DMAS) {
+        return 0;
+    }
+    if (direction == DMA_READ) {
+        memcpy(tcm_address, system_address, length);
+        total_counts.dma_reads++;
+        tick_counts.dma_reads++;
+    } else {
+        memcpy(system_address, tcm_address, length);
+        total_counts.dma_writes++;
+        tick_counts.dma_writes++;
+    }
+    total_counts.dma_bytes += length;
+    tick_counts.dma_bytes += length;
+
+    // The engine starts the DMA when it has finished those before it
+    uint64_t start_time =
+            (cost_cursor > dma_free_time) ? cost_cursor : dma_free_time;
+    dma_free_time = start_time + parameters.dma_setup_cycles +
+            ((length + parameters.dma_bytes_per_cycle - 1) /
+                    parameters.dma_bytes_per_cycle);
+    uint32_t index = (dma_queue_start + n_queued_dmas) % MAX_QUEUED_DMAS;
+    dma_queue[index].done_time = dma_free_time;
+    dma_queue[index].tag = tag;
+    dma_queue[index].is_read = direction == DMA_READ;
+    n_queued_dmas++;
+    return 1;
+}
+
+uint spin1_trigger_user_event(uint arg0, uint arg1) {
+    if (user_event_pending) {
+        return 0;
+    }
+    user_event_pending = true;
+    queue_callback(event_callbacks[USER_EVENT], arg0, arg1, true);
+    return 1;
+}
+
+void spin1_callback_on(uint event_id, callback_t cback, int priority) {
+    use(priority);
+    event_callbacks[event_id] = cback;
+}
+
+void simulation_dma_transfer_done_callback_on(uint tag, callback_t callback) {
+    dma_callbacks[tag] = callback;
+}
+
+uint spin1_int_disable(void) {
+    return 0;
+}
+
+void spin1_mode_restore(uint value) {
+    use(value);
+}
+
+void rt_error(uint code, ...) {
+    fprintf(stderr, "rt_error(%u) at time step %u\n", code, time);
+    exit(2);
+}
+
+//! \brief Let the timer work run in the time that the core is not busy with
+//!        packets and callbacks, up to a given time
+static void run_timer_work(uint64_t until) {
+    uint64_t start = (irq_busy_until > timer_work_time) ?
+            irq_busy_until : timer_work_time;
+    if (until > start && timer_work_left > 0) {
+        uint64_t done = until - start;
+        if (done > timer_work_left) {
+            done = timer_work_left;
+        }
+        timer_work_left -= done;
+        total_counts.busy_cycles += done;
+        tick_counts.busy_cycles += done;
+    }
+    if (until > timer_work_time) {
+        timer_work_time = until;
+    }
+}
+
+//! \brief Handle a packet by FIQ, which delays anything else running
+static void receive_packet(uint64_t now, uint32_t key) {
+    circular_buffer buffer = get_circular_buffer();
+    uint32_t overflows = circular_buffer_get_n_buffer_overflows(buffer);
+    event_callbacks[MC_PACKET_RECEIVED](key, 0);
+    total_counts.packets_received++;
+    tick_counts.packets_received++;
+    if (circular_buffer_get_n_buffer_overflows(buffer) != overflows) {
+        total_counts.packets_dropped++;
+        tick_counts.packets_dropped++;
+    }
+
+    // The packet takes time from whatever is running, or that will run next
+    irq_busy_until = ((irq_busy_until > now) ? irq_busy_until : now) +
+            parameters.cycles_per_packet;
+    total_counts.busy_cycles += parameters.cycles_per_packet;
+    tick_counts.busy_cycles += parameters.cycles_per_packet;
+}
+
+//! \brief Run the next queued callback, starting at the given time
+static void run_callback(uint64_t start) {
+    queued_callback *next = &callback_queue[callback_queue_start];
+    callback_queue_start = (callback_queue_start + 1) % MAX_QUEUED_CALLBACKS;
+    n_queued_callbacks--;
+    if (next->is_user_event) {
+        user_event_pending = false;
+    }
+    cost_cursor = start;
+    next->callback(next->arg0, next->arg1);
+    irq_busy_until = cost_cursor;
+    total_counts.busy_cycles += cost_cursor - start;
+    tick_counts.busy_cycles += cost_cursor - start;
+}
+
+//! \brief Read a whole file of words into memory that the code under test
+//!        can address
+static uint32_t *read_words(const char *filename, uint32_t *n_words) {
+    FILE *file = fopen(filename, "rb");
+    if (file == NULL) {
+        perror(filename);
+        return NULL;
+    }
+    fseek(file, 0, SEEK_END);
+    long n_bytes = ftell(file);
+    fseek(file, 0, SEEK_SET);
+    *n_words = (uint32_t) (n_bytes / sizeof(uint32_t));
+
+    // Always allocate something so that an empty file can be told apart
+    // from an error
+    uint32_t *words = low_memory_allocate(
+            (*n_words + 1) * sizeof(uint32_t));
+    if (words == NULL) {
+        fprintf(stderr, "Could not allocate %ld bytes for %s\n",
+                n_bytes, filename);
+        fclose(file);
+        return NULL;
+    }
+    if (fread(words, sizeof(uint32_t), *n_words, file) != *n_words) {
+        fprintf(stderr, "Could not read %s\n", filename);
+        words = NULL;
+    }
+    fclose(file);
+    return words;
+}
+
+static bool set_parameter(
+        const char *setting, const char **ticks_file,
+        const char **input_file) {
+    const char *equals = strchr(setting, '=');
+    if (equals == NULL) {
+        return false;
+    }
+    size_t name_length = equals - setting;
+    if (strncmp(setting, "ticks_file", name_length) == 0 &&
+            name_length == strlen("ticks_file")) {
+        *ticks_file = equals + 1;
+        return true;
+    }
+    if (strncmp(setting, "input_file", name_length) == 0 &&
+            name_length == strlen("input_file")) {
+        *input_file = equals + 1;
+        return true;
+    }
+    for (uint32_t i = 0;
+            i < sizeof(parameter_names) / sizeof(parameter_names[0]); i++) {
+        if (strlen(parameter_names[i].name) == name_length &&
+                strncmp(setting, parameter_names[i].name, name_length) == 0) {
+            *parameter_names[i].value = (uint32_t) strtoul(
+                    equals + 1, NULL, 0);
+            return true;
+        }
+    }
+    return false;
+}
+
+int main(int argc, char *argv[]) {
+    if (argc < 6) {
+        fprintf(stderr,
+                "Usage: %s POP_TABLE SYNAPTIC_MATRIX DIRECT_MATRIX "
+                "BIT_FIELDS SPIKE_TRACE [name=value ...]\n", argv[0]);
+        return 1;
+    }
+    const char *ticks_filename = NULL;
+    const char *input_filename = NULL;
+    for (int i = 6; i < argc; i++) {
+        if (!set_parameter(argv[i], &ticks_filename, &input_filename)) {
+            fprintf(stderr, "Unknown parameter %s\n", argv[i]);
+            return 1;
+        }
+    }
+    if (parameters.dma_bytes_per_cycle == 0 || parameters.cpu_mhz == 0 ||
+            parameters.timestep_us == 0) {
+        fprintf(stderr, "The clock, time step and DMA rate can't be 0\n");
+        return 1;
+    }
+
+    uint32_t n_words;
+    uint32_t *table = read_words(argv[1], &n_words);
+    uint32_t *synaptic_matrix = read_words(argv[2], &n_words);
+    uint32_t *direct_matrix = read_words(argv[3], &n_words);
+    if (table == NULL || synaptic_matrix == NULL || direct_matrix == NULL) {
+        return 1;
+    }
+    uint32_t row_max_n_words;
+    if (!population_table_initialise(
+            table, synaptic_matrix, direct_matrix, &row_max_n_words)) {
+        return 1;
+    }
+    if (strcmp(argv[4], "-") != 0) {
+        uint32_t *bit_fields = read_words(argv[4], &n_words);
+        if (bit_fields == NULL ||
+                !population_table_load_bit_fields(bit_fields)) {
+            return 1;
+        }
+    }
+    uint32_t n_trace_words;
+    uint32_t *trace = read_words(argv[5], &n_trace_words);
+    if (trace == NULL) {
+        return 1;
+    }
+    uint32_t n_spikes = n_trace_words / 2;
+    if (!spike_processing_initialise(
+            row_max_n_words, -1, 0, parameters.in_spikes_size)) {
+        return 1;
+    }
+    circular_buffer buffer = get_circular_buffer();
+
+    // Run until the tick after the last spike if not told otherwise
+    uint32_t n_ticks = parameters.n_ticks;
+    if (n_ticks == 0) {
+        n_ticks = 1;
+        if (n_spikes > 0) {
+            n_ticks += trace[(n_spikes - 1) * 2] / parameters.timestep_us;
+        }
+    }
+
+    FILE *ticks_file = NULL;
+    if (ticks_filename != NULL) {
+        ticks_file = fopen(ticks_filename, "w");
+        if (ticks_file == NULL) {
+            perror(ticks_filename);
+            return 1;
+        }
+        fprintf(ticks_file, "tick,packets_received,packets_dropped,"
+                "max_in_spikes,dma_reads,dma_writes,dma_bytes,"
+                "cpu_utilisation\n");
+    }
+
+    uint64_t cycles_per_tick =
+            (uint64_t) parameters.cpu_mhz * parameters.timestep_us;
+    uint64_t end_time = cycles_per_tick * n_ticks;
+    uint64_t next_tick_time = 0;
+    uint32_t next_spike = 0;
+    uint32_t timer_overruns = 0;
+    uint32_t overflow_ticks = 0;
+    int64_t first_overflow_us = -1;
+    uint32_t max_in_spikes = 0;
+    double total_utilisation = 0.0;
+    double max_utilisation = 0.0;
+    uint32_t n_ticks_done = 0;
+
+    while (true) {
+        // Find the next event, with timer ticks first, then packets, then
+        // DMAs and then callbacks when they happen at the same time, so that
+        // a spike at the start of a time step is counted in that step
+        uint64_t spike_time = UINT64_MAX;
+        if (next_spike < n_spikes) {
+            spike_time = (uint64_t) trace[next_spike * 2] * parameters.cpu_mhz;
+        }
+        uint64_t dma_time = UINT64_MAX;
+        if (n_queued_dmas > 0) {
+            dma_time = dma_queue[dma_queue_start].done_time;
+        }
+        uint64_t callback_time = UINT64_MAX;
+        if (n_queued_callbacks > 0) {
+            callback_time = (irq_busy_until > timer_work_time) ?
+                    irq_busy_until : timer_work_time;
+        }
+        uint64_t now = spike_time;
+        if (dma_time < now) {
+            now = dma_time;
+        }
+        if (next_tick_time <= now) {
+            now = next_tick_time;
+        }
+        if (callback_time < now) {
+            now = callback_time;
+        }
+        run_timer_work(now);
+
+        if (now == next_tick_time) {
+            if (n_ticks_done > 0) {
+                uint32_t tick_max_in_spikes = buffer->max_n_items;
+                double utilisation =
+                        (double) tick_counts.busy_cycles / cycles_per_tick;
+                if (ticks_file != NULL) {
+                    fprintf(ticks_file, "%u,%u,%u,%u,%u,%u,%llu,%.4f\n",
+                            time, tick_counts.packets_received,
+                            tick_counts.packets_dropped, tick_max_in_spikes,
+                            tick_counts.dma_reads, tick_counts.dma_writes,
+                            (unsigned long long) tick_counts.dma_bytes,
+                            utilisation);
+                }
+                if (tick_counts.packets_dropped > 0) {
+                    overflow_ticks++;
+                }
+                if (tick_max_in_spikes > max_in_spikes) {
+                    max_in_spikes = tick_max_in_spikes;
+                }
+                if (utilisation > max_utilisation) {
+                    max_utilisation = utilisation;
+                }
+                total_utilisation += utilisation;
+                time++;
+            }
+            if (n_ticks_done == n_ticks) {
+                break;
+            }
+
+            // The next tick can't start if the last hasn't finished
+            if (timer_work_left > 0) {
+                timer_overruns++;
+            }
+            timer_work_left += (uint64_t) parameters.n_neurons *
+                    parameters.cycles_per_neuron;
+            memset(&tick_counts, 0, sizeof(tick_counts));
+            buffer->max_n_items = circular_buffer_size(buffer);
+            n_ticks_done++;
+            next_tick_time += cycles_per_tick;
+        } else if (now == spike_time) {
+            uint32_t n_dropped = total_counts.packets_dropped;
+            receive_packet(now, trace[(next_spike * 2) + 1]);
+            if (total_counts.packets_dropped > n_dropped &&
+                    first_overflow_us < 0) {
+                first_overflow_us = trace[next_spike * 2];
+            }
+            next_spike++;
+        } else if (now == dma_time) {
+            queued_dma *dma = &dma_queue[dma_queue_start];
+            dma_queue_start = (dma_queue_start + 1) % MAX_QUEUED_DMAS;
+            n_queued_dmas--;
+            if (dma->is_read && dma_callbacks[dma->tag] != NULL) {
+                queue_callback(dma_callbacks[dma->tag], 0, dma->tag, false);
+            }
+        } else {
+            run_callback(now);
+        }
+    }
+
+    if (ticks_file != NULL) {
+        fclose(ticks_file);
+    }
+    if (input_filename != NULL) {
+        FILE *input_file = fopen(input_filename, "wb");
+        if (input_file == NULL) {
+            perror(input_filename);
+            return 1;
+        }
+        fwrite(synaptic_input, sizeof(uint32_t), SYNAPTIC_INPUT_SIZE,
+                input_file);
+        fclose(input_file);
+    }
+    printf("ticks: %u\n", n_ticks);
+    printf("packets_received: %u\n", total_counts.packets_received);
+    printf("packets_dropped: %u\n", total_counts.packets_dropped);
+    printf("first_overflow_us: %lld\n", (long long) first_overflow_us);
+    printf("overflow_ticks: %u\n", overflow_ticks);
+    printf("max_in_spikes: %u\n", max_in_spikes);
+    printf("in_spikes_capacity: %u\n", circular_buffer_real_size(buffer));
+    printf("dma_reads: %u\n", total_counts.dma_reads);
+    printf("dma_writes: %u\n", total_counts.dma_writes);
+    printf("dma_bytes: %llu\n", (unsigned long long) total_counts.dma_bytes);
+    printf("coalesced_transfers: %u\n",
+            spike_processing_get_n_coalesced_transfers());
+    printf("filtered_packets: %u\n",
+            population_table_get_filtered_packet_count());
+    printf("rows_processed: %u\n", n_rows_processed);
+    printf("synapses_processed: %u\n", n_synapses_processed);
+    printf("mean_cpu_utilisation: %.4f\n", total_utilisation / n_ticks);
+    printf("max_cpu_utilisation: %.4f\n", max_utilisation);
+    printf("timer_overruns: %u\n", timer_overruns);
+    return 0;
+}
@@ -0,0 +1,73 @@
+/*
+ * Copyright (c) 2017-2019 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Stands in for the synapse processing and structural plasticity
+//!        called by the spike processing, charging the cost of each row from
+//!        the numbers of synapses in its header, and summing the weights of
+//!        the fixed synapses rather than updating any ring buffers
+
+#include <neuron/synapses.h>
+#include <neuron/structural_plasticity/synaptogenesis_dynamics.h>
+#include "sim.h"
+
+uint32_t synaptic_input[SYNAPTIC_INPUT_SIZE];
+
+bool synapses_process_synaptic_row(
+        uint32_t time, synaptic_row_t row, bool *write_back) {
+    use(time);
+    address_t fixed_region = synapse_row_fixed_region(row);
+    uint32_t n_fixed = synapse_row_num_fixed_synapses(fixed_region);
+    uint32_t n_plastic = synapse_row_num_plastic_controls(fixed_region);
+    sim_charge(parameters.cycles_per_row +
+            (n_fixed * parameters.cycles_per_fixed_synapse) +
+            (n_plastic * parameters.cycles_per_plastic_synapse));
+    n_rows_processed++;
+    n_synapses_processed += n_fixed + n_plastic;
+
+    uint32_t *fixed_synapses = synapse_row_fixed_weight_controls(fixed_region);
+    for (uint32_t i = 0; i < n_fixed; i++) {
+        uint32_t synapse = fixed_synapses[i];
+        synaptic_input[synapse & (SYNAPTIC_INPUT_SIZE - 1)] +=
+                synapse_row_sparse_weight(synapse);
+    }
+
+    // Plastic rows are written back, as the weights would have changed
+    *write_back = synapse_row_plastic_size(row) > 0;
+    return true;
+}
+
+bool synaptogenesis_dynamics_rewire(
+        uint32_t time, spike_t *spike, address_t *synaptic_row_address,
+        uint32_t *n_bytes) {
+    use(time);
+    use(spike);
+    use(synaptic_row_address);
+    use(n_bytes);
+    return false;
+}
+
+bool synaptogenesis_row_restructure(uint32_t time, address_t row) {
+    use(time);
+    use(row);
+    return false;
+}
+
+void synaptogenesis_spike_received(uint32_t time, spike_t spike) {
+    use(time);
+    use(spike);
+}
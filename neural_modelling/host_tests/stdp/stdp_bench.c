@@ -0,0 +1,269 @@
+/*
+ * Copyright (c) 2017-2019 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Replays trains of pre- and post-synaptic spikes through the STDP
+//!        synapse dynamics on the host, writing out the rows with the
+//!        weights that result and reporting how fast the plastic synapses
+//!        were processed.
+//!
+//! Usage: stdp_bench PARAMETERS_FILE ROWS_FILE SPIKES_FILE OUTPUT_FILE
+//!            N_NEURONS N_SYNAPSE_TYPES LEFT_SHIFT [N_REPEATS]
+//!
+//! PARAMETERS_FILE holds the synapse dynamics region as written by
+//! SynapseDynamicsSTDP.write_parameters().  ROWS_FILE holds the number of
+//! rows and the number of words in each, followed by the rows, each with
+//! a plastic region from SynapseDynamicsSTDP.get_plastic_synaptic_data().
+//! SPIKES_FILE holds pairs of a time step and a spike, in order of time;
+//! a spike is the index of a row for a pre-synaptic spike, or a neuron
+//! index with POST_SPIKE_FLAG set for a post-synaptic spike.  LEFT_SHIFT
+//! is the ring buffer to input left shift of every synapse type.  The rows
+//! are replayed from the start N_REPEATS times, and OUTPUT_FILE is written
+//! like ROWS_FILE with the rows as the last replay left them.  All files
+//! are little-endian 32-bit words.  The results are written to stdout as
+//! "name: value" lines.
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <stdint.h>
+#include <time.h>
+#include <neuron/synapse_row.h>
+#include <neuron/plasticity/synapse_dynamics.h>
+
+//! Marks a spike in the spikes file as post-synaptic
+#define POST_SPIKE_FLAG 0x80000000
+
+//! The number of words before the rows in the rows file
+#define ROWS_HEADER_WORDS 2
+
+//! The size of the ring buffers, which are indexed with an index_t
+#define RING_BUFFER_SIZE (1 << 16)
+
+static uint32_t *read_words(const char *filename, uint32_t *n_words) {
+    FILE *file = fopen(filename, "rb");
+    if (file == NULL) {
+        perror(filename);
+        return NULL;
+    }
+    fseek(file, 0, SEEK_END);
+    long n_bytes = ftell(file);
+    fseek(file, 0, SEEK_SET);
+    *n_words = (uint32_t) (n_bytes / sizeof(uint32_t));
+
+    // Always allocate something so that an empty file can be told apart
+    // from an error
+    uint32_t *words = malloc((*n_words + 1) * sizeof(uint32_t));
+    if (words == NULL) {
+        fprintf(stderr, "Could not allocate %ld bytes for %s\n",
+                n_bytes, filename);
+        fclose(file);
+        return NULL;
+    }
+    if (fread(words, sizeof(uint32_t), *n_words, file) != *n_words) {
+        fprintf(stderr, "Could not read %s\n", filename);
+        free(words);
+        words = NULL;
+    }
+    fclose(file);
+    return words;
+}
+
+//! \brief The number of bits needed for an index of a number of items, as
+//!        the synapse dynamics works it out
+static uint32_t n_index_bits(uint32_t n_items) {
+    uint32_t n_bits = 0;
+    while ((1u << n_bits) < n_items) {
+        n_bits++;
+    }
+    return (n_bits == 0) ? 1 : n_bits;
+}
+
+//! \brief Checks that every spike is of a row or neuron that exists, and
+//!        that the spikes are in order, away from the timed replay
+static bool check_spikes(
+        const uint32_t *spikes, uint32_t n_spikes, uint32_t n_rows,
+        uint32_t n_neurons) {
+    for (uint32_t i = 0; i < n_spikes; i++) {
+        uint32_t time = spikes[i * 2];
+        uint32_t spike = spikes[i * 2 + 1];
+        if (i > 0 && time < spikes[(i - 1) * 2]) {
+            fprintf(stderr, "Spike %u is out of order\n", i);
+            return false;
+        }
+        if ((spike & POST_SPIKE_FLAG) ?
+                ((spike & ~POST_SPIKE_FLAG) >= n_neurons) :
+                (spike >= n_rows)) {
+            fprintf(stderr, "Spike %u is of 0x%08x which doesn't exist\n",
+                    i, spike);
+            return false;
+        }
+    }
+    return true;
+}
+
+void rt_error(uint code, ...) {
+    fprintf(stderr, "rt_error(%u)\n", code);
+    exit(1);
+}
+
+//! The processor time used so far, which is what the replay is timed in
+static double now_seconds(void) {
+    return ((double) clock()) / CLOCKS_PER_SEC;
+}
+
+int main(int argc, char *argv[]) {
+    if (argc < 8 || argc > 9) {
+        fprintf(stderr, "Usage: %s PARAMETERS_FILE ROWS_FILE SPIKES_FILE"
+                " OUTPUT_FILE N_NEURONS N_SYNAPSE_TYPES LEFT_SHIFT"
+                " [N_REPEATS]\n", argv[0]);
+        return 2;
+    }
+    uint32_t n_neurons = (uint32_t) strtoul(argv[5], NULL, 10);
+    uint32_t n_synapse_types = (uint32_t) strtoul(argv[6], NULL, 10);
+    uint32_t left_shift = (uint32_t) strtoul(argv[7], NULL, 10);
+    uint32_t n_repeats = 1;
+    if (argc == 9) {
+        n_repeats = (uint32_t) strtoul(argv[8], NULL, 10);
+    }
+    if (n_neurons == 0 || n_synapse_types == 0 || n_repeats == 0) {
+        fprintf(stderr, "There must be neurons, synapse types and repeats\n");
+        return 2;
+    }
+
+    uint32_t n_parameter_words, n_row_file_words, n_spike_words;
+    uint32_t *parameters = read_words(argv[1], &n_parameter_words);
+    uint32_t *row_file = read_words(argv[2], &n_row_file_words);
+    uint32_t *spikes = read_words(argv[3], &n_spike_words);
+    if (parameters == NULL || row_file == NULL || spikes == NULL) {
+        return 1;
+    }
+    if (n_row_file_words < ROWS_HEADER_WORDS || n_row_file_words !=
+            ROWS_HEADER_WORDS + (row_file[0] * row_file[1])) {
+        fprintf(stderr, "%s is not a file of rows\n", argv[2]);
+        return 1;
+    }
+    uint32_t n_rows = row_file[0];
+    uint32_t row_n_words = row_file[1];
+    uint32_t n_spikes = n_spike_words / 2;
+    if (!check_spikes(spikes, n_spikes, n_rows, n_neurons)) {
+        return 1;
+    }
+
+    uint32_t *left_shifts = malloc(n_synapse_types * sizeof(uint32_t));
+    uint32_t *rows = malloc((n_rows * row_n_words + 1) * sizeof(uint32_t));
+    uint32_t *parameters_copy = malloc(
+            (n_parameter_words + 1) * sizeof(uint32_t));
+    weight_t *ring_buffers = calloc(RING_BUFFER_SIZE, sizeof(weight_t));
+    if (left_shifts == NULL || rows == NULL || parameters_copy == NULL ||
+            ring_buffers == NULL) {
+        fprintf(stderr, "Could not allocate the rows and ring buffers\n");
+        return 1;
+    }
+    for (uint32_t s = 0; s < n_synapse_types; s++) {
+        left_shifts[s] = left_shift;
+    }
+
+    // Each time step only adds to the ring buffers of the neurons and synapse
+    // types for its delay slot, which are cleared as they would be by the
+    // time step update
+    uint32_t synapse_type_index_bits =
+            n_index_bits(n_neurons) + n_index_bits(n_synapse_types);
+    uint32_t n_slot_entries = 1 << synapse_type_index_bits;
+    if (SYNAPSE_DELAY_BITS + synapse_type_index_bits > 16) {
+        fprintf(stderr, "There are too many neurons and synapse types\n");
+        return 1;
+    }
+
+    uint32_t n_pre_spikes = 0, n_post_spikes = 0;
+    uint64_t n_synapses = 0;
+    uint32_t saturation_count = 0;
+    double seconds = 0.0;
+    for (uint32_t repeat = 0; repeat < n_repeats; repeat++) {
+        // Start from the rows and traces as they were to begin with
+        memcpy(rows, &row_file[ROWS_HEADER_WORDS],
+                n_rows * row_n_words * sizeof(uint32_t));
+        memcpy(parameters_copy, parameters,
+                n_parameter_words * sizeof(uint32_t));
+        if (synapse_dynamics_initialise(
+                parameters_copy, n_neurons, n_synapse_types,
+                left_shifts) == NULL) {
+            fprintf(stderr, "Could not initialise the synapse dynamics\n");
+            return 1;
+        }
+        uint32_t start_saturation_count =
+                synapse_dynamics_get_plastic_saturation_count();
+        memset(ring_buffers, 0, RING_BUFFER_SIZE * sizeof(weight_t));
+        n_pre_spikes = 0;
+        n_post_spikes = 0;
+        n_synapses = 0;
+
+        double start = now_seconds();
+        uint32_t last_time = 0;
+        for (uint32_t i = 0; i < n_spikes; i++) {
+            uint32_t time = spikes[i * 2];
+            uint32_t spike = spikes[i * 2 + 1];
+            if (time != last_time) {
+                memset(&ring_buffers[(time & SYNAPSE_DELAY_MASK) <<
+                        synapse_type_index_bits], 0,
+                        n_slot_entries * sizeof(weight_t));
+                last_time = time;
+            }
+            if (spike & POST_SPIKE_FLAG) {
+                synapse_dynamics_process_post_synaptic_event(
+                        time, spike & ~POST_SPIKE_FLAG);
+                n_post_spikes++;
+            } else {
+                address_t row = &rows[spike * row_n_words];
+                address_t fixed_region = synapse_row_fixed_region(row);
+                synapse_dynamics_process_plastic_synapses(
+                        synapse_row_plastic_region(row), fixed_region,
+                        ring_buffers, time);
+                n_synapses += synapse_row_num_plastic_controls(fixed_region);
+                n_pre_spikes++;
+            }
+        }
+        seconds += now_seconds() - start;
+        saturation_count = synapse_dynamics_get_plastic_saturation_count() -
+                start_saturation_count;
+    }
+
+    FILE *output = fopen(argv[4], "wb");
+    if (output == NULL) {
+        perror(argv[4]);
+        return 1;
+    }
+    if (fwrite(row_file, sizeof(uint32_t), ROWS_HEADER_WORDS, output) !=
+            ROWS_HEADER_WORDS || fwrite(
+                rows, sizeof(uint32_t), n_rows * row_n_words, output) !=
+            n_rows * row_n_words) {
+        fprintf(stderr, "Could not write %s\n", argv[4]);
+        fclose(output);
+        return 1;
+    }
+    fclose(output);
+
+    printf("repeats: %u\n", n_repeats);
+    printf("pre_spikes: %u\n", n_pre_spikes);
+    printf("post_spikes: %u\n", n_post_spikes);
+    printf("synapses_processed: %llu\n", (unsigned long long) n_synapses);
+    printf("saturation_count: %u\n", saturation_count);
+    printf("seconds: %.6f\n", seconds);
+    printf("synapses_per_second: %.0f\n",
+            (seconds > 0.0) ? (n_synapses * n_repeats) / seconds : 0.0);
+    return 0;
+}
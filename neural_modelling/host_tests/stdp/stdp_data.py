@@ -0,0 +1,294 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Writes the parameters and plastic rows of a SynapseDynamicsSTDP, and\
+    trains of spikes to replay against them, for the STDP bench, reads the\
+    weights that the bench leaves in the rows, and works out the weights\
+    that the rows should end up with in floating point.
+
+The synapse dynamics has to be made with a simulator set up, as its timing\
+dependence gets the time step from the simulator.  The weights of the\
+connections are in the units of the rows, that is already scaled by the\
+weight scale of their synapse type, and their delays are in time steps.
+"""
+
+import numpy
+from data_specification.enums import DataType
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neuron.plasticity.stdp.timing_dependence import (
+    TimingDependenceSpikeNearestPair, TimingDependenceSpikePair)
+from spynnaker.pyNN.models.neuron.plasticity.stdp.weight_dependence import (
+    WeightDependenceAdditive, WeightDependenceMultiplicative)
+
+#: Marks a spike in the spikes file as post-synaptic
+POST_SPIKE_FLAG = 0x80000000
+
+#: The number of words before the rows in the rows file
+ROWS_HEADER_WORDS = 2
+
+
+class _RegionWriter(object):
+    """ Takes what the data specification of a region would write to it,\
+        without needing the SDRAM of a machine to reserve it in
+    """
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def comment(self, comment):
+        pass
+
+    def switch_write_focus(self, region):
+        pass
+
+    def write_value(self, data, data_type=DataType.UINT32):
+        self.data += data_type.encode(data)[:data_type.size]
+
+    def write_array(self, array_values, data_type=DataType.UINT32):
+        self.data += numpy.array(
+            array_values, dtype=data_type.numpy_typename).tobytes()
+
+
+def write_parameters(filename, synapse_dynamics, weight_scales,
+                     machine_time_step=1000):
+    """ Write the synapse dynamics region as its data specification writes it
+
+    :param str filename: The file to write
+    :param SynapseDynamicsSTDP synapse_dynamics: The synapse dynamics
+    :param list(float) weight_scales: The weight scale of each synapse type
+    :param int machine_time_step: The time step in microseconds
+    """
+    spec = _RegionWriter()
+    synapse_dynamics.write_parameters(
+        spec, 0, machine_time_step, weight_scales)
+    with open(filename, "wb") as f:
+        f.write(bytes(spec.data))
+
+
+def _row_order(connections):
+    """ The order of the connections in the rows
+    """
+    return numpy.argsort(connections["source"], kind="stable")
+
+
+def write_rows(filename, synapse_dynamics, connections, n_rows, n_neurons,
+               n_synapse_types):
+    """ Write a row for each source neuron, all of the length of the longest
+
+    :param str filename: The file to write
+    :param SynapseDynamicsSTDP synapse_dynamics: The synapse dynamics
+    :param ~numpy.ndarray connections:
+        The connections, with sources that are rows and targets that are\
+        neurons
+    :param int n_rows: The number of rows
+    :param int n_neurons: The number of neurons
+    :param int n_synapse_types: The number of synapse types
+    """
+    connections = connections[_row_order(connections)]
+    fp_data, pp_data, fp_size, pp_size = \
+        synapse_dynamics.get_plastic_synaptic_data(
+            connections, connections["source"], n_rows,
+            Slice(0, n_neurons - 1), n_synapse_types)
+
+    # The rows have no fixed synapses
+    rows = [
+        numpy.concatenate((
+            pp_size[i], pp_data[i], [0], fp_size[i], fp_data[i])).astype(
+                "<u4")
+        for i in range(n_rows)]
+    row_n_words = max(row.size for row in rows)
+    data = numpy.zeros((n_rows, row_n_words), dtype="<u4")
+    for i, row in enumerate(rows):
+        data[i, :row.size] = row
+    header = numpy.array([n_rows, row_n_words], dtype="<u4")
+    numpy.concatenate((header, data.ravel())).tofile(filename)
+
+
+def write_spikes(filename, pre_times, pre_rows, post_times, post_neurons):
+    """ Write trains of spikes, in order of time; post-synaptic spikes go\
+        before pre-synaptic spikes in the same time step, as the neurons\
+        are updated before the spikes received are processed
+
+    :param str filename: The file to write
+    :param ~numpy.ndarray pre_times: The time step of each pre-synaptic spike
+    :param ~numpy.ndarray pre_rows: The row of each pre-synaptic spike
+    :param ~numpy.ndarray post_times:
+        The time step of each post-synaptic spike
+    :param ~numpy.ndarray post_neurons: The neuron of each post-synaptic spike
+    """
+    times = numpy.concatenate((post_times, pre_times)).astype("uint32")
+    spikes = numpy.concatenate((
+        numpy.asarray(post_neurons, dtype="uint32") | POST_SPIKE_FLAG,
+        numpy.asarray(pre_rows, dtype="uint32")))
+    order = numpy.argsort(times, kind="stable")
+    trace = numpy.empty((len(times), 2), dtype="<u4")
+    trace[:, 0] = times[order]
+    trace[:, 1] = spikes[order]
+    trace.tofile(filename)
+
+
+def read_weights(filename, synapse_dynamics, connections, n_neurons,
+                 n_synapse_types):
+    """ Read the weights of the connections from rows written by the bench
+
+    :param str filename: The file to read
+    :param SynapseDynamicsSTDP synapse_dynamics: The synapse dynamics
+    :param ~numpy.ndarray connections: The connections the rows were made of
+    :param int n_neurons: The number of neurons
+    :param int n_synapse_types: The number of synapse types
+    :return: The weight of each connection
+    :rtype: ~numpy.ndarray
+    """
+    data = numpy.fromfile(filename, dtype="<u4")
+    n_rows, row_n_words = data[:ROWS_HEADER_WORDS]
+    rows = data[ROWS_HEADER_WORDS:].reshape((n_rows, row_n_words))
+    pp_size = rows[:, 0]
+    fp_size = rows[numpy.arange(n_rows), pp_size + 2]
+    fp_words = synapse_dynamics.get_n_fixed_plastic_words_per_row(fp_size)
+    read = synapse_dynamics.read_plastic_synaptic_data(
+        Slice(0, n_neurons - 1), n_synapse_types, pp_size,
+        [row[1:size + 1] for row, size in zip(rows, pp_size)], fp_size,
+        [row[size + 3:size + 3 + words]
+         for row, size, words in zip(rows, pp_size, fp_words)])
+    weights = numpy.zeros(len(connections))
+    weights[_row_order(connections)] = read["weight"]
+    return weights
+
+
+def reference_weights(synapse_dynamics, weight_scales, left_shift,
+                      connections, pre_times, pre_rows, post_times,
+                      post_neurons):
+    """ Work out in floating point the weights that the connections should\
+        end up with when the spikes are replayed; like the synapse dynamics,\
+        each weight is only updated when a spike arrives at it, for the\
+        post-synaptic spikes since the last spike that arrived, and a\
+        pre-synaptic spike is taken to have arrived at time step 0.
+
+    Only the pair and nearest pair timing dependences and the additive and\
+    multiplicative weight dependences are handled, without the limit on the\
+    number of post-synaptic spikes that the synapse dynamics keeps.
+
+    :param SynapseDynamicsSTDP synapse_dynamics: The synapse dynamics
+    :param list(float) weight_scales: The weight scale of each synapse type
+    :param int left_shift:
+        The ring buffer to input left shift of every synapse type
+    :param ~numpy.ndarray connections: The connections
+    :param ~numpy.ndarray pre_times: The time step of each pre-synaptic spike
+    :param ~numpy.ndarray pre_rows: The row of each pre-synaptic spike
+    :param ~numpy.ndarray post_times:
+        The time step of each post-synaptic spike
+    :param ~numpy.ndarray post_neurons: The neuron of each post-synaptic spike
+    :return: The weight of each connection
+    :rtype: ~numpy.ndarray
+    """
+    # pylint: disable=too-many-arguments, too-many-locals
+    timing = synapse_dynamics.timing_dependence
+    weight = synapse_dynamics.weight_dependence
+    if not isinstance(timing, (
+            TimingDependenceSpikePair, TimingDependenceSpikeNearestPair)):
+        raise NotImplementedError(
+            "Only pair and nearest pair timing dependences are handled")
+    if not isinstance(weight, (
+            WeightDependenceAdditive, WeightDependenceMultiplicative)):
+        raise NotImplementedError(
+            "Only additive and multiplicative weight dependences are handled")
+    nearest = isinstance(timing, TimingDependenceSpikeNearestPair)
+    additive = isinstance(weight, WeightDependenceAdditive)
+    scale = numpy.asarray(weight_scales)[connections["synapse_type"]]
+    w_min = weight.w_min * scale
+    w_max = weight.w_max * scale
+    if additive:
+        a_plus = weight.A_plus * weight.w_max * scale
+        a_minus = weight.A_minus * weight.w_max * scale
+    else:
+        # The weights are multiplied in the format of the ring buffers
+        a_plus = weight.A_plus * scale / (1 << (15 - left_shift))
+        a_minus = weight.A_minus * scale / (1 << (15 - left_shift))
+
+    def trace_at(times, tau):
+        """ The trace just after each spike of a train
+        """
+        traces = numpy.zeros(len(times))
+        for i in range(len(times)):
+            if nearest:
+                traces[i] = 1.0
+            elif i > 0:
+                traces[i] = 1.0 + traces[i - 1] * numpy.exp(
+                    -(times[i] - times[i - 1]) / tau)
+            else:
+                traces[i] = 1.0
+        return traces
+
+    pre_times = numpy.asarray(pre_times)
+    pre_rows = numpy.asarray(pre_rows)
+    post_times = numpy.asarray(post_times)
+    post_neurons = numpy.asarray(post_neurons)
+    weights = connections["weight"].astype("float64")
+    post_trains = dict()
+    for i, conn in enumerate(connections):
+        if conn["target"] not in post_trains:
+            times = numpy.sort(post_times[post_neurons == conn["target"]])
+            post_trains[conn["target"]] = (
+                times, trace_at(times, timing.tau_minus))
+        posts, post_traces = post_trains[conn["target"]]
+        pres = numpy.sort(pre_times[pre_rows == conn["source"]])
+        pre_traces = numpy.concatenate(([0.0], trace_at(
+            pres, timing.tau_plus)))
+        pres = numpy.concatenate(([0], pres))
+        delay = conn["delay"] if synapse_dynamics.backprop_delay else 0
+        w = weights[i]
+        for j in range(1, len(pres)):
+            potentiation = 0.0
+            depression = 0.0
+
+            # Potentiate with the post-synaptic spikes since the last
+            # pre-synaptic spike
+            window = numpy.flatnonzero(
+                (posts > pres[j - 1] - delay) & (posts <= pres[j] - delay))
+            for k in window:
+                since_pre = posts[k] + delay - pres[j - 1]
+                if since_pre <= 0:
+                    continue
+                if nearest:
+                    # Only the first post-synaptic spike after the last
+                    # pre-synaptic spike is paired with it
+                    decayed = numpy.exp(-since_pre / timing.tau_plus)
+                    if k > 0 and posts[k] + delay - posts[k - 1] < since_pre:
+                        decayed = 0.0
+                else:
+                    decayed = pre_traces[j - 1] * numpy.exp(
+                        -since_pre / timing.tau_plus)
+                if additive:
+                    potentiation += decayed
+                else:
+                    w += (w_max[i] - w) * a_plus[i] * decayed
+
+            # Depress with the last post-synaptic spike
+            before = numpy.flatnonzero(posts <= pres[j] - delay)
+            if len(before):
+                last = before[-1]
+                decayed = numpy.exp(
+                    -(pres[j] - (posts[last] + delay)) / timing.tau_minus)
+                if not nearest:
+                    decayed *= post_traces[last]
+                if additive:
+                    depression = decayed
+                else:
+                    w -= (w - w_min[i]) * a_minus[i] * decayed
+            if additive:
+                w = min(w_max[i], max(w_min[i], (
+                    w + a_plus[i] * potentiation - a_minus[i] * depression)))
+        weights[i] = w
+    return weights
@@ -0,0 +1,121 @@
+/*
+ * Copyright (c) 2017-2019 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Host stand-in for the spinn_common circular buffer, which also
+//!        keeps track of the most items it has held, so that how full it
+//!        gets can be reported
+#ifndef _CIRCULAR_BUFFER_H_
+#define _CIRCULAR_BUFFER_H_
+
+#include <stdio.h>
+#include "spin1_api.h"
+
+typedef struct _circular_buffer {
+    //! One less than the size of the buffer, which is a power of 2
+    uint32_t buffer_size;
+    uint32_t output;
+    uint32_t input;
+    uint32_t overflows;
+    uint32_t max_n_items;
+    uint32_t buffer[];
+} _circular_buffer, *circular_buffer;
+
+static inline circular_buffer circular_buffer_initialize(uint32_t size) {
+    uint32_t real_size = 1;
+    while (real_size < size) {
+        real_size <<= 1;
+    }
+    circular_buffer buffer = spin1_malloc(
+            sizeof(_circular_buffer) + (real_size * sizeof(uint32_t)));
+    if (buffer == NULL) {
+        return NULL;
+    }
+    buffer->buffer_size = real_size - 1;
+    buffer->input = 0;
+    buffer->output = 0;
+    buffer->overflows = 0;
+    buffer->max_n_items = 0;
+    return buffer;
+}
+
+static inline uint32_t circular_buffer_real_size(circular_buffer buffer) {
+    return buffer->buffer_size;
+}
+
+static inline uint32_t circular_buffer_size(circular_buffer buffer) {
+    return (buffer->input - buffer->output) & buffer->buffer_size;
+}
+
+static inline bool circular_buffer_add(circular_buffer buffer, uint32_t item) {
+    uint32_t next_input = (buffer->input + 1) & buffer->buffer_size;
+    if (next_input == buffer->output) {
+        buffer->overflows++;
+        return false;
+    }
+    buffer->buffer[buffer->input] = item;
+    buffer->input = next_input;
+    uint32_t n_items = circular_buffer_size(buffer);
+    if (n_items > buffer->max_n_items) {
+        buffer->max_n_items = n_items;
+    }
+    return true;
+}
+
+static inline bool circular_buffer_get_next(
+        circular_buffer buffer, uint32_t *item) {
+    if (buffer->output == buffer->input) {
+        return false;
+    }
+    *item = buffer->buffer[buffer->output];
+    buffer->output = (buffer->output + 1) & buffer->buffer_size;
+    return true;
+}
+
+static inline bool circular_buffer_advance_if_next_equals(
+        circular_buffer buffer, uint32_t item) {
+    if (buffer->output != buffer->input &&
+            buffer->buffer[buffer->output] == item) {
+        buffer->output = (buffer->output + 1) & buffer->buffer_size;
+        return true;
+    }
+    return false;
+}
+
+static inline uint32_t circular_buffer_get_n_buffer_overflows(
+        circular_buffer buffer) {
+    return buffer->overflows;
+}
+
+static inline uint32_t circular_buffer_input(circular_buffer buffer) {
+    return buffer->input;
+}
+
+static inline uint32_t circular_buffer_output(circular_buffer buffer) {
+    return buffer->output;
+}
+
+static inline uint32_t circular_buffer_value_at_index(
+        circular_buffer buffer, uint32_t index) {
+    return buffer->buffer[index & buffer->buffer_size];
+}
+
+static inline void circular_buffer_print_buffer(circular_buffer buffer) {
+    fprintf(stderr, "%u items\n", circular_buffer_size(buffer));
+}
+
+#endif // _CIRCULAR_BUFFER_H_
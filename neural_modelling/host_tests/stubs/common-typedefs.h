@@ -0,0 +1,54 @@
+/*
+ * Copyright (c) 2017-2019 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Host stand-in for the spinnaker_tools common types, with just
+//!        enough for the neural modelling code to be built with gcc
+#ifndef _COMMON_TYPEDEFS_H_
+#define _COMMON_TYPEDEFS_H_
+
+#include <stdbool.h>
+#include <stddef.h>
+#include <stdint.h>
+
+typedef uint32_t* address_t;
+typedef uint16_t index_t;
+typedef uint32_t counter_t;
+typedef uint32_t timer_t;
+typedef unsigned int uint;
+
+// The fixed point types, which are only used in inline code that is never
+// called on the host
+typedef int32_t int_k_t;
+typedef int32_t s1615;
+
+#define IO_BUF 0
+#define io_printf(stream, ...) ((void) 0)
+
+#define use(x) ((void) (x))
+
+//! The ARM signed multiply of the bottom 16 bits of each argument
+static inline int32_t __smulbb(int32_t a, int32_t b) {
+    return ((int32_t) (int16_t) a) * ((int32_t) (int16_t) b);
+}
+
+#define __int_c(n) int ## n ## _t
+#define __int_t(n) __int_c(n)
+#define __uint_c(n) uint ## n ## _t
+#define __uint_t(n) __uint_c(n)
+
+#endif // _COMMON_TYPEDEFS_H_
@@ -0,0 +1,44 @@
+/*
+ * Copyright (c) 2017-2019 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Host stand-in for the spinnaker_tools logging; only errors are
+//!        reported, on stderr, so that logging does not affect timings
+#ifndef _DEBUG_H_
+#define _DEBUG_H_
+
+#include <stdio.h>
+#include "spin1_api.h"
+
+#define LOG_ERROR 10
+#define LOG_WARNING 20
+#define LOG_INFO 30
+#define LOG_DEBUG 40
+
+#ifndef LOG_LEVEL
+#define LOG_LEVEL LOG_INFO
+#endif
+
+#define log_debug(...) ((void) 0)
+#define log_info(...) ((void) 0)
+#define log_warning(...) ((void) 0)
+#define log_error(...) do { \
+        fprintf(stderr, __VA_ARGS__); \
+        fputc('\n', stderr); \
+    } while (0)
+
+#endif // _DEBUG_H_
@@ -0,0 +1,28 @@
+/*
+ * Copyright (c) 2017-2019 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Host stand-in for the front end common simulation interface, with
+//!        only the function used by the spike processing
+#ifndef _SIMULATION_H_
+#define _SIMULATION_H_
+
+#include "spin1_api.h"
+
+void simulation_dma_transfer_done_callback_on(uint tag, callback_t callback);
+
+#endif // _SIMULATION_H_
@@ -0,0 +1,60 @@
+/*
+ * Copyright (c) 2017-2019 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Host stand-in for the parts of the spin1 API used by the code
+//!        under test.  Memory functions are mapped on to the C library; the
+//!        event functions are only declared, and are defined by the harness
+//!        that needs them.
+#ifndef _SPIN1_API_H_
+#define _SPIN1_API_H_
+
+#include <stdlib.h>
+#include <string.h>
+#include "common-typedefs.h"
+
+#define spin1_malloc(bytes) malloc(bytes)
+#define spin1_memcpy(dst, src, n) memcpy((dst), (src), (n))
+
+typedef void (*callback_t)(uint, uint);
+
+//! The events that callbacks can be registered for
+enum spin1_events {
+    MC_PACKET_RECEIVED,
+    DMA_TRANSFER_DONE,
+    TIMER_TICK,
+    SDP_PACKET_RX,
+    USER_EVENT,
+    MCPL_PACKET_RECEIVED,
+    NUM_EVENTS
+};
+
+#define DMA_READ 0
+#define DMA_WRITE 1
+
+#define RTE_SWERR 19
+
+uint spin1_dma_transfer(
+        uint tag, void *system_address, void *tcm_address, uint direction,
+        uint length);
+uint spin1_trigger_user_event(uint arg0, uint arg1);
+void spin1_callback_on(uint event_id, callback_t cback, int priority);
+uint spin1_int_disable(void);
+void spin1_mode_restore(uint value);
+void rt_error(uint code, ...);
+
+#endif // _SPIN1_API_H_
@@ -0,0 +1,38 @@
+/*
+ * Copyright (c) 2017-2019 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Host stand-in for the spinn_common bit utilities
+#ifndef _UTILS_H_
+#define _UTILS_H_
+
+#include <stdbool.h>
+#include <stdint.h>
+
+static inline bool is_power_of_2(uint32_t value) {
+    return (value != 0) && ((value & (value - 1)) == 0);
+}
+
+static inline uint32_t ilog_2(uint32_t value) {
+    return 31 - __builtin_clz(value);
+}
+
+static inline uint32_t next_power_of_2(uint32_t value) {
+    return 1 << (32 - __builtin_clz(value - 1));
+}
+
+#endif // _UTILS_H_
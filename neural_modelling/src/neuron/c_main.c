@@ -62,6 +62,8 @@ struct neuron_provenance {
     uint32_t current_timer_tick;
     uint32_t n_plastic_synaptic_weight_saturations;
     uint32_t n_rewires;
+    uint32_t n_filtered_packets;
+    uint32_t n_coalesced_transfers;
 };
 
 //! values for the priority for each callback
@@ -115,6 +117,9 @@ void c_main_store_provenance_data(address_t provenance_region) {
     prov->n_plastic_synaptic_weight_saturations =
             synapse_dynamics_get_plastic_saturation_count();
     prov->n_rewires = spike_processing_get_successful_rewires();
+    prov->n_filtered_packets = population_table_get_filtered_packet_count();
+    prov->n_coalesced_transfers =
+            spike_processing_get_n_coalesced_transfers();
     log_debug("finished other provenance data");
 }
 
@@ -179,6 +184,12 @@ static bool initialise(void) {
             &row_max_n_words)) {
         return false;
     }
+    if (!population_table_load_bit_fields(
+            data_specification_get_region(
+                    BIT_FIELD_FILTER_REGION, ds_regions))) {
+        return false;
+    }
+
     // Set up the synapse dynamics
     address_t synapse_dynamics_region_address =
             data_specification_get_region(SYNAPSE_DYNAMICS_REGION, ds_regions);
@@ -21,10 +21,13 @@
 // Standard includes
 #include <common/neuron-typedefs.h>
 #include <spin1_api.h>
+#include <debug.h>
 
 //---------------------------------------
 // Macros
 //---------------------------------------
+// maths-util.h has its own MAX when built with FLOATING_POINT
+#undef MAX
 #define MIN(X, Y)	((X) < (Y) ? (X) : (Y))
 #define MAX(X, Y)	((X) > (Y) ? (X) : (Y))
 
@@ -116,9 +116,10 @@ static inline post_event_window_t post_events_get_window_delayed(
     // Calculate number of events
     window.num_events = (end_event_time - window.next_time);
 
-    // Using num_events, find next and previous traces
-    const post_trace_t *end_event_trace = events->traces + count;
-    window.next_trace = (end_event_trace - window.num_events);
+    // Find the next and previous traces from the next event; the window
+    // need not go up to the end of the history, as later events may have
+    // happened within the dendritic delay
+    window.next_trace = events->traces + (window.next_time - events->times);
     window.prev_trace = *(window.next_trace - 1);
 
     // Return window
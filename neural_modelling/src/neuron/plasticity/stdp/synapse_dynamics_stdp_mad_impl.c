@@ -390,7 +390,7 @@ input_t synapse_dynamics_get_intrinsic_bias(
         uint32_t time, index_t neuron_index) {
     use(time);
     use(neuron_index);
-    return 0.0k;
+    return ZERO;
 }
 
 uint32_t synapse_dynamics_get_plastic_pre_synaptic_events(void) {
@@ -33,6 +33,18 @@ bool population_table_initialise(
         address_t table_address, address_t synapse_rows_address,
         address_t direct_rows_address, uint32_t *row_max_n_words);
 
+//! \brief Sets up the filter that drops spikes from neurons that have no
+//!        synapses on this core, without reading any rows; must be called
+//!        after population_table_initialise
+//! \param[in] bit_field_address The address of the start of the bit fields,
+//!                              one for each entry of the table in order
+//! \return True if the filter was set up successfully, False otherwise
+bool population_table_load_bit_fields(address_t bit_field_address);
+
+//! \brief Get the number of spikes dropped by the bit field filter
+//! \return The number of spikes dropped
+uint32_t population_table_get_filtered_packet_count(void);
+
 //! \brief Get the first row data for the given input spike
 //! \param[in] spike The spike received
 //! \param[out] row_address Updated with the address of the row
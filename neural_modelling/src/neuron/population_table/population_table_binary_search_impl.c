@@ -34,6 +34,12 @@ static address_and_row_length *address_list;
 static address_t synaptic_rows_base_address;
 static uint32_t direct_rows_base_address;
 
+//! \brief A bit field for each entry of the table, with a bit set for each
+//!        neuron with synapses on this core, or NULL if all spikes for the
+//!        entry are to be looked up
+static uint32_t **connectivity_bit_fields = NULL;
+static uint32_t n_filtered_packets = 0;
+
 static spike_t last_spike = 0;
 static uint32_t last_neuron_id = 0;
 static uint16_t next_item = 0;
@@ -66,6 +72,11 @@ static inline uint32_t get_neuron_id(
     return spike & ~entry.mask;
 }
 
+static inline bool bit_field_has_neuron(
+        const uint32_t *bit_field, uint32_t neuron_id) {
+    return (bit_field[neuron_id >> 5] >> (neuron_id & 0x1F)) & 0x1;
+}
+
 static inline void print_master_population_table(void) {
     log_info("master_population\n");
     log_info("------------------------------------------\n");
@@ -155,6 +166,51 @@ bool population_table_initialise(
     return true;
 }
 
+bool population_table_load_bit_fields(address_t bit_field_address) {
+    uint32_t n_entries = bit_field_address[0];
+    if (n_entries != master_population_table_length) {
+        log_error("There are %u bit fields for %u population table entries",
+                n_entries, master_population_table_length);
+        return false;
+    }
+    if (n_entries == 0) {
+        return true;
+    }
+
+    connectivity_bit_fields = spin1_malloc(n_entries * sizeof(uint32_t *));
+    if (connectivity_bit_fields == NULL) {
+        log_error("Could not allocate the bit field filter");
+        return false;
+    }
+
+    address_t bit_field_data = &bit_field_address[1];
+    uint32_t n_in_sdram = 0;
+    for (uint32_t i = 0; i < n_entries; i++) {
+        uint32_t n_words = bit_field_data[0];
+        connectivity_bit_fields[i] = NULL;
+        if (n_words > 0) {
+            // Test the bit field in DTCM if there is room for it, as that is
+            // faster, or in SDRAM if not
+            uint32_t *bit_field = spin1_malloc(n_words * sizeof(uint32_t));
+            if (bit_field == NULL) {
+                bit_field = &bit_field_data[1];
+                n_in_sdram++;
+            } else {
+                spin1_memcpy(bit_field, &bit_field_data[1],
+                        n_words * sizeof(uint32_t));
+            }
+            connectivity_bit_fields[i] = bit_field;
+        }
+        bit_field_data = &bit_field_data[1 + n_words];
+    }
+    log_info("%u of %u bit fields are in SDRAM", n_in_sdram, n_entries);
+    return true;
+}
+
+uint32_t population_table_get_filtered_packet_count(void) {
+    return n_filtered_packets;
+}
+
 bool population_table_get_first_address(
         spike_t spike, address_t* row_address, size_t* n_bytes_to_transfer) {
     uint32_t imin = 0;
@@ -170,6 +226,19 @@ bool population_table_get_first_address(
             }
 
             last_neuron_id = get_neuron_id(entry, spike);
+
+            // Drop the spike if the neuron has no synapses here, so that no
+            // rows are read for it
+            if ((connectivity_bit_fields != NULL) &&
+                    (connectivity_bit_fields[imid] != NULL) &&
+                    !bit_field_has_neuron(
+                            connectivity_bit_fields[imid], last_neuron_id)) {
+                log_debug("spike %u (= %x): filtered by bit field",
+                        spike, spike);
+                n_filtered_packets++;
+                return false;
+            }
+
             last_spike = spike;
             next_item = entry.start;
             items_to_go = entry.count;
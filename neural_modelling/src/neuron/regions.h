@@ -28,5 +28,6 @@ typedef enum regions_e {
     PROVENANCE_DATA_REGION,   // 7
     PROFILER_REGION,          // 8
     CONNECTOR_BUILDER_REGION, // 9
-    DIRECT_MATRIX_REGION      // 10
+    DIRECT_MATRIX_REGION,     // 10
+    BIT_FIELD_FILTER_REGION   // 11
 } regions_e;
@@ -23,20 +23,59 @@
 #include <simulation.h>
 #include <debug.h>
 
-//! DMA buffer structure combines the row read from SDRAM with information
+//! The most rows that are read together in one DMA, when they are next to
+//! each other in SDRAM; 1 reads each row on its own
+#ifndef MAX_ROWS_PER_DMA
+#define MAX_ROWS_PER_DMA 16
+#endif
+
+//! The fewest words that a DMA buffer holds, so that there is room for more
+//! than one row when rows are short
+#ifndef MIN_DMA_BUFFER_N_WORDS
+#define MIN_DMA_BUFFER_N_WORDS 256
+#endif
+
+//! A synaptic row in a DMA buffer
+typedef struct dma_row {
+
+    // Address of the row in SDRAM, to write the plastic region back to
+    address_t sdram_address;
+
+    // Offset of the row from the start of the buffer in words
+    uint32_t offset;
+
+    // Number of bytes in the row
+    uint32_t n_bytes;
+
+    // Number of spikes to process the row for
+    uint32_t n_spikes;
+
+} dma_row;
+
+//! DMA buffer structure combines the rows read from SDRAM with information
 //! about the read.
 typedef struct dma_buffer {
 
-    // Address in SDRAM to write back plastic region to
-    address_t sdram_writeback_address;
+    // Address in SDRAM that the read started at
+    address_t sdram_address;
 
-    // Key of originating spike
+    // Key of originating spike of the first row
     // (used to allow row data to be re-used for multiple spikes)
     spike_t originating_spike;
 
     // Number of bytes transferred in the read
     uint32_t n_bytes_transferred;
 
+    // Number of rewires to do on the row; a buffer with rewires to do only
+    // ever holds one row
+    uint32_t n_rewires;
+
+    // Number of rows read, which are next to each other in SDRAM
+    uint32_t n_rows;
+
+    // The rows read
+    dma_row rows[MAX_ROWS_PER_DMA];
+
     // Row data
     address_t row;
 
@@ -67,41 +106,40 @@ static uint32_t buffer_being_read;
 
 static uint32_t max_n_words;
 
+// The number of bytes that each DMA buffer can hold
+static uint32_t dma_buffer_n_bytes;
+
 static uint32_t single_fixed_synapse[4];
 
 static volatile uint32_t rewires_to_do = 0;
 
-// The number of rewires to do when the DMA completes.  When a DMA is first set
-// up, only this or dma_n_spikes can be 1 with the other being 0.
-static uint32_t dma_n_rewires;
-
-// The number of spikes to do when the DMA completes.  When a DMA is first set
-// up, only this or dma_n_rewires can be 1 with the other being 0.
-static uint32_t dma_n_spikes;
-
 // The number of successful rewires
 static uint32_t n_successful_rewires = 0;
 
+// The number of reads that transferred more than one row
+static uint32_t n_coalesced_transfers = 0;
+
+// A row found while looking for rows next to those being read, but which
+// wasn't, to be read next
+static bool has_pending_row = false;
+static address_t pending_row_address;
+static size_t pending_n_bytes;
+static spike_t pending_spike;
+
 
 /* PRIVATE FUNCTIONS - static for inlining */
 
-static inline void do_dma_read(
-        address_t row_address, size_t n_bytes_to_transfer, spike_t spike) {
-    // Write the SDRAM address of the plastic region and the
-    // Key of the originating spike to the beginning of DMA buffer
-    dma_buffer *next_buffer = &dma_buffers[next_buffer_to_fill];
-    next_buffer->sdram_writeback_address = row_address;
-    next_buffer->originating_spike = spike;
-    next_buffer->n_bytes_transferred = n_bytes_to_transfer;
-
-    // Start a DMA transfer to fetch this synaptic row into current
-    // buffer
+static inline void do_dma_read(dma_buffer *next_buffer) {
+    // Start a DMA transfer to fetch the rows into the buffer
     buffer_being_read = next_buffer_to_fill;
     while (!spin1_dma_transfer(
-            DMA_TAG_READ_SYNAPTIC_ROW, row_address, next_buffer->row, DMA_READ,
-            n_bytes_to_transfer)) {
+            DMA_TAG_READ_SYNAPTIC_ROW, next_buffer->sdram_address,
+            next_buffer->row, DMA_READ, next_buffer->n_bytes_transferred)) {
         // Do Nothing
     }
+    if (next_buffer->n_rows > 1) {
+        n_coalesced_transfers++;
+    }
     next_buffer_to_fill = (next_buffer_to_fill + 1) % N_DMA_BUFFERS;
 }
 
@@ -113,48 +151,70 @@ static inline void do_direct_row(address_t row_address) {
     synapses_process_synaptic_row(time, single_fixed_synapse, &write_back);
 }
 
-// Check if there is anything to do - if not, DMA is not busy
-static inline bool is_something_to_do(
+// Get the next row to be read for a spike, without rewiring.  If there is
+// none, this returns with interrupts disabled, so that the caller can act on
+// there being none before another spike arrives, and then restore them.
+static inline bool get_next_spike_row(
         address_t *row_address, size_t *n_bytes_to_transfer,
-        spike_t *spike, uint32_t *n_rewire, uint32_t *n_process_spike) {
-    // Disable interrupts here as dma_busy modification is a critical section
-    uint cpsr = spin1_int_disable();
-
-    // Check for synaptic rewiring
-    while (rewires_to_do) {
-        rewires_to_do--;
-        spin1_mode_restore(cpsr);
-        if (synaptogenesis_dynamics_rewire(time, spike, row_address,
-                n_bytes_to_transfer)) {
-            *n_rewire += 1;
-            return true;
-        }
-        cpsr = spin1_int_disable();
+        spike_t *spike, uint *cpsr) {
+    // Is there a row left over from looking for rows to read together?
+    if (has_pending_row) {
+        has_pending_row = false;
+        *row_address = pending_row_address;
+        *n_bytes_to_transfer = pending_n_bytes;
+        *spike = pending_spike;
+        return true;
     }
 
     // Is there another address in the population table?
-    spin1_mode_restore(cpsr);
     if (population_table_get_next_address(
             spike, row_address, n_bytes_to_transfer)) {
-        *n_process_spike += 1;
         return true;
     }
-    cpsr = spin1_int_disable();
+
     // Are there any more spikes to process?
+    *cpsr = spin1_int_disable();
     while (in_spikes_get_next_spike(spike)) {
         // Enable interrupts while looking up in the master pop table,
         // as this can be slow
-        spin1_mode_restore(cpsr);
+        spin1_mode_restore(*cpsr);
         if (population_table_get_first_address(
                 *spike, row_address, n_bytes_to_transfer)) {
             synaptogenesis_spike_received(time, *spike);
-            *n_process_spike += 1;
             return true;
         }
 
         // Disable interrupts before checking if there is another spike
+        *cpsr = spin1_int_disable();
+    }
+    return false;
+}
+
+// Check if there is anything to do - if not, DMA is not busy
+static inline bool is_something_to_do(
+        address_t *row_address, size_t *n_bytes_to_transfer,
+        spike_t *spike, bool *is_rewire) {
+    // Disable interrupts here as dma_busy modification is a critical section
+    uint cpsr = spin1_int_disable();
+
+    // Check for synaptic rewiring
+    while (rewires_to_do) {
+        rewires_to_do--;
+        spin1_mode_restore(cpsr);
+        if (synaptogenesis_dynamics_rewire(time, spike, row_address,
+                n_bytes_to_transfer)) {
+            *is_rewire = true;
+            return true;
+        }
         cpsr = spin1_int_disable();
     }
+    spin1_mode_restore(cpsr);
+
+    // Is there a row to read for a spike?
+    *is_rewire = false;
+    if (get_next_spike_row(row_address, n_bytes_to_transfer, spike, &cpsr)) {
+        return true;
+    }
 
     // If nothing to do, the DMA is not busy
     dma_busy = false;
@@ -164,60 +224,133 @@ static inline bool is_something_to_do(
     return false;
 }
 
-// Set up a new synaptic DMA read.  If a current_buffer is passed in, any spike
-// found that matches the originating spike of the buffer will increment a
-// count, and the DMA of that row will be skipped.  The number of times a row
-// should be rewired and the number of times synaptic processing should be
-// done on a row is returned.
-static void setup_synaptic_dma_read(dma_buffer *current_buffer,
-        uint32_t *n_rewires, uint32_t *n_synapse_processes) {
+// Find a row in a buffer that has been read, and count another use of it if
+// found, returning whether it was.  A rewire can only use a buffer with only
+// the one row, as the whole buffer is then written back.
+static inline bool reuse_row(
+        dma_buffer *buffer, address_t row_address, bool is_rewire) {
+    if (is_rewire) {
+        if (buffer->n_rows == 1 &&
+                buffer->rows[0].sdram_address == row_address) {
+            buffer->n_rewires++;
+            return true;
+        }
+        return false;
+    }
+    for (uint32_t i = 0; i < buffer->n_rows; i++) {
+        if (buffer->rows[i].sdram_address == row_address) {
+            buffer->rows[i].n_spikes++;
+            return true;
+        }
+    }
+    return false;
+}
+
+// Add a row that follows on from those already in a buffer to the buffer
+static inline void add_row(
+        dma_buffer *buffer, address_t row_address, size_t n_bytes) {
+    dma_row *row = &buffer->rows[buffer->n_rows++];
+    row->sdram_address = row_address;
+    row->offset = buffer->n_bytes_transferred >> 2;
+    row->n_bytes = n_bytes;
+    row->n_spikes = 1;
+    buffer->n_bytes_transferred += n_bytes;
+}
+
+// Add the rows of spikes already received that follow on in SDRAM from those
+// in the buffer to be read, so that they are read together.  Rows that are
+// in the current buffer or in DTCM are dealt with as they are found; the first
+// other row is kept to be read next.
+static inline void add_following_rows(
+        dma_buffer *current_buffer, dma_buffer *next_buffer) {
+    address_t row_address;
+    size_t n_bytes_to_transfer;
+    spike_t spike;
+    uint cpsr;
+    while (next_buffer->n_rows < MAX_ROWS_PER_DMA) {
+        if (!get_next_spike_row(
+                &row_address, &n_bytes_to_transfer, &spike, &cpsr)) {
+            spin1_mode_restore(cpsr);
+            return;
+        }
+        dma_row *last_row = &next_buffer->rows[next_buffer->n_rows - 1];
+        if (row_address == last_row->sdram_address) {
+            last_row->n_spikes++;
+        } else if (current_buffer != NULL &&
+                reuse_row(current_buffer, row_address, false)) {
+            continue;
+        } else if (n_bytes_to_transfer == 0) {
+            do_direct_row(row_address);
+        } else if (row_address == (address_t) (
+                    (uint32_t) next_buffer->sdram_address +
+                    next_buffer->n_bytes_transferred) &&
+                next_buffer->n_bytes_transferred + n_bytes_to_transfer <=
+                    dma_buffer_n_bytes) {
+            add_row(next_buffer, row_address, n_bytes_to_transfer);
+        } else {
+            has_pending_row = true;
+            pending_row_address = row_address;
+            pending_n_bytes = n_bytes_to_transfer;
+            pending_spike = spike;
+            return;
+        }
+    }
+}
+
+// Set up a new synaptic DMA read.  If a current_buffer is passed in, any row
+// found that is in that buffer is counted against the row there, and the DMA
+// of that row will be skipped.
+static void setup_synaptic_dma_read(dma_buffer *current_buffer) {
 
     // Set up to store the DMA location and size to read
     address_t row_address;
     size_t n_bytes_to_transfer;
     spike_t spike;
-    dma_n_spikes = 0;
-    dma_n_rewires = 0;
+    bool is_rewire;
 
     // Keep looking if there is something to do until a DMA can be done
-    bool setup_done = false;
-    while (!setup_done && is_something_to_do(&row_address,
-            &n_bytes_to_transfer, &spike, &dma_n_rewires, &dma_n_spikes)) {
+    while (is_something_to_do(&row_address,
+            &n_bytes_to_transfer, &spike, &is_rewire)) {
         if (current_buffer != NULL &&
-                current_buffer->sdram_writeback_address == row_address) {
-            // If we can reuse the row, add on what we can use it for
-            // Note that only one of these will have a value of 1 with the
-            // other being set to 0, but we add both as it is simple
-            *n_rewires += dma_n_rewires;
-            *n_synapse_processes += dma_n_spikes;
-            dma_n_rewires = 0;
-            dma_n_spikes = 0;
+                reuse_row(current_buffer, row_address, is_rewire)) {
+            // The row has been read already, and is counted there
+            continue;
         } else if (n_bytes_to_transfer == 0) {
             // If the row is in DTCM, process the row now
             do_direct_row(row_address);
-            dma_n_rewires = 0;
-            dma_n_spikes = 0;
         } else {
-            // If the row is in SDRAM, set up the transfer and we are done
-            do_dma_read(row_address, n_bytes_to_transfer, spike);
-            setup_done = true;
+            // If the row is in SDRAM, set up the transfer, with any rows
+            // that follow on from it, and we are done
+            dma_buffer *next_buffer = &dma_buffers[next_buffer_to_fill];
+            next_buffer->sdram_address = row_address;
+            next_buffer->originating_spike = spike;
+            next_buffer->n_bytes_transferred = 0;
+            next_buffer->n_rows = 0;
+            add_row(next_buffer, row_address, n_bytes_to_transfer);
+            if (is_rewire) {
+                next_buffer->rows[0].n_spikes = 0;
+                next_buffer->n_rewires = 1;
+            } else {
+                next_buffer->n_rewires = 0;
+                add_following_rows(current_buffer, next_buffer);
+            }
+            do_dma_read(next_buffer);
+            return;
         }
     }
 }
 
 static inline void setup_synaptic_dma_write(
-        uint32_t dma_buffer_index, bool plastic_only) {
-
-    // Get pointer to current buffer
-    dma_buffer *buffer = &dma_buffers[dma_buffer_index];
+        dma_buffer *buffer, dma_row *row, bool plastic_only) {
 
     // Get the number of plastic bytes and the write back address from the
     // synaptic row
-    size_t write_size = buffer->n_bytes_transferred;
-    address_t sdram_start_address = buffer->sdram_writeback_address;
-    address_t dtcm_start_address = buffer->row;
+    size_t write_size = row->n_bytes;
+    address_t sdram_start_address = row->sdram_address;
+    address_t dtcm_start_address = &buffer->row[row->offset];
     if (plastic_only) {
-        write_size = synapse_row_plastic_size(buffer->row) * sizeof(uint32_t);
+        write_size = synapse_row_plastic_size(dtcm_start_address) *
+                sizeof(uint32_t);
         sdram_start_address = synapse_row_plastic_region(sdram_start_address);
         dtcm_start_address = synapse_row_plastic_region(dtcm_start_address);
     }
@@ -265,58 +398,58 @@ static void dma_complete_callback(uint unused, uint tag) {
     uint32_t current_buffer_index = buffer_being_read;
     dma_buffer *current_buffer = &dma_buffers[current_buffer_index];
 
-    // Start the next DMA transfer and get a count of the rewires and spikes
-    // that can be done on this row now (there might be more while the DMA
-    // was in progress).  Note that either dma_n_rewires or dma_n_spikes is set
-    // to 1 here, with the other being 0.  We take a copy of the count and this
-    // is the value added to for this processing, as setup_synaptic_dma will
-    // count repeats of the current spike
-    uint32_t n_rewires = dma_n_rewires;
-    uint32_t n_spikes = dma_n_spikes;
-    setup_synaptic_dma_read(current_buffer, &n_rewires, &n_spikes);
-
-    // Assume no write back but assume any write back is plastic only
-    bool write_back = false;
-    bool plastic_only = true;
-
-    // If rewiring, do rewiring first
-    for (uint32_t i = 0; i < n_rewires; i++) {
+    // Start the next DMA transfer, counting any rewires and spikes that can
+    // be done on the rows of this buffer now (there might be more while the
+    // DMA was in progress)
+    setup_synaptic_dma_read(current_buffer);
+
+    // If rewiring, do rewiring first; the buffer then has only one row
+    bool rewired = false;
+    for (uint32_t i = 0; i < current_buffer->n_rewires; i++) {
         if (synaptogenesis_row_restructure(time, current_buffer->row)) {
-            write_back = true;
-            plastic_only = false;
+            rewired = true;
             n_successful_rewires++;
         }
     }
-
-    // Process synaptic row repeatedly for any upcoming spikes
-    while (n_spikes > 0) {
-
-        // Process synaptic row, writing it back if it's the last time
-        // it's going to be processed
-        bool write_back_now = false;
-        if (!synapses_process_synaptic_row(
-                time, current_buffer->row, &write_back_now)) {
-            log_error(
-                    "Error processing spike 0x%.8x for address 0x%.8x"
-                    " (local=0x%.8x)",
-                    current_buffer->originating_spike,
-                    current_buffer->sdram_writeback_address,
-                    current_buffer->row);
-
-            // Print out the row for debugging
-            for (uint32_t i = 0;
-                    i < (current_buffer->n_bytes_transferred >> 2); i++) {
-                log_error("%u: 0x%.8x", i, current_buffer->row[i]);
+    current_buffer->n_rewires = 0;
+
+    for (uint32_t r = 0; r < current_buffer->n_rows; r++) {
+        dma_row *row = &current_buffer->rows[r];
+        synaptic_row_t row_data = &current_buffer->row[row->offset];
+
+        // Assume no write back but assume any write back is plastic only
+        bool write_back = rewired;
+        bool plastic_only = !rewired;
+        rewired = false;
+
+        // Process synaptic row repeatedly for any upcoming spikes
+        while (row->n_spikes > 0) {
+
+            // Process synaptic row, writing it back if it's the last time
+            // it's going to be processed
+            bool write_back_now = false;
+            if (!synapses_process_synaptic_row(
+                    time, row_data, &write_back_now)) {
+                log_error(
+                        "Error processing spike 0x%.8x for address 0x%.8x"
+                        " (local=0x%.8x)",
+                        current_buffer->originating_spike,
+                        row->sdram_address, row_data);
+
+                // Print out the row for debugging
+                for (uint32_t i = 0; i < (row->n_bytes >> 2); i++) {
+                    log_error("%u: 0x%.8x", i, row_data[i]);
+                }
+                rt_error(RTE_SWERR);
             }
-            rt_error(RTE_SWERR);
-        }
 
-        write_back |= write_back_now;
-        n_spikes--;
-    }
+            write_back |= write_back_now;
+            row->n_spikes--;
+        }
 
-    if (write_back) {
-        setup_synaptic_dma_write(current_buffer_index, plastic_only);
+        if (write_back) {
+            setup_synaptic_dma_write(current_buffer, row, plastic_only);
+        }
     }
 }
 
@@ -325,18 +458,20 @@ void user_event_callback(uint unused0, uint unused1) {
     use(unused0);
     use(unused1);
 
-    // Reset the counters as this is a new process
-    dma_n_rewires = 0;
-    dma_n_spikes = 0;
-
     if (buffer_being_read < N_DMA_BUFFERS) {
         // If the DMA buffer is full of valid data, attempt to reuse it on the
         // next data to be used, as this might be able to make use of the buffer
-        // without transferring data
+        // without transferring data; it has been processed already, so there
+        // is nothing more to do for it yet
+        dma_buffer *buffer = &dma_buffers[buffer_being_read];
+        buffer->n_rewires = 0;
+        for (uint32_t r = 0; r < buffer->n_rows; r++) {
+            buffer->rows[r].n_spikes = 0;
+        }
         dma_complete_callback(0, DMA_TAG_READ_SYNAPTIC_ROW);
     } else {
         // If the DMA buffer is invalid, just do the first transfer possible
-        setup_synaptic_dma_read(NULL, NULL, NULL);
+        setup_synaptic_dma_read(NULL);
     }
 }
 
@@ -345,13 +480,25 @@ void user_event_callback(uint unused0, uint unused1) {
 bool spike_processing_initialise( // EXPORTED
         size_t row_max_n_words, uint mc_packet_callback_priority,
         uint user_event_priority, uint incoming_spike_buffer_size) {
-    // Allocate the DMA buffers
+    // Allocate the DMA buffers, with room for several short rows if rows
+    // are to be read together, or just the longest row if there isn't space
+    uint32_t buffer_n_words = row_max_n_words;
+    if (MAX_ROWS_PER_DMA > 1 && buffer_n_words < MIN_DMA_BUFFER_N_WORDS) {
+        buffer_n_words = MIN_DMA_BUFFER_N_WORDS;
+    }
     for (uint32_t i = 0; i < N_DMA_BUFFERS; i++) {
-        dma_buffers[i].row = spin1_malloc(row_max_n_words * sizeof(uint32_t));
+        dma_buffers[i].row = spin1_malloc(buffer_n_words * sizeof(uint32_t));
+        if (dma_buffers[i].row == NULL && buffer_n_words > row_max_n_words) {
+            buffer_n_words = row_max_n_words;
+            dma_buffers[i].row = spin1_malloc(
+                    buffer_n_words * sizeof(uint32_t));
+        }
         if (dma_buffers[i].row == NULL) {
             log_error("Could not initialise DMA buffers");
             return false;
         }
+        dma_buffers[i].n_rows = 0;
+        dma_buffers[i].n_rewires = 0;
         log_debug("DMA buffer %u allocated at 0x%08x",
                 i, dma_buffers[i].row);
     }
@@ -359,6 +506,8 @@ bool spike_processing_initialise( // EXPORTED
     next_buffer_to_fill = 0;
     buffer_being_read = N_DMA_BUFFERS;
     max_n_words = row_max_n_words;
+    dma_buffer_n_bytes = buffer_n_words * sizeof(uint32_t);
+    has_pending_row = false;
 
     // Allocate incoming spike buffer
     if (!in_spikes_initialize_spike_buffer(incoming_spike_buffer_size)) {
@@ -400,6 +549,12 @@ uint32_t spike_processing_get_successful_rewires(void) { // EXPORTED
     return n_successful_rewires;
 }
 
+//! \brief returns the number of DMA reads that read more than one row
+//! \return the number of reads of more than one row
+uint32_t spike_processing_get_n_coalesced_transfers(void) { // EXPORTED
+    return n_coalesced_transfers;
+}
+
 //! \brief set the number of times spike_processing has to attempt rewiring
 //! \return bool: currently, always true
 bool spike_processing_do_rewiring(int number_of_rewires) {
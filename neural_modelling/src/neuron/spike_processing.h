@@ -34,6 +34,10 @@ uint32_t spike_processing_get_buffer_overflows(void);
 //! \return the number of successful rewires
 uint32_t spike_processing_get_successful_rewires(void);
 
+//! \brief returns the number of DMA reads that read more than one row
+//! \return the number of reads of more than one row
+uint32_t spike_processing_get_n_coalesced_transfers(void);
+
 //! \brief set the number of times spike_processing has to attempt rewiring
 //! \return bool: currently, always true
 bool spike_processing_do_rewiring(int number_of_rew);
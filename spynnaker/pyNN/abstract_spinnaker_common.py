@@ -29,11 +29,14 @@ from spinn_front_end_common.utility_models import CommandSender
 from spinn_front_end_common.utilities.utility_objs import ExecutableFinder
 from spinn_front_end_common.utilities import globals_variables
 from spynnaker.pyNN.models.utility_models import synapse_expander
+from spynnaker.pyNN.models.neuron.synaptic_block_cache import (
+    SynapticBlockCache)
 from spynnaker.pyNN import overridden_pacman_functions, model_binaries
-from spynnaker.pyNN.utilities import constants
+from spynnaker.pyNN.utilities import constants, host_profiler
 from spynnaker.pyNN.spynnaker_simulator_interface import (
     SpynnakerSimulatorInterface)
 from spynnaker.pyNN.utilities.extracted_data import ExtractedData
+from spynnaker.pyNN.utilities.reference_engine import ReferenceEngine
 from spynnaker import __version__ as version
 
 logger = FormatAdapter(logging.getLogger(__name__))
@@ -46,11 +49,15 @@ class AbstractSpiNNakerCommon(with_metaclass(
     __slots__ = [
         "__command_edge_count",
         "__edge_count",
+        "__edges_by_vertices",
         "__id_counter",
         "__live_spike_recorder",
         "__max_delay",
         "__min_delay",
         "__neurons_per_core_set",
+        "__reference_engine",
+        "__synaptic_block_cache",
+        "__write_host_profile",
         "_populations",
         "_projections"]
 
@@ -77,6 +84,10 @@ class AbstractSpiNNakerCommon(with_metaclass(
         self.__edge_count = 0
         self.__id_counter = 0
 
+        # index of application edges by (pre_vertex, post_vertex), so that
+        # projections can find edges to merge with without scanning the graph
+        self.__edges_by_vertices = dict()
+
         # the number of edges that are associated with commands being sent to
         # a vertex
         self.__command_edge_count = 0
@@ -100,6 +111,9 @@ class AbstractSpiNNakerCommon(with_metaclass(
 
         self.__neurons_per_core_set = set()
 
+        # host simulation of runs on a virtual board, if enabled
+        self.__reference_engine = None
+
         versions = [("sPyNNaker", version)]
         if front_end_versions is not None:
             versions.extend(front_end_versions)
@@ -141,16 +155,34 @@ class AbstractSpiNNakerCommon(with_metaclass(
 
         if self.config.getboolean("Reports", "reports_enabled"):
             if self.config.getboolean("Reports", "write_synaptic_report"):
-                extra_algorithms_pre_run.append("SynapticMatrixReport")
+                if self.config.getboolean(
+                        "Reports", "write_synaptic_report_as_binary"):
+                    extra_algorithms_pre_run.append(
+                        "SynapticMatrixBinaryReport")
+                else:
+                    extra_algorithms_pre_run.append("SynapticMatrixReport")
         if user_extra_algorithms_pre_run is not None:
             extra_algorithms_pre_run.extend(user_extra_algorithms_pre_run)
 
+        # Profile the host-side phases into the report folder, if requested
+        self.__write_host_profile = (
+            self.config.getboolean("Reports", "reports_enabled") and
+            self.config.getboolean("Reports", "write_host_profile"))
+        if self.__write_host_profile:
+            host_profiler.clear()
+            host_profiler.enable(self.config.getboolean(
+                "Reports", "host_profile_trace_memory"))
+
         self.update_extra_mapping_inputs(extra_mapping_inputs)
         self.extend_extra_mapping_algorithms(extra_mapping_algorithms)
         self.prepend_extra_pre_run_algorithms(extra_algorithms_pre_run)
         self.extend_extra_post_run_algorithms(extra_post_run_algorithms)
         self.extend_extra_load_algorithms(extra_load_algorithms)
 
+        # The synaptic blocks generated on the host for all the populations
+        self.__synaptic_block_cache = SynapticBlockCache(self.config.getint(
+            "Simulation", "synaptic_block_cache_bytes"))
+
         # set up machine targeted data
         self._set_up_timings(
             timestep, min_delay, max_delay, self.config, time_scale_factor)
@@ -293,6 +325,29 @@ class AbstractSpiNNakerCommon(with_metaclass(
 
         AbstractSpinnakerBase.add_application_vertex(self, vertex)
 
+    def add_application_edge(self, edge_to_add, partition_identifier):
+        AbstractSpinnakerBase.add_application_edge(
+            self, edge_to_add, partition_identifier)
+
+        # Only the first edge between a pair of vertices is indexed, as that
+        # is the one that any later projections will be merged into
+        self.__edges_by_vertices.setdefault(
+            (edge_to_add.pre_vertex, edge_to_add.post_vertex), edge_to_add)
+
+    def get_application_edge_between(self, pre_vertex, post_vertex):
+        """ Get the application edge that goes from one vertex to another.
+
+        :param pre_vertex: The source vertex of the edge
+        :type pre_vertex: \
+            pacman.model.graph.application.ApplicationVertex
+        :param post_vertex: The destination vertex of the edge
+        :type post_vertex: \
+            pacman.model.graph.application.ApplicationVertex
+        :return: The edge, or None if there is no such edge
+        :rtype: pacman.model.graph.application.ApplicationEdge or None
+        """
+        return self.__edges_by_vertices.get((pre_vertex, post_vertex))
+
     @staticmethod
     def _count_unique_keys(commands):
         unique_keys = {command.key for command in commands}
@@ -327,6 +382,11 @@ class AbstractSpiNNakerCommon(with_metaclass(
         for population in self._populations:
             population._end()
 
+        if self.__write_host_profile:
+            host_profiler.write_profile(self._report_default_directory)
+            host_profiler.disable()
+        self.__synaptic_block_cache.clear()
+
         super(AbstractSpiNNakerCommon, self).stop(
             turn_off_machine, clear_routing_tables, clear_tags)
         self.reset_number_of_neurons_per_core()
@@ -344,6 +404,39 @@ class AbstractSpiNNakerCommon(with_metaclass(
         for projection in self._projections:
             projection._clear_cache()
         super(AbstractSpiNNakerCommon, self).run(run_time)
+        if run_time is not None and self.use_virtual_board and \
+                self.config.getboolean(
+                    "Simulation", "run_reference_engine_on_virtual_board"):
+            if self.__reference_engine is None:
+                self.__reference_engine = ReferenceEngine(
+                    self._populations, self._projections,
+                    self.machine_time_step)
+            self.__reference_engine.run(self.no_machine_time_steps)
+        if self.__write_host_profile:
+            host_profiler.write_profile(self._report_default_directory)
+
+    def reset(self):
+        # The state of the host simulation starts again from the parameters
+        self.__reference_engine = None
+        super(AbstractSpiNNakerCommon, self).reset()
+
+    @property
+    def synaptic_block_cache(self):
+        """ The synaptic blocks generated on the host, shared by all the\
+            populations within one limit on their total size
+
+        :rtype: SynapticBlockCache
+        """
+        return self.__synaptic_block_cache
+
+    @property
+    def reference_engine(self):
+        """ The host simulation of the runs on a virtual board, or None if\
+            there is none
+
+        :rtype: ReferenceEngine or None
+        """
+        return self.__reference_engine
 
     @staticmethod
     def register_binary_search_path(search_path):
@@ -13,13 +13,17 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from .coalescing_command_queue import CoalescingCommandQueue
 from .ethernet_command_connection import EthernetCommandConnection
 from .ethernet_control_connection import EthernetControlConnection
 from .spynnaker_live_spikes_connection import SpynnakerLiveSpikesConnection
+from .spike_injection_queue import SpikeInjectionQueue
+from .spike_ring_buffer import SpikeRingBuffer
 from .spynnaker_poisson_control_connection import (
     SpynnakerPoissonControlConnection)
 
 __all__ = [
-    "EthernetCommandConnection", "EthernetControlConnection",
+    "CoalescingCommandQueue", "EthernetCommandConnection",
+    "EthernetControlConnection", "SpikeInjectionQueue", "SpikeRingBuffer",
     "SpynnakerLiveSpikesConnection", "SpynnakerPoissonControlConnection"
 ]
@@ -0,0 +1,157 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import itertools
+import logging
+from collections import OrderedDict
+from threading import Condition, Thread
+import time
+from timeit import default_timer
+from spinn_utilities.log import FormatAdapter
+from spynnaker.pyNN.exceptions import SpynnakerException
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+
+class CoalescingCommandQueue(object):
+    """ Sends commands to a device from a thread of its own, so that adding\
+        a command doesn't wait for it to be sent.  A command added while an\
+        earlier command with the same ID is still waiting to be sent replaces\
+        it, so that only the latest value of a setting (such as the speed of\
+        a motor) is sent when commands are added faster than they can be\
+        sent.  Commands are otherwise sent in the order they were added.
+    """
+    __slots__ = [
+        "__closed",
+        "__condition",
+        "__n_sending",
+        "__pending",
+        "__send",
+        "__thread",
+        "__unique_ids"]
+
+    def __init__(self, send):
+        """
+        :param callable send:
+            Called with each message of each command to send it to the device
+        """
+        self.__send = send
+        self.__condition = Condition()
+        self.__pending = OrderedDict()
+        self.__n_sending = 0
+        self.__closed = False
+        self.__unique_ids = itertools.count()
+        self.__thread = Thread(
+            target=self.__run, name="Coalescing command queue thread")
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    @property
+    def n_pending(self):
+        """ The number of commands added that have not yet been sent
+
+        :rtype: int
+        """
+        with self.__condition:
+            return len(self.__pending) + self.__n_sending
+
+    def put(self, command_id, messages, delay_after=0.0):
+        """ Add a command to be sent
+
+        :param command_id:
+            The ID of the command, which replaces any command with the same\
+            ID that is still waiting to be sent, or None if the command must\
+            not be replaced
+        :type command_id: object or None
+        :param list messages: The messages that make up the command
+        :param float delay_after:
+            The time in seconds to wait after sending the command before\
+            sending the next one
+        """
+        with self.__condition:
+            if self.__closed:
+                raise SpynnakerException("The command queue is closed")
+            if command_id is None:
+                command_id = (None, next(self.__unique_ids))
+            else:
+                # The replacement goes where a new command would, so that it
+                # is still sent after the commands added before it
+                self.__pending.pop(command_id, None)
+            self.__pending[command_id] = (list(messages), delay_after)
+            self.__condition.notify_all()
+
+    def flush(self, timeout=None):
+        """ Wait for the commands added so far to be sent
+
+        :param timeout:
+            The most time in seconds to wait, or None to wait for as long as\
+            it takes
+        :type timeout: float or None
+        :return: Whether all the commands were sent in time
+        :rtype: bool
+        """
+        with self.__condition:
+            deadline = None
+            if timeout is not None:
+                deadline = default_timer() + timeout
+            while self.__pending or self.__n_sending:
+                if deadline is None:
+                    self.__condition.wait()
+                else:
+                    remaining = deadline - default_timer()
+                    if remaining <= 0:
+                        return False
+                    self.__condition.wait(remaining)
+            return True
+
+    def close(self):
+        """ Send the commands still waiting and stop the sending thread
+        """
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+        self.__thread.join()
+
+    def __take_next(self):
+        """ Wait for a command to send, and take it out of the queue
+
+        :return: The command to send, or None if the queue is closed and\
+            there is nothing left to send
+        :rtype: tuple(object, tuple(list, float)) or None
+        """
+        with self.__condition:
+            while not self.__pending and not self.__closed:
+                self.__condition.wait()
+            if not self.__pending:
+                return None
+            self.__n_sending += 1
+            return self.__pending.popitem(last=False)
+
+    def __run(self):
+        while True:
+            command = self.__take_next()
+            if command is None:
+                return
+            command_id, (messages, delay_after) = command
+            try:
+                for message in messages:
+                    self.__send(message)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Failed to send command {}", command_id)
+            if delay_after:
+                time.sleep(delay_after)
+            with self.__condition:
+                self.__n_sending -= 1
+                self.__condition.notify_all()
@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from spinn_utilities.overrides import overrides
 from spinn_front_end_common.abstract_models import (
     AbstractSendMeMulticastCommandsVertex)
 from spinn_front_end_common.utilities.constants import NOTIFY_PORT
@@ -84,3 +85,11 @@ class EthernetCommandConnection(DatabaseConnection):
         for command_container in self.__command_containers:
             for command in command_container.pause_stop_commands:
                 self.__translator.translate_control_packet(command)
+
+        # The commands have to reach the device before the simulation stops
+        self.__translator.close()
+
+    @overrides(DatabaseConnection.close)
+    def close(self):
+        super(EthernetCommandConnection, self).close()
+        self.__translator.close()
@@ -14,6 +14,8 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import logging
+import numpy
+from spinn_utilities.overrides import overrides
 from spinn_front_end_common.utility_models import MultiCastCommand
 from spinn_front_end_common.utilities.connections import LiveEventConnection
 
@@ -47,8 +49,22 @@ class EthernetControlConnection(LiveEventConnection):
         self.add_receive_callback(label, self._translate, translate_key=False)
 
     def _translate(self, label, key, payload=None):
+        """ Translate the packets received for a label; a packet with a time\
+            comes as the time with a list of the keys received at that time,\
+            which are translated together, and any other packet comes as a\
+            key with an optional payload.
+        """
         translator = self.__translators[label]
-        if payload is None:
+        if isinstance(payload, (list, tuple, numpy.ndarray)):
+            translator.translate_control_packets(
+                [MultiCastCommand(batch_key) for batch_key in payload])
+        elif payload is None:
             translator.translate_control_packet(MultiCastCommand(key))
         else:
             translator.translate_control_packet(MultiCastCommand(key, payload))
+
+    @overrides(LiveEventConnection.close)
+    def close(self):
+        super(EthernetControlConnection, self).close()
+        for translator in self.__translators.values():
+            translator.close()
@@ -0,0 +1,52 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Adding spikes to a :py:class:`SpikeInjectionQueue` from\
+    :py:mod:`asyncio` code.
+"""
+
+import functools
+from six.moves.queue import Full
+
+
+def put_spikes_async(queue, label, neuron_ids, payloads=None, loop=None):
+    """ Add spikes to be sent, waiting for room for them without blocking\
+        the event loop
+
+    :param SpikeInjectionQueue queue: The queue to add the spikes to
+    :param str label:
+        The label of the population from which the spikes will originate
+    :param ~numpy.ndarray neuron_ids:
+        array-like of neuron IDs sending spikes
+    :param payloads:
+        array-like of a 32-bit payload for each spike, or None to send\
+        the spikes without payloads
+    :type payloads: ~numpy.ndarray or None
+    :param loop: The event loop, or None for the current event loop
+    :return: A future that is done when the spikes have been added
+    :rtype: ~asyncio.Future
+    """
+    # Only available on Python 3
+    import asyncio
+    if loop is None:
+        loop = asyncio.get_event_loop()
+    try:
+        queue.put_nowait(label, neuron_ids, payloads)
+    except Full:
+        return loop.run_in_executor(None, functools.partial(
+            queue.put, label, neuron_ids, payloads))
+    future = loop.create_future()
+    future.set_result(None)
+    return future
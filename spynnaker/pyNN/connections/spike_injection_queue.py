@@ -0,0 +1,266 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+from collections import OrderedDict
+from threading import Condition, Thread
+from timeit import default_timer
+import numpy
+from six.moves.queue import Full
+from spinn_utilities.log import FormatAdapter
+from spynnaker.pyNN.exceptions import SpynnakerException
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+
+class _Batch(object):
+    """ The spikes waiting to be sent to one label
+    """
+    __slots__ = ["deadline", "neuron_ids", "payloads", "n_spikes"]
+
+    def __init__(self, deadline):
+        self.deadline = deadline
+        self.neuron_ids = list()
+        self.payloads = list()
+        self.n_spikes = 0
+
+
+class SpikeInjectionQueue(object):
+    """ Sends spikes through a :py:class:`SpynnakerLiveSpikesConnection`\
+        from a thread of its own, so that adding spikes doesn't wait for them\
+        to be sent.  The spikes added to each label within a batching window\
+        are sent together, in as few packets as possible.  When too many\
+        spikes are waiting to be sent, adding more waits until there is room\
+        for them.
+    """
+    __slots__ = [
+        "__batch_window",
+        "__batches",
+        "__closed",
+        "__condition",
+        "__connection",
+        "__max_pending_spikes",
+        "__n_flushes",
+        "__n_pending",
+        "__send_full_keys",
+        "__thread"]
+
+    def __init__(
+            self, connection, batch_window=0.001, max_pending_spikes=1000000,
+            send_full_keys=False):
+        """
+        :param SpynnakerLiveSpikesConnection connection:
+            The connection to send the spikes through
+        :param float batch_window:
+            The time in seconds to wait for more spikes for a label after the\
+            first spike is added, before sending them
+        :param int max_pending_spikes:
+            The most spikes that can be waiting to be sent before adding more\
+            has to wait
+        :param bool send_full_keys: Determines whether to send full 32-bit
+            keys, getting the key for each neuron from the database, or
+            whether to send 16-bit neuron IDs directly
+        """
+        self.__connection = connection
+        self.__batch_window = batch_window
+        self.__max_pending_spikes = max_pending_spikes
+        self.__send_full_keys = send_full_keys
+        self.__condition = Condition()
+        self.__batches = OrderedDict()
+        self.__n_pending = 0
+        self.__n_flushes = 0
+        self.__closed = False
+        self.__thread = Thread(
+            target=self.__run, name="Spike injection queue thread")
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    @property
+    def n_pending(self):
+        """ The number of spikes added that have not yet been sent
+
+        :rtype: int
+        """
+        with self.__condition:
+            return self.__n_pending
+
+    def put(self, label, neuron_ids, payloads=None, block=True, timeout=None):
+        """ Add spikes to be sent
+
+        :param str label:
+            The label of the population from which the spikes will originate
+        :param ~numpy.ndarray neuron_ids:
+            array-like of neuron IDs sending spikes
+        :param payloads:
+            array-like of a 32-bit payload for each spike, or None to send\
+            the spikes without payloads
+        :type payloads: ~numpy.ndarray or None
+        :param bool block:
+            Whether to wait for room for the spikes if too many are waiting\
+            to be sent; if not, :py:class:`queue.Full` is raised instead
+        :param timeout:
+            The most time in seconds to wait for room, or None to wait for\
+            as long as it takes
+        :type timeout: float or None
+        :raise queue.Full: If there isn't room for the spikes in time
+        """
+        # Copy so that the caller can reuse their buffers
+        neuron_ids = numpy.array(neuron_ids, dtype="int64").ravel()
+        if payloads is not None:
+            payloads = numpy.array(payloads, dtype="uint32").ravel()
+            if len(payloads) != len(neuron_ids):
+                raise SpynnakerException(
+                    "There are {} payloads for {} spikes".format(
+                        len(payloads), len(neuron_ids)))
+        n_spikes = len(neuron_ids)
+        if not n_spikes:
+            return
+
+        with self.__condition:
+            # Spikes are let in if there is room, or if nothing is waiting,
+            # as otherwise too many spikes at once could never be added
+            deadline = None
+            if timeout is not None:
+                deadline = default_timer() + timeout
+            while not self.__closed and not self.__has_room(n_spikes):
+                if not block:
+                    raise Full()
+                if deadline is None:
+                    self.__condition.wait()
+                else:
+                    remaining = deadline - default_timer()
+                    if remaining <= 0:
+                        raise Full()
+                    self.__condition.wait(remaining)
+            if self.__closed:
+                raise SpynnakerException("The spike injection queue is closed")
+
+            # Spikes with and without payloads are sent in separate packets
+            key = (label, payloads is not None)
+            batch = self.__batches.get(key)
+            if batch is None:
+                batch = _Batch(default_timer() + self.__batch_window)
+                self.__batches[key] = batch
+            batch.neuron_ids.append(neuron_ids)
+            if payloads is not None:
+                batch.payloads.append(payloads)
+            batch.n_spikes += n_spikes
+            self.__n_pending += n_spikes
+            self.__condition.notify_all()
+
+    def put_nowait(self, label, neuron_ids, payloads=None):
+        """ Add spikes to be sent if there is room for them now
+
+        :param str label:
+            The label of the population from which the spikes will originate
+        :param ~numpy.ndarray neuron_ids:
+            array-like of neuron IDs sending spikes
+        :param payloads:
+            array-like of a 32-bit payload for each spike, or None to send\
+            the spikes without payloads
+        :type payloads: ~numpy.ndarray or None
+        :raise queue.Full: If there isn't room for the spikes
+        """
+        self.put(label, neuron_ids, payloads, block=False)
+
+    def flush(self, timeout=None):
+        """ Send the spikes added so far without waiting for the end of\
+            their batching windows, and wait for them to be sent
+
+        :param timeout:
+            The most time in seconds to wait, or None to wait for as long as\
+            it takes
+        :type timeout: float or None
+        :return: Whether all the spikes were sent in time
+        :rtype: bool
+        """
+        with self.__condition:
+            self.__n_flushes += 1
+            self.__condition.notify_all()
+            try:
+                deadline = None
+                if timeout is not None:
+                    deadline = default_timer() + timeout
+                while self.__n_pending:
+                    if deadline is None:
+                        self.__condition.wait()
+                    else:
+                        remaining = deadline - default_timer()
+                        if remaining <= 0:
+                            return False
+                        self.__condition.wait(remaining)
+                return True
+            finally:
+                self.__n_flushes -= 1
+
+    def __has_room(self, n_spikes):
+        return not self.__n_pending or (
+            self.__n_pending + n_spikes <= self.__max_pending_spikes)
+
+    def close(self):
+        """ Send the spikes still waiting and stop the sending thread
+        """
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+        self.__thread.join()
+
+    def __take_ready_batches(self):
+        """ Wait for batches that are ready to be sent, and take them out of\
+            the queue
+
+        :return: The batches to send, or None if the queue is closed and\
+            there is nothing left to send
+        :rtype: list(tuple(tuple(str, bool), _Batch)) or None
+        """
+        with self.__condition:
+            while True:
+                if not self.__batches:
+                    if self.__closed:
+                        return None
+                    self.__condition.wait()
+                    continue
+                now = default_timer()
+                send_all = (
+                    self.__closed or self.__n_flushes or
+                    self.__n_pending >= self.__max_pending_spikes)
+                ready = [
+                    key for key, batch in self.__batches.items()
+                    if send_all or batch.deadline <= now]
+                if ready:
+                    return [(key, self.__batches.pop(key)) for key in ready]
+                self.__condition.wait(min(
+                    batch.deadline for batch in self.__batches.values()) - now)
+
+    def __run(self):
+        while True:
+            batches = self.__take_ready_batches()
+            if batches is None:
+                return
+            for (label, has_payloads), batch in batches:
+                try:
+                    self.__connection.send_spike_array(
+                        label, numpy.concatenate(batch.neuron_ids),
+                        numpy.concatenate(batch.payloads)
+                        if has_payloads else None,
+                        send_full_keys=self.__send_full_keys)
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception(
+                        "Failed to send {} spikes to {}",
+                        batch.n_spikes, label)
+                with self.__condition:
+                    # The spikes take up room until they have been sent
+                    self.__n_pending -= batch.n_spikes
+                    self.__condition.notify_all()
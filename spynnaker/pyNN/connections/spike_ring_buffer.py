@@ -0,0 +1,135 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+
+
+class SpikeRingBuffer(object):
+    """ Keeps the most recent spikes received, as the time step and neuron\
+        ID of each, in arrays allocated up front.
+
+    Each spike is stored twice, half the storage apart, so that any run of\
+    the spikes kept can be returned as a view of the arrays without copying\
+    it.  The views stay valid until the spikes in them are overwritten by\
+    those received after them.
+    """
+
+    __slots__ = [
+        "__capacity",
+        "__max_times",
+        "__n_added",
+        "__neuron_ids",
+        "__times"]
+
+    def __init__(self, capacity):
+        """
+        :param int capacity: The number of spikes to keep
+        """
+        self.__capacity = capacity
+        self.__times = numpy.zeros(capacity * 2, dtype="uint32")
+        self.__neuron_ids = numpy.zeros(capacity * 2, dtype="uint32")
+
+        # The latest time of the spikes up to each one, which increases even
+        # if spikes arrive out of order, so that it can be searched
+        self.__max_times = numpy.zeros(capacity * 2, dtype="int64")
+        self.__n_added = 0
+
+    @property
+    def capacity(self):
+        """ The number of spikes kept
+
+        :rtype: int
+        """
+        return self.__capacity
+
+    @property
+    def n_added(self):
+        """ The number of spikes ever added, which is also the sequence\
+            number of the next spike to be added
+
+        :rtype: int
+        """
+        return self.__n_added
+
+    def add(self, time, neuron_ids):
+        """ Add spikes that happened in one time step
+
+        :param int time: The time step of the spikes
+        :param ~numpy.ndarray neuron_ids: The IDs of the neurons that spiked
+        """
+        neuron_ids = numpy.asarray(neuron_ids)
+        n_spikes = len(neuron_ids)
+        if not n_spikes:
+            return
+        max_time = time
+        if self.__n_added:
+            max_time = max(time, self.__max_times[
+                (self.__n_added - 1) % self.__capacity])
+
+        # Only the last spikes are kept if there are too many
+        if n_spikes > self.__capacity:
+            self.__n_added += n_spikes - self.__capacity
+            neuron_ids = neuron_ids[-self.__capacity:]
+            n_spikes = self.__capacity
+
+        start = self.__n_added % self.__capacity
+        first = min(n_spikes, self.__capacity - start)
+        self.__write(start, 0, first, time, neuron_ids, max_time)
+        self.__write(0, first, n_spikes, time, neuron_ids, max_time)
+        self.__n_added += n_spikes
+
+    def __write(self, index, first, last, time, neuron_ids, max_time):
+        if last <= first:
+            return
+        end = index + last - first
+        for offset in (0, self.__capacity):
+            self.__times[index + offset:end + offset] = time
+            self.__neuron_ids[index + offset:end + offset] = \
+                neuron_ids[first:last]
+            self.__max_times[index + offset:end + offset] = max_time
+
+    def __first_kept(self):
+        return max(0, self.__n_added - self.__capacity)
+
+    def get_from_sequence(self, sequence):
+        """ Get the spikes added from the one with the given sequence number,\
+            or from the oldest kept if that has been overwritten
+
+        :param int sequence: The sequence number of the first spike to get
+        :return: Views of the times and neuron IDs of the spikes
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        sequence = max(sequence, self.__first_kept())
+        start = sequence % self.__capacity
+        end = start + self.__n_added - sequence
+        return self.__times[start:end], self.__neuron_ids[start:end]
+
+    def get_since(self, time):
+        """ Get the spikes added from the first one at or after a time step
+
+        If spikes arrive out of order, a few spikes that arrived after that\
+        one may be from before the time step.
+
+        :param int time: The time step of the first spike to get
+        :return: Views of the times and neuron IDs of the spikes
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        first = self.__first_kept()
+        start = first % self.__capacity
+        end = start + self.__n_added - first
+        index = numpy.searchsorted(
+            self.__max_times[start:end], time, side="left")
+        return (self.__times[start + index:end],
+                self.__neuron_ids[start + index:end])
@@ -13,20 +13,105 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from threading import RLock
+import numpy
+from spinnman.messages.eieio import EIEIOType
+from spinnman.messages.eieio.data_messages import EIEIODataHeader
 from spinn_front_end_common.utilities.connections import LiveEventConnection
 from spinn_front_end_common.utilities.constants import NOTIFY_PORT
+from spynnaker.pyNN.exceptions import SpynnakerException
+from .spike_ring_buffer import SpikeRingBuffer
 
 # The maximum number of 32-bit keys that will fit in a packet
 _MAX_FULL_KEYS_PER_PACKET = 63
 # The maximum number of 16-bit keys that will fit in a packet
 _MAX_HALF_KEYS_PER_PACKET = 127
+# The maximum number of 32-bit keys with payloads that will fit in a packet
+_MAX_FULL_KEYS_PAYLOADS_PER_PACKET = 31
+# The largest neuron ID that can be sent as a 16-bit key
+_MAX_HALF_KEY = 0xFFFF
+# Marks the neuron IDs that have no key in the array of keys of a label
+_NO_KEY = -1
+
+#: The number of received spikes kept for each label by default
+DEFAULT_SPIKE_BUFFER_SIZE = 1024 * 1024
+
+
+class _PackedEIEIOMessage(object):
+    """ An EIEIO data message that has already been packed into bytes, so\
+        that it can be sent without adding its elements one at a time
+    """
+    __slots__ = ["__bytestring"]
+
+    def __init__(self, bytestring):
+        self.__bytestring = bytestring
+
+    @property
+    def bytestring(self):
+        return self.__bytestring
+
+
+def pack_spike_messages(keys, payloads=None, full_keys=True):
+    """ Pack keys, and optionally a payload for each, into as few EIEIO data\
+        messages as possible
+
+    :param ~numpy.ndarray keys: The keys to send, in the order to send them
+    :param payloads: A 32-bit payload for each key, or None for no payloads
+    :type payloads: ~numpy.ndarray or None
+    :param bool full_keys: \
+        Whether to send 32-bit keys rather than 16-bit ones; keys with\
+        payloads are always 32-bit
+    :return: The messages, each with a ``bytestring`` to send
+    :rtype: list
+    """
+    if payloads is not None:
+        msg_type = EIEIOType.KEY_PAYLOAD_32_BIT
+        max_keys = _MAX_FULL_KEYS_PAYLOADS_PER_PACKET
+        elements = numpy.empty((len(keys), 2), dtype="<u4")
+        elements[:, 0] = keys
+        elements[:, 1] = payloads
+    elif full_keys:
+        msg_type = EIEIOType.KEY_32_BIT
+        max_keys = _MAX_FULL_KEYS_PER_PACKET
+        elements = numpy.asarray(keys, dtype="<u4")
+    else:
+        msg_type = EIEIOType.KEY_16_BIT
+        max_keys = _MAX_HALF_KEYS_PER_PACKET
+        elements = numpy.asarray(keys, dtype="<u2")
+
+    # All the full messages have the same header
+    full_header = EIEIODataHeader(msg_type, count=max_keys).bytestring
+    messages = list()
+    for start in range(0, len(elements), max_keys):
+        chunk = elements[start:start + max_keys]
+        header = full_header
+        if len(chunk) < max_keys:
+            header = EIEIODataHeader(msg_type, count=len(chunk)).bytestring
+        messages.append(_PackedEIEIOMessage(header + chunk.tobytes()))
+    return messages
+
+
+class _ArrayCallback(object):
+    """ A callback to be given the spikes received in each time window
+    """
+    __slots__ = ["callback", "next_sequence", "window", "window_end"]
+
+    def __init__(self, callback, window, next_sequence):
+        self.callback = callback
+        self.window = window
+        self.window_end = None
+        self.next_sequence = next_sequence
 
 
 class SpynnakerLiveSpikesConnection(LiveEventConnection):
     """ A connection for receiving and sending live spikes from and to\
         SpiNNaker
     """
-    __slots__ = []
+    __slots__ = [
+        "__array_callbacks",
+        "__key_arrays",
+        "__spike_buffers",
+        "__spike_lock"]
 
     def __init__(self, receive_labels=None, send_labels=None, local_host=None,
                  local_port=NOTIFY_PORT,
@@ -49,6 +134,16 @@ class SpynnakerLiveSpikesConnection(LiveEventConnection):
             live_packet_gather_label, receive_labels, send_labels,
             local_host, local_port)
 
+        # The keys of each label to send to as an array indexed by neuron ID,
+        # with the mapping they were made from
+        self.__key_arrays = dict()
+
+        # The spikes received from each label kept in a ring buffer, and
+        # the callbacks to give them to in time windows
+        self.__spike_buffers = dict()
+        self.__array_callbacks = dict()
+        self.__spike_lock = RLock()
+
     def send_spike(self, label, neuron_id, send_full_keys=False):
         """ Send a spike from a single neuron
 
@@ -71,4 +166,166 @@ class SpynnakerLiveSpikesConnection(LiveEventConnection):
             keys, getting the key for each neuron from the database, or
             whether to send 16-bit neuron IDs directly
         """
-        self.send_events(label, neuron_ids, send_full_keys)
+        self.send_spike_array(label, neuron_ids, send_full_keys=send_full_keys)
+
+    def send_spike_array(
+            self, label, neuron_ids, payloads=None, send_full_keys=False):
+        """ Send a number of spikes, each optionally with a payload, packing\
+            as many into each packet as will fit.  The keys are found for all\
+            the spikes at once, so this is much faster than sending the\
+            spikes one at a time.
+
+        :param str label:
+            The label of the population from which the spikes will originate
+        :param ~numpy.ndarray neuron_ids:
+            array-like of neuron IDs sending spikes
+        :param payloads:
+            array-like of a 32-bit payload for each spike, or None to send\
+            the spikes without payloads.  Spikes with payloads are always\
+            sent with full 32-bit keys.
+        :type payloads: ~numpy.ndarray or None
+        :param bool send_full_keys: Determines whether to send full 32-bit
+            keys, getting the key for each neuron from the database, or
+            whether to send 16-bit neuron IDs directly
+        """
+        neuron_ids = numpy.asarray(neuron_ids, dtype="int64").ravel()
+        if payloads is not None:
+            payloads = numpy.asarray(payloads).ravel()
+            if len(payloads) != len(neuron_ids):
+                raise SpynnakerException(
+                    "There are {} payloads for {} spikes".format(
+                        len(payloads), len(neuron_ids)))
+        if not len(neuron_ids):
+            return
+        if payloads is not None or send_full_keys:
+            keys = self.__get_keys(label, neuron_ids)
+        else:
+            if neuron_ids.min() < 0 or neuron_ids.max() > _MAX_HALF_KEY:
+                raise SpynnakerException(
+                    "Neuron IDs sent without full keys must be between 0 and"
+                    " {}".format(_MAX_HALF_KEY))
+            keys = neuron_ids
+        for message in pack_spike_messages(keys, payloads, send_full_keys):
+            self.send_eieio_message(message, label)
+
+    def __get_keys(self, label, neuron_ids):
+        """ Get the keys of some neurons of a label from the database mapping
+
+        :param str label: The label of the population
+        :param ~numpy.ndarray neuron_ids: The IDs of the neurons
+        :rtype: ~numpy.ndarray
+        """
+        # The mapping is replaced each time the database is read
+        mapping = self._atom_id_to_key[label]
+        mapping_and_keys = self.__key_arrays.get(label)
+        if mapping_and_keys is None or mapping_and_keys[0] is not mapping:
+            atom_ids = numpy.fromiter(mapping.keys(), "int64", len(mapping))
+            key_array = numpy.full(
+                atom_ids.max() + 1 if len(atom_ids) else 0, _NO_KEY,
+                dtype="int64")
+            key_array[atom_ids] = numpy.fromiter(
+                mapping.values(), "int64", len(mapping))
+            mapping_and_keys = (mapping, key_array)
+            self.__key_arrays[label] = mapping_and_keys
+        key_array = mapping_and_keys[1]
+
+        valid = (neuron_ids >= 0) & (neuron_ids < len(key_array))
+        keys = numpy.full(len(neuron_ids), _NO_KEY, dtype="int64")
+        keys[valid] = key_array[neuron_ids[valid]]
+        if (keys == _NO_KEY).any():
+            raise SpynnakerException(
+                "Neuron IDs {} of {} have no keys".format(
+                    numpy.unique(neuron_ids[keys == _NO_KEY]).tolist(),
+                    label))
+        return keys
+
+    def buffer_received_spikes(
+            self, label, capacity=DEFAULT_SPIKE_BUFFER_SIZE):
+        """ Keep the spikes received from a population in a ring buffer, so\
+            that they can be read with :py:meth:`get_spikes_since`.  The\
+            spikes must be received with their time steps, as they are by\
+            default.
+
+        :param str label:
+            The label of the population; this must be one of those spikes\
+            are received from
+        :param int capacity: The number of spikes to keep; this is ignored\
+            if the spikes of the population are already being kept
+        :return: The buffer the spikes are kept in
+        :rtype: SpikeRingBuffer
+        """
+        with self.__spike_lock:
+            if label not in self.__spike_buffers:
+                self.__spike_buffers[label] = SpikeRingBuffer(capacity)
+                self.__array_callbacks[label] = list()
+                self.add_receive_callback(label, self.__receive_spike_array)
+                self.add_pause_stop_callback(
+                    label, self.__flush_array_callbacks)
+            return self.__spike_buffers[label]
+
+    def add_receive_array_callback(self, label, callback, window=1):
+        """ Add a callback to be given the spikes received from a population\
+            in each time window as arrays, rather than those of each packet\
+            as lists.  The spikes of a window are given when the first spike\
+            after it is received, or when the simulation pauses or stops.
+
+        :param str label:
+            The label of the population; this must be one of those spikes\
+            are received from
+        :param callback: A function to be called with the label, and views\
+            of the time steps and neuron IDs of the spikes.  The views are\
+            only valid until the buffer of the spikes wraps round, so must\
+            be copied to be kept.
+        :type callback: \
+            function(str, ~numpy.ndarray, ~numpy.ndarray) -> None
+        :param int window: The number of time steps in each window
+        """
+        spike_buffer = self.buffer_received_spikes(label)
+        with self.__spike_lock:
+            self.__array_callbacks[label].append(
+                _ArrayCallback(callback, window, spike_buffer.n_added))
+
+    def get_spikes_since(self, label, time):
+        """ Get the spikes received from a population from the first one at\
+            or after a time step, without copying them
+
+        :param str label: The label of the population, for which\
+            :py:meth:`buffer_received_spikes` must have been called
+        :param int time: The time step of the first spike to get
+        :return: Views of the time steps and neuron IDs of the spikes, which\
+            are only valid until the buffer of the spikes wraps round
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        with self.__spike_lock:
+            return self.__spike_buffers[label].get_since(time)
+
+    def __receive_spike_array(self, label, time, neuron_ids):
+        with self.__spike_lock:
+            spike_buffer = self.__spike_buffers[label]
+            for array_callback in self.__array_callbacks[label]:
+                if array_callback.window_end is not None and \
+                        time >= array_callback.window_end:
+                    self.__call_array_callback(
+                        label, spike_buffer, array_callback)
+                if array_callback.window_end is None or \
+                        time >= array_callback.window_end:
+                    array_callback.window_end = (
+                        (time // array_callback.window) + 1) * \
+                        array_callback.window
+            spike_buffer.add(time, neuron_ids)
+
+    def __flush_array_callbacks(self, label, _connection):
+        with self.__spike_lock:
+            spike_buffer = self.__spike_buffers[label]
+            for array_callback in self.__array_callbacks[label]:
+                self.__call_array_callback(
+                    label, spike_buffer, array_callback)
+                array_callback.window_end = None
+
+    @staticmethod
+    def __call_array_callback(label, spike_buffer, array_callback):
+        times, neuron_ids = spike_buffer.get_from_sequence(
+            array_callback.next_sequence)
+        array_callback.next_sequence = spike_buffer.n_added
+        if len(times):
+            array_callback.callback(label, times, neuron_ids)
@@ -35,3 +35,40 @@ class AbstractEthernetTranslator(object):
             ~spinnman.messages.eieio.data_messages.AbstractEIEIODataElement
         :rtype: None
         """
+
+    def translate_control_packets(self, multicast_packets):
+        """ Translate multicast packets received over Ethernet together, in\
+            the order they were received.  By default, each is translated in\
+            turn.
+
+        :param multicast_packets: The received multicast packets
+        :type multicast_packets:
+            iterable(~spinnman.messages.eieio.data_messages.AbstractEIEIODataElement)
+        :rtype: None
+        """
+        for multicast_packet in multicast_packets:
+            self.translate_control_packet(multicast_packet)
+
+    def flush(self, timeout=None):
+        """ Wait for the messages sent to the external device by translated\
+            packets to have been sent.  By default, they are sent as each\
+            packet is translated, so there is nothing to wait for.
+
+        :param timeout:
+            The most time in seconds to wait, or None to wait for as long as\
+            it takes
+        :type timeout: float or None
+        :return: Whether all the messages were sent in time
+        :rtype: bool
+        """
+        # pylint: disable=unused-argument
+        return True
+
+    def close(self):
+        """ Stop sending messages to the external device, once those sent by\
+            packets already translated have been sent.  Translating another\
+            packet starts sending again.  By default, there is nothing to\
+            stop.
+
+        :rtype: None
+        """
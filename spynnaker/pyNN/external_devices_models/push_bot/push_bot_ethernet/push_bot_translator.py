@@ -14,15 +14,21 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import logging
-from time import sleep
+from threading import Lock
 from spinn_utilities.overrides import overrides
 from spinn_utilities.log import FormatAdapter
+from spynnaker.pyNN.connections.coalescing_command_queue import (
+    CoalescingCommandQueue)
 from spynnaker.pyNN.external_devices_models import AbstractEthernetTranslator
 from spynnaker.pyNN.protocols import (
     MunichIoEthernetProtocol, munich_io_spinnaker_link_protocol)
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
+#: The time in seconds to wait after disabling the retina before sending
+#: anything else to the PushBot
+_RETINA_DISABLE_PAUSE = 0.1
+
 
 def _signed_int(uint_value):
     if uint_value > (2 ** 31):
@@ -32,11 +38,19 @@ def _signed_int(uint_value):
 
 class PushBotTranslator(AbstractEthernetTranslator):
     """ Translates packets between PushBot Multicast packets and PushBot\
-        Wi-Fi Commands
+        Wi-Fi Commands.  The commands are sent from a queue, in which a\
+        command that has not yet been sent is replaced by a later command\
+        with the same key, so only the latest value of each setting is sent\
+        when the commands come in faster than the PushBot can take them.\
+        The queue is only started when there is a command to send, and is\
+        stopped again when the translator is closed.
     """
     __slots__ = [
+        "__handlers",
         "__protocol",
-        "__pushbot_wifi_connection"]
+        "__pushbot_wifi_connection",
+        "__queue",
+        "__queue_lock"]
 
     def __init__(self, protocol, pushbot_wifi_connection):
         """
@@ -47,145 +61,144 @@ class PushBotTranslator(AbstractEthernetTranslator):
         """
         self.__protocol = protocol
         self.__pushbot_wifi_connection = pushbot_wifi_connection
-
-    @overrides(AbstractEthernetTranslator.translate_control_packet)
-    def translate_control_packet(self, multicast_packet):
-        # pylint: disable=too-many-statements, too-many-branches
-        key = multicast_packet.key
-
-        # disable retina
-        if key == self.__protocol.disable_retina_key:
-            logger.debug("Sending retina disable")
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.disable_retina())
-            sleep(0.1)
-
+        self.__queue = None
+        self.__queue_lock = Lock()
+
+        # The handler of each key, which gets the messages to send and the
+        # time to wait after sending them from the payload, or None if the
+        # payload is not understood
+        self.__handlers = dict()
+        self.__add_handler(
+            protocol.disable_retina_key, self.__disable_retina)
+        self.__add_handler(
+            protocol.set_retina_transmission_key,
+            self.__set_retina_transmission)
+        for key, description, message in [
+                (protocol.push_bot_motor_0_leaking_towards_zero_key,
+                 "Motor 0 Leaky Velocity",
+                 MunichIoEthernetProtocol.motor_0_leaky_velocity),
+                (protocol.push_bot_motor_0_permanent_key,
+                 "Motor 0 Velocity",
+                 MunichIoEthernetProtocol.motor_0_permanent_velocity),
+                (protocol.push_bot_motor_1_leaking_towards_zero_key,
+                 "Motor 1 Leaky Velocity",
+                 MunichIoEthernetProtocol.motor_1_leaky_velocity),
+                (protocol.push_bot_motor_1_permanent_key,
+                 "Motor 1 Velocity",
+                 MunichIoEthernetProtocol.motor_1_permanent_velocity),
+                (protocol.push_bot_laser_config_total_period_key,
+                 "Laser Period",
+                 MunichIoEthernetProtocol.laser_total_period),
+                (protocol.push_bot_laser_config_active_time_key,
+                 "Laser Active Time",
+                 MunichIoEthernetProtocol.laser_active_time),
+                (protocol.push_bot_laser_set_frequency_key,
+                 "Laser Frequency",
+                 MunichIoEthernetProtocol.laser_frequency),
+                (protocol.push_bot_led_total_period_key,
+                 "LED Period",
+                 MunichIoEthernetProtocol.led_total_period),
+                (protocol.push_bot_led_front_active_time_key,
+                 "Front LED Active Time",
+                 MunichIoEthernetProtocol.led_front_active_time),
+                (protocol.push_bot_led_back_active_time_key,
+                 "Back LED Active Time",
+                 MunichIoEthernetProtocol.led_back_active_time),
+                (protocol.push_bot_led_set_frequency_key,
+                 "LED Frequency",
+                 MunichIoEthernetProtocol.led_frequency),
+                (protocol.push_bot_speaker_config_total_period_key,
+                 "Speaker Period",
+                 MunichIoEthernetProtocol.speaker_total_period),
+                (protocol.push_bot_speaker_config_active_time_key,
+                 "Speaker Active Time",
+                 MunichIoEthernetProtocol.speaker_active_time),
+                (protocol.push_bot_speaker_set_tone_key,
+                 "Speaker Frequency",
+                 MunichIoEthernetProtocol.speaker_frequency)]:
+            self.__add_handler(key, self.__value_handler(description, message))
+        self.__add_handler(
+            protocol.enable_disable_motor_key, self.__enable_disable_motor)
+
+        # Set mode has no context in the Ethernet protocol
+        self.__add_handler(protocol.set_mode().key, self.__ignore_set_mode)
+
+    def __add_handler(self, key, handler):
+        # Where keys are shared, the first command with the key handles it
+        self.__handlers.setdefault(key, handler)
+
+    @staticmethod
+    def __disable_retina(payload):
+        # pylint: disable=unused-argument
+        logger.debug("Sending retina disable")
+        return ([MunichIoEthernetProtocol.disable_retina()],
+                _RETINA_DISABLE_PAUSE)
+
+    @staticmethod
+    def __set_retina_transmission(payload):
         # set retina key (which doesn't do much for Ethernet)
-        elif key == self.__protocol.set_retina_transmission_key:
-            logger.debug("Sending retina enable")
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.set_retina_transmission(
-                    munich_io_spinnaker_link_protocol.GET_RETINA_PAYLOAD_VALUE(
-                        multicast_packet.payload)))
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.enable_retina())
-
-        # motor 0 leaky velocity command
-        elif key == self.__protocol.push_bot_motor_0_leaking_towards_zero_key:
-            speed = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Motor 0 Leaky Velocity = {}", speed)
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.motor_0_leaky_velocity(speed))
-
-        # motor 0 permanent velocity command
-        elif key == self.__protocol.push_bot_motor_0_permanent_key:
-            speed = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Motor 0 Velocity = {}", speed)
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.motor_0_permanent_velocity(speed))
-
-        # motor 1 leaky velocity command
-        elif key == self.__protocol.push_bot_motor_1_leaking_towards_zero_key:
-            speed = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Motor 1 Leaky Velocity = {}", speed)
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.motor_1_leaky_velocity(speed))
-
-        # motor 1 permanent velocity command
-        elif key == self.__protocol.push_bot_motor_1_permanent_key:
-            speed = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Motor 1 Velocity = {}", speed)
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.motor_1_permanent_velocity(speed))
-
-        # laser total period command
-        elif key == self.__protocol.push_bot_laser_config_total_period_key:
-            period = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Laser Period = {}", period)
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.laser_total_period(period))
-
-        # laser active time
-        elif key == self.__protocol.push_bot_laser_config_active_time_key:
-            time = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Laser Active Time = {}", time)
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.laser_active_time(time))
-
-        # laser frequency
-        elif key == self.__protocol.push_bot_laser_set_frequency_key:
-            frequency = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Laser Frequency = {}", frequency)
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.laser_frequency(frequency))
-
-        # led total period command
-        elif key == self.__protocol.push_bot_led_total_period_key:
-            period = _signed_int(multicast_packet.payload)
-            logger.debug("Sending LED Period = {}", period)
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.led_total_period(period))
-
-        # front led active time
-        elif key == self.__protocol.push_bot_led_front_active_time_key:
-            time = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Front LED Active Time = {}", time)
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.led_front_active_time(time))
-
-        # back led active time
-        elif key == self.__protocol.push_bot_led_back_active_time_key:
-            time = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Back LED Active Time = {}", time)
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.led_back_active_time(time))
-
-        # led frequency
-        elif key == self.__protocol.push_bot_led_set_frequency_key:
-            frequency = _signed_int(multicast_packet.payload)
-            logger.debug("Sending LED Frequency = {}", frequency)
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.led_frequency(frequency))
-
-        # speaker total period
-        elif key == self.__protocol.push_bot_speaker_config_total_period_key:
-            period = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Speaker Period = {}", period)
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.speaker_total_period(period))
-
-        # speaker active time
-        elif key == self.__protocol.push_bot_speaker_config_active_time_key:
-            time = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Speaker Active Time = {}", time)
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.speaker_active_time(time))
-
-        # speaker frequency
-        elif key == self.__protocol.push_bot_speaker_set_tone_key:
-            frequency = _signed_int(multicast_packet.payload)
-            logger.debug("Sending Speaker Frequency = {}", frequency)
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.speaker_frequency(frequency))
-
-        # motor enable
-        elif (key == self.__protocol.enable_disable_motor_key and
-              multicast_packet.payload == 1):
+        logger.debug("Sending retina enable")
+        return ([
+            MunichIoEthernetProtocol.set_retina_transmission(
+                munich_io_spinnaker_link_protocol.GET_RETINA_PAYLOAD_VALUE(
+                    payload)),
+            MunichIoEthernetProtocol.enable_retina()], 0.0)
+
+    @staticmethod
+    def __value_handler(description, message):
+        def handle(payload):
+            value = _signed_int(payload)
+            logger.debug("Sending {} = {}", description, value)
+            return [message(value)], 0.0
+        return handle
+
+    @staticmethod
+    def __enable_disable_motor(payload):
+        if payload == 1:
             logger.debug("Sending Motor Enable")
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.enable_motor())
-
-        # motor disable
-        elif (key == self.__protocol.enable_disable_motor_key and
-              multicast_packet.payload == 0):
+            return [MunichIoEthernetProtocol.enable_motor()], 0.0
+        if payload == 0:
             logger.debug("Sending Motor Disable")
-            self.__pushbot_wifi_connection.send(
-                MunichIoEthernetProtocol.disable_motor())
+            return [MunichIoEthernetProtocol.disable_motor()], 0.0
+        return None
+
+    @staticmethod
+    def __ignore_set_mode(payload):
+        # pylint: disable=unused-argument
+        logger.debug("Ignoring set mode command")
+        return [], 0.0
 
-        # detecting set mode (which has no context in Ethernet protocol
-        elif key == self.__protocol.set_mode().key:
-            logger.debug("Ignoring set mode command")
+    @overrides(AbstractEthernetTranslator.translate_control_packet)
+    def translate_control_packet(self, multicast_packet):
+        handler = self.__handlers.get(multicast_packet.key)
+        command = None
+        if handler is not None:
+            command = handler(multicast_packet.payload)
 
         # otherwise no idea what command is, so raise warning and ignore
-        else:
+        if command is None:
             logger.warning("Unknown PushBot command: {}", multicast_packet)
+            return
+        messages, delay_after = command
+        if messages:
+            with self.__queue_lock:
+                if self.__queue is None:
+                    self.__queue = CoalescingCommandQueue(
+                        self.__pushbot_wifi_connection.send)
+                self.__queue.put(multicast_packet.key, messages, delay_after)
+
+    @overrides(AbstractEthernetTranslator.flush)
+    def flush(self, timeout=None):
+        with self.__queue_lock:
+            queue = self.__queue
+        if queue is None:
+            return True
+        return queue.flush(timeout)
+
+    @overrides(AbstractEthernetTranslator.close)
+    def close(self):
+        with self.__queue_lock:
+            queue = self.__queue
+            self.__queue = None
+        if queue is not None:
+            queue.close()
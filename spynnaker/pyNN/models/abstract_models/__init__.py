@@ -15,6 +15,8 @@
 
 from .abstract_accepts_incoming_synapses import AbstractAcceptsIncomingSynapses
 from .abstract_contains_units import AbstractContainsUnits
+from .abstract_filterable_application_edge import (
+    AbstractFilterableApplicationEdge)
 from .abstract_filterable_edge import AbstractFilterableEdge
 from .abstract_population_initializable import AbstractPopulationInitializable
 from .abstract_population_settable import AbstractPopulationSettable
@@ -24,6 +26,7 @@ from .abstract_settable import AbstractSettable
 from .abstract_weight_updatable import AbstractWeightUpdatable
 
 __all__ = ["AbstractAcceptsIncomingSynapses", "AbstractContainsUnits",
-           "AbstractFilterableEdge", "AbstractPopulationInitializable",
-           "AbstractPopulationSettable", "AbstractReadParametersBeforeSet",
-           "AbstractSettable", "AbstractWeightUpdatable"]
+           "AbstractFilterableApplicationEdge", "AbstractFilterableEdge",
+           "AbstractPopulationInitializable", "AbstractPopulationSettable",
+           "AbstractReadParametersBeforeSet", "AbstractSettable",
+           "AbstractWeightUpdatable"]
@@ -0,0 +1,41 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from six import add_metaclass
+from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+
+
+@add_metaclass(AbstractBase)
+class AbstractFilterableApplicationEdge(object):
+    """ An application edge that can decide in one pass which of its\
+        machine edges can be filtered
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def filter_slice_pairs(self, pre_slices, post_slices):
+        """ Determine which of the machine edges between the given slices\
+            of the pre- and post-vertex should be filtered out
+
+        :param list(~pacman.model.graphs.common.Slice) pre_slices:
+            the slices of the pre-vertex, in machine vertex index order
+        :param list(~pacman.model.graphs.common.Slice) post_slices:
+            the slices of the post-vertex, in machine vertex index order
+        :return: A boolean array of shape\
+            (len(pre_slices), len(post_slices)) which is True where the\
+            machine edge between the slices should be filtered
+        :rtype: ~numpy.ndarray
+        """
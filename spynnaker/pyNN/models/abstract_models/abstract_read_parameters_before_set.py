@@ -37,3 +37,54 @@ class AbstractReadParametersBeforeSet(object):
             the slice of atoms for this vertex
         :rtype: None
         """
+
+    def get_slices_to_read_before_set(self, vertex_slices, selector=None):
+        """ Get the slices whose cores must be read before the selected\
+            atoms are changed.  By default this is all of them, as any\
+            change results in every core being reloaded.
+
+        :param vertex_slices: the slices of the machine vertices not yet read
+        :type vertex_slices: list(~pacman.model.graphs.common.Slice)
+        :param selector: the atoms that are about to change, or None for all
+        :type selector: None or slice or int or list(bool) or list(int)
+        :rtype: list(~pacman.model.graphs.common.Slice)
+        """
+        # pylint: disable=unused-argument
+        return list(vertex_slices)
+
+    def read_parameter_data_from_machine(
+            self, transceiver, placement, vertex_slice):
+        """ Read the raw parameter data of a core without updating the\
+            parameters, so that several cores can be read at the same time.\
+            By default nothing is read here, and all the work is done by\
+            :py:meth:`update_parameters_from_data`.
+
+        :param ~spinnman.transceiver.Transceiver transceiver:
+            the SpinnMan interface
+        :param ~pacman.model.placements.Placement placement:
+            the placement of a vertex
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            the slice of atoms for this vertex
+        :return: the data read, or None if nothing was read
+        """
+        # pylint: disable=unused-argument
+        return None
+
+    def update_parameters_from_data(
+            self, data, transceiver, placement, vertex_slice):
+        """ Update the parameters from the data read by\
+            :py:meth:`read_parameter_data_from_machine`.  This is only called\
+            for one core at a time.
+
+        :param data: the data read, or None if nothing was read
+        :param ~spinnman.transceiver.Transceiver transceiver:
+            the SpinnMan interface
+        :param ~pacman.model.placements.Placement placement:
+            the placement of a vertex
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            the slice of atoms for this vertex
+        :rtype: None
+        """
+        # pylint: disable=unused-argument
+        self.read_parameters_from_machine(
+            transceiver, placement, vertex_slice)
@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy
 from six import add_metaclass
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
 
@@ -70,6 +71,23 @@ class AbstractSpikeRecordable(object):
             ordered by time
         """
 
+    def get_spike_counts(
+            self, placements, graph_mapper, buffer_manager, machine_time_step):
+        """ Get the number of spikes recorded for each neuron of the object.\
+            By default, the spikes are got and counted.
+
+        :param placements: the placements object
+        :param graph_mapper: the graph mapper object
+        :param buffer_manager: the buffer manager object
+        :param machine_time_step: the time step of the simulation
+        :return: The number of spikes of each neuron
+        :rtype: ~numpy.ndarray
+        """
+        spikes = self.get_spikes(
+            placements, graph_mapper, buffer_manager, machine_time_step)
+        return numpy.bincount(
+            spikes[:, 0].astype("int64"), minlength=self.n_atoms)
+
     @abstractmethod
     def get_spikes_sampling_interval(self):
         """ Return the current sampling interval for spikes
@@ -30,6 +30,7 @@ from spinn_front_end_common.utilities.constants import (
     BYTES_PER_WORD, MICRO_TO_MILLISECOND_CONVERSION, BITS_PER_WORD)
 from spinn_front_end_common.interface.buffer_management import \
     recording_utilities
+from spynnaker.pyNN.utilities.host_profiler import profile_phase
 import itertools
 
 logger = FormatAdapter(logging.getLogger(__name__))
@@ -121,6 +122,18 @@ class NeuronRecorder(object):
             i for i in xrange(vertex_slice.lo_atom, vertex_slice.hi_atom + 1)
             if i in indexes]
 
+    def get_recorded_indexes(self, variable):
+        """ Get the IDs of the neurons recording a variable
+
+        :param str variable: The variable to get the IDs of
+        :rtype: list(int)
+        """
+        if self.__sampling_rates[variable] == 0:
+            return []
+        if self.__indexes[variable] is None:
+            return list(range(self.__n_neurons))
+        return sorted(self.__indexes[variable])
+
     def get_neuron_sampling_interval(self, variable):
         """ Return the current sampling interval for this variable
 
@@ -257,6 +270,17 @@ class NeuronRecorder(object):
         :param n_machine_time_steps:
         :return:
         """
+        with profile_phase("get_matrix_data", label) as phase:
+            data, indexes, sampling_interval = self.__get_matrix_data(
+                label, buffer_manager, region, placements, graph_mapper,
+                application_vertex, variable, n_machine_time_steps)
+            if data is not None:
+                phase.add_bytes(data.nbytes)
+        return data, indexes, sampling_interval
+
+    def __get_matrix_data(
+            self, label, buffer_manager, region, placements, graph_mapper,
+            application_vertex, variable, n_machine_time_steps):
         if variable in self.__bitfield_variables:
             msg = "Variable {} is not supported, use get_spikes".format(
                 variable)
@@ -300,6 +324,16 @@ class NeuronRecorder(object):
     def get_spikes(
             self, label, buffer_manager, region, placements, graph_mapper,
             application_vertex, variable, machine_time_step):
+        with profile_phase("get_spikes", label) as phase:
+            spikes = self.__get_spikes(
+                label, buffer_manager, region, placements, graph_mapper,
+                application_vertex, variable, machine_time_step)
+            phase.add_bytes(spikes.nbytes)
+        return spikes
+
+    def __get_spikes(
+            self, label, buffer_manager, region, placements, graph_mapper,
+            application_vertex, variable, machine_time_step):
         if variable not in self.__bitfield_variables:
             msg = "Variable {} is not supported, use get_matrix_data".format(
                 variable)
@@ -366,6 +400,62 @@ class NeuronRecorder(object):
         result = numpy.column_stack((spike_ids, spike_times))
         return result[numpy.lexsort((spike_times, spike_ids))]
 
+    def get_spike_counts(
+            self, label, buffer_manager, region, placements, graph_mapper,
+            application_vertex, variable):
+        """ Get the number of spikes recorded for each neuron, counted\
+            straight from the recorded bit fields of each core without\
+            making the list of spikes
+
+        :return: The number of spikes of each neuron of the vertex
+        :rtype: ~numpy.ndarray
+        """
+        if variable not in self.__bitfield_variables:
+            msg = "Variable {} is not supported, use get_matrix_data".format(
+                variable)
+            raise ConfigurationException(msg)
+
+        # TODO: count the spikes on the core, in a recording region of their
+        # own, so that only the counts have to be read back
+        counts = numpy.zeros(self.__n_neurons, dtype="int64")
+        vertices = graph_mapper.get_machine_vertices(application_vertex)
+        missing_str = ""
+        progress = ProgressBar(
+            vertices, "Counting spikes for {}".format(label))
+        for vertex in progress.over(vertices):
+            placement = placements.get_placement_of_vertex(vertex)
+            vertex_slice = graph_mapper.get_slice(vertex)
+            neurons = self._neurons_recording(variable, vertex_slice)
+            neurons_recording = len(neurons)
+            if neurons_recording == 0:
+                continue
+            n_words = int(math.ceil(neurons_recording / BITS_PER_WORD))
+
+            record_raw, data_missing = buffer_manager.get_data_by_placement(
+                placement, region)
+            if data_missing:
+                missing_str += "({}, {}, {}); ".format(
+                    placement.x, placement.y, placement.p)
+            if not len(record_raw):
+                continue
+            words = numpy.asarray(record_raw, dtype="uint8").view(
+                dtype="<u4").reshape([-1, n_words + 1])[:, 1:]
+
+            # Bit b of word w is the neuron at index w * 32 + b
+            n_bits = int(BITS_PER_WORD)
+            bit_counts = numpy.empty((n_words, n_bits), dtype="int64")
+            for bit in range(n_bits):
+                bit_counts[:, bit] = numpy.count_nonzero(
+                    words & numpy.uint32(1 << bit), axis=0)
+            counts[numpy.asarray(neurons)] += \
+                bit_counts.reshape(-1)[:neurons_recording]
+
+        if len(missing_str) > 0:
+            logger.warning(
+                "Population {} is missing spike data in region {} from the"
+                " following cores: {}", label, region, missing_str)
+        return counts
+
     def get_recordable_variables(self):
         return self.__sampling_rates.keys()
 
@@ -37,6 +37,11 @@ _expr_context = SafeEval(
     numpy.power, numpy.sin, numpy.sinh, numpy.sqrt, numpy.tan, numpy.tanh,
     numpy.maximum, numpy.minimum, e=numpy.e, pi=numpy.pi)
 
+# The streams of seeds used for random weights and delays generated on the
+# host; streams 1 to 3 are used for generating on the machine
+_HOST_WEIGHT_SEED_STREAM = 0
+_HOST_DELAY_SEED_STREAM = 4
+
 
 # with_metaclass due to https://github.com/benjaminp/six/issues/219
 class AbstractConnector(with_metaclass(AbstractBase, object)):
@@ -337,21 +342,42 @@ class AbstractConnector(with_metaclass(AbstractBase, object)):
         regexpr = re.compile(r'.*d\[\d*\].*')
         return regexpr.match(d_expression)
 
+    def _get_param_base_seed(self, values, synapse_info=None):
+        """ Get the seed from which the seeds of each pair of slices are\
+            derived for a random parameter of a projection.  This is drawn\
+            from the parameter's own RNG the first time it is needed for the\
+            projection, so a parameter used by several projections gets\
+            different values in each.
+
+        :param ~pyNN.random.RandomDistribution values:
+        :param SynapseInformation synapse_info:
+            the projection the parameter is used in
+        :rtype: int
+        """
+        key = (values, synapse_info)
+        seed = self.__param_seeds.get(key, None)
+        if seed is None:
+            seed = int(values.rng.next() * 0xFFFFFFFF)
+            self.__param_seeds[key] = seed
+        return seed
+
     def _generate_random_values(
-            self, values, n_connections, pre_vertex_slice, post_vertex_slice):
+            self, values, n_connections, pre_vertex_slice, post_vertex_slice,
+            synapse_info, stream):
         """
         :param ~pyNN.random.NumpyRNG values:
         :param int n_connections:
         :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
         :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        :param SynapseInformation synapse_info:
+        :param int stream: the stream of seeds to use
         :rtype: ~numpy.ndarray
         """
-        key = (id(pre_vertex_slice), id(post_vertex_slice), id(values))
-        seed = self.__param_seeds.get(key, None)
-        if seed is None:
-            seed = int(values.rng.next() * 0x7FFFFFFF)
-            self.__param_seeds[key] = seed
-        new_rng = NumpyRNG(seed)
+        seed = utility_calls.get_slice_pair_seeds(
+            self._get_param_base_seed(values, synapse_info), stream,
+            pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom,
+            post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)[0, 0]
+        new_rng = NumpyRNG(int(seed & 0x7FFFFFFF))
         copy_rd = RandomDistribution(
             values.name, parameters_pos=None, rng=new_rng,
             **values.parameters)
@@ -360,7 +386,8 @@ class AbstractConnector(with_metaclass(AbstractBase, object)):
         return copy_rd.next(n_connections)
 
     def _generate_values(self, values, n_connections, connection_slices,
-                         pre_slice, post_slice, synapse_info):
+                         pre_slice, post_slice, synapse_info,
+                         stream=_HOST_WEIGHT_SEED_STREAM):
         """
         :param values:
         :type values: ~pyNN.random.NumpyRNG or int or float or list(int) or
@@ -370,11 +397,13 @@ class AbstractConnector(with_metaclass(AbstractBase, object)):
         :param ~pacman.model.graphs.common.Slice pre_slice:
         :param ~pacman.model.graphs.common.Slice post_slice:
         :param SynapseInformation synapse_info:
+        :param int stream: the stream of seeds to use for random values
         :rtype: ~numpy.ndarray
         """
         if isinstance(values, RandomDistribution):
             return self._generate_random_values(
-                values, n_connections, pre_slice, post_slice)
+                values, n_connections, pre_slice, post_slice, synapse_info,
+                stream)
         elif numpy.isscalar(values):
             return numpy.repeat([values], n_connections).astype("float64")
         elif hasattr(values, "__getitem__"):
@@ -415,7 +444,7 @@ class AbstractConnector(with_metaclass(AbstractBase, object)):
         """
         weights = self._generate_values(
             synapse_info.weights, n_connections, connection_slices, pre_slice,
-            post_slice, synapse_info)
+            post_slice, synapse_info, _HOST_WEIGHT_SEED_STREAM)
         if self.__safe:
             if not weights.size:
                 warn_once(logger, "No connection in " + str(self))
@@ -458,7 +487,7 @@ class AbstractConnector(with_metaclass(AbstractBase, object)):
         """
         delays = self._generate_values(
             synapse_info.delays, n_connections, connection_slices, pre_slice,
-            post_slice, synapse_info)
+            post_slice, synapse_info, _HOST_DELAY_SEED_STREAM)
 
         return self._clip_delays(delays)
 
@@ -489,6 +518,22 @@ class AbstractConnector(with_metaclass(AbstractBase, object)):
         """
         # pylint: disable=too-many-arguments
 
+    def get_connected_slice_pairs(
+            self, pre_slices, post_slices, synapse_info):
+        """ Determine which pairs of pre- and post-slices could have any\
+            connections between them.  By default all pairs could.
+
+        :param list(~pacman.model.graphs.common.Slice) pre_slices:
+        :param list(~pacman.model.graphs.common.Slice) post_slices:
+        :param SynapseInformation synapse_info:
+        :return: A boolean array of shape\
+            (len(pre_slices), len(post_slices)) which is True where the\
+            slices could be connected
+        :rtype: ~numpy.ndarray
+        """
+        # pylint: disable=unused-argument
+        return numpy.ones((len(pre_slices), len(post_slices)), dtype="bool")
+
     def get_provenance_data(self, synapse_info):
         """
         :param SynapseInformation synapse_info:
@@ -22,6 +22,8 @@ from data_specification.enums.data_type import DataType
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spynnaker.pyNN.models.neural_projections.connectors import (
     AbstractConnector)
+from spynnaker.pyNN.utilities.utility_calls import (
+    get_slice_limits, get_slice_pair_seeds)
 
 # Hash of the constant parameter generator
 PARAM_TYPE_CONSTANT_ID = 0
@@ -38,6 +40,14 @@ PARAM_TYPE_BY_NAME = {
 
 PARAM_TYPE_KERNEL = 6
 
+# The streams of seeds derived for each use of a base seed
+_CONNECTOR_SEED_STREAM = 1
+_WEIGHT_SEED_STREAM = 2
+_DELAY_SEED_STREAM = 3
+
+# The atom used in place of a slice when a seed is shared by all slices
+_ALL_ATOMS = -1
+
 
 # Hashes of the connection generators supported by the synapse expander
 class ConnectorIDs(Enum):
@@ -56,17 +66,12 @@ class AbstractGenerateConnectorOnMachine(with_metaclass(
     """
 
     __slots__ = [
-        "__delay_seed",
-        "__weight_seed",
-        "__connector_seed"
-    ]
+        "__connector_seeds"]
 
     def __init__(self, safe=True, callback=None, verbose=False):
         AbstractConnector.__init__(
             self, safe=safe, callback=callback, verbose=verbose)
-        self.__delay_seed = dict()
-        self.__weight_seed = dict()
-        self.__connector_seed = dict()
+        self.__connector_seeds = dict()
 
     def _generate_lists_on_machine(self, values):
         """ Checks if the connector should generate lists on machine rather\
@@ -85,48 +90,69 @@ class AbstractGenerateConnectorOnMachine(with_metaclass(
 
         return False
 
-    def _get_connector_seed(self, pre_vertex_slice, post_vertex_slice, rng):
-        """ Get the seed of the connector for a given pre-post pairing
-        """
-        key = (id(pre_vertex_slice), id(post_vertex_slice))
-        if key not in self.__connector_seed:
-            self.__connector_seed[key] = [
-                int(i * 0xFFFFFFFF) for i in rng.next(n=4)]
-        return self.__connector_seed[key]
-
-    @staticmethod
-    def _generate_param_seed(
-            pre_vertex_slice, post_vertex_slice, values, seeds):
-        """ Get the seed of a parameter generator for a given pre-post pairing
+    def _get_connector_seed(
+            self, pre_vertex_slice, post_vertex_slice, rng,
+            synapse_info=None):
+        """ Get the seed of the connector for a given pre-post pairing of a\
+            projection.  The seeds are derived from a single seed drawn from\
+            the RNG for each projection, so the same pairing always gets the\
+            same seed, but a connector used by several projections connects\
+            each differently.
+
+        :param pre_vertex_slice: \
+            the pre-slice, or None if the seed is shared by all pre-slices
+        :param post_vertex_slice: \
+            the post-slice, or None if the seed is shared by all post-slices
+        :param ~pyNN.random.NumpyRNG rng: the RNG to draw the seed from
+        :param SynapseInformation synapse_info: the projection
+        :rtype: list(int)
         """
-        if not isinstance(values, RandomDistribution):
-            return None
-        key = (id(pre_vertex_slice), id(post_vertex_slice), id(values))
-        if key not in seeds:
-            seeds[key] = [int(i * 0xFFFFFFFF) for i in values.rng.next(n=4)]
-        return seeds[key]
-
-    @staticmethod
-    def _param_generator_params(values, seed):
-        """ Get the parameter generator parameters as a numpy array
+        base_seed = self.__connector_seeds.get(synapse_info)
+        if base_seed is None:
+            base_seed = int(rng.next() * 0xFFFFFFFF)
+            self.__connector_seeds[synapse_info] = base_seed
+        pre_lo, pre_hi = (_ALL_ATOMS, _ALL_ATOMS) \
+            if pre_vertex_slice is None else \
+            (pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom)
+        post_lo, post_hi = (_ALL_ATOMS, _ALL_ATOMS) \
+            if post_vertex_slice is None else \
+            (post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        return get_slice_pair_seeds(
+            base_seed, _CONNECTOR_SEED_STREAM, pre_lo, pre_hi,
+            post_lo, post_hi)[0].tolist()
+
+    def _param_generator_params(
+            self, values, stream, pre_vertex_slices, post_vertex_slices,
+            synapse_info=None):
+        """ Get the parameter generator parameters for each pair of the\
+            given slices, encoded together as a numpy array with one row\
+            per pair
         """
+        n_pairs = len(pre_vertex_slices)
         if numpy.isscalar(values):
-            return numpy.array(
-                [DataType.S1615.encode_as_int(values)],
-                dtype="uint32")
+            return numpy.full(
+                (n_pairs, 1), DataType.S1615.encode_as_int(values),
+                dtype="int64").astype("uint32")
 
         if isinstance(values, RandomDistribution):
             parameters = (
                 values.parameters.get(param_name, None)
                 for param_name in available_distributions[values.name])
-            parameters = (
-                DataType.S1615.max if param == numpy.inf
-                else DataType.S1615.min if param == -numpy.inf else param
-                for param in parameters if param is not None)
-            params = [
-                DataType.S1615.encode_as_int(param) for param in parameters]
-            params.extend(seed)
-            return numpy.array(params, dtype="uint32")
+            parameters = numpy.array(
+                [param for param in parameters if param is not None],
+                dtype="float64")
+            parameters[parameters == numpy.inf] = DataType.S1615.max
+            parameters[parameters == -numpy.inf] = DataType.S1615.min
+            params = DataType.S1615.encode_as_numpy_int_array(
+                parameters).astype("int64")
+            pre_lo, pre_hi = get_slice_limits(pre_vertex_slices)
+            post_lo, post_hi = get_slice_limits(post_vertex_slices)
+            seeds = get_slice_pair_seeds(
+                self._get_param_base_seed(values, synapse_info), stream,
+                pre_lo, pre_hi,
+                post_lo, post_hi)
+            return numpy.hstack((
+                numpy.tile(params.astype("uint32"), (n_pairs, 1)), seeds))
 
         raise ValueError("Unexpected value {}".format(values))
 
@@ -174,15 +200,33 @@ class AbstractGenerateConnectorOnMachine(with_metaclass(
         """
         return self._param_generator_id(weights)
 
-    def gen_weights_params(self, weights, pre_vertex_slice, post_vertex_slice):
+    def gen_weights_params(
+            self, weights, pre_vertex_slice, post_vertex_slice,
+            synapse_info=None):
         """ Get the parameters of the weight generator on the machine
 
         :rtype: numpy array of uint32
         """
-        seed = self._generate_param_seed(
-            pre_vertex_slice, post_vertex_slice, weights,
-            self.__weight_seed)
-        return self._param_generator_params(weights, seed)
+        return self.gen_weights_params_for_slice_pairs(
+            weights, [pre_vertex_slice], [post_vertex_slice], synapse_info)[0]
+
+    def gen_weights_params_for_slice_pairs(
+            self, weights, pre_vertex_slices, post_vertex_slices,
+            synapse_info=None):
+        """ Get the parameters of the weight generator on the machine for\
+            several pairs of slices at once
+
+        :param weights: the weights to generate
+        :param pre_vertex_slices: the pre-slice of each pair
+        :param post_vertex_slices: the post-slice of each pair
+        :param SynapseInformation synapse_info:
+            the projection the weights are for
+        :return: the parameters of each pair, one pair per row
+        :rtype: 2D numpy array of uint32
+        """
+        return self._param_generator_params(
+            weights, _WEIGHT_SEED_STREAM, pre_vertex_slices,
+            post_vertex_slices, synapse_info)
 
     def gen_weight_params_size_in_bytes(self, weights):
         """ The size of the weight parameters in bytes
@@ -198,15 +242,33 @@ class AbstractGenerateConnectorOnMachine(with_metaclass(
         """
         return self._param_generator_id(delays)
 
-    def gen_delay_params(self, delays, pre_vertex_slice, post_vertex_slice):
+    def gen_delay_params(
+            self, delays, pre_vertex_slice, post_vertex_slice,
+            synapse_info=None):
         """ Get the parameters of the delay generator on the machine
 
         :rtype: numpy array of uint32
         """
-        seed = self._generate_param_seed(
-            pre_vertex_slice, post_vertex_slice, delays,
-            self.__delay_seed)
-        return self._param_generator_params(delays, seed)
+        return self.gen_delay_params_for_slice_pairs(
+            delays, [pre_vertex_slice], [post_vertex_slice], synapse_info)[0]
+
+    def gen_delay_params_for_slice_pairs(
+            self, delays, pre_vertex_slices, post_vertex_slices,
+            synapse_info=None):
+        """ Get the parameters of the delay generator on the machine for\
+            several pairs of slices at once
+
+        :param delays: the delays to generate
+        :param pre_vertex_slices: the pre-slice of each pair
+        :param post_vertex_slices: the post-slice of each pair
+        :param SynapseInformation synapse_info:
+            the projection the delays are for
+        :return: the parameters of each pair, one pair per row
+        :rtype: 2D numpy array of uint32
+        """
+        return self._param_generator_params(
+            delays, _DELAY_SEED_STREAM, pre_vertex_slices, post_vertex_slices,
+            synapse_info)
 
     def gen_delay_params_size_in_bytes(self, delays):
         """ The size of the delay parameters in bytes
@@ -43,8 +43,7 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine,
         "__n_post",
         "__post_neurons",
         "__post_neurons_set",
-        "__with_replacement",
-        "__post_connector_seed"]
+        "__with_replacement"]
 
     def __init__(
             self, n, allow_self_connections=True, with_replacement=False,
@@ -73,7 +72,6 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine,
         self.__with_replacement = with_replacement
         self.__post_neurons = None
         self.__post_neurons_set = False
-        self.__post_connector_seed = dict()
         self._rng = rng
 
     def set_projection_information(self, machine_time_step, synapse_info):
@@ -265,11 +263,9 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine,
             synapse_type, synapse_info):
         params = self._basic_connector_params(synapse_info)
 
-        # The same seed needs to be sent to each of the slices
-        key = (id(pre_vertex_slice), id(post_slices))
-        if key not in self.__post_connector_seed:
-            self.__post_connector_seed[key] = [
-                int(i * 0xFFFFFFFF) for i in self._rng.next(n=4)]
+        # The same seed needs to be sent to each of the post-slices
+        seed = self._get_connector_seed(
+            pre_vertex_slice, None, self._rng, synapse_info)
 
         # Only deal with self-connections if the two populations are the same
         self_connections = True
@@ -281,7 +277,7 @@ class FixedNumberPostConnector(AbstractGenerateConnectorOnMachine,
             self.__with_replacement,
             self.__n_post,
             synapse_info.n_post_neurons])
-        params.extend(self.__post_connector_seed[key])
+        params.extend(seed)
         return numpy.array(params, dtype="uint32")
 
     @property
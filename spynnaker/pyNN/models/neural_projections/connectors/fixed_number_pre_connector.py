@@ -42,8 +42,7 @@ class FixedNumberPreConnector(AbstractGenerateConnectorOnMachine,
         "__n_pre",
         "__pre_neurons",
         "__pre_neurons_set",
-        "__with_replacement",
-        "__pre_connector_seed"]
+        "__with_replacement"]
 
     def __init__(
             self, n, allow_self_connections=True, with_replacement=False,
@@ -77,7 +76,6 @@ class FixedNumberPreConnector(AbstractGenerateConnectorOnMachine,
         self.__with_replacement = with_replacement
         self.__pre_neurons_set = False
         self.__pre_neurons = None
-        self.__pre_connector_seed = dict()
         self._rng = rng
 
     def set_projection_information(self, machine_time_step, synapse_info):
@@ -270,11 +268,9 @@ class FixedNumberPreConnector(AbstractGenerateConnectorOnMachine,
             synapse_type, synapse_info):
         params = self._basic_connector_params(synapse_info)
 
-        # The same seed needs to be sent to each of the slices
-        key = (id(pre_slices), id(post_vertex_slice))
-        if key not in self.__pre_connector_seed:
-            self.__pre_connector_seed[key] = [
-                int(i * 0xFFFFFFFF) for i in self._rng.next(n=4)]
+        # The same seed needs to be sent to each of the pre-slices
+        seed = self._get_connector_seed(
+            None, post_vertex_slice, self._rng, synapse_info)
 
         # Only deal with self-connections if the two populations are the same
         self_connections = True
@@ -287,7 +283,7 @@ class FixedNumberPreConnector(AbstractGenerateConnectorOnMachine,
             self.__with_replacement,
             self.__n_pre,
             synapse_info.n_pre_neurons])
-        params.extend(self.__pre_connector_seed[key])
+        params.extend(seed)
         return numpy.array(params, dtype="uint32")
 
     @property
@@ -163,7 +163,7 @@ class FixedProbabilityConnector(AbstractGenerateConnectorOnMachine,
             DataType.U032.max if self._p_connect == 1.0 else self._p_connect)])
 
         params.extend(self._get_connector_seed(
-            pre_vertex_slice, post_vertex_slice, self._rng))
+            pre_vertex_slice, post_vertex_slice, self._rng, synapse_info))
         return numpy.array(params, dtype="uint32")
 
     @property
@@ -20,6 +20,7 @@ from spinn_front_end_common.utilities.constants import \
     MICRO_TO_MILLISECOND_CONVERSION
 from spinn_utilities.overrides import overrides
 from spinn_front_end_common.utilities import globals_variables
+from spynnaker.pyNN.utilities.utility_calls import get_slice_limits
 from .abstract_connector import AbstractConnector
 from spynnaker.pyNN.exceptions import InvalidParameterType
 
@@ -260,6 +261,46 @@ class FromListConnector(AbstractConnector):
         self._split_connections(pre_slices, post_slices)
         return len(self.__split_conn_list[(pre_hi, post_hi)])
 
+    def get_n_connections_per_slice_pair(self, pre_slices, post_slices):
+        """ Get the number of connections between each pair of pre- and\
+            post-slices.
+
+        :param list(~pacman.model.graphs.common.Slice) pre_slices:
+        :param list(~pacman.model.graphs.common.Slice) post_slices:
+        :return: An array of shape (len(pre_slices), len(post_slices))
+        :rtype: ~numpy.ndarray
+        """
+        n_pairs = (len(pre_slices), len(post_slices))
+        if not len(self.__sources):
+            return numpy.zeros(n_pairs, dtype="int64")
+
+        # Find the slice of each end of each connection, ignoring outliers
+        pre_indices = self.__get_slice_indices(pre_slices, self.__sources)
+        post_indices = self.__get_slice_indices(post_slices, self.__targets)
+        in_slices = (pre_indices >= 0) & (post_indices >= 0)
+        joined_indices = numpy.ravel_multi_index(
+            (pre_indices[in_slices], post_indices[in_slices]), n_pairs)
+        return numpy.bincount(
+            joined_indices, minlength=numpy.prod(n_pairs)).reshape(n_pairs)
+
+    def __get_slice_indices(self, slices, atoms):
+        """ Get the index of the slice containing each atom, or -1 if it is\
+            not in any slice
+        """
+        lo_atoms, hi_atoms = get_slice_limits(slices)
+        order = numpy.argsort(lo_atoms)
+        positions = numpy.searchsorted(
+            lo_atoms[order], atoms, side="right") - 1
+        indices = order[numpy.maximum(positions, 0)]
+        found = (positions >= 0) & (atoms <= hi_atoms[indices])
+        return numpy.where(found, indices, -1)
+
+    @overrides(AbstractConnector.get_connected_slice_pairs)
+    def get_connected_slice_pairs(
+            self, pre_slices, post_slices, synapse_info):
+        return self.get_n_connections_per_slice_pair(
+            pre_slices, post_slices) > 0
+
     @conn_list.setter
     def conn_list(self, conn_list):
         if conn_list is None or not len(conn_list):
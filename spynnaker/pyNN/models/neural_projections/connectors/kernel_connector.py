@@ -17,6 +17,7 @@ import numpy
 from pyNN.random import RandomDistribution
 from .abstract_connector import AbstractConnector
 from spynnaker.pyNN.exceptions import SpynnakerException
+from spynnaker.pyNN.utilities.utility_calls import get_slice_limits
 from spinn_utilities.overrides import overrides
 from data_specification.enums.data_type import DataType
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
@@ -342,16 +343,16 @@ class KernelConnector(AbstractGenerateConnectorOnMachine):
         return super(KernelConnector, self).gen_delay_params_size_in_bytes(
             delays)
 
-    @overrides(AbstractGenerateConnectorOnMachine.gen_delay_params)
-    def gen_delay_params(self, delays, pre_vertex_slice, post_vertex_slice):
+    @overrides(AbstractGenerateConnectorOnMachine.
+               gen_delay_params_for_slice_pairs)
+    def gen_delay_params_for_slice_pairs(
+            self, delays, pre_vertex_slices, post_vertex_slices,
+            synapse_info=None):
         if self._krn_delays is not None:
-            properties = self._kernel_properties
-            properties.append(post_vertex_slice.lo_atom)
-            data = numpy.array(properties, dtype="uint32")
-            values = DataType.S1615.encode_as_numpy_int_array(self._krn_delays)
-            return numpy.concatenate((data, values.flatten()))
-        return super(KernelConnector, self).gen_delay_params(
-            delays, pre_vertex_slice, post_vertex_slice)
+            return self.__kernel_params_for_slice_pairs(
+                self._krn_delays, post_vertex_slices)
+        return super(KernelConnector, self).gen_delay_params_for_slice_pairs(
+            delays, pre_vertex_slices, post_vertex_slices, synapse_info)
 
     @overrides(AbstractGenerateConnectorOnMachine.gen_weights_id)
     def gen_weights_id(self, weights):
@@ -368,17 +369,29 @@ class KernelConnector(AbstractGenerateConnectorOnMachine):
         return super(KernelConnector, self).gen_weight_params_size_in_bytes(
             weights)
 
-    @overrides(AbstractGenerateConnectorOnMachine.gen_weights_params)
-    def gen_weights_params(self, weights, pre_vertex_slice, post_vertex_slice):
+    @overrides(AbstractGenerateConnectorOnMachine.
+               gen_weights_params_for_slice_pairs)
+    def gen_weights_params_for_slice_pairs(
+            self, weights, pre_vertex_slices, post_vertex_slices,
+            synapse_info=None):
         if self._krn_weights is not None:
-            properties = self._kernel_properties
-            properties.append(post_vertex_slice.lo_atom)
-            data = numpy.array(properties, dtype="uint32")
-            values = DataType.S1615.encode_as_numpy_int_array(
-                self._krn_weights)
-            return numpy.concatenate((data, values.flatten()))
-        return super(KernelConnector, self).gen_weights_params(
-            weights, pre_vertex_slice, post_vertex_slice)
+            return self.__kernel_params_for_slice_pairs(
+                self._krn_weights, post_vertex_slices)
+        return super(
+            KernelConnector, self).gen_weights_params_for_slice_pairs(
+                weights, pre_vertex_slices, post_vertex_slices, synapse_info)
+
+    def __kernel_params_for_slice_pairs(self, kernel, post_vertex_slices):
+        """ Get the kernel generator parameters for each post-slice, one\
+            row per slice
+        """
+        post_lo, _ = get_slice_limits(post_vertex_slices)
+        data = numpy.array(self._kernel_properties, dtype="uint32")
+        values = DataType.S1615.encode_as_numpy_int_array(kernel).flatten()
+        return numpy.hstack((
+            numpy.tile(data, (len(post_lo), 1)),
+            post_lo.astype("uint32")[:, None],
+            numpy.tile(values.astype("uint32"), (len(post_lo), 1))))
 
     @property
     @overrides(AbstractGenerateConnectorOnMachine.gen_connector_id)
@@ -332,7 +332,7 @@ class MultapseConnector(AbstractGenerateConnectorOnMachine,
             n_connections,
             pre_size * post_size])
         params.extend(self._get_connector_seed(
-            pre_vertex_slice, post_vertex_slice, self._rng))
+            pre_vertex_slice, post_vertex_slice, self._rng, synapse_info))
         return numpy.array(params, dtype="uint32")
 
     @property
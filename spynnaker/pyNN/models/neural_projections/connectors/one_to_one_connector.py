@@ -16,6 +16,7 @@
 import logging
 import numpy
 from spinn_utilities.overrides import overrides
+from spynnaker.pyNN.utilities.utility_calls import get_slice_limits
 from .abstract_connector import AbstractConnector
 from .abstract_generate_connector_on_machine import (
     AbstractGenerateConnectorOnMachine, ConnectorIDs)
@@ -109,6 +110,55 @@ class OneToOneConnector(AbstractGenerateConnectorOnMachine,
         block["synapse_type"] = synapse_type
         return block
 
+    @overrides(AbstractConnector.get_connected_slice_pairs)
+    def get_connected_slice_pairs(
+            self, pre_slices, post_slices, synapse_info):
+        pre_lo, pre_hi = get_slice_limits(pre_slices)
+        post_lo, post_hi = get_slice_limits(post_slices)
+
+        # Make the pre-slices the rows and the post-slices the columns
+        pre_lo = pre_lo[:, None]
+        pre_hi = pre_hi[:, None]
+        post_lo = post_lo[None, :]
+        post_hi = post_hi[None, :]
+
+        if synapse_info.prepop_is_view:
+            prepop_lo = synapse_info.pre_population._indexes[0]
+            prepop_hi = synapse_info.pre_population._indexes[-1]
+        if synapse_info.postpop_is_view:
+            postpop_lo = synapse_info.post_population._indexes[0]
+            postpop_hi = synapse_info.post_population._indexes[-1]
+
+        # Both are views; the slices must overlap relative to the view starts
+        # and both must overlap their views
+        if synapse_info.prepop_is_view and synapse_info.postpop_is_view:
+            unconnected = (
+                (pre_hi - prepop_lo < post_lo - postpop_lo) |
+                (pre_lo - prepop_lo > post_hi - postpop_lo) |
+                (pre_hi < prepop_lo) | (pre_lo > prepop_hi) |
+                (post_hi < postpop_lo) | (post_lo > postpop_hi))
+
+        # Only the pre-population is a view
+        elif synapse_info.prepop_is_view:
+            unconnected = (
+                (pre_hi - prepop_lo < post_lo) |
+                (pre_lo - prepop_lo > post_hi) |
+                (pre_hi < prepop_lo) | (pre_lo > prepop_hi))
+
+        # Only the post-population is a view
+        elif synapse_info.postpop_is_view:
+            unconnected = (
+                (pre_hi < post_lo - postpop_lo) |
+                (pre_lo > post_hi - postpop_lo) |
+                (post_hi < postpop_lo) | (post_lo > postpop_hi))
+
+        # The usual scenario with normal populations
+        else:
+            unconnected = (pre_hi < post_lo) | (pre_lo > post_hi)
+
+        return numpy.broadcast_to(
+            ~unconnected, (len(pre_slices), len(post_slices)))
+
     def __repr__(self):
         return "OneToOneConnector()"
 
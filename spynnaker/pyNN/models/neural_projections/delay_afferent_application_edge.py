@@ -13,11 +13,16 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from spinn_utilities.overrides import overrides
 from pacman.model.graphs.application import ApplicationEdge
+from spynnaker.pyNN.models.abstract_models import (
+    AbstractFilterableApplicationEdge)
+from spynnaker.pyNN.utilities.utility_calls import get_slice_limits
 from .delay_afferent_machine_edge import DelayAfferentMachineEdge
 
 
-class DelayAfferentApplicationEdge(ApplicationEdge):
+class DelayAfferentApplicationEdge(
+        ApplicationEdge, AbstractFilterableApplicationEdge):
     __slots__ = ()
 
     def __init__(self, prevertex, delayvertex, label=None):
@@ -26,3 +31,12 @@ class DelayAfferentApplicationEdge(ApplicationEdge):
 
     def create_machine_edge(self, pre_vertex, post_vertex, label):
         return DelayAfferentMachineEdge(pre_vertex, post_vertex, label)
+
+    @overrides(AbstractFilterableApplicationEdge.filter_slice_pairs)
+    def filter_slice_pairs(self, pre_slices, post_slices):
+        # Only the edges between matching slices are needed
+        pre_lo, pre_hi = get_slice_limits(pre_slices)
+        post_lo, post_hi = get_slice_limits(post_slices)
+        return (
+            (pre_lo[:, None] != post_lo[None, :]) |
+            (pre_hi[:, None] != post_hi[None, :]))
@@ -13,12 +13,19 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy
 from spinn_utilities.overrides import overrides
 from pacman.model.graphs.application import ApplicationEdge
+from spynnaker.pyNN.models.abstract_models import (
+    AbstractFilterableApplicationEdge)
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    OneToOneConnector)
+from spynnaker.pyNN.utilities.utility_calls import get_slice_limits
 from .delayed_machine_edge import DelayedMachineEdge
 
 
-class DelayedApplicationEdge(ApplicationEdge):
+class DelayedApplicationEdge(
+        ApplicationEdge, AbstractFilterableApplicationEdge):
     __slots__ = [
         "__synapse_information"]
 
@@ -39,3 +46,17 @@ class DelayedApplicationEdge(ApplicationEdge):
     def create_machine_edge(self, pre_vertex, post_vertex, label):
         return DelayedMachineEdge(
             self.__synapse_information, pre_vertex, post_vertex, label)
+
+    @overrides(AbstractFilterableApplicationEdge.filter_slice_pairs)
+    def filter_slice_pairs(self, pre_slices, post_slices):
+        # Filter one-to-one connections that are out of range
+        filtered = numpy.zeros(
+            (len(pre_slices), len(post_slices)), dtype="bool")
+        pre_lo, pre_hi = get_slice_limits(pre_slices)
+        post_lo, post_hi = get_slice_limits(post_slices)
+        for synapse_info in self.__synapse_information:
+            if isinstance(synapse_info.connector, OneToOneConnector):
+                filtered |= (
+                    (pre_hi[:, None] < post_lo[None, :]) |
+                    (pre_lo[:, None] > post_hi[None, :]))
+        return filtered
@@ -14,18 +14,27 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import logging
+import numpy
 from spinn_utilities.overrides import overrides
 from pacman.model.graphs.application import ApplicationEdge
+from spinn_front_end_common.interface.provenance import (
+    AbstractProvidesLocalProvenanceData)
+from spinn_front_end_common.utilities.utility_objs import ProvenanceDataItem
+from spynnaker.pyNN.models.abstract_models import (
+    AbstractFilterableApplicationEdge)
 from .projection_machine_edge import ProjectionMachineEdge
 
 logger = logging.getLogger(__name__)
 
 
-class ProjectionApplicationEdge(ApplicationEdge):
+class ProjectionApplicationEdge(
+        ApplicationEdge, AbstractFilterableApplicationEdge,
+        AbstractProvidesLocalProvenanceData):
     """ An edge which terminates on an :py:class:`AbstractPopulationVertex`.
     """
     __slots__ = [
         "__delay_edge",
+        "__n_filtered_machine_edges",
         "__stored_synaptic_data_from_machine",
         "__synapse_information"]
 
@@ -44,6 +53,9 @@ class ProjectionApplicationEdge(ApplicationEdge):
 
         self.__stored_synaptic_data_from_machine = None
 
+        # The number of machine edges removed by the graph edge filter
+        self.__n_filtered_machine_edges = 0
+
     def add_synapse_information(self, synapse_information):
         self.__synapse_information.append(synapse_information)
 
@@ -70,3 +82,32 @@ class ProjectionApplicationEdge(ApplicationEdge):
             self, pre_vertex, post_vertex, label):
         return ProjectionMachineEdge(
             self.__synapse_information, pre_vertex, post_vertex, label)
+
+    @overrides(AbstractFilterableApplicationEdge.filter_slice_pairs)
+    def filter_slice_pairs(self, pre_slices, post_slices):
+        # Filter pairs that none of the connectors could connect
+        connected = numpy.zeros(
+            (len(pre_slices), len(post_slices)), dtype="bool")
+        for synapse_info in self.__synapse_information:
+            connected |= synapse_info.connector.get_connected_slice_pairs(
+                pre_slices, post_slices, synapse_info)
+        return ~connected
+
+    @property
+    def n_filtered_machine_edges(self):
+        """ The number of machine edges of this edge that were filtered out\
+            of the machine graph
+
+        :rtype: int
+        """
+        return self.__n_filtered_machine_edges
+
+    @n_filtered_machine_edges.setter
+    def n_filtered_machine_edges(self, n_filtered_machine_edges):
+        self.__n_filtered_machine_edges = n_filtered_machine_edges
+
+    @overrides(AbstractProvidesLocalProvenanceData.get_local_provenance_data)
+    def get_local_provenance_data(self):
+        return [ProvenanceDataItem(
+            [self.label, "Number_of_filtered_machine_edges"],
+            self.__n_filtered_machine_edges)]
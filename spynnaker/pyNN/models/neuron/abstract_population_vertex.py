@@ -16,6 +16,7 @@
 import logging
 import os
 import math
+import numpy
 from spinn_utilities.overrides import overrides
 from pacman.model.constraints.key_allocator_constraints import (
     ContiguousKeyRangeContraint)
@@ -178,6 +179,40 @@ class AbstractPopulationVertex(
     def _neuron_recorder(self):  # for testing only
         return self.__neuron_recorder
 
+    @property
+    def neuron_impl(self):
+        """ The implementation of the neurons of the vertex
+
+        :rtype: AbstractNeuronImpl
+        """
+        return self.__neuron_impl
+
+    def get_component_values(self, component, vertex_slice, ts):
+        """ Get the values of the struct of a standard neuron component for\
+            a slice, as they would be read back from the machine
+
+        :param AbstractStandardNeuronComponent component:\
+            The component to get the values of
+        :param ~pacman.model.graphs.common.Slice vertex_slice:\
+            The slice of atoms to get the values of
+        :param float ts:\
+            The time to be advanced in one call to the update of the component
+        :return: an array of values for each struct field
+        :rtype: list(~numpy.ndarray)
+        """
+        data = component.get_data(
+            self._parameters, self._state_variables, vertex_slice, ts)
+        return component.struct.read_data(
+            data.tobytes(), 0, vertex_slice.n_atoms)
+
+    def get_recorded_indexes(self, variable):
+        """ Get the IDs of the neurons recording a variable
+
+        :param str variable: The variable to get the IDs of
+        :rtype: list(int)
+        """
+        return self.__neuron_recorder.get_recorded_indexes(variable)
+
     @inject_items({
         "graph": "MemoryApplicationGraph",
         "machine_time_step": "MachineTimeStep"
@@ -407,6 +442,12 @@ class AbstractPopulationVertex(
         # pylint: disable=too-many-arguments, arguments-differ
         vertex_slice = graph_mapper.get_slice(placement.vertex)
 
+        # If nothing on this core has changed, leave its memory as it is
+        if not self.__change_requires_neuron_parameters_reload and \
+                not self.__slice_has_changes(vertex_slice):
+            spec.end_specification()
+            return
+
         # reserve the neuron parameters data region
         self._reserve_neuron_params_data_region(
             spec, graph_mapper.get_slice(placement.vertex))
@@ -418,14 +459,31 @@ class AbstractPopulationVertex(
             machine_time_step=machine_time_step, spec=spec,
             time_scale_factor=time_scale_factor,
             vertex_slice=vertex_slice)
+        self.__clear_slice_changes(vertex_slice)
 
         # close spec
         spec.end_specification()
 
+    def __slice_has_changes(self, vertex_slice):
+        return (
+            self._parameters.has_changes(
+                vertex_slice.lo_atom, vertex_slice.hi_atom + 1) or
+            self._state_variables.has_changes(
+                vertex_slice.lo_atom, vertex_slice.hi_atom + 1))
+
+    def __clear_slice_changes(self, vertex_slice):
+        self._parameters.clear_changes(
+            vertex_slice.lo_atom, vertex_slice.hi_atom + 1)
+        self._state_variables.clear_changes(
+            vertex_slice.lo_atom, vertex_slice.hi_atom + 1)
+
     @overrides(AbstractRewritesDataSpecification
                .requires_memory_regions_to_be_reloaded)
     def requires_memory_regions_to_be_reloaded(self):
-        return self.__change_requires_neuron_parameters_reload
+        return (
+            self.__change_requires_neuron_parameters_reload or
+            self._parameters.has_changes() or
+            self._state_variables.has_changes())
 
     @overrides(AbstractRewritesDataSpecification.mark_regions_reloaded)
     def mark_regions_reloaded(self):
@@ -484,6 +542,7 @@ class AbstractPopulationVertex(
         # Write the neuron parameters
         self._write_neuron_parameters(
             spec, key, vertex_slice, machine_time_step, time_scale_factor)
+        self.__clear_slice_changes(vertex_slice)
 
         # write profile data
         profile_utils.write_profile_region_data(
@@ -537,6 +596,14 @@ class AbstractPopulationVertex(
             placements, graph_mapper, self, NeuronRecorder.SPIKES,
             machine_time_step)
 
+    @overrides(AbstractSpikeRecordable.get_spike_counts)
+    def get_spike_counts(
+            self, placements, graph_mapper, buffer_manager, machine_time_step):
+        return self.__neuron_recorder.get_spike_counts(
+            self.label, buffer_manager,
+            len(self.__neuron_impl.get_recordable_variables()),
+            placements, graph_mapper, self, NeuronRecorder.SPIKES)
+
     @overrides(AbstractNeuronRecordable.get_recordable_variables)
     def get_recordable_variables(self):
         return self.__neuron_recorder.get_recordable_variables()
@@ -581,7 +648,6 @@ class AbstractPopulationVertex(
                 " parameter {}".format(variable))
         self._state_variables.set_value(variable, value)
         self.__updated_state_variables.add(variable)
-        self.__change_requires_neuron_parameters_reload = True
 
     @property
     def initialize_parameters(self):
@@ -654,11 +720,33 @@ class AbstractPopulationVertex(
                 "Population {} does not have parameter {}".format(
                     self.__neuron_impl.model_name, key))
         self._parameters.set_value(key, value)
-        self.__change_requires_neuron_parameters_reload = True
 
     @overrides(AbstractReadParametersBeforeSet.read_parameters_from_machine)
     def read_parameters_from_machine(
             self, transceiver, placement, vertex_slice):
+        self.update_parameters_from_data(
+            self.read_parameter_data_from_machine(
+                transceiver, placement, vertex_slice),
+            transceiver, placement, vertex_slice)
+
+    @overrides(
+        AbstractReadParametersBeforeSet.get_slices_to_read_before_set)
+    def get_slices_to_read_before_set(self, vertex_slices, selector=None):
+        # Only the cores holding changed atoms are reloaded, so only those
+        # need to be read
+        if selector is None:
+            return list(vertex_slices)
+        ids = numpy.unique(self._parameters.selector_to_ids(selector))
+        return [
+            vertex_slice for vertex_slice in vertex_slices
+            if numpy.any(
+                (ids >= vertex_slice.lo_atom) &
+                (ids <= vertex_slice.hi_atom))]
+
+    @overrides(
+        AbstractReadParametersBeforeSet.read_parameter_data_from_machine)
+    def read_parameter_data_from_machine(
+            self, transceiver, placement, vertex_slice):
 
         # locate SDRAM address to where the neuron parameters are stored
         neuron_region_sdram_address = \
@@ -677,14 +765,17 @@ class AbstractPopulationVertex(
         size_of_region -= self.BYTES_TILL_START_OF_GLOBAL_PARAMETERS
 
         # get data from the machine
-        byte_array = transceiver.read_memory(
+        return transceiver.read_memory(
             placement.x, placement.y, neuron_parameters_sdram_address,
             size_of_region)
 
+    @overrides(AbstractReadParametersBeforeSet.update_parameters_from_data)
+    def update_parameters_from_data(
+            self, data, transceiver, placement, vertex_slice):
+
         # update python neuron parameters with the data
         self.__neuron_impl.read_data(
-            byte_array, 0, vertex_slice, self._parameters,
-            self._state_variables)
+            data, 0, vertex_slice, self._parameters, self._state_variables)
 
     @property
     def weight_scale(self):
@@ -739,6 +830,30 @@ class AbstractPopulationVertex(
             placements, monitor_api, monitor_cores,
             handle_time_out_configuration, fixed_routes, extra_monitor)
 
+    def read_synaptic_blocks_from_machine(
+            self, transceiver, placement, edges_and_infos, graph_mapper,
+            routing_infos, using_extra_monitor_cores, placements=None,
+            monitor_api=None, extra_monitor=None, fixed_routes=None):
+        # pylint: disable=too-many-arguments
+        return self.__synapse_manager.read_synaptic_blocks_from_machine(
+            transceiver, placement, edges_and_infos, graph_mapper,
+            routing_infos, using_extra_monitor_cores, placements,
+            monitor_api, extra_monitor, fixed_routes)
+
+    def get_connections_from_blocks(
+            self, placement, edge, graph_mapper, synapse_information,
+            blocks, machine_time_step):
+        # pylint: disable=too-many-arguments
+        return self.__synapse_manager.get_connections_from_blocks(
+            placement, edge, graph_mapper, synapse_information, blocks,
+            machine_time_step)
+
+    def get_host_expanded_connections(
+            self, placement, edges_and_infos, graph_mapper,
+            machine_time_step):
+        return self.__synapse_manager.get_host_expanded_connections(
+            placement, edges_and_infos, graph_mapper, machine_time_step)
+
     def clear_connection_cache(self):
         self.__synapse_manager.clear_connection_cache()
 
@@ -13,7 +13,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from collections import defaultdict
 import numpy
+from six import itervalues
 from data_specification.enums.data_type import DataType
 from spinn_front_end_common.utilities.constants import (
     MICRO_TO_MILLISECOND_CONVERSION, BYTES_PER_WORD)
@@ -63,6 +65,22 @@ class GeneratorData(object):
         self.__max_stage = max_stage
         self.__machine_time_step = machine_time_step
 
+    @property
+    def synapse_information(self):
+        """ The synapse information of the connection
+
+        :rtype: SynapseInformation
+        """
+        return self.__synapse_information
+
+    @property
+    def pre_vertex_slice(self):
+        """ The slice of the pre-vertex of the connection
+
+        :rtype: ~pacman.model.graphs.common.Slice
+        """
+        return self.__pre_vertex_slice
+
     @property
     def size(self):
         """ The size of the generated data in bytes
@@ -86,6 +104,50 @@ class GeneratorData(object):
 
         :rtype: ~numpy.ndarray(~numpy.uint32)
         """
+        connector = self.__synapse_information.connector
+        return self.__gen_data(
+            connector.gen_weights_params(
+                self.__synapse_information.weights, self.__pre_vertex_slice,
+                self.__post_vertex_slice, self.__synapse_information),
+            connector.gen_delay_params(
+                self.__synapse_information.delays, self.__pre_vertex_slice,
+                self.__post_vertex_slice, self.__synapse_information))
+
+    @staticmethod
+    def get_all_gen_data(generator_data):
+        """ The data to be written for each of a list of connections.  The\
+            weight and delay generator parameters of all the connections of\
+            each projection are encoded together.
+
+        :param list(GeneratorData) generator_data: the connections
+        :rtype: list(~numpy.ndarray(~numpy.uint32))
+        """
+        # pylint: disable=protected-access
+        by_info = defaultdict(list)
+        for index, data in enumerate(generator_data):
+            by_info[data.__synapse_information].append(index)
+
+        weight_params = [None] * len(generator_data)
+        delay_params = [None] * len(generator_data)
+        for indices in itervalues(by_info):
+            info = generator_data[indices[0]].__synapse_information
+            pre_slices = [
+                generator_data[i].__pre_vertex_slice for i in indices]
+            post_slices = [
+                generator_data[i].__post_vertex_slice for i in indices]
+            weights = info.connector.gen_weights_params_for_slice_pairs(
+                info.weights, pre_slices, post_slices, info)
+            delays = info.connector.gen_delay_params_for_slice_pairs(
+                info.delays, pre_slices, post_slices, info)
+            for i, index in enumerate(indices):
+                weight_params[index] = weights[i]
+                delay_params[index] = delays[i]
+
+        return [
+            data.__gen_data(weight_params[i], delay_params[i])
+            for i, data in enumerate(generator_data)]
+
+    def __gen_data(self, weight_params, delay_params):
         connector = self.__synapse_information.connector
         synapse_dynamics = self.__synapse_information.synapse_dynamics
         items = list()
@@ -113,10 +175,6 @@ class GeneratorData(object):
             self.__post_slice_index, self.__pre_vertex_slice,
             self.__post_vertex_slice, self.__synapse_information.synapse_type,
             self.__synapse_information))
-        items.append(connector.gen_weights_params(
-            self.__synapse_information.weights, self.__pre_vertex_slice,
-            self.__post_vertex_slice))
-        items.append(connector.gen_delay_params(
-            self.__synapse_information.delays, self.__pre_vertex_slice,
-            self.__post_vertex_slice))
+        items.append(weight_params)
+        items.append(delay_params)
         return numpy.concatenate(items)
@@ -0,0 +1,1004 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" A host version of the synapse expander, which generates the connections\
+    described by the data of the connector builder region in the same way as\
+    ``synapse_expander.aplx`` does on the machine, including the random\
+    number streams and the fixed point arithmetic.  This lets the\
+    connections be known without running the expander or reading the\
+    synaptic matrix back from the machine.
+
+The only generators that do not reproduce the machine exactly are those of\
+the normal distributions, which use an approximation to the inverse of the\
+normal distribution function used by the machine (``norminv_urt``).
+"""
+
+import numpy
+from scipy import special  # @UnresolvedImport
+from spinn_front_end_common.utilities.constants import (
+    MICRO_TO_MILLISECOND_CONVERSION)
+from spynnaker.pyNN.exceptions import SpynnakerException
+from spynnaker.pyNN.models.neural_projections.connectors.\
+    abstract_generate_connector_on_machine import (
+        ConnectorIDs, PARAM_TYPE_BY_NAME, PARAM_TYPE_CONSTANT_ID,
+        PARAM_TYPE_KERNEL)
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    AbstractSynapseDynamics)
+from spynnaker.pyNN.models.neuron.synapse_dynamics.\
+    abstract_generate_on_machine import MatrixGeneratorID
+
+_UINT32_MASK = 0xFFFFFFFF
+
+# The fixed point representation of accum (S1615)
+_ACCUM_SHIFT = 15
+_ACCUM_ONE = 1 << _ACCUM_SHIFT
+
+# The offset of a matrix that is not present
+_NO_MATRIX = 0xFFFFFFFF
+
+# The number of time steps of delay handled by each delay stage
+_MAX_DELAY_PER_STAGE = 16
+
+# The number of words in the header of each connector
+_N_CONNECTOR_HEADER_WORDS = 15
+
+# The number of words of kernel properties
+_N_KERNEL_WORDS = 8
+
+
+def _to_int16(values):
+    return ((numpy.asarray(values, dtype="int64") + 0x8000) % 0x10000) - \
+        0x8000
+
+
+def _to_int32(values):
+    return ((numpy.asarray(values, dtype="int64") + 0x80000000) %
+            0x100000000) - 0x80000000
+
+
+def _accum_multiply(a, b):
+    """ Multiply accum values as the machine does, truncating the result
+    """
+    return _to_int32(
+        (numpy.asarray(a, dtype="int64") * numpy.asarray(b, dtype="int64")) >>
+        _ACCUM_SHIFT)
+
+
+def _fract_multiply(u, values):
+    """ Multiply unsigned long fract values (given as their 32-bit\
+        representation) by integer or accum values, truncating the result
+    """
+    u = numpy.asarray(u, dtype="int64")
+    values = numpy.asarray(values, dtype="int64")
+    # Split to avoid overflow in 64 bits
+    return ((u >> 16) * values + (((u & 0xFFFF) * values) >> 16)) >> 16
+
+
+class MarsKiss64(object):
+    """ The random number generator used by the synapse expander\
+        (``mars_kiss64_seed`` of spinn_common).
+    """
+
+    __slots__ = [
+        "__seed"]
+
+    def __init__(self, seed):
+        """
+        :param seed: The 4 words of the seed
+        :type seed: list(int)
+        """
+        self.__seed = [int(value) & _UINT32_MASK for value in seed]
+
+    def next(self):
+        """ Get the next value
+
+        :rtype: int
+        """
+        return int(self.next_n(1)[0])
+
+    def next_n(self, n):
+        """ Get the next n values
+
+        :param int n: The number of values to get
+        :rtype: ~numpy.ndarray(uint32)
+        """
+        x, y, z, c = self.__seed
+        values = [0] * n
+        for i in range(n):
+            x = (314527869 * x + 1234567) & _UINT32_MASK
+            y ^= (y << 5) & _UINT32_MASK
+            y ^= y >> 7
+            y ^= (y << 22) & _UINT32_MASK
+            t = 4294584393 * z + c
+            c = t >> 32
+            z = t & _UINT32_MASK
+            values[i] = (x + y + z) & _UINT32_MASK
+        self.__seed = [x, y, z, c]
+        return numpy.array(values, dtype="uint32")
+
+    def random_in_range(self, range_):
+        """ Get a value in [0, range) using 15 random bits, as the\
+            connectors do
+
+        :param int range_: The size of the range
+        :rtype: int
+        """
+        return ((self.next() & 0x7FFF) * range_) >> 15
+
+    def random_in_ranges(self, ranges):
+        """ Get a value in [0, r) for each r in ranges using 15 random bits
+
+        :param ~numpy.ndarray ranges: The sizes of the ranges
+        :rtype: ~numpy.ndarray
+        """
+        ranges = numpy.asarray(ranges, dtype="int64")
+        values = self.next_n(len(ranges)).astype("int64") & 0x7FFF
+        return (values * ranges) >> 15
+
+    def exponential(self):
+        """ Get an exponentially distributed accum value (von Neumann's\
+            method, as ``exponential_dist_variate``)
+
+        :return: The raw accum value
+        :rtype: int
+        """
+        a = 0
+        while True:
+            u = self.next()
+            u0 = u
+            while True:
+                u_star = self.next()
+                if u < u_star:
+                    return (a << _ACCUM_SHIFT) + (u0 >> (32 - _ACCUM_SHIFT))
+                u = self.next()
+                if u >= u_star:
+                    break
+            a += 1
+
+    def normal_n(self, n):
+        """ Get n normally distributed accum values
+
+        :param int n: The number of values to get
+        :return: The raw accum values
+        :rtype: ~numpy.ndarray(int64)
+        """
+        # TODO: port the fixed point table and polynomials of norminv_urt
+        # from spinn_common, so that these are the values the machine makes
+        # and the normal parameter generators can be taken out of
+        # _INEXACT_PARAMS; until then, their connections are read back
+        values = (self.next_n(n).astype("float64") + 0.5) / 2.0 ** 32
+        return numpy.round(
+            special.ndtri(values) * _ACCUM_ONE).astype("int64")
+
+
+class _Reader(object):
+    """ Reads words from the connector builder data in turn
+    """
+
+    __slots__ = [
+        "__data",
+        "__position"]
+
+    def __init__(self, data):
+        self.__data = numpy.asarray(data, dtype="uint32")
+        self.__position = 0
+
+    def read(self, n_words):
+        values = self.__data[self.__position:self.__position + n_words]
+        if len(values) < n_words:
+            raise SpynnakerException(
+                "The synapse expander data ends unexpectedly")
+        self.__position += n_words
+        return values
+
+    def read_value(self):
+        return int(self.read(1)[0])
+
+    def read_accum(self):
+        return int(self.read(1).view("int32")[0])
+
+    def read_accums(self, n_words):
+        return self.read(n_words).view("int32").astype("int64")
+
+    def read_rng(self):
+        return MarsKiss64(self.read(4))
+
+    def read_half_words(self, n_words):
+        words = self.read(n_words).astype("int64")
+        return numpy.column_stack((words & 0xFFFF, words >> 16)).flatten()
+
+
+class _KernelShape(object):
+    """ The shapes and positions of a kernel connection, in the order of\
+        ``struct kernel``.
+    """
+
+    __slots__ = [
+        "pre_width", "post_width", "start_pre_height",
+        "start_post_width", "start_post_height", "step_pre_width",
+        "step_pre_height", "step_post_width", "step_post_height",
+        "kernel_width", "kernel_height"]
+
+    def __init__(self, reader):
+        (_, _, self.pre_width, _, self.post_width, _, _,
+         self.start_pre_height, self.start_post_width, self.start_post_height,
+         self.step_pre_width, self.step_pre_height, self.step_post_width,
+         self.step_post_height, self.kernel_width, self.kernel_height) = \
+            (int(value) for value in reader.read_half_words(_N_KERNEL_WORDS))
+
+    @staticmethod
+    def __pre_in_post_world(value, start, step):
+        d = _to_int16(value - start - 1)
+        quotient = numpy.abs(d) // step
+        return numpy.where(d < 0, 1 - quotient, quotient + 1)
+
+    def get_kernel_coordinates(self, pre_neuron_index, post_indices):
+        """ Get the row and column in the kernel of each post-neuron
+
+        :param int pre_neuron_index: The index of the pre-neuron
+        :param ~numpy.ndarray post_indices: The indices of the post-neurons
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        pre_r, pre_c = divmod(pre_neuron_index, self.pre_width)
+        post_r, post_c = numpy.divmod(
+            numpy.asarray(post_indices, dtype="int64"), self.post_width)
+
+        # Move the post coordinates into the common coordinate system
+        pac_r = (self.start_post_height + post_r * self.step_post_height) & \
+            0xFFFF
+        pac_c = (self.start_post_width + post_c * self.step_post_width) & \
+            0xFFFF
+
+        # Move the common coordinates into the pre coordinate system; as on
+        # the machine, the start row is used as the start of both
+        pap_r = self.__pre_in_post_world(
+            pac_r, self.start_pre_height, self.step_pre_height)
+        pap_c = self.__pre_in_post_world(
+            pac_c, self.start_pre_height, self.step_pre_width)
+
+        k_r = _to_int16((self.kernel_height >> 1) - _to_int16(pap_r - pre_r))
+        k_c = _to_int16((self.kernel_width >> 1) - _to_int16(pap_c - pre_c))
+        return k_r, k_c
+
+    def in_kernel(self, k_r, k_c):
+        return ((k_r >= 0) & (k_r < self.kernel_height) &
+                (k_c >= 0) & (k_c < self.kernel_width))
+
+
+class _ExpanderContext(object):
+    """ The state that the synapse expander keeps between connectors
+    """
+
+    __slots__ = [
+        "fixed_pre_indices",
+        "n_fixed_pre_neurons_done"]
+
+    def __init__(self):
+        self.fixed_pre_indices = None
+        self.n_fixed_pre_neurons_done = 0
+
+
+def _draw_without_replacement(rng, n_conns, n_values, exclude=None):
+    """ Reservoir sample n_conns of n_values, as the fixed number connectors\
+        do, optionally excluding one value
+    """
+    indices = list(range(n_conns))
+    replace_start = n_conns
+    if exclude is not None and exclude < n_conns:
+        indices[exclude] = n_conns
+        replace_start = n_conns + 1
+    candidates = [
+        i for i in range(replace_start, n_values) if i != exclude]
+    choices = rng.random_in_ranges(numpy.array(candidates) + 1)
+    for i, j in zip(candidates, choices.tolist()):
+        if j < n_conns:
+            indices[j] = i
+    return numpy.array(indices, dtype="int64")
+
+
+def _draw_with_replacement(rng, n_conns, n_values, exclude=None):
+    """ Sample n_conns of n_values with replacement, as the fixed number\
+        connectors do, optionally excluding one value
+    """
+    if exclude is None:
+        return rng.random_in_ranges(numpy.full(n_conns, n_values))
+    indices = numpy.zeros(n_conns, dtype="int64")
+    for i in range(n_conns):
+        j = rng.random_in_range(n_values)
+        while j == exclude:
+            j = rng.random_in_range(n_values)
+        indices[i] = j
+    return indices
+
+
+class _ViewConnector(object):
+    """ Reads the view of the populations common to most connectors
+    """
+
+    __slots__ = [
+        "_pre_lo",
+        "_pre_hi",
+        "_post_lo",
+        "_post_hi"]
+
+    def __init__(self, reader):
+        self._pre_lo = reader.read_value()
+        self._pre_hi = reader.read_value()
+        self._post_lo = reader.read_value()
+        self._post_hi = reader.read_value()
+
+    def _pre_in_view(self, pre_neuron_index):
+        return self._pre_lo <= pre_neuron_index <= self._pre_hi
+
+    def _post_in_view(self, post_slice_start, post_slice_count):
+        post = numpy.arange(
+            post_slice_start, post_slice_start + post_slice_count)
+        return (post >= self._post_lo) & (post <= self._post_hi)
+
+
+class _OneToOneConnector(_ViewConnector):
+    """ connection_generator_one_to_one.h
+    """
+
+    __slots__ = []
+
+    def generate(self, pre_slice_start, pre_slice_count, post_slice_start,
+                 post_slice_count, max_row_length):
+        if max_row_length < 1:
+            return _no_connections()
+        pre = numpy.arange(pre_slice_start, pre_slice_start + pre_slice_count)
+        post = pre - self._pre_lo + self._post_lo
+        keep = ((pre >= self._pre_lo) & (pre <= self._pre_hi) &
+                (post >= self._post_lo) & (post <= self._post_hi) &
+                (post >= post_slice_start) &
+                (post < post_slice_start + post_slice_count))
+        return pre[keep], post[keep] - post_slice_start
+
+
+class _AllToAllConnector(_ViewConnector):
+    """ connection_generator_all_to_all.h
+    """
+
+    __slots__ = [
+        "__allow_self_connections"]
+
+    def __init__(self, reader):
+        super(_AllToAllConnector, self).__init__(reader)
+        self.__allow_self_connections = reader.read_value()
+
+    def generate(self, pre_slice_start, pre_slice_count, post_slice_start,
+                 post_slice_count, max_row_length):
+        if max_row_length < 1:
+            return _no_connections()
+        pre = numpy.arange(pre_slice_start, pre_slice_start + pre_slice_count)
+        pre = pre[(pre >= self._pre_lo) & (pre <= self._pre_hi)]
+        mask = numpy.tile(
+            self._post_in_view(post_slice_start, post_slice_count),
+            (len(pre), 1))
+        if not self.__allow_self_connections:
+            mask &= (pre[:, None] != numpy.arange(
+                post_slice_start, post_slice_start + post_slice_count))
+        rows, columns = numpy.nonzero(mask)
+        return pre[rows], columns
+
+
+class _FixedProbabilityConnector(_ViewConnector):
+    """ connection_generator_fixed_prob.h
+    """
+
+    __slots__ = [
+        "__allow_self_connections",
+        "__probability",
+        "__rng"]
+
+    def __init__(self, reader):
+        super(_FixedProbabilityConnector, self).__init__(reader)
+        self.__allow_self_connections = reader.read_value()
+        self.__probability = reader.read_value()
+        self.__rng = reader.read_rng()
+
+    def generate(self, pre_slice_start, pre_slice_count, post_slice_start,
+                 post_slice_count, max_row_length):
+        if max_row_length < 1:
+            return _no_connections()
+        pre = numpy.arange(pre_slice_start, pre_slice_start + pre_slice_count)
+        pre = pre[(pre >= self._pre_lo) & (pre <= self._pre_hi)]
+        mask = numpy.tile(
+            self._post_in_view(post_slice_start, post_slice_count),
+            (len(pre), 1))
+        if not self.__allow_self_connections:
+            mask &= (pre[:, None] != numpy.arange(
+                post_slice_start, post_slice_start + post_slice_count))
+
+        # A random value is drawn for each candidate, in row order
+        connected = numpy.zeros(mask.shape, dtype="bool")
+        connected[mask] = (
+            self.__rng.next_n(int(mask.sum())) <= self.__probability)
+
+        # Rows are truncated when they are full
+        connected &= numpy.cumsum(connected, axis=1) <= max_row_length
+        rows, columns = numpy.nonzero(connected)
+        return pre[rows], columns
+
+
+class _FixedNumberConnector(_ViewConnector):
+    """ The parameters common to the connectors of a fixed number of\
+        connections
+    """
+
+    __slots__ = [
+        "_allow_self_connections",
+        "_with_replacement",
+        "_n_connections",
+        "_n_values",
+        "_rng"]
+
+    def __init__(self, reader):
+        super(_FixedNumberConnector, self).__init__(reader)
+        self._allow_self_connections = reader.read_value()
+        self._with_replacement = reader.read_value()
+        self._n_connections = reader.read_value()
+        self._n_values = reader.read_value()
+        self._rng = reader.read_rng()
+
+    def _draw(self, n_conns, n_values, exclude):
+        if self._with_replacement:
+            return _draw_with_replacement(
+                self._rng, n_conns, n_values,
+                None if self._allow_self_connections else exclude)
+        return _draw_without_replacement(
+            self._rng, n_conns, n_values,
+            None if self._allow_self_connections else exclude)
+
+
+class _FixedTotalConnector(_FixedNumberConnector):
+    """ connection_generator_fixed_total.h
+    """
+
+    __slots__ = []
+
+    def __binomial(self, n, n_total, k):
+        values = self._rng.next_n(n).astype("uint64")
+        return int(numpy.count_nonzero(
+            (values * numpy.uint64(n_total)) >> numpy.uint64(32) <
+            numpy.uint64(k)))
+
+    def __hypergeometric(self, n, n_total, k):
+        count = 0
+        k_remaining = k
+        not_k_remaining = n_total - k
+        for value in self._rng.next_n(n).tolist():
+            if ((value * (k_remaining + not_k_remaining)) >> 32) < \
+                    k_remaining:
+                count += 1
+                k_remaining -= 1
+            else:
+                not_k_remaining -= 1
+        return count
+
+    def __generate_row(self, pre_neuron_index, post_slice_start,
+                       post_slice_count, max_row_length):
+        if max_row_length == 0 or self._n_connections == 0:
+            return None
+        if not self._pre_in_view(pre_neuron_index):
+            return None
+
+        # Work out the range of the view on this slice
+        slice_hi = post_slice_start + post_slice_count - 1
+        if self._post_hi < post_slice_start or self._post_lo > slice_hi:
+            return None
+        slice_lo = max(self._post_lo, post_slice_start)
+        slice_hi = min(self._post_hi, slice_hi)
+        n_values = slice_hi - slice_lo + 1
+        if not self._allow_self_connections and \
+                self._post_lo <= pre_neuron_index <= self._post_hi:
+            n_values -= 1
+
+        # The last row gets all the remaining connections
+        if pre_neuron_index == self._pre_hi:
+            n_conns = self._n_connections
+        elif self._with_replacement:
+            n_conns = self.__binomial(
+                self._n_connections, self._n_values, n_values)
+        else:
+            n_conns = self.__hypergeometric(
+                self._n_connections, self._n_values, n_values)
+        n_conns = min(n_conns, max_row_length)
+
+        if self._with_replacement:
+            indices = self._rng.random_in_ranges(numpy.full(n_conns, n_values))
+        else:
+            indices = _draw_without_replacement(self._rng, n_conns, n_values)
+        self._n_connections -= n_conns
+        self._n_values -= n_values
+        return indices + slice_lo - post_slice_start
+
+    def generate(self, pre_slice_start, pre_slice_count, post_slice_start,
+                 post_slice_count, max_row_length):
+        return _generate_rows(
+            self.__generate_row, pre_slice_start, pre_slice_count,
+            post_slice_start, post_slice_count, max_row_length)
+
+
+class _FixedPreConnector(_FixedNumberConnector):
+    """ connection_generator_fixed_pre.h; the indices are generated for all\
+        the pre-neurons when the first pre-neuron is generated, and shared\
+        between connectors as on the machine.
+    """
+
+    __slots__ = [
+        "__context"]
+
+    def __init__(self, reader, context):
+        super(_FixedPreConnector, self).__init__(reader)
+        self.__context = context
+
+    def __generate_row(self, pre_neuron_index, post_slice_start,
+                       post_slice_count, max_row_length):
+        context = self.__context
+        n_conns = self._n_connections
+        if max_row_length == 0 or n_conns == 0:
+            return None
+
+        if pre_neuron_index == 0:
+            if context.fixed_pre_indices is not None:
+                raise SpynnakerException(
+                    "Fixed pre connections created out of order")
+            context.n_fixed_pre_neurons_done = 0
+            context.fixed_pre_indices = numpy.vstack([
+                self._draw(n_conns, self._n_values, n + post_slice_start)
+                for n in range(post_slice_count)]).reshape(
+                    post_slice_count, n_conns)
+
+        if not self._pre_in_view(pre_neuron_index):
+            return None
+        if context.fixed_pre_indices is None:
+            raise SpynnakerException(
+                "Fixed pre connections have not been created before use")
+
+        mask = context.fixed_pre_indices + self._pre_lo == pre_neuron_index
+        mask &= self._post_in_view(post_slice_start, post_slice_count)[
+            :, None]
+        columns, _ = numpy.nonzero(mask)
+
+        context.n_fixed_pre_neurons_done += 1
+        if context.n_fixed_pre_neurons_done == self._n_values:
+            context.fixed_pre_indices = None
+        return columns
+
+    def generate(self, pre_slice_start, pre_slice_count, post_slice_start,
+                 post_slice_count, max_row_length):
+        return _generate_rows(
+            self.__generate_row, pre_slice_start, pre_slice_count,
+            post_slice_start, post_slice_count, max_row_length)
+
+
+class _FixedPostConnector(_FixedNumberConnector):
+    """ connection_generator_fixed_post.h
+    """
+
+    __slots__ = []
+
+    def __generate_row(self, pre_neuron_index, post_slice_start,
+                       post_slice_count, max_row_length):
+        if max_row_length == 0 or self._n_connections == 0:
+            return None
+        if not self._pre_in_view(pre_neuron_index):
+            return None
+        post = self._draw(
+            self._n_connections, self._n_values, pre_neuron_index) + \
+            self._post_lo
+        post = post[(post >= post_slice_start) &
+                    (post < post_slice_start + post_slice_count)]
+        return post - post_slice_start
+
+    def generate(self, pre_slice_start, pre_slice_count, post_slice_start,
+                 post_slice_count, max_row_length):
+        return _generate_rows(
+            self.__generate_row, pre_slice_start, pre_slice_count,
+            post_slice_start, post_slice_count, max_row_length)
+
+
+class _KernelConnector(object):
+    """ connection_generator_kernel.h
+    """
+
+    __slots__ = [
+        "__shape"]
+
+    def __init__(self, reader):
+        self.__shape = _KernelShape(reader)
+
+    def generate(self, pre_slice_start, pre_slice_count, post_slice_start,
+                 post_slice_count, max_row_length):
+        if max_row_length < 1:
+            return _no_connections()
+        post = numpy.arange(
+            post_slice_start, post_slice_start + post_slice_count)
+
+        def generate_row(pre, *_args):
+            k_r, k_c = self.__shape.get_kernel_coordinates(pre, post)
+            return numpy.flatnonzero(self.__shape.in_kernel(k_r, k_c))
+
+        return _generate_rows(
+            generate_row, pre_slice_start, pre_slice_count, post_slice_start,
+            post_slice_count, max_row_length)
+
+
+def _no_connections():
+    return numpy.zeros(0, dtype="int64"), numpy.zeros(0, dtype="int64")
+
+
+def _generate_rows(
+        generate_row, pre_slice_start, pre_slice_count, post_slice_start,
+        post_slice_count, max_row_length):
+    """ Generate the post-indices of each pre-neuron in turn, and join them
+    """
+    pre_indices = list()
+    post_indices = list()
+    for pre in range(pre_slice_start, pre_slice_start + pre_slice_count):
+        post = generate_row(
+            pre, post_slice_start, post_slice_count, max_row_length)
+        if post is not None and len(post):
+            pre_indices.append(numpy.full(len(post), pre, dtype="int64"))
+            post_indices.append(numpy.asarray(post, dtype="int64"))
+    if not pre_indices:
+        return _no_connections()
+    return numpy.concatenate(pre_indices), numpy.concatenate(post_indices)
+
+
+class _ConstantParam(object):
+    """ param_generator_constant.h
+    """
+
+    __slots__ = [
+        "__value"]
+
+    def __init__(self, reader):
+        self.__value = reader.read_accum()
+
+    def generate(self, pre_indices, post_indices):
+        # pylint: disable=unused-argument
+        return numpy.full(len(pre_indices), self.__value, dtype="int64")
+
+
+class _UniformParam(object):
+    """ param_generator_uniform.h
+    """
+
+    __slots__ = [
+        "__low",
+        "__high",
+        "__rng"]
+
+    def __init__(self, reader):
+        self.__low = reader.read_accum()
+        self.__high = reader.read_accum()
+        self.__rng = reader.read_rng()
+
+    def generate(self, pre_indices, post_indices):
+        # pylint: disable=unused-argument
+        value_range = _to_int32(self.__high - self.__low)
+        return _to_int32(self.__low + _fract_multiply(
+            self.__rng.next_n(len(pre_indices)), value_range))
+
+
+class _NormalParam(object):
+    """ param_generator_normal.h
+    """
+
+    __slots__ = [
+        "_mu",
+        "_sigma",
+        "_rng"]
+
+    def __init__(self, reader):
+        self._mu = reader.read_accum()
+        self._sigma = reader.read_accum()
+        self._rng = reader.read_rng()
+
+    def _draw(self, n):
+        return _to_int32(
+            self._mu + _accum_multiply(self._rng.normal_n(n), self._sigma))
+
+    def generate(self, pre_indices, post_indices):
+        # pylint: disable=unused-argument
+        return self._draw(len(pre_indices))
+
+
+class _NormalClippedParam(_NormalParam):
+    """ param_generator_normal_clipped.h; values outside the range are\
+        drawn again
+    """
+
+    __slots__ = [
+        "__low",
+        "__high"]
+
+    def __init__(self, reader):
+        super(_NormalClippedParam, self).__init__(reader)
+        self.__low = reader.read_accum()
+        self.__high = reader.read_accum()
+
+    def generate(self, pre_indices, post_indices):
+        # pylint: disable=unused-argument
+        # Each value is the next draw in range, so draw until there are
+        # enough in range, never drawing more than are still needed
+        n_values = len(pre_indices)
+        values = list()
+        n_found = 0
+        while n_found < n_values:
+            draws = self._draw(n_values - n_found)
+            draws = draws[(draws >= self.__low) & (draws <= self.__high)]
+            values.append(draws)
+            n_found += len(draws)
+        if not values:
+            return numpy.zeros(0, dtype="int64")
+        return numpy.concatenate(values)
+
+
+class _NormalClippedToBoundaryParam(_NormalParam):
+    """ param_generator_normal_clipped_to_boundary.h
+    """
+
+    __slots__ = [
+        "__low",
+        "__high"]
+
+    def __init__(self, reader):
+        super(_NormalClippedToBoundaryParam, self).__init__(reader)
+        self.__low = reader.read_accum()
+        self.__high = reader.read_accum()
+
+    def generate(self, pre_indices, post_indices):
+        # pylint: disable=unused-argument
+        return numpy.clip(
+            self._draw(len(pre_indices)), self.__low, self.__high)
+
+
+class _ExponentialParam(object):
+    """ param_generator_exponential.h
+    """
+
+    __slots__ = [
+        "__beta",
+        "__rng"]
+
+    def __init__(self, reader):
+        self.__beta = reader.read_accum()
+        self.__rng = reader.read_rng()
+
+    def generate(self, pre_indices, post_indices):
+        # pylint: disable=unused-argument
+        values = numpy.array(
+            [self.__rng.exponential() for _ in range(len(pre_indices))],
+            dtype="int64")
+        return _accum_multiply(values, self.__beta)
+
+
+class _KernelParam(object):
+    """ param_generator_kernel.h
+    """
+
+    __slots__ = [
+        "__shape",
+        "__post_slice_start",
+        "__values"]
+
+    def __init__(self, reader):
+        self.__shape = _KernelShape(reader)
+        self.__post_slice_start = reader.read_value()
+        self.__values = reader.read_accums(
+            self.__shape.kernel_height * self.__shape.kernel_width)
+
+    def generate(self, pre_indices, post_indices):
+        values = numpy.zeros(len(pre_indices), dtype="int64")
+        post = numpy.asarray(post_indices) + self.__post_slice_start
+        for pre in numpy.unique(pre_indices):
+            row = pre_indices == pre
+            k_r, k_c = self.__shape.get_kernel_coordinates(pre, post[row])
+            in_kernel = self.__shape.in_kernel(k_r, k_c)
+            row_values = numpy.zeros(len(k_r), dtype="int64")
+            row_values[in_kernel] = self.__values[
+                k_r[in_kernel] * self.__shape.kernel_width + k_c[in_kernel]]
+            values[row] = row_values
+        return values
+
+
+_CONNECTORS = {
+    ConnectorIDs.ONE_TO_ONE_CONNECTOR.value: _OneToOneConnector,
+    ConnectorIDs.ALL_TO_ALL_CONNECTOR.value: _AllToAllConnector,
+    ConnectorIDs.FIXED_PROBABILITY_CONNECTOR.value: _FixedProbabilityConnector,
+    ConnectorIDs.FIXED_TOTAL_NUMBER_CONNECTOR.value: _FixedTotalConnector,
+    ConnectorIDs.FIXED_NUMBER_POST_CONNECTOR.value: _FixedPostConnector,
+    ConnectorIDs.KERNEL_CONNECTOR.value: _KernelConnector}
+
+_PARAMS = {
+    PARAM_TYPE_CONSTANT_ID: _ConstantParam,
+    PARAM_TYPE_BY_NAME["uniform"]: _UniformParam,
+    PARAM_TYPE_BY_NAME["normal"]: _NormalParam,
+    PARAM_TYPE_BY_NAME["normal_clipped"]: _NormalClippedParam,
+    PARAM_TYPE_BY_NAME["normal_clipped_to_boundary"]:
+        _NormalClippedToBoundaryParam,
+    PARAM_TYPE_BY_NAME["exponential"]: _ExponentialParam,
+    PARAM_TYPE_KERNEL: _KernelParam}
+
+# The parameter generators that do not reproduce the machine exactly
+_INEXACT_PARAMS = (
+    PARAM_TYPE_BY_NAME["normal"], PARAM_TYPE_BY_NAME["normal_clipped"],
+    PARAM_TYPE_BY_NAME["normal_clipped_to_boundary"])
+
+
+def _read_connector(connector_id, reader, context):
+    if connector_id == ConnectorIDs.FIXED_NUMBER_PRE_CONNECTOR.value:
+        return _FixedPreConnector(reader, context)
+    if connector_id not in _CONNECTORS:
+        raise SpynnakerException(
+            "Connection generator with hash {} not found".format(
+                connector_id))
+    return _CONNECTORS[connector_id](reader)
+
+
+def _read_param(param_id, reader):
+    if param_id not in _PARAMS:
+        raise SpynnakerException(
+            "Param generator with hash {} not found".format(param_id))
+    return _PARAMS[param_id](reader)
+
+
+def _rescale_delays(delays, timestep_per_delay):
+    delays = _accum_multiply(delays, timestep_per_delay)
+    delays[delays < 0] = _ACCUM_ONE
+    return (delays >> _ACCUM_SHIFT) & 0xFFFF
+
+
+def _rescale_weights(weights, weight_scale):
+    weights = _accum_multiply(numpy.abs(weights), weight_scale)
+    return (weights >> _ACCUM_SHIFT) & 0xFFFF
+
+
+def _get_delay_stages(delays, max_stage):
+    """ Split delays into the delay stage and the remaining delay, as\
+        ``get_delay`` does
+    """
+    delays = numpy.maximum(delays, 1)
+    stages = (delays - 1) // _MAX_DELAY_PER_STAGE
+    too_big = stages >= max_stage
+    stages[too_big] = max_stage - 1
+    delays[too_big] = stages[too_big] * _MAX_DELAY_PER_STAGE
+    # C remainder of possibly negative values
+    delays = numpy.fmod(delays - 1, _MAX_DELAY_PER_STAGE) + 1
+    return stages, delays
+
+
+def _rank_in_group(keys):
+    """ Get the position of each item among the items with the same key,\
+        in the order given
+    """
+    order = numpy.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    starts = numpy.flatnonzero(numpy.concatenate((
+        [True], sorted_keys[1:] != sorted_keys[:-1])))
+    counts = numpy.diff(numpy.append(starts, len(keys)))
+    ranks = numpy.empty(len(keys), dtype="int64")
+    ranks[order] = numpy.arange(len(keys)) - numpy.repeat(starts, counts)
+    return ranks
+
+
+def _expand_connector(reader, post_slice_start, post_slice_count,
+                      machine_scales, weight_scales, time_steps_per_ms,
+                      context):
+    """ Generate the connections of one connector, as\
+        ``read_connection_builder_region`` and ``matrix_generator_generate``
+    """
+    # pylint: disable=too-many-locals
+    (offset, delayed_offset, max_row_n_words, max_delayed_row_n_words,
+     max_row_n_synapses, max_delayed_row_n_synapses, pre_slice_start,
+     pre_slice_count, max_stage) = (int(v) for v in reader.read(9))
+    timestep_per_delay = reader.read_accum()
+    (synapse_type, matrix_type, connector_type, weight_type,
+     delay_type) = (int(v) for v in reader.read(5))
+
+    exact = weight_type not in _INEXACT_PARAMS and \
+        delay_type not in _INEXACT_PARAMS
+    if matrix_type == MatrixGeneratorID.STDP_MATRIX.value:
+        reader.read(3)
+    elif matrix_type != MatrixGeneratorID.STATIC_MATRIX.value:
+        raise SpynnakerException(
+            "Matrix generator with hash {} not found".format(matrix_type))
+    connector = _read_connector(connector_type, reader, context)
+    weight_generator = _read_param(weight_type, reader)
+    delay_generator = _read_param(delay_type, reader)
+
+    pre, post = connector.generate(
+        pre_slice_start, pre_slice_count, post_slice_start, post_slice_count,
+        max_row_n_synapses + max_delayed_row_n_synapses)
+    delays = _rescale_delays(
+        delay_generator.generate(pre, post), timestep_per_delay)
+    weights = _rescale_weights(
+        weight_generator.generate(pre, post), machine_scales[synapse_type])
+    stages, delays = _get_delay_stages(delays, max_stage)
+
+    # Synapses can only be written to the matrices that exist
+    has_matrix = numpy.where(
+        stages == 0, offset != _NO_MATRIX, delayed_offset != _NO_MATRIX)
+    if not numpy.all(has_matrix):
+        raise SpynnakerException(
+            "Delay stage {} has not been initialised".format(
+                stages[~has_matrix][0]))
+
+    # Full static rows drop the extra synapses
+    if matrix_type == MatrixGeneratorID.STATIC_MATRIX.value:
+        space = numpy.where(
+            stages == 0, max_row_n_words, max_delayed_row_n_words)
+        keep = _rank_in_group((pre * max_stage) + stages) < space
+        pre, post, weights = pre[keep], post[keep], weights[keep]
+        stages, delays = stages[keep], delays[keep]
+
+    # A delay of 0 within a stage is read as a full stage
+    delays = delays & 0xF
+    delays[delays == 0] = _MAX_DELAY_PER_STAGE
+
+    # Order as read back from the matrices: all the rows of each stage in turn
+    order = numpy.argsort(
+        stages * pre_slice_count + (pre - pre_slice_start), kind="stable")
+    if time_steps_per_ms is None:
+        time_steps_per_ms = float(timestep_per_delay) / _ACCUM_ONE
+    connections = numpy.zeros(
+        len(pre), dtype=AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
+    connections["source"] = pre[order]
+    connections["target"] = post[order] + post_slice_start
+    connections["weight"] = (
+        weights[order] / float(weight_scales[synapse_type]))
+    connections["delay"] = (
+        (stages[order] * _MAX_DELAY_PER_STAGE + delays[order]) /
+        time_steps_per_ms)
+    return connections, exact
+
+
+def expand_synapses(data, weight_scales=None, machine_time_step=None):
+    """ Generate the connections described by the data of a connector\
+        builder region, as the synapse expander would on the machine.
+
+    :param ~numpy.ndarray data: The words of the region
+    :param weight_scales: \
+        The weight scale of each synapse type, to convert the weights back\
+        with instead of the (fixed point) ones in the data, as is done when\
+        reading the weights from the machine
+    :type weight_scales: list(float) or None
+    :param machine_time_step: \
+        The time step in microseconds, to convert the delays back with\
+        instead of the (fixed point) one in the data
+    :type machine_time_step: int or None
+    :return: The connections of each connector in the region, and whether\
+        each was generated exactly as on the machine
+    :rtype: list(tuple(~numpy.ndarray, bool))
+    """
+    reader = _Reader(data)
+    (n_in_edges, post_slice_start, post_slice_count, n_synapse_types, _,
+     _) = (int(v) for v in reader.read(6))
+    machine_scales = reader.read_accums(n_synapse_types)
+    if weight_scales is None:
+        weight_scales = machine_scales / float(_ACCUM_ONE)
+    time_steps_per_ms = None
+    if machine_time_step is not None:
+        time_steps_per_ms = (
+            MICRO_TO_MILLISECOND_CONVERSION / float(machine_time_step))
+    context = _ExpanderContext()
+    return [
+        _expand_connector(
+            reader, post_slice_start, post_slice_count, machine_scales,
+            weight_scales, time_steps_per_ms, context)
+        for _ in range(n_in_edges)]
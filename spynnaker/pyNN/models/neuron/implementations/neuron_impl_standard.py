@@ -94,6 +94,41 @@ class NeuronImplStandard(AbstractNeuronImpl):
     def n_steps_per_timestep(self, n_steps_per_timestep):
         self.__n_steps_per_timestep = n_steps_per_timestep
 
+    @property
+    def neuron_model(self):
+        """
+        :rtype: AbstractNeuronModel
+        """
+        return self.__neuron_model
+
+    @property
+    def input_type(self):
+        """
+        :rtype: AbstractInputType
+        """
+        return self.__input_type
+
+    @property
+    def synapse_type(self):
+        """
+        :rtype: AbstractSynapseType
+        """
+        return self.__synapse_type
+
+    @property
+    def threshold_type(self):
+        """
+        :rtype: AbstractThresholdType
+        """
+        return self.__threshold_type
+
+    @property
+    def additional_input_type(self):
+        """
+        :rtype: AbstractAdditionalInput or None
+        """
+        return self.__additional_input_type
+
     @property
     @overrides(AbstractNeuronImpl.model_name)
     def model_name(self):
@@ -17,7 +17,8 @@ import logging
 import math
 import struct
 import numpy
-from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+from spinn_front_end_common.utilities.constants import (
+    BITS_PER_WORD, BYTES_PER_WORD)
 from spynnaker.pyNN.models.neural_projections import (
     ProjectionApplicationEdge, ProjectionMachineEdge)
 from spynnaker.pyNN.exceptions import (
@@ -26,6 +27,11 @@ from spynnaker.pyNN.exceptions import (
 logger = logging.getLogger(__name__)
 _TWO_WORDS = struct.Struct("<II")
 
+#: The most neurons that an entry can have a bit field filter for; spikes\
+#: for entries with more neurons are not filtered
+MAX_BIT_FIELD_BITS = 1 << 16
+_N_BITS_PER_WORD = int(BITS_PER_WORD)
+
 
 class _MasterPopEntry(object):
     """ Internal class that contains a master population table entry
@@ -33,7 +39,8 @@ class _MasterPopEntry(object):
     __slots__ = [
         "__addresses_and_row_lengths",
         "__mask",
-        "__routing_key"]
+        "__routing_key",
+        "__rows_with_synapses"]
 
     MASTER_POP_ENTRY_SIZE_WORDS = 3
     MASTER_POP_ENTRY_SIZE_BYTES = 3 * BYTES_PER_WORD
@@ -45,10 +52,28 @@ class _MasterPopEntry(object):
         self.__mask = mask
         self.__addresses_and_row_lengths = list()
 
-    def append(self, address, row_length, is_single):
+        # Spikes are only filtered when the neuron IDs are the low bits of
+        # the key, and there are not too many of them
+        neuron_mask = (~mask) & 0xFFFFFFFF
+        n_neurons = neuron_mask + 1
+        self.__rows_with_synapses = None
+        if not (neuron_mask & n_neurons) and n_neurons <= MAX_BIT_FIELD_BITS:
+            self.__rows_with_synapses = numpy.zeros(n_neurons, dtype="bool")
+
+    def append(self, address, row_length, is_single, rows_with_synapses):
         index = len(self.__addresses_and_row_lengths)
         self.__addresses_and_row_lengths.append(
             (address, row_length, is_single))
+        if self.__rows_with_synapses is None:
+            return index
+
+        # The rows are unknown if they are not written by the host
+        if rows_with_synapses is None:
+            if row_length:
+                self.__rows_with_synapses = None
+            return index
+        n_rows = min(len(rows_with_synapses), len(self.__rows_with_synapses))
+        self.__rows_with_synapses[:n_rows] |= rows_with_synapses[:n_rows]
         return index
 
     @property
@@ -73,6 +98,15 @@ class _MasterPopEntry(object):
         """
         return self.__addresses_and_row_lengths
 
+    @property
+    def rows_with_synapses(self):
+        """
+        :return: whether each neuron that can send to this entry has any\
+            synapses in any of its rows, or None if this is not known
+        :rtype: ~numpy.ndarray(bool) or None
+        """
+        return self.__rows_with_synapses
+
 
 class MasterPopTableAsBinarySearch(object):
     """ Master population table, implemented as binary search master.
@@ -155,6 +189,33 @@ class MasterPopTableAsBinarySearch(object):
             (n_entries * 2 * _MasterPopEntry.ADDRESS_LIST_ENTRY_SIZE_BYTES) +
             8)
 
+    def get_bit_field_filter_size(self, in_edges):
+        """ Get the size of the bit field filter in SDRAM
+
+        :param in_edges: the in coming edges
+        :return: the most the bit field filter will take in SDRAM (in bytes)
+        """
+        n_words = 1
+        for in_edge in in_edges:
+            if isinstance(in_edge, ProjectionApplicationEdge):
+                max_atoms = min(
+                    in_edge.pre_vertex.get_max_atoms_per_core(),
+                    in_edge.pre_vertex.n_atoms)
+                n_edge_vertices = int(math.ceil(
+                    float(in_edge.pre_vertex.n_atoms) / float(max_atoms)))
+
+                # Keys are allocated in powers of two, and delayed keys
+                # have a key for each stage of each neuron
+                n_keys = max_atoms * max(in_edge.n_delay_stages, 1)
+                n_bits = min(
+                    1 << int(math.ceil(math.log(n_keys, 2))),
+                    MAX_BIT_FIELD_BITS)
+                n_words += n_edge_vertices * (
+                    1 + int(math.ceil(n_bits / BITS_PER_WORD)))
+
+        # Multiply by 2 to allow for the entries of delayed keys
+        return n_words * 2 * BYTES_PER_WORD
+
     def get_allowed_row_length(self, row_length):
         """
         :param row_length: the row length being considered
@@ -189,7 +250,8 @@ class MasterPopTableAsBinarySearch(object):
         self.__n_single_entries = 0
 
     def update_master_population_table(
-            self, block_start_addr, row_length, key_and_mask, is_single=False):
+            self, block_start_addr, row_length, key_and_mask, is_single=False,
+            rows_with_synapses=None):
         """ Add an entry in the binary search to deal with the synaptic matrix
 
         :param spec: the writer for DSG
@@ -201,6 +263,11 @@ class MasterPopTableAsBinarySearch(object):
         :param master_pop_table_region: the region ID for the master pop
         :param is_single: \
             Flag that states if the entry is a direct entry for a single row.
+        :param rows_with_synapses: \
+            Whether each row of the matrix has any synapses, or None if\
+            this is not known, in which case spikes for the entry are not\
+            filtered unless the row length is 0
+        :type rows_with_synapses: ~numpy.ndarray(bool) or None
         :return: The index of the entry, to be used to retrieve it
         :rtype: int
         """
@@ -214,28 +281,52 @@ class MasterPopTableAsBinarySearch(object):
         if not is_single:
             start_addr = block_start_addr // self.ADDRESS_SCALE
         index = self.__entries[key_and_mask.key].append(
-            start_addr, row_length, is_single)
+            start_addr, row_length, is_single, rows_with_synapses)
         self.__n_addresses += 1
         return index
 
-    def finish_master_pop_table(self, spec, master_pop_table_region):
+    def finish_master_pop_table(
+            self, spec, master_pop_table_region, bit_field_filter_region=None):
         """ Complete the master pop table in the data specification.
 
         :param spec: the data specification to write the master pop entry to
         :param master_pop_table_region: \
             the region to which the master pop table is being stored
+        :param bit_field_filter_region: \
+            the region to reserve and write the bit field filter to, or None\
+            if it is not to be written
         """
         spec.switch_write_focus(region=master_pop_table_region)
+        spec.write_array(self.get_master_population_table_data())
+
+        if bit_field_filter_region is not None:
+            bit_field_data = self.get_bit_field_filter_data()
+            spec.reserve_memory_region(
+                region=bit_field_filter_region,
+                size=len(bit_field_data) * BYTES_PER_WORD,
+                label="BitFieldFilter")
+            spec.switch_write_focus(region=bit_field_filter_region)
+            spec.write_array(bit_field_data)
+
+        self.__entries.clear()
+        del self.__entries
+        self.__entries = None
+        self.__n_addresses = 0
 
+    def get_master_population_table_data(self):
+        """ Get the words of the master pop table region as they will be\
+            written, without finishing the table; this is also the format\
+            read by the host harness of the table lookup.
+
+        :return: the number of entries, the number of addresses, the entries\
+            and the address list, as 32-bit words
+        :rtype: ~numpy.ndarray
+        """
         # sort entries by key
         entries = sorted(
             self.__entries.values(),
             key=lambda entry: entry.routing_key)
-
-        # write no master pop entries and the address list size
         n_entries = len(entries)
-        spec.write_value(n_entries)
-        spec.write_value(self.__n_addresses)
 
         # Generate the table and list as arrays
         pop_table = numpy.zeros(n_entries, dtype=self.MASTER_POP_ENTRY_DTYPE)
@@ -246,14 +337,42 @@ class MasterPopTableAsBinarySearch(object):
             start += self._make_pop_table_entry(
                 entry, i, start, pop_table, address_list)
 
-        # Write the arrays
-        spec.write_array(pop_table.view("<u4"))
-        spec.write_array(address_list)
-
-        self.__entries.clear()
-        del self.__entries
-        self.__entries = None
-        self.__n_addresses = 0
+        return numpy.concatenate((
+            numpy.array([n_entries, self.__n_addresses], dtype="<u4"),
+            pop_table.view("<u4"), address_list))
+
+    def get_bit_field_filter_data(self):
+        """ Get the words of the bit field filter region as they will be\
+            written, without finishing the table.  There is a bit field for\
+            each entry of the table, in the same order, with a bit set for\
+            each neuron that has synapses in any of the rows of the entry;\
+            spikes from other neurons can be dropped without reading any\
+            rows.
+
+        :return: the number of entries, then for each entry the number of\
+            words in its bit field (0 if it is not to be filtered) followed\
+            by the words, as 32-bit words
+        :rtype: ~numpy.ndarray
+        """
+        entries = sorted(
+            self.__entries.values(),
+            key=lambda entry: entry.routing_key)
+        data = [numpy.array([len(entries)], dtype="<u4")]
+        for entry in entries:
+            rows = entry.rows_with_synapses
+            if rows is None:
+                data.append(numpy.zeros(1, dtype="<u4"))
+                continue
+            n_words = int(math.ceil(len(rows) / BITS_PER_WORD))
+            bit_field = numpy.zeros(n_words + 1, dtype="<u4")
+            bit_field[0] = n_words
+            neuron_ids = numpy.flatnonzero(rows)
+            numpy.bitwise_or.at(
+                bit_field, (neuron_ids // _N_BITS_PER_WORD) + 1,
+                numpy.left_shift(
+                    1, neuron_ids % _N_BITS_PER_WORD).astype("<u4"))
+            data.append(bit_field)
+        return numpy.concatenate(data)
 
     def _make_pop_table_entry(self, entry, i, start, pop_table, address_list):
         # pylint: disable=too-many-arguments
@@ -287,8 +406,28 @@ class MasterPopTableAsBinarySearch(object):
         :type txrx: :py:class:`spinnman.transceiver.Transceiver`
         :return: a synaptic matrix memory position.
         """
-        # pylint: disable=too-many-arguments, too-many-locals, arguments-differ
+        # pylint: disable=too-many-arguments, arguments-differ
+        entry_list, address_list = self.read_master_population_table(
+            master_pop_base_mem_address, txrx, chip_x, chip_y)
+        return self.get_synaptic_matrix_data_locations(
+            incoming_key, entry_list, address_list)
 
+    def read_master_population_table(
+            self, master_pop_base_mem_address, txrx, chip_x, chip_y):
+        """ Read the whole master population table of a core, so that\
+            several keys can be looked up in it without further reads.
+
+        :param master_pop_base_mem_address: the base address of the master pop
+        :param txrx: the transceiver object
+        :param chip_x: the x coordinate of the chip of this master pop
+        :param chip_y: the y coordinate of the chip of this master pop
+        :type master_pop_base_mem_address: int
+        :type txrx: :py:class:`spinnman.transceiver.Transceiver`
+        :type chip_x: int
+        :type chip_y: int
+        :return: the table entries and the address list
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
         # get entries in master pop
         n_entries, n_addresses = _TWO_WORDS.unpack(txrx.read_memory(
             chip_x, chip_y, master_pop_base_mem_address, _TWO_WORDS.size))
@@ -309,7 +448,21 @@ class MasterPopTableAsBinarySearch(object):
         address_list = numpy.frombuffer(
             full_data, 'uint8', n_address_bytes, n_entry_bytes).view(
                 dtype=self.ADDRESS_LIST_DTYPE)
+        return entry_list, address_list
+
+    def get_synaptic_matrix_data_locations(
+            self, incoming_key, entry_list, address_list):
+        """ Find the synaptic matrix locations of a key in a master\
+            population table that has already been read.
 
+        :param incoming_key: \
+            the source key which the synaptic matrix needs to be mapped to
+        :param entry_list: the entries as read from the table
+        :param address_list: the address list as read from the table
+        :type incoming_key: int
+        :return: list of (row length, address offset, is single)
+        :rtype: list(tuple(int, int, bool))
+        """
         entry = self._locate_entry(entry_list, incoming_key)
         if entry is None:
             return []
@@ -21,12 +21,39 @@ logger = logging.getLogger(__name__)
 # Default value of fixed-point one for STDP
 STDP_FIXED_POINT_ONE = (1 << 11)
 
+# The lookup tables made so far, by what they were made for, as they are the
+# same for every timing dependence and core with the same settings
+_exp_lut_arrays = dict()
+_exp_dist_lut_arrays = dict()
+
 
 def float_to_fixed(value):
     return int(round(float(value) * STDP_FIXED_POINT_ONE))
 
 
 def get_exp_lut_array(time_step, time_constant, shift=0):
+    """ Get the lookup table of an exponential decay, with a header of its\
+        size and shift.  The tables are the same for every timing dependence\
+        with the same time constant, so each is only made once and shared\
+        read-only.
+
+    :param float time_step: The time step, in the units of the time constant
+    :param float time_constant: The time constant of the decay
+    :param int shift: The right shift of the time to get a table index
+    :return: The header and table, packed into words
+    :rtype: ~numpy.ndarray
+    """
+    key = (float(time_step), float(time_constant), int(shift),
+           STDP_FIXED_POINT_ONE)
+    lut = _exp_lut_arrays.get(key)
+    if lut is None:
+        lut = _make_exp_lut_array(time_step, time_constant, shift)
+        lut.setflags(write=False)
+        _exp_lut_arrays[key] = lut
+    return lut
+
+
+def _make_exp_lut_array(time_step, time_constant, shift):
     # Compute the actual exponential decay parameter
     # NB: lambda is a reserved word in Python
     l_ambda = time_step / float(time_constant)
@@ -43,3 +70,24 @@ def get_exp_lut_array(time_step, time_constant, shift=0):
     # Concatenate with the header
     header = numpy.array([len(a), shift], dtype="uint16")
     return numpy.concatenate((header, a.astype("uint16"))).view("uint32")
+
+
+def get_exp_dist_lut_array(mean):
+    """ Get the lookup table of the inverse of the cumulative distribution\
+        of an exponential distribution, shared read-only like the tables of\
+        :py:func:`get_exp_lut_array`.
+
+    :param float mean: The mean of the distribution
+    :return: The table, with an entry for each fixed-point probability
+    :rtype: ~numpy.ndarray
+    """
+    key = (float(mean), STDP_FIXED_POINT_ONE)
+    lut = _exp_dist_lut_arrays.get(key)
+    if lut is None:
+        indices = numpy.arange(STDP_FIXED_POINT_ONE)
+        inv_cdf = numpy.log(
+            1.0 - indices / float(STDP_FIXED_POINT_ONE)) * -mean
+        lut = inv_cdf.astype(numpy.uint16)
+        lut.setflags(write=False)
+        _exp_dist_lut_arrays[key] = lut
+    return lut
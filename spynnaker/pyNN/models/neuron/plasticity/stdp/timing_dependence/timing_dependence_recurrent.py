@@ -13,7 +13,6 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import numpy
 from spinn_front_end_common.utilities.constants import \
     MICRO_TO_MILLISECOND_CONVERSION
 from spinn_utilities.overrides import overrides
@@ -25,7 +24,7 @@ from spynnaker.pyNN.models.neuron.plasticity.stdp.synapse_structure import (
     SynapseStructureWeightAccumulator)
 from spynnaker.pyNN.models.neuron.plasticity.stdp.common.plasticity_helpers \
     import (
-        STDP_FIXED_POINT_ONE)
+        STDP_FIXED_POINT_ONE, get_exp_dist_lut_array)
 
 
 class TimingDependenceRecurrent(AbstractTimingDependence):
@@ -123,10 +122,8 @@ class TimingDependenceRecurrent(AbstractTimingDependence):
         :param .DataSpecificationGenerator spec:
         :param float mean:
         """
-        indices = numpy.arange(STDP_FIXED_POINT_ONE)
-        inv_cdf = numpy.log(1.0 - indices/float(STDP_FIXED_POINT_ONE)) * -mean
         spec.write_array(
-            inv_cdf.astype(numpy.uint16), data_type=DataType.UINT16)
+            get_exp_dist_lut_array(mean), data_type=DataType.UINT16)
 
     @property
     def synaptic_structure(self):
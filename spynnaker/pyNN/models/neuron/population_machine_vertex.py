@@ -47,6 +47,8 @@ class PopulationMachineVertex(
         CURRENT_TIMER_TIC = 3
         PLASTIC_SYNAPTIC_WEIGHT_SATURATION_COUNT = 4
         N_REWIRES = 5
+        N_BIT_FIELD_FILTERED_PACKETS = 6
+        N_COALESCED_DMA_TRANSFERS = 7
 
     PROFILE_TAG_LABELS = {
         0: "TIMER",
@@ -112,6 +114,12 @@ class PopulationMachineVertex(
             PLASTIC_SYNAPTIC_WEIGHT_SATURATION_COUNT.value]
         n_rewires = provenance_data[
             self.EXTRA_PROVENANCE_DATA_ENTRIES.N_REWIRES.value]
+        n_filtered_packets = provenance_data[
+            self.EXTRA_PROVENANCE_DATA_ENTRIES.
+            N_BIT_FIELD_FILTERED_PACKETS.value]
+        n_coalesced_transfers = provenance_data[
+            self.EXTRA_PROVENANCE_DATA_ENTRIES.
+            N_COALESCED_DMA_TRANSFERS.value]
 
         label, x, y, p, names = self._get_placement_details(placement)
 
@@ -157,6 +165,14 @@ class PopulationMachineVertex(
         provenance_items.append(ProvenanceDataItem(
             self._add_name(names, "Number_of_rewires"),
             n_rewires))
+        provenance_items.append(ProvenanceDataItem(
+            self._add_name(
+                names, "Times_packets_were_dropped_by_the_bit_field_filter"),
+            n_filtered_packets))
+        provenance_items.append(ProvenanceDataItem(
+            self._add_name(
+                names, "Times_synaptic_rows_were_read_together_in_one_DMA"),
+            n_coalesced_transfers))
 
         return provenance_items
 
@@ -17,6 +17,14 @@ import numpy
 from .abstract_formation import AbstractFormation
 from spinn_utilities.overrides import overrides
 
+# The probability LUTs made so far, by the grid, peak probability, spread\
+# and distance metric they were made for, as they are the same for every\
+# projection with the same settings
+_probability_tables = dict()
+
+# The most pairs of neurons to find the distances between at once
+_MAX_CHUNK_PAIRS = 1 << 20
+
 
 class DistanceDependentFormation(AbstractFormation):
     """ Formation rule that depends on the physical distance between neurons
@@ -83,20 +91,20 @@ class DistanceDependentFormation(AbstractFormation):
         :return: distance-dependent probabilities
         :rtype: numpy.ndarray(float)
         """
-        euclidian_distances = numpy.ones(self.__grid ** 2) * numpy.nan
-        for row in range(euclidian_distances.shape[0]):
-            for column in range(euclidian_distances.shape[1]):
-                if self.__grid[0] > 1:
-                    pre = (row // self.__grid[0], row % self.__grid[1])
-                    post = (column // self.__grid[0], column % self.__grid[1])
-                else:
-                    pre = (0, row % self.__grid[1])
-                    post = (0, column % self.__grid[1])
-
-                # TODO Make distance metric "type" controllable
-                euclidian_distances[row, column] = self.distance(
-                    pre, post, metric='euclidian')
-        largest_squared_distance = numpy.max(euclidian_distances ** 2)
+        # TODO Make distance metric "type" controllable
+        key = (tuple(int(size) for size in self.__grid), float(probability),
+               float(sigma), "euclidian")
+        probabilities = _probability_tables.get(key)
+        if probabilities is None:
+            probabilities = self.__make_distance_probability_array(
+                probability, sigma, "euclidian")
+            probabilities.setflags(write=False)
+            _probability_tables[key] = probabilities
+        return probabilities
+
+    def __make_distance_probability_array(self, probability, sigma, metric):
+        distances = self.__distances(*self.__grid_deltas(), metric=metric)
+        largest_squared_distance = numpy.max(distances ** 2)
         squared_distances = numpy.arange(largest_squared_distance + 1)
         raw_probabilities = probability * (
             numpy.exp(-squared_distances / (2 * sigma ** 2)))
@@ -114,6 +122,81 @@ class DistanceDependentFormation(AbstractFormation):
 
         return filtered_probabilities
 
+    def __grid_points(self, n_points):
+        """ The (x, y) positions of the first n_points neurons on the grid,\
+            without repeats
+
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        index = numpy.arange(n_points)
+        x = index // self.__grid[0] if self.__grid[0] > 1 else 0 * index
+        y = index % self.__grid[1]
+        points = numpy.unique(numpy.column_stack((x, y)), axis=0)
+        return points[:, 0], points[:, 1]
+
+    def __periodic_deltas(self, x0, x1, dimension):
+        """ The absolute differences between coordinates along a dimension\
+            with periodic boundary conditions, as in :py:meth:`distance`
+        """
+        delta = numpy.abs(x0 - x1)
+        size = self.__grid[dimension]
+        if size > 0:
+            delta = numpy.where(delta > size * .5, delta - size, delta)
+        return numpy.abs(delta)
+
+    def __grid_deltas(self):
+        """ The distinct (x, y) distances between the neurons of the grid,\
+            as used by the probability LUTs
+
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        # There is a pre-neuron for each row of a (grid ** 2) matrix, and a
+        # post-neuron for each column
+        n_pre, n_post = self.__grid ** 2
+        pre_x, pre_y = self.__grid_points(n_pre)
+        post_x, post_y = self.__grid_points(n_post)
+
+        # When all combinations of x and y are present, the distances along
+        # each dimension are independent
+        if len(pre_x) == len(numpy.unique(pre_x)) * len(numpy.unique(pre_y)) \
+                and len(post_x) == (len(numpy.unique(post_x)) *
+                                    len(numpy.unique(post_y))):
+            delta_x = numpy.unique(self.__periodic_deltas(
+                numpy.unique(pre_x)[:, None], numpy.unique(post_x)[None, :],
+                0))
+            delta_y = numpy.unique(self.__periodic_deltas(
+                numpy.unique(pre_y)[:, None], numpy.unique(post_y)[None, :],
+                1))
+            delta_x, delta_y = numpy.meshgrid(delta_x, delta_y)
+            return delta_x.ravel(), delta_y.ravel()
+
+        # Otherwise, find the distances between all pairs of neurons, a few
+        # pre-neurons at a time to limit the memory used
+        deltas = list()
+        chunk = max(1, _MAX_CHUNK_PAIRS // len(post_x))
+        for start in range(0, len(pre_x), chunk):
+            delta_x = self.__periodic_deltas(
+                pre_x[start:start + chunk, None], post_x[None, :], 0)
+            delta_y = self.__periodic_deltas(
+                pre_y[start:start + chunk, None], post_y[None, :], 1)
+            deltas.append(numpy.unique(numpy.column_stack(
+                (delta_x.ravel(), delta_y.ravel())), axis=0))
+        deltas = numpy.unique(numpy.concatenate(deltas), axis=0)
+        return deltas[:, 0], deltas[:, 1]
+
+    @staticmethod
+    def __distances(delta_x, delta_y, metric):
+        """ The distances for arrays of differences in x and y, computed as\
+            in :py:meth:`distance`
+        """
+        if metric == 'manhattan':
+            return delta_x + delta_y
+        elif metric == 'equidistant':
+            p = 4
+            return numpy.floor(numpy.power(
+                numpy.power(delta_x, p) + numpy.power(delta_y, p), 1. / p))
+        return numpy.sqrt(delta_x ** 2 + delta_y ** 2)
+
     def distance(self, x0, x1, metric):
         """ Compute the distance between points x0 and x1 place on the grid\
             using periodic boundary conditions.
@@ -22,6 +22,7 @@ from spinn_front_end_common.utilities.constants import \
 from spynnaker.pyNN.models.neural_projections.connectors import (
     AbstractConnector)
 from spynnaker.pyNN.utilities.constants import MAX_SUPPORTED_DELAY_TICS
+from spynnaker.pyNN.utilities.host_profiler import profile_phase
 from spynnaker.pyNN.exceptions import SynapseRowTooBigException
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     AbstractStaticSynapseDynamics, AbstractSynapseDynamicsStructural,
@@ -31,6 +32,9 @@ _N_HEADER_WORDS = 3
 # There are 16 slots, one per time step
 _STD_DELAY_SLOTS = 16
 
+#: The default number of rows of a synaptic matrix to encode at a time
+ROWS_PER_CHUNK = 256
+
 
 class MaxRowInfo(object):
     """ Information about the maximums for rows in a synaptic matrix.
@@ -107,6 +111,190 @@ class MaxRowInfo(object):
         return self.__delayed_max_words
 
 
+class SynapticRows(object):
+    """ The rows of a synaptic matrix, from one pre-vertex slice to one\
+        post-vertex slice.  The rows are only encoded as they are iterated\
+        over, a chunk of rows at a time, so only the connections and one\
+        chunk of encoded rows need be held in memory at once.
+    """
+
+    __slots__ = [
+        "__connections",
+        "__max_row_length",
+        "__n_rows",
+        "__n_synapse_types",
+        "__post_vertex_slice",
+        "__row_indices",
+        "__row_starts",
+        "__rows_per_chunk",
+        "__synapse_dynamics"]
+
+    #: Rows of a matrix with no rows
+    EMPTY = None
+
+    def __init__(
+            self, connections, row_indices, n_rows, post_vertex_slice,
+            n_synapse_types, population_table, synapse_dynamics,
+            rows_per_chunk=ROWS_PER_CHUNK):
+        """
+        :param ~numpy.ndarray connections: The connections of the matrix
+        :param ~numpy.ndarray row_indices: The row of each connection
+        :param int n_rows: The number of rows in the matrix
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        :param int n_synapse_types:
+        :param MasterPopTableAsBinarySearch population_table:
+        :param AbstractSynapseDynamics synapse_dynamics:
+        :param int rows_per_chunk: The number of rows to encode at a time
+        """
+        # pylint: disable=too-many-arguments
+        self.__n_rows = n_rows
+        self.__post_vertex_slice = post_vertex_slice
+        self.__n_synapse_types = n_synapse_types
+        self.__synapse_dynamics = synapse_dynamics
+        self.__rows_per_chunk = rows_per_chunk
+        if n_rows == 0:
+            self.__connections = None
+            self.__row_indices = None
+            self.__row_starts = None
+            self.__max_row_length = 0
+            return
+
+        # Group the connections by row, keeping their order within each row
+        order = numpy.argsort(row_indices, kind="mergesort")
+        self.__connections = connections[order]
+        self.__row_indices = row_indices[order]
+        counts = numpy.bincount(self.__row_indices, minlength=n_rows)
+        self.__row_starts = numpy.concatenate(([0], numpy.cumsum(counts)))
+
+        # All rows are padded to the length of the longest row, which is
+        # the one with the most connections
+        longest = int(numpy.argmax(counts[:n_rows]))
+        row_items = self.__get_row_items(longest, longest + 1)
+        self.__max_row_length = population_table.get_allowed_row_length(
+            self.__get_max_length(row_items))
+
+    @property
+    def max_row_length(self):
+        """ The length of each row in words, excluding the header
+
+        :rtype: int
+        """
+        return self.__max_row_length
+
+    @property
+    def n_words(self):
+        """ The number of words in all the rows, including the headers
+
+        :rtype: int
+        """
+        if self.__n_rows == 0:
+            return 0
+        return self.__n_rows * (self.__max_row_length + _N_HEADER_WORDS)
+
+    @property
+    def rows_with_synapses(self):
+        """ Whether each row has any synapses in it
+
+        :rtype: ~numpy.ndarray(bool)
+        """
+        if self.__n_rows == 0:
+            return numpy.zeros(0, dtype="bool")
+        return numpy.diff(self.__row_starts[:self.__n_rows + 1]) > 0
+
+    def __iter__(self):
+        """ Encode the rows, a chunk of rows at a time
+
+        :rtype: iterable(~numpy.ndarray(~numpy.uint32))
+        """
+        for first_row in range(0, self.__n_rows, self.__rows_per_chunk):
+            last_row = min(first_row + self.__rows_per_chunk, self.__n_rows)
+            with profile_phase("encode_rows") as phase:
+                row_data = self.__join_rows(
+                    self.__get_row_items(first_row, last_row))
+                phase.add_bytes(row_data.nbytes)
+            yield row_data
+
+    def get_all(self):
+        """ Encode all the rows at once
+
+        :rtype: ~numpy.ndarray(~numpy.uint32)
+        """
+        if self.__n_rows == 0:
+            return numpy.zeros(0, dtype="uint32")
+        return numpy.concatenate(list(self))
+
+    def __get_row_items(self, first_row, last_row):
+        """ Get the parts of each of a range of rows
+
+        :return: The plastic-plastic sizes and data, the fixed-fixed and\
+            fixed-plastic sizes, and the fixed-fixed and fixed-plastic data\
+            of each row
+        :rtype: list(list(~numpy.ndarray))
+        """
+        start = self.__row_starts[first_row]
+        end = self.__row_starts[last_row]
+        connections = self.__connections[start:end]
+        row_indices = self.__row_indices[start:end] - first_row
+        n_rows = last_row - first_row
+        dynamics = self.__synapse_dynamics
+        if isinstance(dynamics, AbstractStaticSynapseDynamics):
+
+            # Get the static data
+            ff_data, ff_size = dynamics.get_static_synaptic_data(
+                connections, row_indices, n_rows, self.__post_vertex_slice,
+                self.__n_synapse_types)
+
+            # Blank the plastic data
+            fp_data = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
+            pp_data = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
+            fp_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
+            pp_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
+        else:
+
+            # Blank the static data
+            ff_data = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
+            ff_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
+
+            # Get the plastic data
+            fp_data, pp_data, fp_size, pp_size = \
+                dynamics.get_plastic_synaptic_data(
+                    connections, row_indices, n_rows,
+                    self.__post_vertex_slice, self.__n_synapse_types)
+        return [pp_size, pp_data, ff_size, fp_size, ff_data, fp_data]
+
+    @staticmethod
+    def __get_max_length(row_items):
+        """ Get the length of the longest of some rows, excluding the header
+
+        :param list(list(~numpy.ndarray)) row_items:
+        :rtype: int
+        """
+        _, pp_data, _, _, ff_data, fp_data = row_items
+        return max(
+            pp.size + fp.size + ff.size
+            for pp, fp, ff in zip(pp_data, fp_data, ff_data))
+
+    def __join_rows(self, row_items):
+        """ Pad some rows to the maximum row length and join them
+
+        :param list(list(~numpy.ndarray)) row_items:
+        :rtype: ~numpy.ndarray(~numpy.uint32)
+        """
+        _, pp_data, _, _, ff_data, fp_data = row_items
+        padding = [
+            numpy.zeros(
+                self.__max_row_length - (pp.size + fp.size + ff.size),
+                dtype="uint32")
+            for pp, fp, ff in zip(pp_data, fp_data, ff_data)]
+        rows = [
+            numpy.concatenate(items)
+            for items in zip(*(row_items + [padding]))]
+        return numpy.concatenate(rows)
+
+
+SynapticRows.EMPTY = SynapticRows(None, None, 0, None, 0, None, None)
+
+
 class SynapseIORowBased(object):
     """ A SynapseRowIO implementation that uses a row for each source neuron,\
         where each row consists of a fixed region, a plastic region, and a\
@@ -234,69 +422,6 @@ class SynapseIORowBased(object):
             undelayed_max_bytes, delayed_max_bytes,
             undelayed_max_n_words, delayed_max_n_words)
 
-    @staticmethod
-    def _get_max_row_length_and_row_data(
-            connections, row_indices, n_rows, post_vertex_slice,
-            n_synapse_types, population_table, synapse_dynamics):
-        """
-        :param ~numpy.ndarray connections:
-        :param ~numpy.ndarray row_indices:
-        :param int n_rows:
-        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
-        :param int n_synapse_types:
-        :param MasterPopTableAsBinarySearch population_table:
-        :param AbstractSynapseDynamics synapse_dynamics:
-        :rtype: tuple(int, ~numpy.ndarray)
-        """
-        # pylint: disable=too-many-arguments, too-many-locals
-        row_ids = range(n_rows)
-        ff_data, ff_size = None, None
-        fp_data, pp_data, fp_size, pp_size = None, None, None, None
-        if isinstance(synapse_dynamics, AbstractStaticSynapseDynamics):
-
-            # Get the static data
-            ff_data, ff_size = synapse_dynamics.get_static_synaptic_data(
-                connections, row_indices, n_rows, post_vertex_slice,
-                n_synapse_types)
-
-            # Blank the plastic data
-            fp_data = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
-            pp_data = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
-            fp_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
-            pp_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
-        else:
-
-            # Blank the static data
-            ff_data = [numpy.zeros(0, dtype="uint32") for _ in row_ids]
-            ff_size = [numpy.zeros(1, dtype="uint32") for _ in row_ids]
-
-            # Get the plastic data
-            fp_data, pp_data, fp_size, pp_size = \
-                synapse_dynamics.get_plastic_synaptic_data(
-                    connections, row_indices, n_rows, post_vertex_slice,
-                    n_synapse_types)
-
-        # Add some padding
-        row_lengths = [
-            _N_HEADER_WORDS + pp_data[i].size + fp_data[i].size +
-            ff_data[i].size for i in row_ids]
-        max_length = max(row_lengths) - _N_HEADER_WORDS
-        max_row_length = population_table.get_allowed_row_length(max_length)
-        padding = [
-            numpy.zeros(
-                max_row_length - (row_length - _N_HEADER_WORDS),
-                dtype="uint32")
-            for row_length in row_lengths]
-
-        # Join the bits into rows
-        items_to_join = [
-            pp_size, pp_data, ff_size, fp_size, ff_data, fp_data, padding]
-        rows = [numpy.concatenate(items) for items in zip(*items_to_join)]
-        row_data = numpy.concatenate(rows)
-
-        # Return the data
-        return max_row_length, row_data
-
     def get_synapses(
             self, synapse_info, pre_slices, pre_slice_index,
             post_slices, post_slice_index, pre_vertex_slice,
@@ -327,6 +452,52 @@ class SynapseIORowBased(object):
             tuple(~numpy.ndarray, int, ~numpy.ndarray, int, ~numpy.ndarray,\
             ~numpy.ndarray)
         """
+        # pylint: disable=too-many-arguments
+        rows, delayed_rows, delayed_source_ids, stages = \
+            self.get_synapse_rows(
+                synapse_info, pre_slices, pre_slice_index, post_slices,
+                post_slice_index, pre_vertex_slice, post_vertex_slice,
+                n_delay_stages, population_table, n_synapse_types,
+                weight_scales, machine_time_step, app_edge, machine_edge)
+        return (rows.get_all(), rows.max_row_length, delayed_rows.get_all(),
+                delayed_rows.max_row_length, delayed_source_ids, stages)
+
+    def get_synapse_rows(
+            self, synapse_info, pre_slices, pre_slice_index,
+            post_slices, post_slice_index, pre_vertex_slice,
+            post_vertex_slice, n_delay_stages, population_table,
+            n_synapse_types, weight_scales, machine_time_step,
+            app_edge, machine_edge, rows_per_chunk=ROWS_PER_CHUNK,
+            connections=None):
+        """ Get the synapses as rows for non-delayed synapses and rows for\
+            delayed synapses, as :py:meth:`get_synapses` does, but without\
+            encoding the rows until they are iterated over, a chunk of rows\
+            at a time.
+
+        :param SynapseInformation synapse_info:
+        :param list(~pacman.model.graphs.common.Slice) pre_slices:
+        :param int pre_slice_index:
+        :param list(~pacman.model.graphs.common.Slice) post_slices:
+        :param int post_slice_index:
+        :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        :param int n_delay_stages:
+        :param MasterPopTableAsBinarySearch population_table:
+        :param int n_synapse_types:
+        :param dict(AbstractSynapseType,float) weight_scales:
+        :param int machine_time_step:
+        :param ProjectionApplicationEdge app_edge:
+        :param ProjectionMachineEdge machine_edge:
+        :param int rows_per_chunk: The number of rows to encode at a time
+        :param connections: \
+            The synaptic block of the slices as made by the connector, if it\
+            has already been made; it is not changed
+        :type connections: \
+            ~numpy.ndarray(AbstractConnector.NUMPY_SYNAPSES_DTYPE) or None
+        :return: (rows, delayed_rows, delayed_source_ids, stages)
+        :rtype:
+            tuple(SynapticRows, SynapticRows, ~numpy.ndarray, ~numpy.ndarray)
+        """
         # pylint: disable=too-many-arguments, too-many-locals
         # pylint: disable=assignment-from-no-return
         # Get delays in timesteps
@@ -334,11 +505,19 @@ class SynapseIORowBased(object):
         if max_delay is not None:
             max_delay *= (MICRO_TO_MILLISECOND_CONVERSION / machine_time_step)
 
-        # Get the actual connections
-        connections = synapse_info.connector.create_synaptic_block(
-            pre_slices, pre_slice_index, post_slices, post_slice_index,
-            pre_vertex_slice, post_vertex_slice, synapse_info.synapse_type,
-            synapse_info)
+        # Get the actual connections; the delays and weights are converted
+        # in place, so a block made elsewhere is copied first
+        if connections is None:
+            with profile_phase(
+                    "create_synaptic_block",
+                    type(synapse_info.connector).__name__) as phase:
+                connections = synapse_info.connector.create_synaptic_block(
+                    pre_slices, pre_slice_index, post_slices,
+                    post_slice_index, pre_vertex_slice, post_vertex_slice,
+                    synapse_info.synapse_type, synapse_info)
+                phase.add_bytes(connections.nbytes)
+        else:
+            connections = numpy.array(connections)
 
         # Convert delays to timesteps
         connections["delay"] = numpy.rint(
@@ -350,9 +529,11 @@ class SynapseIORowBased(object):
             synapse_info.synapse_type])
 
         # Set connections for structural plasticity
-        if isinstance(synapse_info.synapse_dynamics,
-                      AbstractSynapseDynamicsStructural):
-            synapse_info.synapse_dynamics.set_connections(
+        dynamics = synapse_info.synapse_dynamics
+        is_structural = isinstance(
+            dynamics, AbstractSynapseDynamicsStructural)
+        if is_structural:
+            dynamics.set_connections(
                 connections, post_vertex_slice, app_edge, synapse_info,
                 machine_edge)
 
@@ -369,26 +550,21 @@ class SynapseIORowBased(object):
                 0, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
         del connections
 
-        # Get the data for the connections
-        row_data = numpy.zeros(0, dtype="uint32")
-        max_row_length = 0
-        if undelayed_connections.size or \
-                isinstance(synapse_info.synapse_dynamics,
-                           AbstractSynapseDynamicsStructural):
+        # Get the rows for the connections; structural plasticity needs the
+        # rows even if there are no connections
+        rows = SynapticRows.EMPTY
+        if undelayed_connections.size or is_structural:
             # Get which row each connection will go into
             undelayed_row_indices = (
-                    undelayed_connections["source"] - pre_vertex_slice.lo_atom)
-            max_row_length, row_data = self._get_max_row_length_and_row_data(
+                undelayed_connections["source"] - pre_vertex_slice.lo_atom)
+            rows = SynapticRows(
                 undelayed_connections, undelayed_row_indices,
                 pre_vertex_slice.n_atoms, post_vertex_slice, n_synapse_types,
-                population_table, synapse_info.synapse_dynamics)
-
-            del undelayed_row_indices
+                population_table, dynamics, rows_per_chunk)
         del undelayed_connections
 
-        # Get the data for the delayed connections
-        delayed_row_data = numpy.zeros(0, dtype="uint32")
-        max_delayed_row_length = 0
+        # Get the rows for the delayed connections
+        delayed_rows = SynapticRows.EMPTY
         stages = numpy.zeros(0, dtype="uint32")
         delayed_source_ids = numpy.zeros(0, dtype="uint32")
         if delayed_connections.size:
@@ -404,19 +580,47 @@ class SynapseIORowBased(object):
             delayed_connections["delay"] -= max_delay * stages
             delayed_source_ids = (
                     delayed_connections["source"] - pre_vertex_slice.lo_atom)
-
-            # Get the data
-            max_delayed_row_length, delayed_row_data = \
-                self._get_max_row_length_and_row_data(
-                    delayed_connections, delayed_row_indices,
-                    pre_vertex_slice.n_atoms * n_delay_stages,
-                    post_vertex_slice, n_synapse_types, population_table,
-                    synapse_info.synapse_dynamics)
-            del delayed_row_indices
+            delayed_rows = SynapticRows(
+                delayed_connections, delayed_row_indices,
+                pre_vertex_slice.n_atoms * n_delay_stages, post_vertex_slice,
+                n_synapse_types, population_table, dynamics, rows_per_chunk)
         del delayed_connections
 
-        return (row_data, max_row_length, delayed_row_data,
-                max_delayed_row_length, delayed_source_ids, stages)
+        return rows, delayed_rows, delayed_source_ids, stages
+
+    @staticmethod
+    def get_block_connections(
+            synapse_info, connections, weight_scales, machine_time_step):
+        """ Get the connections of a synaptic block as made by the connector,\
+            with the weights and delays as they would be read back from the\
+            rows made from it, without making or reading the rows.
+
+        :param SynapseInformation synapse_info:
+        :param ~numpy.ndarray connections: \
+            The synaptic block, as made by the connector
+        :param dict(AbstractSynapseType,float) weight_scales:
+        :param int machine_time_step:
+        :return: array with ``source``, ``target``, ``weight`` and ``delay``\
+            columns
+        :rtype: ~numpy.ndarray
+        """
+        result = numpy.zeros(
+            connections.size,
+            dtype=AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
+        result["source"] = connections["source"]
+        result["target"] = connections["target"]
+
+        # The rows hold weights as 16-bit magnitudes
+        weight_scale = weight_scales[synapse_info.synapse_type]
+        result["weight"] = (numpy.rint(
+            numpy.abs(connections["weight"]) * weight_scale).astype(
+                "uint32") & 0xFFFF) / weight_scale
+
+        # The rows hold delays as whole time steps
+        steps_per_ms = MICRO_TO_MILLISECOND_CONVERSION / machine_time_step
+        result["delay"] = numpy.rint(
+            connections["delay"] * steps_per_ms) / steps_per_ms
+        return result
 
     def read_synapses(
             self, synapse_info, pre_vertex_slice, post_vertex_slice,
@@ -0,0 +1,140 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import OrderedDict
+from spynnaker.pyNN.utilities.host_profiler import profile_phase
+
+
+class SynapticBlockCache(object):
+    """ Keeps the synaptic blocks generated on the host by the connector of\
+        each projection for each pair of slices, so that a block is only\
+        generated once however many times it is used.  The least recently\
+        used blocks are discarded to keep the total size within a limit.
+
+    The blocks are read-only; a user that needs to change a block must copy\
+    it first.
+    """
+
+    __slots__ = [
+        "__blocks",
+        "__max_bytes",
+        "__n_bytes",
+        "__n_hits",
+        "__n_misses"]
+
+    def __init__(self, max_bytes):
+        """
+        :param int max_bytes: \
+            The most bytes to keep; 0 means that no block is kept
+        """
+        self.__max_bytes = max_bytes
+        self.__blocks = OrderedDict()
+        self.__n_bytes = 0
+        self.__n_hits = 0
+        self.__n_misses = 0
+
+    @property
+    def max_bytes(self):
+        """ The most bytes of blocks that are kept
+
+        :rtype: int
+        """
+        return self.__max_bytes
+
+    @property
+    def n_bytes(self):
+        """ The bytes of the blocks currently kept
+
+        :rtype: int
+        """
+        return self.__n_bytes
+
+    @property
+    def n_blocks(self):
+        """ The number of blocks currently kept
+
+        :rtype: int
+        """
+        return len(self.__blocks)
+
+    @property
+    def n_hits(self):
+        """ The number of blocks requested that were already kept
+
+        :rtype: int
+        """
+        return self.__n_hits
+
+    @property
+    def n_misses(self):
+        """ The number of blocks requested that had to be generated
+
+        :rtype: int
+        """
+        return self.__n_misses
+
+    def get_block(
+            self, synapse_info, pre_slices, pre_slice_index, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice):
+        """ Get the synaptic block of a projection between a pair of slices,\
+            generating it if it is not kept
+
+        :param SynapseInformation synapse_info: The projection's information
+        :param list(~pacman.model.graphs.common.Slice) pre_slices:
+        :param int pre_slice_index:
+        :param list(~pacman.model.graphs.common.Slice) post_slices:
+        :param int post_slice_index:
+        :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
+        :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        :return: The connections, with the weights and delays as given by\
+            the connector; this must not be changed
+        :rtype: ~numpy.ndarray(AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+        """
+        key = (synapse_info,
+               pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom,
+               post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        block = self.__blocks.pop(key, None)
+        if block is not None:
+            self.__n_hits += 1
+            # Put back as the most recently used
+            self.__blocks[key] = block
+            return block
+
+        self.__n_misses += 1
+        with profile_phase(
+                "create_synaptic_block",
+                type(synapse_info.connector).__name__) as phase:
+            block = synapse_info.connector.create_synaptic_block(
+                pre_slices, pre_slice_index, post_slices, post_slice_index,
+                pre_vertex_slice, post_vertex_slice,
+                synapse_info.synapse_type, synapse_info)
+            phase.add_bytes(block.nbytes)
+        block.setflags(write=False)
+
+        # A block that can never fit is returned without being kept
+        if block.nbytes > self.__max_bytes:
+            return block
+        while self.__n_bytes + block.nbytes > self.__max_bytes:
+            _, evicted = self.__blocks.popitem(last=False)
+            self.__n_bytes -= evicted.nbytes
+        self.__blocks[key] = block
+        self.__n_bytes += block.nbytes
+        return block
+
+    def clear(self):
+        """ Discard all the blocks kept
+        """
+        self.__blocks.clear()
+        self.__n_bytes = 0
@@ -21,12 +21,16 @@ import struct
 import numpy
 import scipy.stats  # @UnresolvedImport
 from scipy import special  # @UnresolvedImport
+from six import iteritems
 from pyNN.random import RandomDistribution
 from data_specification.enums import DataType
+from spinn_front_end_common.utilities import globals_variables
 from spinn_front_end_common.utilities.helpful_functions import (
     locate_memory_region_for_placement)
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spynnaker.pyNN.models.neuron.generator_data import GeneratorData
+from spynnaker.pyNN.models.neuron.host_synapse_expander import (
+    expand_synapses)
 from spynnaker.pyNN.models.neural_projections.connectors import (
     AbstractGenerateConnectorOnMachine)
 from spynnaker.pyNN.models.neural_projections import ProjectionApplicationEdge
@@ -42,6 +46,7 @@ from spynnaker.pyNN.utilities.constants import (
 from spynnaker.pyNN.utilities.utility_calls import (
     get_maximum_probable_value, get_n_bits)
 from spynnaker.pyNN.utilities.running_stats import RunningStats
+from spynnaker.pyNN.utilities.host_profiler import profile_phase
 from spynnaker.pyNN.models.neuron.master_pop_table import (
     MasterPopTableAsBinarySearch)
 
@@ -71,7 +76,9 @@ class SynapticManager(object):
     """
     # pylint: disable=too-many-arguments, too-many-locals
     __slots__ = [
+        "__connector_builder_data",
         "__delay_key_index",
+        "__expand_synapses_on_host",
         "__n_synapse_types",
         "__one_to_one_connection_dtcm_max_bytes",
         "__poptable_type",
@@ -139,6 +146,15 @@ class SynapticManager(object):
         # A map of synapse information for each machine pre vertex to index
         self.__synapse_indices = dict()
 
+        # Whether to find the connections generated on the machine by
+        # running the synapse expander on the host instead of reading them
+        self.__expand_synapses_on_host = config.getboolean(
+            "Simulation", "expand_synapses_on_host")
+
+        # The synapse expander data and generator data of each placement,
+        # kept to run the synapse expander on the host
+        self.__connector_builder_data = dict()
+
     @property
     def synapse_dynamics(self):
         return self.__synapse_dynamics
@@ -329,6 +345,7 @@ class SynapticManager(object):
             self._get_synaptic_blocks_size(
                 vertex_slice, in_edges, machine_time_step) +
             self.__poptable_type.get_master_population_table_size(in_edges) +
+            self.__poptable_type.get_bit_field_filter_size(in_edges) +
             self._get_size_of_generator_information(in_edges))
 
     def _reserve_memory_regions(
@@ -582,9 +599,11 @@ class SynapticManager(object):
             post_vertex_slice, all_syn_block_sz, weight_scales,
             master_pop_table_region, synaptic_matrix_region,
             direct_matrix_region, routing_info,
-            graph_mapper, machine_graph, machine_time_step):
+            graph_mapper, machine_graph, machine_time_step,
+            bit_field_filter_region=None):
         """ Simultaneously generates both the master population table and
-            the synaptic matrix.
+            the synaptic matrix, and the bit field filter of the table if\
+            a region is given for it.
         """
         spec.comment(
             "\nWriting Synaptic Matrix and Master Population Table:\n")
@@ -644,15 +663,21 @@ class SynapticManager(object):
                             synapse_info, pre_slices, pre_vertex_slice,
                             pre_slice_index, app_edge, rinfo))
                     else:
-                        block_addr, single_addr, index = self.__write_block(
-                            spec, synaptic_matrix_region, synapse_info,
-                            pre_slices, pre_slice_index, post_slices,
-                            post_slice_index, pre_vertex_slice,
-                            post_vertex_slice, app_edge,
-                            self.__n_synapse_types, single_synapses,
-                            weight_scales, machine_time_step, rinfo,
-                            all_syn_block_sz, block_addr, single_addr,
-                            machine_edge=machine_edge)
+                        with profile_phase(
+                                "write_block", machine_edge.label) as phase:
+                            start_addr = block_addr
+                            block_addr, single_addr, index = \
+                                self.__write_block(
+                                    spec, synaptic_matrix_region,
+                                    synapse_info, pre_slices, pre_slice_index,
+                                    post_slices, post_slice_index,
+                                    pre_vertex_slice, post_vertex_slice,
+                                    app_edge, self.__n_synapse_types,
+                                    single_synapses, weight_scales,
+                                    machine_time_step, rinfo,
+                                    all_syn_block_sz, block_addr, single_addr,
+                                    machine_edge=machine_edge)
+                            phase.add_bytes(block_addr - start_addr)
                         key = (synapse_info, pre_vertex_slice.lo_atom,
                                post_vertex_slice.lo_atom)
                         self.__synapse_indices[key] = index
@@ -672,8 +697,9 @@ class SynapticManager(object):
                    post_vertex_slice.lo_atom)
             self.__synapse_indices[key] = index
 
-        self.__poptable_type.finish_master_pop_table(
-            spec, master_pop_table_region)
+        with profile_phase("write_master_pop_table"):
+            self.__poptable_type.finish_master_pop_table(
+                spec, master_pop_table_region, bit_field_filter_region)
 
         # Write the size and data of single synapses to the direct region
         if single_synapses:
@@ -802,13 +828,32 @@ class SynapticManager(object):
             post_vertex_slice, app_edge, n_synapse_types, single_synapses,
             weight_scales, machine_time_step, rinfo, all_syn_block_sz,
             block_addr, single_addr, machine_edge):
-        (row_data, row_length, delayed_row_data, delayed_row_length,
-         delayed_source_ids, delay_stages) = self.__synapse_io.get_synapses(
-             synapse_info, pre_slices, pre_slice_index, post_slices,
-             post_slice_index, pre_vertex_slice, post_vertex_slice,
-             app_edge.n_delay_stages, self.__poptable_type, n_synapse_types,
-             weight_scales, machine_time_step,
-             app_edge=app_edge, machine_edge=machine_edge)
+        # The blocks are kept by the simulator, within one limit for all the
+        # populations, so that each is generated once however often it is used
+        block_cache = globals_variables.get_simulator().synaptic_block_cache
+        connections = block_cache.get_block(
+            synapse_info, pre_slices, pre_slice_index, post_slices,
+            post_slice_index, pre_vertex_slice, post_vertex_slice)
+
+        # The connections to be read before the run are those generated,
+        # so they don't need to be read back from the rows
+        if (app_edge, synapse_info) in self.__pre_run_connection_holders:
+            block_connections = self.__synapse_io.get_block_connections(
+                synapse_info, connections, weight_scales, machine_time_step)
+            for conn_holder in self.__pre_run_connection_holders[
+                    app_edge, synapse_info]:
+                conn_holder.add_connections(block_connections)
+                conn_holder.finish()
+
+        rows, delayed_rows, delayed_source_ids, delay_stages = \
+            self.__synapse_io.get_synapse_rows(
+                synapse_info, pre_slices, pre_slice_index, post_slices,
+                post_slice_index, pre_vertex_slice, post_vertex_slice,
+                app_edge.n_delay_stages, self.__poptable_type,
+                n_synapse_types, weight_scales, machine_time_step,
+                app_edge=app_edge, machine_edge=machine_edge,
+                connections=connections)
+        del connections
 
         if app_edge.delay_edge is not None:
             app_edge.delay_edge.pre_vertex.add_delays(
@@ -818,27 +863,17 @@ class SynapticManager(object):
                 "Found delayed source IDs but no delay "
                 "machine edge for {}".format(app_edge.label))
 
-        if (app_edge, synapse_info) in self.__pre_run_connection_holders:
-            for conn_holder in self.__pre_run_connection_holders[
-                    app_edge, synapse_info]:
-                conn_holder.add_connections(self._read_synapses(
-                    synapse_info, pre_vertex_slice, post_vertex_slice,
-                    row_length, delayed_row_length, n_synapse_types,
-                    weight_scales, row_data, delayed_row_data,
-                    machine_time_step))
-                conn_holder.finish()
-
         index = None
-        if row_data.size:
+        if rows.n_words:
             block_addr, single_addr, index = self.__write_row_data(
                 spec, synapse_info.connector, pre_vertex_slice,
-                post_vertex_slice, row_length, row_data, rinfo,
-                single_synapses, synaptic_matrix_region, block_addr,
-                single_addr, app_edge, synapse_info)
+                post_vertex_slice, rows, rinfo, single_synapses,
+                synaptic_matrix_region, block_addr, single_addr, app_edge,
+                synapse_info)
         elif rinfo is not None:
             index = self.__poptable_type.update_master_population_table(
                 0, 0, rinfo.first_key_and_mask)
-        del row_data
+        del rows
 
         if block_addr > all_syn_block_sz:
             raise Exception(
@@ -851,16 +886,16 @@ class SynapticManager(object):
         if delay_key in self.__delay_key_index:
             delay_rinfo = self.__delay_key_index[delay_key]
         d_index = None
-        if delayed_row_data.size:
+        if delayed_rows.n_words:
             block_addr, single_addr, d_index = self.__write_row_data(
                 spec, synapse_info.connector, pre_vertex_slice,
-                post_vertex_slice, delayed_row_length, delayed_row_data,
-                delay_rinfo, single_synapses, synaptic_matrix_region,
-                block_addr, single_addr, app_edge, synapse_info)
+                post_vertex_slice, delayed_rows, delay_rinfo, single_synapses,
+                synaptic_matrix_region, block_addr, single_addr, app_edge,
+                synapse_info)
         elif delay_rinfo is not None:
             d_index = self.__poptable_type.update_master_population_table(
                 0, 0, delay_rinfo.first_key_and_mask)
-        del delayed_row_data
+        del delayed_rows
 
         if block_addr > all_syn_block_sz:
             raise Exception(
@@ -888,25 +923,38 @@ class SynapticManager(object):
 
     def __write_row_data(
             self, spec, connector, pre_vertex_slice, post_vertex_slice,
-            row_length, row_data, rinfo, single_synapses,
-            synaptic_matrix_region, block_addr, single_addr, app_edge,
-            synapse_info):
-        if row_length == 1 and self.__is_direct(
+            rows, rinfo, single_synapses, synaptic_matrix_region,
+            block_addr, single_addr, app_edge, synapse_info):
+        # Structural plasticity can add synapses to empty rows, so the
+        # spikes for them can't be filtered out
+        rows_with_synapses = None
+        if not isinstance(
+                self.__synapse_dynamics, AbstractSynapseDynamicsStructural):
+            rows_with_synapses = rows.rows_with_synapses
+
+        if rows.max_row_length == 1 and self.__is_direct(
                 single_addr, connector, pre_vertex_slice, post_vertex_slice,
                 app_edge, synapse_info):
-            single_rows = row_data.reshape(-1, 4)[:, 3]
+            # The direct matrix is limited to a small size, so can be kept
+            # in memory until written
+            single_rows = rows.get_all().reshape(-1, 4)[:, 3]
             single_synapses.append(single_rows)
             index = self.__poptable_type.update_master_population_table(
-                single_addr, 1, rinfo.first_key_and_mask, is_single=True)
+                single_addr, 1, rinfo.first_key_and_mask, is_single=True,
+                rows_with_synapses=rows_with_synapses)
             single_addr += len(single_rows) * BYTES_PER_WORD
         else:
+            # Write the rows as they are made, so that only some of them
+            # are in memory at once
             block_addr = self._write_padding(
                 spec, synaptic_matrix_region, block_addr)
             spec.switch_write_focus(synaptic_matrix_region)
-            spec.write_array(row_data)
+            for row_data in rows:
+                spec.write_array(row_data)
             index = self.__poptable_type.update_master_population_table(
-                block_addr, row_length, rinfo.first_key_and_mask)
-            block_addr += len(row_data) * BYTES_PER_WORD
+                block_addr, rows.max_row_length, rinfo.first_key_and_mask,
+                rows_with_synapses=rows_with_synapses)
+            block_addr += rows.n_words * BYTES_PER_WORD
         return block_addr, single_addr, index
 
     def _get_ring_buffer_shifts(
@@ -925,6 +973,16 @@ class SynapticManager(object):
             self, spec, application_vertex, post_vertex_slice, machine_vertex,
             placement, machine_graph, application_graph, routing_info,
             graph_mapper, weight_scale, machine_time_step):
+        with profile_phase("write_synapses", machine_vertex.label):
+            self.__write_data_spec(
+                spec, application_vertex, post_vertex_slice, machine_vertex,
+                placement, machine_graph, application_graph, routing_info,
+                graph_mapper, weight_scale, machine_time_step)
+
+    def __write_data_spec(
+            self, spec, application_vertex, post_vertex_slice, machine_vertex,
+            placement, machine_graph, application_graph, routing_info,
+            graph_mapper, weight_scale, machine_time_step):
         # Create an index of delay keys into this vertex
         for m_edge in machine_graph.get_edges_ending_at_vertex(machine_vertex):
             app_edge = graph_mapper.get_application_edge(m_edge)
@@ -949,9 +1007,10 @@ class SynapticManager(object):
             all_syn_block_sz, graph_mapper, application_graph,
             application_vertex)
 
-        ring_buffer_shifts = self._get_ring_buffer_shifts(
-            application_vertex, application_graph, machine_time_step,
-            weight_scale)
+        with profile_phase("ring_buffer_shifts"):
+            ring_buffer_shifts = self._get_ring_buffer_shifts(
+                application_vertex, application_graph, machine_time_step,
+                weight_scale)
         weight_scales = self._write_synapse_parameters(
             spec, ring_buffer_shifts, weight_scale)
 
@@ -961,7 +1020,8 @@ class SynapticManager(object):
             POPULATION_BASED_REGIONS.POPULATION_TABLE.value,
             POPULATION_BASED_REGIONS.SYNAPTIC_MATRIX.value,
             POPULATION_BASED_REGIONS.DIRECT_MATRIX.value,
-            routing_info, graph_mapper, machine_graph, machine_time_step)
+            routing_info, graph_mapper, machine_graph, machine_time_step,
+            POPULATION_BASED_REGIONS.BIT_FIELD_FILTER.value)
 
         if self.__synapse_dynamics is not None:
             if isinstance(self.__synapse_dynamics,
@@ -979,8 +1039,77 @@ class SynapticManager(object):
 
         self.__weight_scales[placement] = weight_scales
 
-        self._write_on_machine_data_spec(
+        builder_data = self._write_on_machine_data_spec(
             spec, post_vertex_slice, weight_scales, gen_data)
+        if builder_data is not None:
+            if self.__expand_synapses_on_host:
+                self.__connector_builder_data[placement] = (
+                    builder_data, gen_data)
+            self.__fill_generated_connection_holders(
+                builder_data, gen_data, weight_scales, machine_time_step)
+
+    def __fill_generated_connection_holders(
+            self, builder_data, generator_data, weight_scales,
+            machine_time_step):
+        """ Fill in the connection holders of connections generated on the\
+            machine when using a virtual board, where the synapse expander\
+            never runs
+        """
+        conn_holders = defaultdict(list)
+        for (_, synapse_info), conn_holder_list in iteritems(
+                self.__pre_run_connection_holders):
+            conn_holders[synapse_info].extend(conn_holder_list)
+        if not any(data.synapse_information in conn_holders
+                   for data in generator_data):
+            return
+        if not globals_variables.get_simulator().use_virtual_board:
+            return
+        for data, (connections, _) in zip(generator_data, expand_synapses(
+                builder_data, weight_scales, machine_time_step)):
+            for conn_holder in conn_holders.get(data.synapse_information, ()):
+                conn_holder.add_connections(connections)
+                conn_holder.finish()
+
+    def get_host_expanded_connections(
+            self, placement, edges_and_infos, graph_mapper, machine_time_step):
+        """ Get the connections generated on a core by the synapse expander\
+            by running the expander again on the host, instead of reading\
+            them from the machine.
+
+        :param placement: the placement of the core
+        :param edges_and_infos: \
+            the machine edges and synapse information to get the connections\
+            of
+        :type edges_and_infos: \
+            list(tuple(~pacman.model.graphs.machine.MachineEdge,\
+            SynapseInformation))
+        :param graph_mapper:
+        :param int machine_time_step:
+        :return: the connections of each edge and synapse information, or\
+            None if any cannot be reproduced exactly on the host, so must be\
+            read from the machine
+        :rtype: dict(tuple(~pacman.model.graphs.machine.MachineEdge,\
+            SynapseInformation), ~numpy.ndarray) or None
+        """
+        if placement not in self.__connector_builder_data:
+            return None
+        builder_data, generator_data = self.__connector_builder_data[
+            placement]
+        expanded = dict()
+        for data, result in zip(generator_data, expand_synapses(
+                builder_data, self.__weight_scales[placement],
+                machine_time_step)):
+            expanded[data.synapse_information,
+                     data.pre_vertex_slice.lo_atom] = result
+
+        connections = dict()
+        for machine_edge, synapse_info in edges_and_infos:
+            pre_vertex_slice = graph_mapper.get_slice(machine_edge.pre_vertex)
+            key = (synapse_info, pre_vertex_slice.lo_atom)
+            if key not in expanded or not expanded[key][1]:
+                return None
+            connections[machine_edge, synapse_info] = expanded[key][0]
+        return connections
 
     def clear_connection_cache(self):
         self.__retrieved_blocks = dict()
@@ -1040,6 +1169,134 @@ class SynapticManager(object):
             self.__weight_scales[placement], data, delayed_data,
             machine_time_step)
 
+    def read_synaptic_blocks_from_machine(
+            self, transceiver, placement, edges_and_infos, graph_mapper,
+            routing_infos, using_extra_monitor_cores, placements=None,
+            monitor_api=None, extra_monitor=None, fixed_routes=None):
+        """ Read the synaptic blocks of several machine edges that end at\
+            the same core.  The master population table is read once, and\
+            the span of each of the synaptic and direct matrix regions that\
+            holds the requested blocks is read in one go, rather than\
+            reading each block separately.  Any streaming set up needed for\
+            the extra monitor cores must already have been done.
+
+        :param edges_and_infos: \
+            iterable of (machine edge, synapse information) pairs to read
+        :return: dict of (machine edge, synapse information) to the blocks\
+            to be decoded with :py:meth:`get_connections_from_blocks`
+        :rtype: dict
+        """
+        master_pop_table, direct_synapses, indirect_synapses = \
+            self.__compute_addresses(transceiver, placement)
+        entry_list, address_list = \
+            self.__poptable_type.read_master_population_table(
+                master_pop_table, transceiver, placement.x, placement.y)
+
+        # Work out where each block lives without reading it yet
+        to_read = dict()
+        requests = dict()
+        for machine_edge, synapse_info in edges_and_infos:
+            app_edge = graph_mapper.get_application_edge(machine_edge)
+            if not isinstance(app_edge, ProjectionApplicationEdge):
+                continue
+            pre_vertex_slice = graph_mapper.get_slice(machine_edge.pre_vertex)
+            post_vertex_slice = graph_mapper.get_slice(
+                machine_edge.post_vertex)
+            index = self.__synapse_indices[
+                synapse_info, pre_vertex_slice.lo_atom,
+                post_vertex_slice.lo_atom]
+            block_keys = [(
+                routing_infos.get_first_key_for_edge(machine_edge),
+                pre_vertex_slice.n_atoms)]
+            if app_edge.delay_edge is not None:
+                block_keys.append((self.__delay_key_index[
+                    app_edge.pre_vertex, pre_vertex_slice.lo_atom,
+                    pre_vertex_slice.hi_atom].first_key,
+                    pre_vertex_slice.n_atoms * app_edge.n_delay_stages))
+            for key, n_rows in block_keys:
+                block_id = (placement, key, index)
+                if (block_id not in self.__retrieved_blocks and
+                        block_id not in to_read):
+                    to_read[block_id] = self.__locate_block(
+                        key, n_rows, index, entry_list, address_list)
+            requests[machine_edge, synapse_info] = [
+                (placement, key, index) for key, _ in block_keys]
+
+        # Read the span of each region that covers all the blocks
+        indirect_blocks = [
+            (block_id, location) for block_id, location in iteritems(to_read)
+            if location is not None and not location[2]]
+        direct_blocks = [
+            (block_id, location) for block_id, location in iteritems(to_read)
+            if location is not None and location[2]]
+        for block_id, location in iteritems(to_read):
+            if location is None:
+                self.__retrieved_blocks[block_id] = (None, None)
+        for base_address, blocks in (
+                (indirect_synapses, indirect_blocks),
+                (direct_synapses, direct_blocks)):
+            if not blocks:
+                continue
+            start = min(location[1] for _, location in blocks)
+            end = max(location[1] + location[3] for _, location in blocks)
+            data = self.__read_memory(
+                transceiver, monitor_api, placement, base_address + start,
+                end - start, using_extra_monitor_cores, extra_monitor,
+                fixed_routes, placements)
+            for block_id, (max_row_length, offset, is_single, n_bytes) in \
+                    blocks:
+                block = data[offset - start:offset - start + n_bytes]
+                if is_single:
+                    self.__retrieved_blocks[block_id] = (
+                        self.__single_block_to_rows(block), 1)
+                else:
+                    self.__retrieved_blocks[block_id] = (
+                        bytearray(block), max_row_length)
+
+        return {
+            edge_and_info: [self.__retrieved_blocks[block_id]
+                            for block_id in block_ids]
+            for edge_and_info, block_ids in iteritems(requests)}
+
+    def __locate_block(self, key, n_rows, index, entry_list, address_list):
+        """ Find the (max row length, offset, is single, size in bytes) of\
+            a block in a master population table that has already been\
+            read, or None if there is no data for the block.
+        """
+        items = self.__poptable_type.get_synaptic_matrix_data_locations(
+            key, entry_list, address_list)
+        if index >= len(items):
+            return None
+        max_row_length, offset, is_single = items[index]
+        if max_row_length == 0 or offset is None:
+            return None
+        if is_single:
+            return max_row_length, offset, True, n_rows * BYTES_PER_WORD
+        return max_row_length, offset, False, \
+            self.__synapse_io.get_block_n_bytes(max_row_length, n_rows)
+
+    def get_connections_from_blocks(
+            self, placement, machine_edge, graph_mapper, synapse_info,
+            blocks, machine_time_step):
+        """ Convert blocks read by\
+            :py:meth:`read_synaptic_blocks_from_machine` into connections.\
+            This does not talk to the machine, so can be done for several\
+            edges at once.
+
+        :param blocks: the blocks read for this machine edge
+        """
+        pre_vertex_slice = graph_mapper.get_slice(machine_edge.pre_vertex)
+        post_vertex_slice = graph_mapper.get_slice(machine_edge.post_vertex)
+        data, max_row_length = blocks[0]
+        delayed_data, delayed_max_row_len = None, 0
+        if len(blocks) > 1:
+            delayed_data, delayed_max_row_len = blocks[1]
+        return self._read_synapses(
+            synapse_info, pre_vertex_slice, post_vertex_slice,
+            max_row_length, delayed_max_row_len, self.__n_synapse_types,
+            self.__weight_scales[placement], data, delayed_data,
+            machine_time_step)
+
     def __compute_addresses(self, transceiver, placement):
         """ Helper for computing the addresses of the master pop table and\
             synaptic-matrix-related bits.
@@ -1133,14 +1390,9 @@ class SynapticManager(object):
             max_row_length, n_rows)
 
         # read in the synaptic block
-        if using_monitors:
-            extra_monitor.update_transaction_id_from_machine(transceiver)
-            return monitor_api.get_data(
-                extra_monitor,
-                placements.get_placement_of_vertex(extra_monitor), address,
-                synaptic_block_size, fixed_routes)
-        return transceiver.read_memory(
-            placement.x, placement.y, address, synaptic_block_size)
+        return self.__read_memory(
+            transceiver, monitor_api, placement, address, synaptic_block_size,
+            using_monitors, extra_monitor, fixed_routes, placements)
 
     def __read_single_synaptic_block(
             self, transceiver, data_receiver, placement, n_rows, address,
@@ -1151,22 +1403,40 @@ class SynapticManager(object):
         synaptic_block_size = n_rows * BYTES_PER_WORD
 
         # read in the synaptic row data
+        single_block = self.__read_memory(
+            transceiver, data_receiver, placement, address,
+            synaptic_block_size, using_monitors, extra_monitor, fixed_routes,
+            placements)
+
+        # Convert the block into a set of rows
+        return self.__single_block_to_rows(single_block), 1
+
+    @staticmethod
+    def __read_memory(
+            transceiver, monitor_api, placement, address, n_bytes,
+            using_monitors, extra_monitor, fixed_routes, placements):
+        """ Read memory from the chip of a placement, either directly or\
+            through the extra monitor cores.
+        """
         if using_monitors:
             extra_monitor.update_transaction_id_from_machine(transceiver)
-            single_block = data_receiver.get_data(
+            return monitor_api.get_data(
                 extra_monitor,
-                placements.get_placement_of_vertex(extra_monitor),
-                address, synaptic_block_size, fixed_routes)
-        else:
-            single_block = transceiver.read_memory(
-                placement.x, placement.y, address, synaptic_block_size)
+                placements.get_placement_of_vertex(extra_monitor), address,
+                n_bytes, fixed_routes)
+        return transceiver.read_memory(
+            placement.x, placement.y, address, n_bytes)
 
-        # Convert the block into a set of rows
-        numpy_block = numpy.zeros((n_rows, BYTES_PER_WORD), dtype="uint32")
-        numpy_block[:, 3] = numpy.asarray(
-            single_block, dtype="uint8").view("uint32")
+    @staticmethod
+    def __single_block_to_rows(single_block):
+        """ Convert a block of single synapses, one per row, into a set of\
+            rows of length one.
+        """
+        words = numpy.frombuffer(single_block, dtype="uint32")
+        numpy_block = numpy.zeros((len(words), BYTES_PER_WORD), dtype="uint32")
+        numpy_block[:, 3] = words
         numpy_block[:, 1] = 1
-        return bytearray(numpy_block.tobytes()), 1
+        return bytearray(numpy_block.tobytes())
 
     # inherited from AbstractProvidesIncomingPartitionConstraints
     def get_incoming_partition_constraints(self):
@@ -1179,9 +1449,11 @@ class SynapticManager(object):
         :param spec: The specification to write to
         :param post_vertex_slice: The slice of the vertex being written
         :param weight_scales: scaling of weights on each synapse
+        :return: the data written, or None if there is no data to write
+        :rtype: ~numpy.ndarray(~numpy.uint32) or None
         """
         if not generator_data:
-            return
+            return None
 
         n_bytes = (
             _SYNAPSES_BASE_GENERATOR_SDRAM_USAGE_IN_BYTES +
@@ -1195,25 +1467,30 @@ class SynapticManager(object):
         spec.switch_write_focus(
             region=POPULATION_BASED_REGIONS.CONNECTOR_BUILDER.value)
 
-        spec.write_value(len(generator_data))
-        spec.write_value(post_vertex_slice.lo_atom)
-        spec.write_value(post_vertex_slice.n_atoms)
-        spec.write_value(self.__n_synapse_types)
-        spec.write_value(get_n_bits(self.__n_synapse_types))
-        n_neuron_id_bits = get_n_bits(post_vertex_slice.n_atoms)
-        spec.write_value(n_neuron_id_bits)
-        for w in weight_scales:
-            # if the weights are high enough and the population size large
-            # enough, then weight_scales < 1 will result in a zero scale
-            # if converted to an int, so this needs to be an S1615
-            dtype = DataType.S1615
-            if w > dtype.max:
-                spec.write_value(data=dtype.max, data_type=dtype)
-            else:
-                spec.write_value(data=w, data_type=dtype)
+        data = self.__get_connector_builder_data(
+            post_vertex_slice, weight_scales, generator_data)
+        spec.write_array(data)
+        return data
 
-        for data in generator_data:
-            spec.write_array(data.gen_data)
+    def __get_connector_builder_data(
+            self, post_vertex_slice, weight_scales, generator_data):
+        """ Get the data of the synapse expander region
+
+        :rtype: ~numpy.ndarray(~numpy.uint32)
+        """
+        # if the weights are high enough and the population size large
+        # enough, then weight_scales < 1 will result in a zero scale
+        # if converted to an int, so this needs to be an S1615
+        dtype = DataType.S1615
+        items = [numpy.array([
+            len(generator_data), post_vertex_slice.lo_atom,
+            post_vertex_slice.n_atoms, self.__n_synapse_types,
+            get_n_bits(self.__n_synapse_types),
+            get_n_bits(post_vertex_slice.n_atoms)] + [
+                dtype.encode_as_int(min(w, dtype.max))
+                for w in weight_scales], dtype="uint32")]
+        items.extend(GeneratorData.get_all_gen_data(generator_data))
+        return numpy.concatenate(items)
 
     def gen_on_machine(self, vertex_slice):
         """ True if the synapses should be generated on the machine
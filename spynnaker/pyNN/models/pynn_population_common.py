@@ -14,6 +14,8 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import logging
+from collections import defaultdict
+from multiprocessing.pool import ThreadPool
 import numpy
 from six import string_types, iteritems
 from spinn_utilities.logger_utils import warn_once
@@ -30,6 +32,7 @@ from spinn_front_end_common.abstract_models import AbstractChangableAfterRun
 from spynnaker.pyNN.models.abstract_models import (
     AbstractReadParametersBeforeSet, AbstractContainsUnits,
     AbstractPopulationInitializable, AbstractPopulationSettable)
+from spynnaker.pyNN.models.common import AbstractSpikeRecordable
 from .abstract_pynn_model import AbstractPyNNModel
 
 logger = FormatAdapter(logging.getLogger(__file__))
@@ -46,7 +49,7 @@ class PyNNPopulationCommon(object):
         "__change_requires_mapping",
         "__delay_vertex",
         "__first_id",
-        "__has_read_neuron_parameters_this_run",
+        "__machine_vertices_read_this_run",
         "__last_id",
         "_positions",
         "__record_gsyn_file",
@@ -136,7 +139,7 @@ class PyNNPopulationCommon(object):
 
         # parameter
         self.__change_requires_mapping = True
-        self.__has_read_neuron_parameters_this_run = False
+        self.__machine_vertices_read_this_run = set()
 
         # things for pynn demands
         self._all_ids = numpy.arange(
@@ -180,7 +183,7 @@ class PyNNPopulationCommon(object):
 
     def mark_no_changes(self):
         self.__change_requires_mapping = False
-        self.__has_read_neuron_parameters_this_run = False
+        self.__machine_vertices_read_this_run = set()
 
     def __add__(self, other):
         """ Merges populations
@@ -340,7 +343,7 @@ class PyNNPopulationCommon(object):
         # Doesn't make much sense on SpiNNaker
         return self._size
 
-    def _set_check(self, parameter, value):
+    def _set_check(self, parameter, value, selector=None):
         """ Checks for various set methods.
         """
         if not self._vertex_population_settable:
@@ -360,7 +363,7 @@ class PyNNPopulationCommon(object):
                 "Parameter must either be the name of a single parameter to"
                 " set, or a dict of parameter: value items to set")
 
-        self._read_parameters_before_set()
+        self._read_parameters_before_set(selector)
 
     def set(self, parameter, value=None):
         """ Set one or more parameters for every cell in the population.
@@ -405,7 +408,7 @@ class PyNNPopulationCommon(object):
         :param parameter: the parameter to set
         :param value: the value of the parameter to set.
         """
-        self._set_check(parameter, value)
+        self._set_check(parameter, value, selector)
 
         # set new parameters
         if type(parameter) is str:
@@ -414,56 +417,150 @@ class PyNNPopulationCommon(object):
             for (key, value) in parameter.iteritems():
                 self.__vertex.set_value_by_selector(selector, key, value)
 
-    def _read_parameters_before_set(self):
+    def _read_parameters_before_set(self, selector=None):
         """ Reads parameters from the machine before "set" completes
 
+        :param selector: the atoms that are about to change, or None for all
+        :type selector: None or slice or int or list(bool) or list(int)
         :return: None
         """
 
-        # If the tools have run before, and not reset, and the read
-        # hasn't already been done, read back the data
-        if globals_variables.get_simulator().has_ran \
-                and self._vertex_read_parameters_before_set \
-                and not self.__has_read_neuron_parameters_this_run \
-                and not globals_variables.get_simulator().use_virtual_board:
-            # locate machine vertices from the application vertices
-            machine_vertices = globals_variables.get_simulator().graph_mapper\
-                .get_machine_vertices(self.__vertex)
-
-            # go through each machine vertex and read the neuron parameters
-            # it contains
-            for machine_vertex in machine_vertices:
-
-                # tell the core to rewrite neuron params back to the
-                # SDRAM space.
-                placement = globals_variables.get_simulator().placements.\
-                    get_placement_of_vertex(machine_vertex)
-
-                self.__vertex.read_parameters_from_machine(
-                    globals_variables.get_simulator().transceiver, placement,
-                    globals_variables.get_simulator().graph_mapper.get_slice(
-                        machine_vertex))
-
-            self.__has_read_neuron_parameters_this_run = True
-
-    def get_spike_counts(self, spikes, gather=True):
+        # If the tools have run before, and not reset, read back the data
+        # of any core that might be reloaded and hasn't already been read
+        simulator = globals_variables.get_simulator()
+        if not simulator.has_ran \
+                or not self._vertex_read_parameters_before_set \
+                or simulator.use_virtual_board:
+            return
+
+        # locate machine vertices from the application vertices
+        graph_mapper = simulator.graph_mapper
+        vertex_by_slice = {
+            graph_mapper.get_slice(machine_vertex): machine_vertex
+            for machine_vertex in graph_mapper.get_machine_vertices(
+                self.__vertex)
+            if machine_vertex not in self.__machine_vertices_read_this_run}
+        vertex_slices = self.__vertex.get_slices_to_read_before_set(
+            list(vertex_by_slice), selector)
+        if not vertex_slices:
+            return
+
+        # Group the cores by board, so each board's connection is only used
+        # by one thread at a time
+        machine = simulator.machine
+        transceiver = simulator.transceiver
+        reads_by_board = defaultdict(list)
+        for vertex_slice in vertex_slices:
+            placement = simulator.placements.get_placement_of_vertex(
+                vertex_by_slice[vertex_slice])
+            chip = machine.get_chip_at(placement.x, placement.y)
+            reads_by_board[
+                chip.nearest_ethernet_x, chip.nearest_ethernet_y].append(
+                    (placement, vertex_slice))
+
+        def _read_board(reads):
+            return [
+                self.__vertex.read_parameter_data_from_machine(
+                    transceiver, placement, vertex_slice)
+                for placement, vertex_slice in reads]
+
+        # Read the raw data from the boards in parallel
+        board_reads = list(reads_by_board.values())
+        pool = ThreadPool(len(board_reads))
+        try:
+            board_data = pool.map(_read_board, board_reads)
+        finally:
+            pool.close()
+            pool.join()
+
+        # Update the parameters one core at a time
+        for reads, data in zip(board_reads, board_data):
+            for (placement, vertex_slice), core_data in zip(reads, data):
+                self.__vertex.update_parameters_from_data(
+                    core_data, transceiver, placement, vertex_slice)
+                self.__machine_vertices_read_this_run.add(placement.vertex)
+
+    def get_spike_counts(self, spikes=None, gather=True, as_array=False):
         """ Return the number of spikes for each neuron.
 
         Defined by
         http://neuralensemble.org/docs/PyNN/reference/populations.html
 
+        :param spikes: the spikes, as rows of neuron id and time, or None to\
+            count the spikes recorded without getting each of them
         :param gather: pointless on sPyNNaker
+        :param as_array: whether to return the counts as an array indexed by\
+            neuron, rather than as a dict of neuron to count
         """
         if not gather:
             warn_once(
                 logger, "sPyNNaker only supports gather=True. We will run "
                 "as if gather was set to True.")
-        n_spikes = {}
-        counts = numpy.bincount(spikes[:, 0].astype(dtype=numpy.int32),
-                                minlength=self.__vertex.n_atoms)
-        for i in range(self.__vertex.n_atoms):
-            n_spikes[i] = counts[i]
-        return n_spikes
+        if spikes is None:
+            counts = self._get_recorded_spike_counts()
+        else:
+            counts = numpy.bincount(
+                spikes[:, 0].astype(dtype=numpy.int32),
+                minlength=self.__vertex.n_atoms)
+        if as_array:
+            return counts
+        return dict(enumerate(counts.tolist()))
+
+    def get_mean_rates(self, gather=True, as_array=False):
+        """ Return the mean spike rate of each neuron over the time\
+            simulated, from the number of spikes recorded for each neuron.
+
+        :param gather: pointless on sPyNNaker
+        :param as_array: whether to return the rates as an array indexed by\
+            neuron, rather than as a dict of neuron to rate
+        :return: the rates in spikes per second
+        """
+        if not gather:
+            warn_once(
+                logger, "sPyNNaker only supports gather=True. We will run "
+                "as if gather was set to True.")
+        counts = self._get_recorded_spike_counts()
+        run_time = globals_variables.get_simulator().get_current_time()
+        if not run_time:
+            rates = numpy.zeros(len(counts))
+        else:
+            rates = counts * (1000.0 / run_time)
+        if as_array:
+            return rates
+        return dict(enumerate(rates.tolist()))
+
+    def _get_recorded_spike_counts(self):
+        """ Get the number of spikes recorded for each neuron, without\
+            getting every spike where the vertex can count them.
+
+        :return: the number of spikes of each neuron
+        :rtype: ~numpy.ndarray
+        """
+        if not isinstance(self.__vertex, AbstractSpikeRecordable):
+            raise ConfigurationException(
+                "This population has not got the capability to record spikes")
+        if not self.__vertex.is_recording_spikes():
+            raise ConfigurationException(
+                "This population has not been set to record spikes")
+
+        sim = globals_variables.get_simulator()
+        if not sim.has_ran:
+            logger.warning(
+                "The simulation has not yet run, therefore spikes cannot "
+                "be counted, hence the counts will be zero")
+            return numpy.zeros(self.__vertex.n_atoms, dtype="int64")
+        if sim.use_virtual_board:
+            if sim.reference_engine is None:
+                logger.warning(
+                    "The simulation is using a virtual machine and so has "
+                    "not truly ran, hence the counts will be zero")
+                return numpy.zeros(self.__vertex.n_atoms, dtype="int64")
+            spikes = sim.reference_engine.get_spikes(self.__vertex)
+            return numpy.bincount(
+                spikes[:, 0].astype("int64"), minlength=self.__vertex.n_atoms)
+        return self.__vertex.get_spike_counts(
+            sim.placements, sim.graph_mapper, sim.buffer_manager,
+            sim.machine_time_step)
 
     @property
     def positions(self):
@@ -31,6 +31,7 @@ from spynnaker.pyNN.models.neural_projections import (
     ProjectionApplicationEdge, DelayAfferentApplicationEdge)
 from spynnaker.pyNN.models.utility_models.delays import DelayExtensionVertex
 from spynnaker.pyNN.utilities import constants
+from spynnaker.pyNN.utilities.host_profiler import profile_phase
 from spynnaker.pyNN.models.neuron import ConnectionHolder
 
 # pylint: disable=protected-access
@@ -209,9 +210,16 @@ class PyNNProjectionCommon(object):
     def _projection_edge(self):
         return self.__projection_edge
 
+    @property
+    def _virtual_connection_list(self):
+        """ The blocks of connections generated on the host when using a\
+            virtual board, or None if not using a virtual board
+        """
+        return self.__virtual_connection_list
+
     def _find_existing_edge(self, pre_synaptic_vertex, post_synaptic_vertex):
-        """ Searches though the graph's edges to locate any\
-            edge which has the same post and pre vertex
+        """ Locates any edge which has the same post and pre vertex, using\
+            the edge index held by the simulator
 
         :param pre_synaptic_vertex: the source vertex of the multapse
         :type pre_synaptic_vertex: \
@@ -221,16 +229,8 @@ class PyNNProjectionCommon(object):
             pacman.model.graph.application.ApplicationVertex
         :return: None or the edge going to these vertices.
         """
-
-        # Find edges ending at the postsynaptic vertex
-        graph_edges = self.__spinnaker_control.original_application_graph.\
-            get_edges_ending_at_vertex(post_synaptic_vertex)
-
-        # Search the edges for any that start at the presynaptic vertex
-        for edge in graph_edges:
-            if edge.pre_vertex == pre_synaptic_vertex:
-                return edge
-        return None
+        return self.__spinnaker_control.get_application_edge_between(
+            pre_synaptic_vertex, post_synaptic_vertex)
 
     def _add_delay_extension(
             self, pre_synaptic_population, post_synaptic_population,
@@ -340,6 +340,19 @@ class PyNNProjectionCommon(object):
             receivers = None
             extra_monitor_placements = None
 
+        with profile_phase(
+                "get_projection_data", self.__projection_edge.label) as phase:
+            self.__get_projection_data_from_edges(
+                data_to_get, pre_vertex, post_vertex, connection_holder,
+                handle_time_out_configuration, extra_monitors, receivers,
+                extra_monitor_placements, phase)
+
+    def __get_projection_data_from_edges(
+            self, data_to_get, pre_vertex, post_vertex, connection_holder,
+            handle_time_out_configuration, extra_monitors, receivers,
+            extra_monitor_placements, phase):
+        # pylint: disable=too-many-arguments
+        ctl = self.__spinnaker_control
         edges = ctl.graph_mapper.get_machine_edges(self.__projection_edge)
         progress = ProgressBar(
             edges, "Getting {}s for projection between {} and {}".format(
@@ -369,6 +382,7 @@ class PyNNProjectionCommon(object):
                 ctl.fixed_routes, sender_extra_monitor_core)
             if connections is not None:
                 connection_holder.add_connections(connections)
+                phase.add_bytes(connections.nbytes)
         connection_holder.finish()
 
     def _clear_cache(self):
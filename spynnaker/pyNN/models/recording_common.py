@@ -15,13 +15,14 @@
 
 import logging
 import numpy
-from six.moves import xrange
 from spinn_utilities import logger_utils
 from spinn_utilities.log import FormatAdapter
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utilities.globals_variables import get_simulator
 from spynnaker.pyNN.models.common import (
     AbstractSpikeRecordable, AbstractNeuronRecordable)
+from spynnaker.pyNN.utilities.utility_calls import (
+    PYNN7_CHUNK_ROWS, iter_matrix_to_pynn7, matrix_to_pynn7)
 # pylint: disable=protected-access
 
 logger = FormatAdapter(logging.getLogger(__name__))
@@ -103,20 +104,35 @@ class RecordingCommon(object):
                     "conductance from a model which does not use conductance "
                     "input. You will receive current measurements instead.")
 
-    def _get_recorded_pynn7(self, variable):
+    def _get_recorded_pynn7(self, variable, dtype=numpy.float64):
+        """ Get the recorded data in PyNN 0.7 format, that is rows of neuron\
+            id, time and value, or of neuron id and time for spikes.
+
+        :param variable: the variable name to read
+        :param dtype: the type of the rows of values; float32 halves their\
+            size
+        :rtype: ~numpy.ndarray
+        """
         if variable == "spikes":
-            data = self._get_spikes()
+            return self._get_spikes()
 
         (data, ids, sampling_interval) = self._get_recorded_matrix(variable)
-        n_machine_time_steps = len(data)
-        n_neurons = len(ids)
-        column_length = n_machine_time_steps * n_neurons
-        times = [i * sampling_interval
-                 for i in xrange(0, n_machine_time_steps)]
-        return numpy.column_stack((
-                numpy.repeat(ids, n_machine_time_steps, 0),
-                numpy.tile(times, n_neurons),
-                numpy.transpose(data).reshape(column_length)))
+        return matrix_to_pynn7(data, ids, sampling_interval, dtype)
+
+    def _iter_recorded_pynn7(
+            self, variable, dtype=numpy.float64, max_rows=PYNN7_CHUNK_ROWS):
+        """ Get the recorded data of a variable other than spikes in PyNN\
+            0.7 format in chunks of rows, so that the rows of long recordings\
+            need not all be held at once.
+
+        :param variable: the variable name to read
+        :param dtype: the type of the rows; float32 halves their size
+        :param int max_rows: the most rows in each chunk
+        :rtype: iterable(~numpy.ndarray)
+        """
+        (data, ids, sampling_interval) = self._get_recorded_matrix(variable)
+        return iter_matrix_to_pynn7(
+            data, ids, sampling_interval, dtype, max_rows)
 
     def _get_recorded_matrix(self, variable):
         """ Perform safety checks and get the recorded data from the vertex\
@@ -153,6 +169,11 @@ class RecordingCommon(object):
             indexes = []
             sampling_interval = self.__population._vertex.\
                 get_neuron_sampling_interval(variable)
+        elif sim.use_virtual_board and sim.reference_engine is not None:
+            # the run was simulated on the host instead
+            (data, indexes, sampling_interval) = \
+                sim.reference_engine.get_matrix_data(
+                    self.__population._vertex, variable)
         elif sim.use_virtual_board:
             logger.warning(
                 "The simulation is using a virtual machine and so has not"
@@ -193,6 +214,9 @@ class RecordingCommon(object):
             return numpy.zeros((0, 2))
 
         if sim.use_virtual_board:
+            if sim.reference_engine is not None:
+                return sim.reference_engine.get_spikes(
+                    self.__population._vertex)
             logger.warning(
                 "The simulation is using a virtual machine and so has not "
                 "truly ran, hence the list will be empty")
@@ -204,6 +228,24 @@ class RecordingCommon(object):
             sim.placements, sim.graph_mapper, sim.buffer_manager,
             sim.machine_time_step)
 
+    def _get_spike_counts(self):
+        """ How to get the number of spikes of each neuron from a vertex,\
+            without getting every spike where the vertex can count them.
+
+        :return: the number of spikes of each neuron
+        :rtype: ~numpy.ndarray
+        """
+        return self.__population._get_recorded_spike_counts()
+
+    def _get_mean_rates(self):
+        """ Get the mean spike rate of each neuron over the time simulated,\
+            from the number of spikes of each neuron.
+
+        :return: the rates in spikes per second
+        :rtype: ~numpy.ndarray
+        """
+        return self.__population.get_mean_rates(as_array=True)
+
     def _turn_off_all_recording(self, indexes=None):
         """ Turns off recording, is used by a pop saying `.record()`
 
@@ -50,6 +50,7 @@ from spynnaker.pyNN.models.abstract_models import (
     AbstractReadParametersBeforeSet)
 from .spike_source_poisson_machine_vertex import (
     SpikeSourcePoissonMachineVertex)
+from spynnaker.pyNN.exceptions import MemReadException
 from spynnaker.pyNN.utilities.utility_calls import validate_mars_kiss_64_seed
 from spynnaker.pyNN.utilities.struct import Struct
 from spynnaker.pyNN.utilities.ranged.spynnaker_ranged_dict \
@@ -899,43 +900,58 @@ class SpikeSourcePoissonVertex(
             placement.x, placement.y,
             poisson_rate_region_sdram_address, size_of_region)
 
-        # For each atom, read the number of rates and the rate parameters
-        offset = 0
-        for i in range(vertex_slice.lo_atom, vertex_slice.hi_atom + 1):
-            n_values = struct.unpack_from("<I", byte_array, offset)[0]
-            offset += 4
-
-            # Skip reading the index, as it will be recalculated on data write
-            offset += 4
-
-            (_start, _end, _next, is_fast_source, exp_minus_lambda,
-             sqrt_lambda, isi, time_to_next_spike) = _PoissonStruct.read_data(
-                 byte_array, offset, n_values)
-            offset += _PoissonStruct.get_size_in_whole_words(n_values) * 4
-
-            # Work out the spikes per tick depending on if the source is
-            # slow (isi), fast (exp) or faster (sqrt)
-            is_fast_source = is_fast_source == 1.0
-            spikes_per_tick = numpy.zeros(len(is_fast_source), dtype="float")
-            spikes_per_tick[is_fast_source] = numpy.log(
-                exp_minus_lambda[is_fast_source]) * -1.0
-            is_faster_source = sqrt_lambda > 0
-            # pylint: disable=assignment-from-no-return
-            spikes_per_tick[is_faster_source] = numpy.square(
-                sqrt_lambda[is_faster_source])
-            slow_elements = isi > 0
-            spikes_per_tick[slow_elements] = 1.0 / isi[slow_elements]
-
-            # Convert spikes per tick to rates
-            self.__data["rates"].set_value_by_id(
-                i,
-                spikes_per_tick *
-                (MICROSECONDS_PER_SECOND / float(self.__machine_time_step)))
-
-            # Store the updated time until next spike so that it can be
-            # rewritten when the parameters are loaded
-            self.__data["time_to_spike"].set_value_by_id(
-                i, time_to_next_spike)
+        # Locate the record of each atom from the number of rates it has;
+        # each record is the number of rates, the index, then the rates
+        words = numpy.frombuffer(byte_array, dtype="uint32")
+        n_rates = numpy.array([
+            len(r) for r in self.__data["rates"][vertex_slice.as_slice]])
+        record_offsets = numpy.concatenate(([0], numpy.cumsum(
+            PARAMS_WORDS_PER_NEURON + n_rates * PARAMS_WORDS_PER_RATE)[:-1]))
+        if not numpy.array_equal(words[record_offsets], n_rates):
+            raise MemReadException(
+                "The rates read from {} do not match those written".format(
+                    placement))
+
+        # Gather the words of every rate of every atom into one array
+        rate_index = numpy.arange(numpy.sum(n_rates))
+        first_rate = numpy.repeat(numpy.cumsum(n_rates) - n_rates, n_rates)
+        rate_offsets = (
+            numpy.repeat(record_offsets + PARAMS_WORDS_PER_NEURON, n_rates) +
+            (rate_index - first_rate) * PARAMS_WORDS_PER_RATE)
+        rate_data = words[
+            rate_offsets[:, None] + numpy.arange(PARAMS_WORDS_PER_RATE)]
+        rate_data = numpy.ascontiguousarray(rate_data).view(
+            _PoissonStruct.numpy_dtype).reshape(-1)
+        (_start, _end, _next, is_fast_source, exp_minus_lambda, sqrt_lambda,
+         isi, time_to_next_spike) = (
+            rate_data["f" + str(i)] / float(data_type.scale)
+            for i, data_type in enumerate(_PoissonStruct.field_types))
+
+        # Work out the spikes per tick depending on if the source is
+        # slow (isi), fast (exp) or faster (sqrt)
+        is_fast_source = is_fast_source == 1.0
+        spikes_per_tick = numpy.zeros(len(is_fast_source), dtype="float")
+        spikes_per_tick[is_fast_source] = numpy.log(
+            exp_minus_lambda[is_fast_source]) * -1.0
+        is_faster_source = sqrt_lambda > 0
+        # pylint: disable=assignment-from-no-return
+        spikes_per_tick[is_faster_source] = numpy.square(
+            sqrt_lambda[is_faster_source])
+        slow_elements = isi > 0
+        spikes_per_tick[slow_elements] = 1.0 / isi[slow_elements]
+
+        # Convert spikes per tick to rates, and store these and the updated
+        # time until next spike so that they can be rewritten when the
+        # parameters are loaded
+        rates = spikes_per_tick * (
+            MICROSECONDS_PER_SECOND / float(self.__machine_time_step))
+        splits = numpy.cumsum(n_rates)[:-1]
+        self.__data["rates"].set_values_by_slice(
+            vertex_slice.lo_atom, vertex_slice.hi_atom + 1,
+            numpy.split(rates, splits))
+        self.__data["time_to_spike"].set_values_by_slice(
+            vertex_slice.lo_atom, vertex_slice.hi_atom + 1,
+            numpy.split(time_to_next_spike, splits))
 
     @inject_items({
         "machine_time_step": "MachineTimeStep",
@@ -256,8 +256,8 @@ class DelayExtensionVertex(
             spec.write_value(len(generator_data))
             spec.write_value(vertex_slice.lo_atom)
             spec.write_value(vertex_slice.n_atoms)
-            for data in generator_data:
-                spec.write_array(data.gen_data)
+            for data in DelayGeneratorData.get_all_gen_data(generator_data):
+                spec.write_array(data)
 
         # End-of-Spec:
         spec.end_specification()
@@ -13,7 +13,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from collections import defaultdict
 import numpy
+from six import itervalues
 from data_specification.enums.data_type import DataType
 from spinn_front_end_common.utilities.constants import (
     MICRO_TO_MILLISECOND_CONVERSION, BYTES_PER_WORD)
@@ -86,6 +88,41 @@ class DelayGeneratorData(object):
 
         :rtype: ~numpy.ndarray(~numpy.uint32)
         """
+        return self.__gen_data(
+            self.__synapse_information.connector.gen_delay_params(
+                self.__synapse_information.delays, self.__pre_vertex_slice,
+                self.__post_vertex_slice, self.__synapse_information))
+
+    @staticmethod
+    def get_all_gen_data(generator_data):
+        """ Get the data to be written for each of a list of connections.\
+            The delay generator parameters of all the connections of each\
+            projection are encoded together.
+
+        :param list(DelayGeneratorData) generator_data: the connections
+        :rtype: list(~numpy.ndarray(~numpy.uint32))
+        """
+        # pylint: disable=protected-access
+        by_info = defaultdict(list)
+        for index, data in enumerate(generator_data):
+            by_info[data.__synapse_information].append(index)
+
+        delay_params = [None] * len(generator_data)
+        for indices in itervalues(by_info):
+            info = generator_data[indices[0]].__synapse_information
+            delays = info.connector.gen_delay_params_for_slice_pairs(
+                info.delays,
+                [generator_data[i].__pre_vertex_slice for i in indices],
+                [generator_data[i].__post_vertex_slice for i in indices],
+                info)
+            for i, index in enumerate(indices):
+                delay_params[index] = delays[i]
+
+        return [
+            data.__gen_data(delay_params[i])
+            for i, data in enumerate(generator_data)]
+
+    def __gen_data(self, delay_params):
         connector = self.__synapse_information.connector
         items = list()
         items.append(numpy.array([
@@ -104,7 +141,5 @@ class DelayGeneratorData(object):
             self.__post_slice_index, self.__pre_vertex_slice,
             self.__post_vertex_slice, self.__synapse_information.synapse_type,
             self.__synapse_information))
-        items.append(connector.gen_delay_params(
-            self.__synapse_information.delays, self.__pre_vertex_slice,
-            self.__post_vertex_slice))
+        items.append(delay_params)
         return numpy.concatenate(items)
@@ -15,11 +15,14 @@
 
 import logging
 import os
+from collections import defaultdict
+from multiprocessing.pool import ThreadPool
 from spinn_utilities.progress_bar import ProgressBar
 from spinn_utilities.make_tools.replacer import Replacer
 from spinnman.model import ExecutableTargets
 from spinnman.model.enums import CPUState
-from spinn_front_end_common.utilities import globals_variables
+from spinn_front_end_common.utilities import (
+    globals_variables, helpful_functions)
 from spynnaker.pyNN.exceptions import SpynnakerException
 from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
 from spynnaker.pyNN.models.utility_models.delays import DelayExtensionVertex
@@ -37,9 +40,16 @@ DELAY_EXPANDER = "delay_expander.aplx"
 
 def synapse_expander(
         app_graph, graph_mapper, placements, transceiver,
-        provenance_file_path, executable_finder):
+        provenance_file_path, executable_finder,
+        using_extra_monitor_cores=False, extra_monitor_cores=None,
+        extra_monitor_cores_to_chips=None, packet_gather_cores_to_chips=None,
+        machine=None, fixed_routes=None):
     """ Run the synapse expander - needs to be done after data has been loaded
+
+    If the extra monitor cores are available, the connections needed before\
+    the run are read back through them; otherwise they are read with SCAMP.
     """
+    # pylint: disable=too-many-arguments, too-many-locals
 
     synapse_bin = executable_finder.get_executable_path(SYNAPSE_EXPANDER)
     delay_bin = executable_finder.get_executable_path(DELAY_EXPANDER)
@@ -84,8 +94,14 @@ def synapse_expander(
             [CPUState.FINISHED])
         progress.update()
         finished = True
+        monitors = None
+        if using_extra_monitor_cores and extra_monitor_cores is not None:
+            monitors = _ExtraMonitors(
+                extra_monitor_cores, extra_monitor_cores_to_chips,
+                packet_gather_cores_to_chips, machine, fixed_routes)
         _fill_in_connection_data(
-            gen_on_machine_vertices, graph_mapper, placements, transceiver)
+            gen_on_machine_vertices, graph_mapper, placements, transceiver,
+            monitors)
         _extract_iobuf(expander_cores, transceiver, provenance_file_path)
         progress.end()
     except Exception:  # pylint: disable=broad-except
@@ -145,20 +161,71 @@ def _handle_failure(expander_cores, transceiver, provenance_file_path):
                    display=True)
 
 
+class _ExtraMonitors(object):
+    """ The extra monitor details needed to stream data off the machine
+    """
+    __slots__ = [
+        "extra_monitor_cores", "extra_monitor_cores_to_chips",
+        "packet_gather_cores_to_chips", "machine", "fixed_routes"]
+
+    def __init__(self, extra_monitor_cores, extra_monitor_cores_to_chips,
+                 packet_gather_cores_to_chips, machine, fixed_routes):
+        self.extra_monitor_cores = extra_monitor_cores
+        self.extra_monitor_cores_to_chips = extra_monitor_cores_to_chips
+        self.packet_gather_cores_to_chips = packet_gather_cores_to_chips
+        self.machine = machine
+        self.fixed_routes = fixed_routes
+
+    def get_receiver(self, placement):
+        """ Get the gatherer and the extra monitor that read a placement
+        """
+        receiver = helpful_functions.locate_extra_monitor_mc_receiver(
+            placement_x=placement.x, placement_y=placement.y,
+            machine=self.machine,
+            packet_gather_cores_to_ethernet_connection_map=(
+                self.packet_gather_cores_to_chips))
+        return receiver, self.extra_monitor_cores_to_chips[
+            placement.x, placement.y]
+
+    def get_receivers(self, placements):
+        """ Get the gatherers and their board's extra monitors that are\
+            needed to read the given placements
+        """
+        receivers = defaultdict(set)
+        for placement in placements:
+            chip = self.machine.get_chip_at(placement.x, placement.y)
+            receiver, _ = self.get_receiver(placement)
+            receivers[receiver].update(
+                self.extra_monitor_cores_to_chips[xy]
+                for xy in self.machine.get_existing_xys_on_board(chip))
+        return receivers
+
+
 def _fill_in_connection_data(
-        gen_on_machine_vertices, graph_mapper, placements, transceiver):
-    """ Once expander has run, fill in the connection data
-    :param app_graph
-    :param graph_mapper
+        gen_on_machine_vertices, graph_mapper, placements, transceiver,
+        monitors=None):
+    """ Once expander has run, fill in the connection data.  Each core is\
+        read once for all the connection holders that need data from it,\
+        and the data is then converted into connections in parallel.  Cores\
+        whose connections can be generated again on the host are not read.
+
+    :param gen_on_machine_vertices: the vertices that have been expanded
+    :param graph_mapper:
+    :param placements:
+    :param transceiver:
+    :param monitors: the extra monitors to read with, or None to use SCAMP
+    :type monitors: _ExtraMonitors
     :rtype: None
     """
+    # pylint: disable=too-many-locals
     ctl = globals_variables.get_simulator()
-    use_extra_monitors = False
 
+    # Group the edges to be read by the core they are to be read from
+    to_read = defaultdict(list)
+    conn_holders = dict()
     for vertex in gen_on_machine_vertices:
-        conn_holders = vertex.get_connection_holders()
         for (app_edge, synapse_info), conn_holder_list in iteritems(
-                conn_holders):
+                vertex.get_connection_holders()):
             # Only do this if this synapse_info has been generated
             # on the machine using the expander
             connector = synapse_info.connector
@@ -170,13 +237,91 @@ def _fill_in_connection_data(
             synapse_gen = isinstance(
                 dynamics, AbstractGenerateOnMachine)
             if connector_gen and synapse_gen:
-                machine_edges = graph_mapper.get_machine_edges(app_edge)
-                for machine_edge in machine_edges:
+                conn_holders[app_edge, synapse_info] = conn_holder_list
+                for machine_edge in graph_mapper.get_machine_edges(app_edge):
                     placement = placements.get_placement_of_vertex(
                         machine_edge.post_vertex)
-                    conns = vertex.get_connections_from_machine(
-                        transceiver, placement, machine_edge, graph_mapper,
-                        ctl.routing_infos, synapse_info, ctl.machine_time_step,
-                        use_extra_monitors)
-                    for conn_holder in conn_holder_list:
-                        conn_holder.add_connections(conns)
+                    to_read[vertex, placement].append(
+                        (machine_edge, synapse_info))
+    if not to_read:
+        return
+
+    # Where the expander can be reproduced exactly on the host, do that in
+    # parallel instead of reading the connections back
+    def _expand(item):
+        (vertex, placement), edges_and_infos = item
+        return vertex.get_host_expanded_connections(
+            placement, edges_and_infos, graph_mapper, ctl.machine_time_step)
+
+    pool = ThreadPool()
+    try:
+        expanded = pool.map(_expand, list(iteritems(to_read)))
+    finally:
+        pool.close()
+        pool.join()
+    found = list()
+    for key, conns in zip(list(to_read), expanded):
+        if conns is not None:
+            del to_read[key]
+            found.extend(iteritems(conns))
+
+    # Set up the routers for streaming, once for all the reads
+    receivers = dict()
+    if monitors is not None:
+        receivers = monitors.get_receivers(
+            placement for _, placement in to_read)
+    for receiver, extra_monitor_cores in iteritems(receivers):
+        receiver.load_system_routing_tables(
+            transceiver, monitors.extra_monitor_cores, placements)
+        receiver.set_cores_for_data_streaming(
+            transceiver, list(extra_monitor_cores), placements)
+
+    # Read the data from each core
+    blocks = list()
+    try:
+        for (vertex, placement), edges_and_infos in iteritems(to_read):
+            receiver, extra_monitor, fixed_routes = None, None, None
+            if monitors is not None:
+                receiver, extra_monitor = monitors.get_receiver(placement)
+                fixed_routes = monitors.fixed_routes
+            for (machine_edge, synapse_info), edge_blocks in iteritems(
+                    vertex.read_synaptic_blocks_from_machine(
+                        transceiver, placement, edges_and_infos,
+                        graph_mapper, ctl.routing_infos,
+                        monitors is not None, placements, receiver,
+                        extra_monitor, fixed_routes)):
+                blocks.append((
+                    vertex, placement, machine_edge, synapse_info,
+                    edge_blocks))
+    finally:
+        for receiver, extra_monitor_cores in iteritems(receivers):
+            receiver.unset_cores_for_data_streaming(
+                transceiver, list(extra_monitor_cores), placements)
+            receiver.load_application_routing_tables(
+                transceiver, monitors.extra_monitor_cores, placements)
+
+    # Convert the data into connections in parallel
+    def _decode(item):
+        vertex, placement, machine_edge, synapse_info, edge_blocks = item
+        return vertex.get_connections_from_blocks(
+            placement, machine_edge, graph_mapper, synapse_info,
+            edge_blocks, ctl.machine_time_step)
+
+    pool = ThreadPool()
+    try:
+        all_conns = pool.map(_decode, blocks)
+    finally:
+        pool.close()
+        pool.join()
+
+    found.extend(
+        ((machine_edge, synapse_info), conns)
+        for (_, _, machine_edge, synapse_info, _), conns in zip(
+            blocks, all_conns))
+    for (machine_edge, synapse_info), conns in found:
+        app_edge = graph_mapper.get_application_edge(machine_edge)
+        for conn_holder in conn_holders[app_edge, synapse_info]:
+            conn_holder.add_connections(conns)
+    for conn_holder_list in conn_holders.values():
+        for conn_holder in conn_holder_list:
+            conn_holder.finish()
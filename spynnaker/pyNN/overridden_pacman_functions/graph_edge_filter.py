@@ -14,13 +14,15 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import logging
+from collections import defaultdict
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.progress_bar import ProgressBar
 from pacman.model.graphs.application import ApplicationEdge
 from pacman.model.graphs.machine import MachineGraph
 from pacman.model.graphs.common import GraphMapper
 from spynnaker.pyNN.exceptions import FilterableException
-from spynnaker.pyNN.models.abstract_models import AbstractFilterableEdge
+from spynnaker.pyNN.models.abstract_models import (
+    AbstractFilterableApplicationEdge, AbstractFilterableEdge)
 from spynnaker.pyNN.models.neural_projections import ProjectionApplicationEdge
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     AbstractSynapseDynamicsStructural)
@@ -48,62 +50,91 @@ class GraphEdgeFilter(object):
             "Filtering edges")
 
         # add the vertices directly, as they wont be pruned.
+        new_machine_graph.add_vertices(machine_graph.vertices)
         for vertex in progress.over(machine_graph.vertices, False):
             self._add_vertex_to_new_graph(
-                vertex, graph_mapper, new_machine_graph, new_graph_mapper)
-        prune_count = 0
+                vertex, graph_mapper, new_graph_mapper)
+
+        # The slice pairs to be filtered, worked out once per application edge
+        slice_pair_filters = dict()
+        prune_counts = defaultdict(int)
         no_prune_count = 0
 
         # start checking edges to decide which ones need pruning....
         for partition in progress.over(machine_graph.outgoing_edge_partitions):
+            kept_edges = list()
             for edge in partition.edges:
-                if self._is_filterable(edge, graph_mapper):
+                app_edge = graph_mapper.get_application_edge(edge)
+                if self._is_filterable(
+                        edge, app_edge, graph_mapper, slice_pair_filters):
                     logger.debug("this edge was pruned {}", edge)
-                    prune_count += 1
+                    prune_counts[app_edge] += 1
                     continue
                 logger.debug("this edge was not pruned {}", edge)
-                no_prune_count += 1
-                self._add_edge_to_new_graph(
-                    edge, partition, graph_mapper, new_machine_graph,
+                kept_edges.append((edge, app_edge))
+            no_prune_count += len(kept_edges)
+            if kept_edges:
+                self._add_edges_to_new_graph(
+                    kept_edges, partition, new_machine_graph,
                     new_graph_mapper)
 
+        # record the pruning against the application edges for provenance
+        for app_edge in slice_pair_filters:
+            if isinstance(app_edge, ProjectionApplicationEdge):
+                app_edge.n_filtered_machine_edges = prune_counts[app_edge]
+
         # returned the pruned graph and graph_mapper
         logger.debug("prune_count:{} no_prune_count:{}",
-                     prune_count, no_prune_count)
+                     sum(prune_counts.values()), no_prune_count)
         return new_machine_graph, new_graph_mapper
 
     @staticmethod
-    def _add_vertex_to_new_graph(vertex, old_mapper, new_graph, new_mapper):
-        new_graph.add_vertex(vertex)
+    def _add_vertex_to_new_graph(vertex, old_mapper, new_mapper):
         new_mapper.add_vertex_mapping(
             machine_vertex=vertex,
             vertex_slice=old_mapper.get_slice(vertex),
             application_vertex=old_mapper.get_application_vertex(vertex))
 
     @staticmethod
-    def _add_edge_to_new_graph(
-            edge, partition, old_mapper, new_graph, new_mapper):
-        new_graph.add_edge(edge, partition.identifier)
-        new_mapper.add_edge_mapping(
-            edge, old_mapper.get_application_edge(edge))
+    def _add_edges_to_new_graph(
+            edges_and_app_edges, partition, new_graph, new_mapper):
+        new_graph.add_edges(
+            [edge for edge, _ in edges_and_app_edges], partition.identifier)
+        for edge, app_edge in edges_and_app_edges:
+            new_mapper.add_edge_mapping(edge, app_edge)
 
         # add partition constraints from the original graph to the new graph
         # add constraints from the application partition
         new_partition = new_graph. \
             get_outgoing_edge_partition_starting_at_vertex(
-                edge.pre_vertex, partition.identifier)
+                partition.pre_vertex, partition.identifier)
         new_partition.add_constraints(partition.constraints)
 
     @staticmethod
-    def _is_filterable(edge, graph_mapper):
-        app_edge = graph_mapper.get_application_edge(edge)
-
+    def _get_slice_pair_filter(app_edge, graph_mapper):
         # Don't filter edges which have structural synapse dynamics
         if isinstance(app_edge, ProjectionApplicationEdge):
             for syn_info in app_edge.synapse_information:
                 if isinstance(syn_info.synapse_dynamics,
                               AbstractSynapseDynamicsStructural):
-                    return False
+                    return None
+        return app_edge.filter_slice_pairs(
+            graph_mapper.get_slices(app_edge.pre_vertex),
+            graph_mapper.get_slices(app_edge.post_vertex))
+
+    @classmethod
+    def _is_filterable(cls, edge, app_edge, graph_mapper, slice_pair_filters):
+        # Filter edges of application edges in bulk where possible
+        if isinstance(app_edge, AbstractFilterableApplicationEdge):
+            if app_edge not in slice_pair_filters:
+                slice_pair_filters[app_edge] = cls._get_slice_pair_filter(
+                    app_edge, graph_mapper)
+            slice_pair_filter = slice_pair_filters[app_edge]
+            if slice_pair_filter is None:
+                return False
+            return bool(slice_pair_filter[
+                graph_mapper.get_machine_vertex_index(edge.pre_vertex),
+                graph_mapper.get_machine_vertex_index(edge.post_vertex)])
         if isinstance(edge, AbstractFilterableEdge):
             return edge.filter_edge(graph_mapper)
         elif isinstance(app_edge, ApplicationEdge):
@@ -77,6 +77,7 @@ class POPULATION_BASED_REGIONS(Enum):
     PROFILING = 8
     CONNECTOR_BUILDER = 9
     DIRECT_MATRIX = 10
+    BIT_FIELD_FILTER = 11
 
 
 #: The partition ID used for spike data
@@ -0,0 +1,424 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Opt-in profiling of the phases of the host-side work, such as\
+    generating connections, encoding rows and extracting recorded data.
+
+Code marks a phase with::
+
+    with profile_phase("encode_rows", edge.label) as phase:
+        ...
+        phase.add_bytes(data.nbytes)
+
+which costs almost nothing unless profiling has been enabled with\
+:py:func:`enable`.  Phases nest, so each is recorded with the stack of\
+phases around it; :py:func:`write_profile` writes the records as JSON and\
+in the "folded stack" format read by flame graph tools.
+"""
+
+from collections import OrderedDict, defaultdict
+import json
+import logging
+import os
+import threading
+import timeit
+from spinn_utilities.log import FormatAdapter
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+#: The name of the JSON profile written to the report folder
+PROFILE_FILENAME = "host_profile.json"
+
+#: The name of the folded stack profile written to the report folder
+FOLDED_FILENAME = "host_profile.folded"
+
+_MICROSECONDS_PER_SECOND = 1000000.0
+
+
+class PhaseRecord(object):
+    """ The measurements of one execution of a phase
+    """
+
+    __slots__ = [
+        "__name",
+        "__item",
+        "__stack",
+        "__start_time",
+        "__time",
+        "__child_time",
+        "__n_bytes",
+        "__start_memory",
+        "__observed_peak",
+        "__peak_bytes"]
+
+    def __init__(self, name, item, stack):
+        """
+        :param str name: The name of the phase
+        :param item: The vertex, edge or other item the phase worked on
+        :type item: str or None
+        :param tuple(str) stack: The frames of the phases around this one
+        """
+        self.__name = name
+        self.__item = item
+        self.__stack = stack
+        self.__start_time = None
+        self.__time = None
+        self.__child_time = 0.0
+        self.__n_bytes = 0
+        self.__start_memory = None
+        self.__observed_peak = None
+        self.__peak_bytes = None
+
+    @property
+    def name(self):
+        """ The name of the phase
+
+        :rtype: str
+        """
+        return self.__name
+
+    @property
+    def item(self):
+        """ The vertex, edge or other item the phase worked on, if any
+
+        :rtype: str or None
+        """
+        return self.__item
+
+    @property
+    def frame(self):
+        """ The name of the phase with the item it worked on
+
+        :rtype: str
+        """
+        if self.__item is None:
+            return self.__name
+        return "{}({})".format(self.__name, self.__item)
+
+    @property
+    def stack(self):
+        """ The frames of the phases around this one, outermost first
+
+        :rtype: tuple(str)
+        """
+        return self.__stack
+
+    @property
+    def time(self):
+        """ The wall time of the phase in seconds
+
+        :rtype: float
+        """
+        return self.__time
+
+    @property
+    def self_time(self):
+        """ The wall time of the phase in seconds, less that of the phases\
+            inside it
+
+        :rtype: float
+        """
+        return self.__time - self.__child_time
+
+    @property
+    def n_bytes(self):
+        """ The number of bytes the phase reported producing
+
+        :rtype: int
+        """
+        return self.__n_bytes
+
+    @property
+    def peak_bytes(self):
+        """ The peak memory allocated during the phase above that allocated\
+            at its start, or None if memory is not being traced
+
+        :rtype: int or None
+        """
+        return self.__peak_bytes
+
+    def add_bytes(self, n_bytes):
+        """ Add to the number of bytes the phase has produced
+
+        :param int n_bytes: The number of bytes to add
+        """
+        self.__n_bytes += int(n_bytes)
+
+    def _start(self, parent):
+        if _tracing_memory():
+            current, peak = tracemalloc.get_traced_memory()
+            if parent is not None:
+                parent._observe_peak(peak)
+            _reset_peak()
+            self.__start_memory = current
+            self.__observed_peak = current
+        self.__start_time = timeit.default_timer()
+
+    def _stop(self, parent):
+        self.__time = timeit.default_timer() - self.__start_time
+        if self.__start_memory is not None and _tracing_memory():
+            _, peak = tracemalloc.get_traced_memory()
+            self._observe_peak(peak)
+            self.__peak_bytes = self.__observed_peak - self.__start_memory
+            if parent is not None:
+                parent._observe_peak(self.__observed_peak)
+            _reset_peak()
+        if parent is not None:
+            parent._add_child_time(self.__time)
+
+    def _observe_peak(self, peak):
+        if self.__observed_peak is not None:
+            self.__observed_peak = max(self.__observed_peak, peak)
+
+    def _add_child_time(self, time):
+        self.__child_time += time
+
+    def to_dict(self):
+        """ The record as a dictionary that can be written as JSON
+
+        :rtype: dict
+        """
+        return OrderedDict((
+            ("phase", self.__name),
+            ("item", self.__item),
+            ("stack", list(self.__stack)),
+            ("time", self.__time),
+            ("self_time", self.self_time),
+            ("n_bytes", self.__n_bytes),
+            ("peak_bytes", self.__peak_bytes)))
+
+
+class _Phase(object):
+    """ A context manager that records a phase in the profile
+    """
+
+    __slots__ = ["__record"]
+
+    def __init__(self, name, item):
+        stack = _get_stack()
+        self.__record = PhaseRecord(
+            name, None if item is None else str(item),
+            tuple(record.frame for record in stack))
+
+    def __enter__(self):
+        stack = _get_stack()
+        # pylint: disable=protected-access
+        self.__record._start(stack[-1] if stack else None)
+        stack.append(self.__record)
+        return self.__record
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        stack = _get_stack()
+        stack.pop()
+        # pylint: disable=protected-access
+        self.__record._stop(stack[-1] if stack else None)
+        _state.records.append(self.__record)
+        return False
+
+
+class _NoPhase(object):
+    """ Stands in for a phase when profiling is disabled
+    """
+
+    __slots__ = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def add_bytes(self, n_bytes):
+        pass
+
+
+class _State(threading.local):
+    """ The stack of phases of each thread
+    """
+
+    def __init__(self):
+        super(_State, self).__init__()
+        self.stack = list()
+
+
+class _Profile(object):
+    """ The global state of the profiler
+    """
+
+    __slots__ = [
+        "enabled",
+        "records",
+        "started_tracemalloc",
+        "threads"]
+
+    def __init__(self):
+        self.enabled = False
+        self.records = list()
+        self.started_tracemalloc = False
+        self.threads = _State()
+
+
+_state = _Profile()
+_NO_PHASE = _NoPhase()
+
+
+def _get_stack():
+    return _state.threads.stack
+
+
+def _tracing_memory():
+    return tracemalloc is not None and tracemalloc.is_tracing()
+
+
+def _reset_peak():
+    # Before Python 3.9, the peak can't be reset, so is the peak since
+    # tracing started; the peaks of phases may then be overestimated
+    reset_peak = getattr(tracemalloc, "reset_peak", None)
+    if reset_peak is not None:
+        reset_peak()
+
+
+def enable(trace_memory=False):
+    """ Start recording phases
+
+    :param bool trace_memory:
+        Whether to measure the peak memory allocated in each phase as well\
+        as its time.  This uses :py:mod:`tracemalloc`, which slows down\
+        allocation considerably.
+    """
+    _state.enabled = True
+    if trace_memory:
+        if tracemalloc is None:
+            logger.warning(
+                "tracemalloc is not available, so the peak memory of host "
+                "phases will not be recorded")
+        elif not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _state.started_tracemalloc = True
+
+
+def disable():
+    """ Stop recording phases; those already recorded are kept
+    """
+    _state.enabled = False
+    if _state.started_tracemalloc:
+        tracemalloc.stop()
+        _state.started_tracemalloc = False
+
+
+def is_enabled():
+    """ Whether phases are being recorded
+
+    :rtype: bool
+    """
+    return _state.enabled
+
+
+def clear():
+    """ Discard the phases recorded so far
+    """
+    _state.records = list()
+
+
+def get_records():
+    """ The phases recorded so far, in the order they finished
+
+    :rtype: list(PhaseRecord)
+    """
+    return list(_state.records)
+
+
+def profile_phase(name, item=None):
+    """ Get a context manager which records the code it wraps as a phase,\
+        and gives a :py:class:`PhaseRecord` to which the bytes produced can\
+        be added.  When profiling is disabled, nothing is recorded.
+
+    :param str name: The name of the phase
+    :param item: The vertex, edge or other item the phase works on, if any
+    :type item: str or None
+    """
+    if not _state.enabled:
+        return _NO_PHASE
+    return _Phase(name, item)
+
+
+def summarise(records):
+    """ Total the measurements of the phases with each name
+
+    :param iterable(PhaseRecord) records: The records to summarise
+    :return: The count, total time, self time, bytes and largest peak of\
+        each phase, in the order first seen
+    :rtype: dict(str, dict)
+    """
+    summary = OrderedDict()
+    for record in records:
+        if record.name not in summary:
+            summary[record.name] = OrderedDict((
+                ("count", 0), ("time", 0.0), ("self_time", 0.0),
+                ("n_bytes", 0), ("peak_bytes", None)))
+        totals = summary[record.name]
+        totals["count"] += 1
+        totals["time"] += record.time
+        totals["self_time"] += record.self_time
+        totals["n_bytes"] += record.n_bytes
+        if record.peak_bytes is not None:
+            totals["peak_bytes"] = max(
+                totals["peak_bytes"] or 0, record.peak_bytes)
+    return summary
+
+
+def folded_stacks(records):
+    """ Get the self time of each stack of phases in microseconds, as the\
+        lines of a "folded stack" file as read by flame graph tools
+
+    :param iterable(PhaseRecord) records: The records to fold
+    :rtype: list(str)
+    """
+    times = defaultdict(float)
+    for record in records:
+        frames = [
+            frame.replace(";", ":") for frame in record.stack + (
+                record.frame,)]
+        times[";".join(frames)] += record.self_time
+    return [
+        "{} {}".format(stack, int(round(time * _MICROSECONDS_PER_SECOND)))
+        for stack, time in sorted(times.items())]
+
+
+def write_profile(report_folder):
+    """ Write the phases recorded so far into the report folder, as JSON\
+        and as folded stacks
+
+    :param str report_folder: The folder to write the profile to
+    """
+    records = get_records()
+    json_file = os.path.join(report_folder, PROFILE_FILENAME)
+    folded_file = os.path.join(report_folder, FOLDED_FILENAME)
+    try:
+        with open(json_file, "w") as f:
+            json.dump(OrderedDict((
+                ("phases", summarise(records)),
+                ("records", [record.to_dict() for record in records]))),
+                f, indent=4)
+        with open(folded_file, "w") as f:
+            for line in folded_stacks(records):
+                f.write(line + "\n")
+    except IOError:
+        logger.exception(
+            "Can't write the host profile to {}", report_folder)
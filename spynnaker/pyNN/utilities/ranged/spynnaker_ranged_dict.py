@@ -32,3 +32,34 @@ class SpynnakerRangeDictionary(RangeDictionary):
         :rtype: SpynnakerRangedList
         """
         return SpynnakerRangedList(size, value, key)
+
+    def __tracked_lists(self):
+        for key in self.keys():
+            value_list = self.get_list(key)
+            if isinstance(value_list, SpynnakerRangedList):
+                yield value_list
+
+    def has_changes(self, slice_start=0, slice_stop=None):
+        """ Determine if any value of any ID in a range has been changed\
+            since the changes were last cleared.
+
+        :param slice_start: Start of the range
+        :type slice_start: int
+        :param slice_stop: Exclusive end of the range, or None for the end
+        :type slice_stop: int or None
+        :rtype: bool
+        """
+        return any(
+            value_list.has_changes(slice_start, slice_stop)
+            for value_list in self.__tracked_lists())
+
+    def clear_changes(self, slice_start=0, slice_stop=None):
+        """ Forget the changes to all values of the IDs in a range.
+
+        :param slice_start: Start of the range
+        :type slice_start: int
+        :param slice_stop: Exclusive end of the range, or None for the end
+        :type slice_stop: int or None
+        """
+        for value_list in self.__tracked_lists():
+            value_list.clear_changes(slice_start, slice_stop)
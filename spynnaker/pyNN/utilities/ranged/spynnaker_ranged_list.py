@@ -19,6 +19,109 @@ from spinn_utilities.ranged.ranged_list import RangedList
 
 
 class SpynnakerRangedList(RangedList):
+    """ A ranged list that also keeps track of which ranges of IDs have been\
+        changed since the changes were last cleared, so that only the parts\
+        of the machine holding those IDs need to be updated.
+    """
+
+    __slots__ = [
+        "__changed_ranges"]
+
+    def __init__(
+            self, size=None, value=None, key=None, use_list_as_value=False):
+        """
+        :param size: Fixed length of the list
+        :param value: value to given to all elements in the list
+        :param key: The dict key this list covers.\
+            This is used only for better Exception messages
+        :param use_list_as_value: True if the value *is* a list
+        """
+        self.__changed_ranges = list()
+        super(SpynnakerRangedList, self).__init__(
+            size, value, key, use_list_as_value)
+
+        # The initial values are not a change
+        self.__changed_ranges = list()
+
+    def __mark_changed(self, start, stop):
+        """ Add a range of IDs to the sorted, non-overlapping changed ranges.
+        """
+        merged = list()
+        for (c_start, c_stop) in self.__changed_ranges:
+            if c_stop < start or c_start > stop:
+                merged.append((c_start, c_stop))
+            else:
+                start = min(start, c_start)
+                stop = max(stop, c_stop)
+        merged.append((start, stop))
+        merged.sort()
+        self.__changed_ranges = merged
+
+    @overrides(RangedList.set_value)
+    def set_value(self, value, use_list_as_value=False):
+        RangedList.set_value(self, value, use_list_as_value)
+        self.__mark_changed(0, len(self))
+
+    @overrides(RangedList.set_value_by_id)
+    def set_value_by_id(self, id, value):  # @ReservedAssignment
+        RangedList.set_value_by_id(self, id, value)
+        self.__mark_changed(id, id + 1)
+
+    @overrides(RangedList.set_value_by_slice)
+    def set_value_by_slice(
+            self, slice_start, slice_stop, value, use_list_as_value=False):
+        RangedList.set_value_by_slice(
+            self, slice_start, slice_stop, value, use_list_as_value)
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        if slice_start < slice_stop:
+            self.__mark_changed(slice_start, slice_stop)
+
+    @property
+    def changed_ranges(self):
+        """ The ranges of IDs changed since the changes were last cleared,\
+            as a sorted list of (start, exclusive stop) tuples
+
+        :rtype: list(tuple(int, int))
+        """
+        return list(self.__changed_ranges)
+
+    def has_changes(self, slice_start=0, slice_stop=None):
+        """ Determine if any ID in a range has been changed since the\
+            changes were last cleared.
+
+        :param slice_start: Start of the range
+        :type slice_start: int
+        :param slice_stop: Exclusive end of the range, or None for the end\
+            of the list
+        :type slice_stop: int or None
+        :rtype: bool
+        """
+        if slice_stop is None:
+            slice_stop = len(self)
+        return any(
+            start < slice_stop and stop > slice_start
+            for (start, stop) in self.__changed_ranges)
+
+    def clear_changes(self, slice_start=0, slice_stop=None):
+        """ Forget the changes to the IDs in a range, e.g. once they have\
+            been written to the machine.
+
+        :param slice_start: Start of the range
+        :type slice_start: int
+        :param slice_stop: Exclusive end of the range, or None for the end\
+            of the list
+        :type slice_stop: int or None
+        """
+        if slice_stop is None:
+            slice_stop = len(self)
+        remaining = list()
+        for (start, stop) in self.__changed_ranges:
+            if start < slice_start:
+                remaining.append((start, min(stop, slice_start)))
+            if stop > slice_stop:
+                remaining.append((max(start, slice_stop), stop))
+        self.__changed_ranges = remaining
 
     @staticmethod
     @overrides(RangedList.is_list)
@@ -37,3 +140,27 @@ class SpynnakerRangedList(RangedList):
             return value.next(n=size)
 
         return RangedList.as_list(value, size, ids)
+
+    def set_values_by_slice(self, slice_start, slice_stop, values):
+        """ Set a separate value for each ID in a slice in one go, rather\
+            than splitting the ranges once for each ID in turn.
+
+        :param slice_start: Start of the range
+        :type slice_start: int
+        :param slice_stop: Exclusive end of the range
+        :type slice_stop: int
+        :param values: The value of each ID in the range, in order
+        :type values: list
+
+        .. note::
+            This is intended for values read back from the machine, so the\
+            IDs are not marked as changed.
+        """
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        if len(values) != slice_stop - slice_start:
+            raise Exception("The number of values does not equal the size")
+        if self._ranged_based:
+            self._ranges = list(self)
+            self._ranged_based = False
+        self._ranges[slice_start:slice_stop] = values
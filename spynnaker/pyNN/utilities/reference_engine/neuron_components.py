@@ -0,0 +1,285 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Vectorised host versions of the C implementations of the standard neuron\
+    components.  Each works on the values of the component's struct, as\
+    returned by :py:meth:`Struct.read_data`, i.e. one array per struct field\
+    with one element per neuron, updating them in place as the C code would.
+"""
+
+import numpy
+from spynnaker.pyNN.exceptions import SpynnakerException
+from spynnaker.pyNN.models.neuron.input_types import (
+    InputTypeConductance, InputTypeCurrent, InputTypeDelta)
+from spynnaker.pyNN.models.neuron.neuron_models import (
+    NeuronModelIzh, NeuronModelLeakyIntegrateAndFire)
+from spynnaker.pyNN.models.neuron.synapse_types import (
+    SynapseTypeAlpha, SynapseTypeDelta, SynapseTypeExponential)
+from spynnaker.pyNN.models.neuron.threshold_types import (
+    ThresholdTypeMaassStochastic, ThresholdTypeStatic)
+
+# The constants of the Izhikevich update, as used on the machine
+_IZH_V_SQUARED = 0.040008544921875
+_IZH_TQ_OFFSET = 1.85
+
+# The saturation of the probability of the Maass stochastic threshold
+_PROB_SATURATION = 0.8
+
+# The number of random bits used by the Maass stochastic threshold
+_RANDOM_RANGE = 0x10000
+
+
+class _LIFModel(object):
+    """ neuron_model_lif_impl.c: v, v_rest, r_membrane, exp_tc, i_offset,\
+        count_refrac, v_reset, tau_refrac
+    """
+
+    @staticmethod
+    def voltage(values):
+        return values[0]
+
+    @staticmethod
+    def update(values, exc, inh, external_bias, ts_ms):
+        # pylint: disable=unused-argument
+        (v, v_rest, r_membrane, exp_tc, i_offset, count_refrac, _, _) = values
+        active = count_refrac <= 0
+        alpha = (exc - inh + external_bias + i_offset) * r_membrane + v_rest
+        v[active] = (alpha - exp_tc * (alpha - v))[active]
+        count_refrac[~active] -= 1
+        return v
+
+    @staticmethod
+    def has_spiked(values, spiked, ts_ms):
+        # pylint: disable=unused-argument
+        values[0][spiked] = values[6][spiked]
+        values[5][spiked] = values[7][spiked]
+
+
+class _IzhikevichModel(object):
+    """ neuron_model_izh_impl.c: a, b, c, d, v, u, i_offset, this_h
+    """
+
+    @staticmethod
+    def voltage(values):
+        return values[4]
+
+    @staticmethod
+    def update(values, exc, inh, external_bias, ts_ms):
+        (a, b, _, _, v, u, i_offset, this_h) = values
+        pre_alph = 140.0 + exc - inh + external_bias + i_offset - u
+        alpha = pre_alph + (5.0 + _IZH_V_SQUARED * v) * v
+        eta = v + 0.5 * this_h * alpha
+        beta = 0.5 * this_h * (b * v - u) * a
+        new_v = v + this_h * (
+            pre_alph - beta + (5.0 + _IZH_V_SQUARED * eta) * eta)
+        u += a * this_h * (-u - beta + b * eta)
+        v[:] = new_v
+        this_h[:] = ts_ms
+        return v
+
+    @staticmethod
+    def has_spiked(values, spiked, ts_ms):
+        values[4][spiked] = values[2][spiked]
+        values[5][spiked] += values[3][spiked]
+        values[7][spiked] = ts_ms * _IZH_TQ_OFFSET
+
+
+class _ExponentialSynapse(object):
+    """ synapse_types_exponential_impl.h: (decay, init, isyn) for excitatory\
+        then inhibitory
+    """
+
+    @staticmethod
+    def inputs(values):
+        return values[2], values[5]
+
+    @staticmethod
+    def add_input(values, synapse_type, weights):
+        base = 3 * synapse_type
+        values[base + 2] += weights * values[base + 1]
+
+    @staticmethod
+    def shape(values):
+        values[2] *= values[0]
+        values[5] *= values[3]
+
+
+class _AlphaSynapse(object):
+    """ synapse_types_alpha_impl.h: (lin_buff, exp_buff,\
+        dt_divided_by_tau_sqr, decay, q_buff) for excitatory then inhibitory
+    """
+
+    @staticmethod
+    def inputs(values):
+        return values[0] * values[1], values[5] * values[6]
+
+    @staticmethod
+    def add_input(values, synapse_type, weights):
+        lin, exp, dt_tau_sqr, decay, q = values[
+            5 * synapse_type:5 * synapse_type + 5]
+        has_input = weights > 0
+        weights = weights[has_input]
+        q[has_input] = weights
+        exp[has_input] = exp[has_input] * decay[has_input] + 1.0
+        lin[has_input] = (
+            (lin[has_input] + weights * dt_tau_sqr[has_input]) *
+            (1.0 - 1.0 / exp[has_input]))
+
+    @staticmethod
+    def shape(values):
+        for base in (0, 5):
+            values[base] += values[base + 4] * values[base + 2]
+            values[base + 1] *= values[base + 3]
+
+
+class _DeltaSynapse(object):
+    """ synapse_types_delta_impl.h: isyn_exc, isyn_inh
+    """
+
+    @staticmethod
+    def inputs(values):
+        return values[0].copy(), values[1].copy()
+
+    @staticmethod
+    def add_input(values, synapse_type, weights):
+        values[synapse_type] += weights
+
+    @staticmethod
+    def shape(values):
+        values[0][:] = 0.0
+        values[1][:] = 0.0
+
+
+class _CurrentInput(object):
+    """ input_type_current.h: no values
+    """
+
+    @staticmethod
+    def to_current(values, exc, inh, v):
+        # pylint: disable=unused-argument
+        return exc, inh
+
+
+class _ConductanceInput(object):
+    """ input_type_conductance.h: e_rev_E, e_rev_I
+    """
+
+    @staticmethod
+    def to_current(values, exc, inh, v):
+        return exc * (values[0] - v), -inh * (values[1] - v)
+
+
+class _DeltaInput(object):
+    """ input_type_delta.h: scale_factor
+    """
+
+    @staticmethod
+    def to_current(values, exc, inh, v):
+        # pylint: disable=unused-argument
+        return exc * values[0], inh * values[0]
+
+
+class _StaticThreshold(object):
+    """ threshold_type_static.h: v_thresh
+    """
+
+    @staticmethod
+    def is_above_threshold(values, v, rng):
+        # pylint: disable=unused-argument
+        return v >= values[0]
+
+
+class _MaassStochasticThreshold(object):
+    """ threshold_type_maass_stochastic.h: du_th_inv, tau_th_inv, v_thresh,\
+        neg_machine_time_step_ms_div_10
+    """
+
+    @staticmethod
+    def is_above_threshold(values, v, rng):
+        du_th_inv, tau_th_inv, v_thresh, neg_ts_div_10 = values
+        exponent = (v - v_thresh) * du_th_inv
+        hazard = numpy.exp(numpy.minimum(exponent, 5.0)) * tau_th_inv
+        result = numpy.where(
+            exponent < 5.0,
+            (1.0 - numpy.exp(hazard * neg_ts_div_10)) * _PROB_SATURATION,
+            _PROB_SATURATION)
+        random_number = rng.randint(0, _RANDOM_RANGE, len(v)) / float(
+            _RANDOM_RANGE)
+        return result >= random_number
+
+
+_NEURON_MODELS = {
+    NeuronModelLeakyIntegrateAndFire: _LIFModel,
+    NeuronModelIzh: _IzhikevichModel}
+
+_SYNAPSE_TYPES = {
+    SynapseTypeExponential: _ExponentialSynapse,
+    SynapseTypeAlpha: _AlphaSynapse,
+    SynapseTypeDelta: _DeltaSynapse}
+
+_INPUT_TYPES = {
+    InputTypeCurrent: _CurrentInput,
+    InputTypeConductance: _ConductanceInput,
+    InputTypeDelta: _DeltaInput}
+
+_THRESHOLD_TYPES = {
+    ThresholdTypeStatic: _StaticThreshold,
+    ThresholdTypeMaassStochastic: _MaassStochasticThreshold}
+
+
+def _find(implementations, component):
+    # Subclasses may change the C code, so only exact types are accepted
+    try:
+        return implementations[type(component)]
+    except KeyError:
+        raise SpynnakerException(
+            "The reference engine does not support {}".format(
+                type(component).__name__))
+
+
+def get_neuron_model(neuron_model):
+    """ Get the host version of a neuron model.
+
+    :param AbstractNeuronModel neuron_model: The model to find
+    :raises SpynnakerException: If the model is not supported
+    """
+    return _find(_NEURON_MODELS, neuron_model)
+
+
+def get_synapse_type(synapse_type):
+    """ Get the host version of a synapse type.
+
+    :param AbstractSynapseType synapse_type: The synapse type to find
+    :raises SpynnakerException: If the synapse type is not supported
+    """
+    return _find(_SYNAPSE_TYPES, synapse_type)
+
+
+def get_input_type(input_type):
+    """ Get the host version of an input type.
+
+    :param AbstractInputType input_type: The input type to find
+    :raises SpynnakerException: If the input type is not supported
+    """
+    return _find(_INPUT_TYPES, input_type)
+
+
+def get_threshold_type(threshold_type):
+    """ Get the host version of a threshold type.
+
+    :param AbstractThresholdType threshold_type: The threshold type to find
+    :raises SpynnakerException: If the threshold type is not supported
+    """
+    return _find(_THRESHOLD_TYPES, threshold_type)
@@ -0,0 +1,426 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import numpy
+from spinn_utilities.log import FormatAdapter
+from pacman.model.graphs.common import Slice
+from spinn_front_end_common.utilities.constants import (
+    MICRO_TO_MILLISECOND_CONVERSION)
+from spynnaker.pyNN.exceptions import SpynnakerException
+from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
+from spynnaker.pyNN.models.neuron.implementations import NeuronImplStandard
+from .neuron_components import (
+    get_input_type, get_neuron_model, get_synapse_type, get_threshold_type)
+from .spike_sources import get_spike_source
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+_RECORDED_VARIABLES = ("v", "gsyn_exc", "gsyn_inh")
+
+
+def _quantise(values, field_types):
+    """ Round struct values to the fixed point representation they have in\
+        the machine.
+    """
+    for value, data_type in zip(values, field_types):
+        scale = float(data_type.scale)
+        numpy.clip(
+            numpy.round(value * scale) / scale, float(data_type.min),
+            float(data_type.max), out=value)
+
+
+class _Recording(object):
+    """ The samples of a variable of the recorded atoms of a vertex.
+    """
+
+    __slots__ = [
+        "ids",
+        "rate",
+        "samples"]
+
+    def __init__(self, ids, sampling_interval, ms_per_step):
+        self.ids = numpy.array(ids, dtype="int64")
+        self.rate = max(1, int(round(sampling_interval / ms_per_step)))
+        self.samples = list()
+
+    def sample(self, step, values):
+        if step % self.rate == 0:
+            self.samples.append(values[self.ids])
+
+    def get_matrix(self):
+        if not self.samples:
+            return numpy.zeros((0, len(self.ids)))
+        return numpy.vstack(self.samples)
+
+
+class _SpikeRecording(object):
+    """ The spikes of the recorded atoms of a vertex.
+    """
+
+    __slots__ = [
+        "recorded",
+        "rate",
+        "ms_per_step",
+        "spike_ids",
+        "spike_times"]
+
+    def __init__(self, ids, n_atoms, sampling_interval, ms_per_step):
+        self.recorded = numpy.zeros(n_atoms, dtype="bool")
+        self.recorded[list(ids)] = True
+        self.rate = max(1, int(round(sampling_interval / ms_per_step)))
+        self.ms_per_step = ms_per_step
+        self.spike_ids = list()
+        self.spike_times = list()
+
+    def record(self, step, spike_counts):
+        ids = numpy.flatnonzero((spike_counts > 0) & self.recorded)
+        if len(ids):
+            # Spikes are recorded at the time of the sample that holds them
+            self.spike_ids.append(ids)
+            self.spike_times.append(numpy.full(
+                len(ids), (step - step % self.rate) * self.ms_per_step))
+
+    def get_spikes(self):
+        if not self.spike_ids:
+            return numpy.zeros((0, 2), dtype="float")
+        ids = numpy.concatenate(self.spike_ids)
+        times = numpy.concatenate(self.spike_times)
+        result = numpy.column_stack((ids, times))
+        return result[numpy.lexsort((times, ids))]
+
+
+class _NeuronPopulation(object):
+    """ The state of a population of standard neurons.
+    """
+
+    __slots__ = [
+        "__n_atoms",
+        "__n_steps",
+        "__ms_per_step",
+        "__model",
+        "__synapse",
+        "__input",
+        "__threshold",
+        "__values",
+        "__field_types",
+        "__ring_buffers",
+        "__rng",
+        "__recordings"]
+
+    def __init__(self, vertex, machine_time_step, rng):
+        impl = vertex.neuron_impl
+        if not isinstance(impl, NeuronImplStandard):
+            raise SpynnakerException(
+                "The reference engine does not support {}".format(
+                    impl.model_name))
+        if impl.additional_input_type is not None:
+            raise SpynnakerException(
+                "The reference engine does not support additional inputs")
+        self.__n_atoms = vertex.n_atoms
+        self.__n_steps = impl.n_steps_per_timestep
+        ts = machine_time_step / float(self.__n_steps)
+        self.__ms_per_step = ts / MICRO_TO_MILLISECOND_CONVERSION
+        self.__model = get_neuron_model(impl.neuron_model)
+        self.__synapse = get_synapse_type(impl.synapse_type)
+        self.__input = get_input_type(impl.input_type)
+        self.__threshold = get_threshold_type(impl.threshold_type)
+
+        # The values of the neuron model, synapse type, input type and
+        # threshold type, in the machine representation
+        components = [
+            impl.neuron_model, impl.synapse_type, impl.input_type,
+            impl.threshold_type]
+        vertex_slice = Slice(0, vertex.n_atoms - 1)
+        self.__values = [
+            vertex.get_component_values(component, vertex_slice, ts)
+            for component in components]
+        self.__field_types = [
+            component.struct.field_types for component in components]
+        self.__ring_buffers = numpy.zeros(
+            (1, impl.get_n_synapse_types(), self.__n_atoms))
+        self.__rng = rng
+
+        ms_per_time_step = machine_time_step / MICRO_TO_MILLISECOND_CONVERSION
+        self.__recordings = {
+            variable: _Recording(
+                vertex.get_recorded_indexes(variable),
+                vertex.get_neuron_sampling_interval(variable),
+                ms_per_time_step)
+            for variable in _RECORDED_VARIABLES
+            if vertex.is_recording(variable)}
+
+    @property
+    def ring_buffers(self):
+        return self.__ring_buffers
+
+    def resize_ring_buffers(self, max_delay_steps):
+        """ Make the ring buffers big enough for the longest delay
+        """
+        size = max_delay_steps + 1
+        if size > len(self.__ring_buffers):
+            self.__ring_buffers = numpy.zeros(
+                (size,) + self.__ring_buffers.shape[1:])
+
+    def get_recording(self, variable):
+        return self.__recordings.get(variable)
+
+    def do_time_step(self, step):
+        """ Update the neurons for a time step, as neuron_impl_standard.h
+
+        :return: The number of spikes of each neuron (0 or 1)
+        :rtype: ~numpy.ndarray
+        """
+        (model_values, synapse_values, input_values,
+         threshold_values) = self.__values
+
+        # Add the input from the ring buffers
+        ring_buffer = self.__ring_buffers[step % len(self.__ring_buffers)]
+        for synapse_type, weights in enumerate(ring_buffer):
+            if numpy.any(weights):
+                self.__synapse.add_input(synapse_values, synapse_type, weights)
+        ring_buffer[:] = 0.0
+
+        spiked = numpy.zeros(self.__n_atoms, dtype="bool")
+        for i in range(self.__n_steps):
+            voltage = self.__model.voltage(model_values)
+            exc, inh = self.__synapse.inputs(synapse_values)
+            if i == 0:
+                for variable, values in zip(
+                        _RECORDED_VARIABLES, (voltage, exc, inh)):
+                    recording = self.__recordings.get(variable)
+                    if recording is not None:
+                        recording.sample(step, values)
+            exc, inh = self.__input.to_current(
+                input_values, exc, inh, voltage)
+            result = self.__model.update(
+                model_values, exc, inh, 0.0, self.__ms_per_step)
+            spike_now = self.__threshold.is_above_threshold(
+                threshold_values, result, self.__rng)
+            self.__model.has_spiked(
+                model_values, spike_now, self.__ms_per_step)
+            spiked |= spike_now
+            self.__synapse.shape(synapse_values)
+            for values, field_types in zip(
+                    self.__values, self.__field_types):
+                _quantise(values, field_types)
+        return spiked.astype("int64")
+
+
+class _Projection(object):
+    """ The connections of a projection, sorted by source.
+    """
+
+    __slots__ = [
+        "__post",
+        "__synapse_type",
+        "__index",
+        "__targets",
+        "__weights",
+        "__delays"]
+
+    def __init__(self, connections, n_pre_atoms, post, synapse_type,
+                 machine_time_step):
+        self.__post = post
+        self.__synapse_type = synapse_type
+        order = numpy.argsort(connections["source"], kind="stable")
+        connections = connections[order]
+        self.__index = numpy.searchsorted(
+            connections["source"], numpy.arange(n_pre_atoms + 1))
+        self.__targets = connections["target"].astype("int64")
+        self.__weights = numpy.abs(connections["weight"])
+        self.__delays = numpy.maximum(1, numpy.rint(
+            connections["delay"] * (
+                MICRO_TO_MILLISECOND_CONVERSION / float(machine_time_step)))
+            ).astype("int64")
+
+    @property
+    def post(self):
+        return self.__post
+
+    @property
+    def max_delay_steps(self):
+        if not len(self.__delays):
+            return 0
+        return int(self.__delays.max())
+
+    def deliver(self, step, spike_counts):
+        """ Add the weights of the connections from the spiking atoms to\
+            the ring buffers of the targets, at the time step they arrive
+        """
+        sources = numpy.flatnonzero(spike_counts)
+        starts = self.__index[sources]
+        lengths = self.__index[sources + 1] - starts
+        total = lengths.sum()
+        if not total:
+            return
+        offsets = numpy.cumsum(lengths) - lengths
+        indices = (
+            numpy.arange(total) - numpy.repeat(offsets, lengths) +
+            numpy.repeat(starts, lengths))
+        weights = self.__weights[indices] * numpy.repeat(
+            spike_counts[sources], lengths)
+        ring_buffers = self.__post.ring_buffers
+        slots = (step + self.__delays[indices]) % len(ring_buffers)
+        numpy.add.at(
+            ring_buffers, (slots, self.__synapse_type,
+                           self.__targets[indices]), weights)
+
+
+class ReferenceEngine(object):
+    """ Simulates a network on the host with numpy, using the same neuron\
+        components and the same connections as would be used on the\
+        machine, so that a run on a virtual board still produces recordings.
+
+    The neuron parameters and state are read from the vertices when the\
+    engine is created, and the state is then kept by the engine until it is\
+    discarded (e.g. on reset).  The state is rounded to the fixed point\
+    representation of the machine after each update.  Synapses are static.
+    """
+
+    __slots__ = [
+        "__machine_time_step",
+        "__ms_per_time_step",
+        "__step",
+        "__neurons",
+        "__sources",
+        "__projections",
+        "__spike_recordings"]
+
+    def __init__(self, populations, projections, machine_time_step,
+                 seed=None):
+        """
+        :param list populations: The PyNN populations to simulate
+        :param list projections: The PyNN projections between them
+        :param int machine_time_step: The time step in microseconds
+        :param seed: The seed of stochastic thresholds, or None for random
+        :type seed: int or None
+        """
+        # pylint: disable=protected-access
+        self.__machine_time_step = machine_time_step
+        self.__ms_per_time_step = (
+            machine_time_step / MICRO_TO_MILLISECOND_CONVERSION)
+        self.__step = 0
+        rng = numpy.random.RandomState(seed)
+
+        self.__neurons = dict()
+        self.__sources = dict()
+        self.__spike_recordings = dict()
+        for population in populations:
+            vertex = population._vertex
+            if isinstance(vertex, AbstractPopulationVertex):
+                self.__neurons[vertex] = _NeuronPopulation(
+                    vertex, machine_time_step, rng)
+            else:
+                source = get_spike_source(vertex, machine_time_step)
+                if source is None:
+                    logger.warning(
+                        "The reference engine cannot simulate {}, so it will"
+                        " not send any spikes", vertex.label)
+                    continue
+                self.__sources[vertex] = source
+            if vertex.is_recording_spikes():
+                self.__spike_recordings[vertex] = _SpikeRecording(
+                    vertex.get_recorded_indexes("spikes")
+                    if vertex in self.__neurons else range(vertex.n_atoms),
+                    vertex.n_atoms, vertex.get_spikes_sampling_interval(),
+                    self.__ms_per_time_step)
+
+        self.__projections = list()
+        for projection in projections:
+            edge = projection._projection_edge
+            post = self.__neurons.get(edge.post_vertex)
+            if post is None or (
+                    edge.pre_vertex not in self.__neurons and
+                    edge.pre_vertex not in self.__sources):
+                continue
+            info = projection._synapse_information
+            self.__projections.append((edge.pre_vertex, _Projection(
+                self.__get_connections(projection, edge, info),
+                edge.pre_vertex.n_atoms, post, info.synapse_type,
+                machine_time_step)))
+        for _, projection in self.__projections:
+            projection.post.resize_ring_buffers(projection.max_delay_steps)
+
+    @staticmethod
+    def __get_connections(projection, edge, synapse_info):
+        # pylint: disable=protected-access
+        connections = projection._virtual_connection_list
+        if connections:
+            return numpy.concatenate(connections)
+
+        # Connections generated on the machine have to be generated here
+        pre_slice = Slice(0, edge.pre_vertex.n_atoms - 1)
+        post_slice = Slice(0, edge.post_vertex.n_atoms - 1)
+        return synapse_info.connector.create_synaptic_block(
+            [pre_slice], 0, [post_slice], 0, pre_slice, post_slice,
+            synapse_info.synapse_type, synapse_info)
+
+    @property
+    def n_time_steps(self):
+        """ The number of time steps simulated so far
+
+        :rtype: int
+        """
+        return self.__step
+
+    def run(self, n_machine_time_steps):
+        """ Simulate until the given total number of time steps
+
+        :param int n_machine_time_steps: The time step to run until
+        """
+        while self.__step < n_machine_time_steps:
+            step = self.__step
+            spikes = dict()
+            for vertex, source in self.__sources.items():
+                spikes[vertex] = source.get_spike_counts(step)
+            for vertex, neurons in self.__neurons.items():
+                spikes[vertex] = neurons.do_time_step(step)
+            for pre_vertex, projection in self.__projections:
+                projection.deliver(step, spikes[pre_vertex])
+            for vertex, recording in self.__spike_recordings.items():
+                recording.record(step, spikes[vertex])
+            self.__step += 1
+
+    def get_matrix_data(self, vertex, variable):
+        """ Get the recorded samples of a variable of a vertex, in the form\
+            returned by\
+            :py:meth:`~spynnaker.pyNN.models.common.NeuronRecorder.get_matrix_data`
+
+        :param AbstractPopulationVertex vertex: The vertex to get the data of
+        :param str variable: The variable to get
+        :return: data, indexes, sampling_interval
+        :rtype: tuple(~numpy.ndarray, list(int), float)
+        """
+        neurons = self.__neurons.get(vertex)
+        recording = None if neurons is None else neurons.get_recording(
+            variable)
+        sampling_interval = vertex.get_neuron_sampling_interval(variable)
+        if recording is None:
+            return numpy.zeros((0, 0)), [], sampling_interval
+        return (recording.get_matrix(), list(recording.ids),
+                sampling_interval)
+
+    def get_spikes(self, vertex):
+        """ Get the recorded spikes of a vertex, as an array of\
+            (neuron ID, time in ms)
+
+        :param vertex: The vertex to get the spikes of
+        :rtype: ~numpy.ndarray
+        """
+        recording = self.__spike_recordings.get(vertex)
+        if recording is None:
+            return numpy.zeros((0, 2), dtype="float")
+        return recording.get_spikes()
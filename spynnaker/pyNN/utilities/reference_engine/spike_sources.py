@@ -0,0 +1,129 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_front_end_common.utilities.constants import (
+    MICRO_TO_SECOND_CONVERSION)
+from spynnaker.pyNN.models.spike_source.spike_source_array_vertex import (
+    SpikeSourceArrayVertex)
+from spynnaker.pyNN.models.spike_source.spike_source_poisson_vertex import (
+    SpikeSourcePoissonVertex)
+
+
+class ArraySpikeSource(object):
+    """ Plays back the spikes of a spike source array, at the time steps at\
+        which the machine would send them.
+    """
+
+    __slots__ = [
+        "__n_atoms",
+        "__ids",
+        "__ticks"]
+
+    def __init__(self, vertex):
+        """
+        :param SpikeSourceArrayVertex vertex: The vertex to play back
+        """
+        self.__n_atoms = vertex.n_atoms
+        times = vertex.send_buffer_times
+        if len(times) and hasattr(times[0], "__len__"):
+            ids = numpy.repeat(
+                numpy.arange(len(times)), [len(t) for t in times])
+            ticks = numpy.concatenate(
+                [numpy.asarray(t, dtype="int64") for t in times])
+        else:
+            ticks = numpy.tile(
+                numpy.asarray(times, dtype="int64"), self.__n_atoms)
+            ids = numpy.repeat(numpy.arange(self.__n_atoms), len(times))
+        order = numpy.argsort(ticks, kind="stable")
+        self.__ids = ids[order]
+        self.__ticks = ticks[order]
+
+    def get_spike_counts(self, step):
+        """ Get the number of spikes sent by each atom at a time step
+
+        :param int step: The time step
+        :rtype: ~numpy.ndarray
+        """
+        start, end = numpy.searchsorted(self.__ticks, [step, step + 1])
+        return numpy.bincount(
+            self.__ids[start:end], minlength=self.__n_atoms)
+
+
+class PoissonSpikeSource(object):
+    """ Generates the spikes of a Poisson spike source, using the rate\
+        active at each time step.
+    """
+
+    __slots__ = [
+        "__n_atoms",
+        "__ids",
+        "__probabilities",
+        "__starts",
+        "__ends",
+        "__rng"]
+
+    def __init__(self, vertex, machine_time_step):
+        """
+        :param SpikeSourcePoissonVertex vertex: The vertex to generate for
+        :param int machine_time_step: The time step in microseconds
+        """
+        self.__n_atoms = vertex.n_atoms
+        rates = [numpy.atleast_1d(r) for r in vertex.rates]
+        starts = [numpy.atleast_1d(s) for s in vertex.starts]
+        durations = [
+            numpy.atleast_1d(numpy.array(d, dtype="float"))
+            for d in vertex.durations]
+        steps_per_ms = 1000.0 / machine_time_step
+
+        # One entry for each rate of each atom; later rates win on overlap
+        self.__ids = numpy.repeat(
+            numpy.arange(self.__n_atoms), [len(r) for r in rates])
+        self.__probabilities = numpy.concatenate(rates) * (
+            float(machine_time_step) / MICRO_TO_SECOND_CONVERSION)
+        start_ms = numpy.concatenate(starts).astype("float")
+        duration_ms = numpy.concatenate(durations)
+        self.__starts = numpy.round(start_ms * steps_per_ms)
+        self.__ends = numpy.where(
+            numpy.isnan(duration_ms), numpy.inf,
+            self.__starts + numpy.round(
+                numpy.nan_to_num(duration_ms) * steps_per_ms))
+        self.__rng = numpy.random.RandomState(vertex.seed)
+
+    def get_spike_counts(self, step):
+        """ Get the number of spikes sent by each atom at a time step
+
+        :param int step: The time step
+        :rtype: ~numpy.ndarray
+        """
+        active = (self.__starts <= step) & (step < self.__ends)
+        probabilities = numpy.zeros(self.__n_atoms)
+        probabilities[self.__ids[active]] = self.__probabilities[active]
+        return self.__rng.poisson(probabilities)
+
+
+def get_spike_source(vertex, machine_time_step):
+    """ Get a host source of spikes for a vertex, or None if the vertex does\
+        not send spikes that can be simulated on the host
+
+    :param ~pacman.model.graphs.application.ApplicationVertex vertex:
+    :param int machine_time_step: The time step in microseconds
+    :rtype: ArraySpikeSource or PoissonSpikeSource or None
+    """
+    if isinstance(vertex, SpikeSourceArrayVertex):
+        return ArraySpikeSource(vertex)
+    if isinstance(vertex, SpikeSourcePoissonVertex):
+        return PoissonSpikeSource(vertex, machine_time_step)
+    return None
@@ -0,0 +1,151 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import logging
+import os
+import numpy
+from spinn_utilities.progress_bar import ProgressBar
+from spynnaker.pyNN.exceptions import SynapticConfigurationException
+from spynnaker.pyNN.models.neural_projections import ProjectionApplicationEdge
+
+logger = logging.getLogger(__name__)
+_DIRNAME = "synaptic_matrix_reports"
+_TMPL_FILENAME = "synaptic_matrix_for_application_edge_{}.npz"
+_INDEX_FILENAME = "synaptic_matrix_index.json"
+
+#: The columns written for each connection
+COLUMNS = ("source", "target", "weight", "delay")
+
+
+class SpYNNakerSynapticMatrixBinaryReport(object):
+    """ Generate the synaptic matrices for reporting purposes, as compressed\
+        numpy files (one per application edge) and an index file listing\
+        the edges written.
+
+    :param str report_folder: where to write the report
+    :param connection_holder: where the synaptic matrices are stored \
+        (possibly after retrieval from the machine)
+    :type connection_holder:
+        dict(tuple(ProjectionApplicationEdge, SynapseInformation), \
+        ConnectionHolder)
+    :param dsg_targets: used to check if connection holders are populated
+    """
+
+    def __call__(self, report_folder, connection_holder, dsg_targets):
+        """ Convert synaptic matrix for every application edge.
+        """
+        if dsg_targets is None:
+            raise SynapticConfigurationException(
+                "dsg_targets should not be none, used as a check for "
+                "connection holder data to be generated")
+
+        # generate folder for synaptic reports
+        top_level_folder = os.path.join(report_folder, _DIRNAME)
+        if not os.path.exists(top_level_folder):
+            os.mkdir(top_level_folder)
+
+        # Group the connection holders by edge; the same holder may be used
+        # for several synapse information objects of an edge
+        holders_by_edge = dict()
+        for (edge, _), holder in connection_holder.items():
+            if isinstance(edge, ProjectionApplicationEdge):
+                holders = holders_by_edge.setdefault(edge, list())
+                if not any(h is holder for h in holders):
+                    holders.append(holder)
+
+        # create progress bar
+        progress = ProgressBar(
+            holders_by_edge.keys(), "Generating synaptic matrix reports")
+
+        # for each application edge, write matrix in new file, keeping only
+        # the summary of each one
+        index = list()
+        for edge in progress.over(holders_by_edge.keys()):
+            file_name = _TMPL_FILENAME.format(edge.label)
+            index.append(self._write_file(
+                top_level_folder, file_name, holders_by_edge[edge], edge))
+
+        index_file = os.path.join(top_level_folder, _INDEX_FILENAME)
+        try:
+            with open(index_file, "w") as f:
+                json.dump(index, f, indent=4)
+        except IOError:
+            logger.exception("Can't open file %s for writing.", index_file)
+
+    @staticmethod
+    def _write_file(folder, file_name, holders, edge):
+        connections = [
+            conns for holder in holders if holder.connections
+            for conns in holder.connections]
+        if connections:
+            connections = numpy.concatenate(connections)
+            columns = {
+                column: connections[column] for column in COLUMNS}
+        else:
+            columns = {
+                column: numpy.zeros(0) for column in COLUMNS}
+
+        try:
+            numpy.savez_compressed(os.path.join(folder, file_name), **columns)
+        except IOError:
+            logger.exception("Can't open file %s for writing.", file_name)
+
+        summary = {
+            "edge": edge.label,
+            "pre_vertex": edge.pre_vertex.label,
+            "post_vertex": edge.post_vertex.label,
+            "file": file_name,
+            "n_connections": len(columns["source"])}
+        for column in ("weight", "delay"):
+            values = columns[column]
+            summary[column + "_min"] = (
+                float(numpy.min(values)) if len(values) else None)
+            summary[column + "_max"] = (
+                float(numpy.max(values)) if len(values) else None)
+        return summary
+
+
+def read_synaptic_matrix_index(report_folder):
+    """ Read the index of a binary synaptic matrix report.
+
+    :param str report_folder: the folder the report was written to
+    :return: a summary of each edge in the report, as a dictionary with\
+        keys "edge", "pre_vertex", "post_vertex", "file", "n_connections",\
+        "weight_min", "weight_max", "delay_min" and "delay_max"
+    :rtype: list(dict)
+    """
+    with open(os.path.join(report_folder, _DIRNAME, _INDEX_FILENAME)) as f:
+        return json.load(f)
+
+
+def read_synaptic_matrix(report_folder, edge_label):
+    """ Read the connections of an edge from a binary synaptic matrix report.
+
+    :param str report_folder: the folder the report was written to
+    :param str edge_label: the label of the application edge to read
+    :return: the connections, as a numpy structured array of source,\
+        target, weight and delay
+    :rtype: ~numpy.ndarray
+    """
+    file_name = os.path.join(
+        report_folder, _DIRNAME, _TMPL_FILENAME.format(edge_label))
+    with numpy.load(file_name) as data:
+        connections = numpy.zeros(
+            len(data["source"]),
+            dtype=[(column, data[column].dtype) for column in COLUMNS])
+        for column in COLUMNS:
+            connections[column] = data[column]
+    return connections
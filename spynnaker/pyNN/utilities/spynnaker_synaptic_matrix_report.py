@@ -15,6 +15,7 @@
 
 import logging
 import os
+import sys
 import numpy
 from spinn_utilities.progress_bar import ProgressBar
 from spynnaker.pyNN.exceptions import SynapticConfigurationException
@@ -43,7 +44,7 @@ class SpYNNakerSynapticMatrixReport(object):
 
         # Update the print options to display everything
         print_opts = numpy.get_printoptions()
-        numpy.set_printoptions(threshold=numpy.nan)
+        numpy.set_printoptions(threshold=sys.maxsize)
 
         if dsg_targets is None:
             raise SynapticConfigurationException(
@@ -45,6 +45,9 @@ STATS_BY_NAME = {
     'randint': RandomStatsRandIntImpl(),
     'vonmises': RandomStatsVonmisesImpl()}
 
+#: The most rows of PyNN 0.7 format data in each chunk made at a time
+PYNN7_CHUNK_ROWS = 1 << 18
+
 logger = logging.getLogger(__name__)
 
 
@@ -286,6 +289,49 @@ def validate_mars_kiss_64_seed(seed):
     return seed
 
 
+def _split_mix_64(values):
+    """ The SplitMix64 mixing function, applied to an array of uint64
+    """
+    z = values + numpy.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> numpy.uint64(30))) * numpy.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> numpy.uint64(27))) * numpy.uint64(0x94D049BB133111EB)
+    return z ^ (z >> numpy.uint64(31))
+
+
+def get_slice_pair_seeds(
+        base_seed, stream, pre_lo_atoms, pre_hi_atoms, post_lo_atoms,
+        post_hi_atoms):
+    """ Derive Mars KISS 64 seeds for pairs of slices from a single seed.\
+        The seeds depend only on the arguments, so the same pair of slices\
+        always gets the same seed, however the slices were made.
+
+    :param int base_seed: the seed from which all the seeds are derived
+    :param int stream: \
+        a number to tell apart the different uses of the same base seed
+    :param pre_lo_atoms: the low atoms of the pre-slices
+    :param pre_hi_atoms: the high atoms of the pre-slices
+    :param post_lo_atoms: the low atoms of the post-slices
+    :param post_hi_atoms: the high atoms of the post-slices
+    :return: a seed of four words for each pair, after broadcasting the atoms
+    :rtype: ~numpy.ndarray(~numpy.uint32)
+    """
+    parts = numpy.broadcast_arrays(
+        *(numpy.atleast_1d(numpy.asarray(part, dtype="int64"))
+          for part in (stream, pre_lo_atoms, pre_hi_atoms, post_lo_atoms,
+                       post_hi_atoms)))
+    state = numpy.full(
+        parts[0].shape, base_seed & 0xFFFFFFFFFFFFFFFF, dtype="uint64")
+    for part in parts:
+        state = _split_mix_64(state ^ part.astype("uint64"))
+    seeds = numpy.stack([
+        (_split_mix_64(state + numpy.uint64(i)) >> numpy.uint64(32)).astype(
+            "uint32")
+        for i in range(4)], axis=-1)
+    seeds[..., 1][seeds[..., 1] == 0] = 13031301
+    seeds[..., 3] = seeds[..., 3] % 698769068 + 1
+    return seeds
+
+
 def get_n_bits(n_values):
     """ Determine how many bits are required for the given number of values
 
@@ -298,3 +344,94 @@ def get_n_bits(n_values):
     if n_values == 1:
         return 1
     return int(math.ceil(math.log(n_values, 2)))
+
+
+def get_slice_limits(slices):
+    """ Get the low and high atoms of a list of slices as arrays
+
+    :param list(~pacman.model.graphs.common.Slice) slices: the slices
+    :return: the low atoms and the high atoms of the slices, in order
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+    """
+    lo_atoms = numpy.fromiter(
+        (s.lo_atom for s in slices), dtype="int64", count=len(slices))
+    hi_atoms = numpy.fromiter(
+        (s.hi_atom for s in slices), dtype="int64", count=len(slices))
+    return lo_atoms, hi_atoms
+
+
+def _fill_pynn7(block, data, ids, times):
+    """ Fill rows of PyNN 0.7 format data, neuron by neuron
+
+    :param ~numpy.ndarray block:
+        The rows to fill, as many as there are times for each of the ids
+    :param ~numpy.ndarray data: The matrix of the neurons, times by neurons
+    :param ~numpy.ndarray ids: The ids of the neurons
+    :param ~numpy.ndarray times: The time of each row of the matrix
+    """
+    by_neuron = block.reshape((len(ids), len(times), 3))
+    by_neuron[:, :, 0] = ids[:, numpy.newaxis]
+    by_neuron[:, :, 1] = times
+    # The transpose is a view, so the matrix is only copied into the rows
+    by_neuron[:, :, 2] = data.T
+
+
+def _pynn7_inputs(data, ids, sampling_interval):
+    data = numpy.asarray(data)
+    ids = numpy.asarray(ids)
+    if not len(ids):
+        data = data[:, :0]
+    times = numpy.arange(len(data)) * sampling_interval
+    return data, ids, times
+
+
+def matrix_to_pynn7(data, ids, sampling_interval, dtype=numpy.float64):
+    """ Convert recorded data from matrix format to PyNN 0.7 format, that\
+        is rows of neuron id, time and value, ordered by neuron and then\
+        time.  Only the rows are allocated; the matrix is copied straight\
+        into them.
+
+    :param ~numpy.ndarray data:
+        The recorded data, with a row for each time and a column for each\
+        neuron
+    :param list(int) ids: The id of the neuron of each column
+    :param float sampling_interval: The time between rows of the data
+    :param dtype: The type of the rows; float32 halves their size
+    :return: The rows of neuron id, time and value
+    :rtype: ~numpy.ndarray
+    """
+    data, ids, times = _pynn7_inputs(data, ids, sampling_interval)
+    rows = numpy.empty((len(ids) * len(times), 3), dtype=dtype)
+    if len(rows):
+        _fill_pynn7(rows, data, ids, times)
+    return rows
+
+
+def iter_matrix_to_pynn7(
+        data, ids, sampling_interval, dtype=numpy.float64,
+        max_rows=PYNN7_CHUNK_ROWS):
+    """ Convert recorded data from matrix format to PyNN 0.7 format in\
+        chunks, so that only one chunk of rows exists at a time if each is\
+        dealt with before asking for the next.  Each chunk holds all the\
+        rows of some of the neurons.
+
+    :param ~numpy.ndarray data:
+        The recorded data, with a row for each time and a column for each\
+        neuron
+    :param list(int) ids: The id of the neuron of each column
+    :param float sampling_interval: The time between rows of the data
+    :param dtype: The type of the rows; float32 halves their size
+    :param int max_rows:
+        The most rows in a chunk, unless a single neuron has more than this
+    :return: The chunks of rows of neuron id, time and value, in order
+    :rtype: iterable(~numpy.ndarray)
+    """
+    data, ids, times = _pynn7_inputs(data, ids, sampling_interval)
+    if not len(times):
+        return
+    n_per_chunk = max(1, max_rows // len(times))
+    for start in range(0, len(ids), n_per_chunk):
+        end = min(start + n_per_chunk, len(ids))
+        rows = numpy.empty(((end - start) * len(times), 3), dtype=dtype)
+        _fill_pynn7(rows, data[:, start:end], ids[start:end], times)
+        yield rows
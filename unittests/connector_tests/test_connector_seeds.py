@@ -0,0 +1,118 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from pyNN.random import NumpyRNG, RandomDistribution
+from pacman.model.graphs.common.slice import Slice
+from spynnaker.pyNN.models.neural_projections import SynapseInformation
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    FixedProbabilityConnector)
+from spynnaker.pyNN.utilities.utility_calls import get_slice_pair_seeds
+from unittests.mocks import MockSimulator
+
+
+def test_seeds_stable_across_slices():
+    MockSimulator.setup()
+    connector = FixedProbabilityConnector(0.5, rng=NumpyRNG(seed=1))
+    rng = NumpyRNG(seed=2)
+    seed = connector._get_connector_seed(Slice(0, 99), Slice(0, 49), rng)
+
+    # Recreated slices must get the same seed, without using the RNG again
+    assert connector._get_connector_seed(
+        Slice(0, 99), Slice(0, 49), None) == seed
+    assert connector._get_connector_seed(
+        Slice(100, 199), Slice(0, 49), None) != seed
+
+
+def test_slice_pair_params_match_single_params():
+    MockSimulator.setup()
+    connector = FixedProbabilityConnector(0.5)
+    weights = RandomDistribution(
+        "uniform", low=0.0, high=2.0, rng=NumpyRNG(seed=3))
+    pre_slices = [Slice(0, 99), Slice(100, 199), Slice(0, 99)]
+    post_slices = [Slice(0, 49), Slice(0, 49), Slice(50, 99)]
+    params = connector.gen_weights_params_for_slice_pairs(
+        weights, pre_slices, post_slices)
+    assert params.shape == (3, 6)
+    for row, pre_slice, post_slice in zip(params, pre_slices, post_slices):
+        assert numpy.array_equal(row, connector.gen_weights_params(
+            weights, pre_slice, post_slice))
+
+    # Delays from the same distribution use a different stream of seeds
+    delays = connector.gen_delay_params_for_slice_pairs(
+        weights, pre_slices, post_slices)
+    assert not numpy.array_equal(params[:, 2:], delays[:, 2:])
+
+
+def _synapse_info(connector, weights, delays):
+    return SynapseInformation(
+        connector, None, None, False, False, None, None, 0, weights, delays)
+
+
+def test_seeds_differ_between_projections():
+    MockSimulator.setup()
+    connector = FixedProbabilityConnector(0.5)
+    rng = NumpyRNG(seed=2)
+    values = RandomDistribution(
+        "uniform", low=1.0, high=2.0, rng=NumpyRNG(seed=3))
+    first = _synapse_info(connector, values, 1.0)
+    second = _synapse_info(connector, values, 1.0)
+    pre_slice = Slice(0, 99)
+    post_slice = Slice(0, 49)
+
+    # A connector reused by another projection must connect it differently
+    seed = connector._get_connector_seed(pre_slice, post_slice, rng, first)
+    assert connector._get_connector_seed(
+        pre_slice, post_slice, rng, second) != seed
+    assert connector._get_connector_seed(
+        pre_slice, post_slice, None, first) == seed
+
+    # ... and a shared distribution must give it different weights
+    assert not numpy.array_equal(
+        connector.gen_weights_params(values, pre_slice, post_slice, first),
+        connector.gen_weights_params(values, pre_slice, post_slice, second))
+    assert numpy.array_equal(
+        connector.gen_weights_params(values, pre_slice, post_slice, first),
+        connector.gen_weights_params(values, pre_slice, post_slice, first))
+
+
+def test_host_weights_and_delays_differ():
+    MockSimulator.setup()
+    connector = FixedProbabilityConnector(0.5)
+    values = RandomDistribution(
+        "uniform", low=1.0, high=10.0, rng=NumpyRNG(seed=3))
+    synapse_info = _synapse_info(connector, values, values)
+    pre_slice = Slice(0, 99)
+    post_slice = Slice(0, 49)
+    weights = connector._generate_weights(
+        100, [slice(0, 100)], pre_slice, post_slice, synapse_info)
+    delays = connector._generate_delays(
+        100, [slice(0, 100)], pre_slice, post_slice, synapse_info)
+    assert len(weights) == len(delays) == 100
+    assert not numpy.array_equal(weights, delays)
+
+    # Regenerating the same slices gives the same values
+    assert numpy.array_equal(weights, connector._generate_weights(
+        100, [slice(0, 100)], pre_slice, post_slice, synapse_info))
+
+
+def test_slice_pair_seeds_are_valid():
+    seeds = get_slice_pair_seeds(
+        12345, 1, numpy.arange(100), numpy.arange(100) + 10, 0, 9)
+    assert seeds.shape == (100, 4)
+    assert numpy.all(seeds[:, 1] != 0)
+    assert numpy.all(seeds[:, 3] < 698769069)
+    assert numpy.all(seeds[:, 3] != 0)
+    assert len(set(map(tuple, seeds.tolist()))) == 100
@@ -145,3 +145,32 @@ def test_connector_split():
     except AssertionError:
         print(connection_list)
         reraise(*sys.exc_info())
+
+
+def test_connector_slice_pair_counts():
+    MockSimulator.setup()
+    n_sources = 1000
+    n_targets = 1000
+    n_connections = 10000
+    sources = numpy.random.randint(0, n_sources, n_connections)
+    targets = numpy.random.randint(0, n_targets, n_connections)
+    pre_slices = [Slice(i, min(i + 56, n_sources - 1))
+                  for i in range(0, n_sources, 57)]
+    post_slices = [Slice(i, min(i + 58, n_targets - 1))
+                   for i in range(0, n_targets, 59)]
+    connector = FromListConnector(numpy.dstack((sources, targets))[0])
+
+    counts = connector.get_n_connections_per_slice_pair(
+        pre_slices, post_slices)
+    assert counts.shape == (len(pre_slices), len(post_slices))
+    assert numpy.sum(counts) == n_connections
+    for i, pre_slice in enumerate(pre_slices):
+        for j, post_slice in enumerate(post_slices):
+            assert counts[i, j] == connector.get_n_connections(
+                pre_slices, post_slices, pre_slice.hi_atom,
+                post_slice.hi_atom)
+
+    # The slices don't have to be in order
+    connected = connector.get_connected_slice_pairs(
+        pre_slices[::-1], post_slices, None)
+    assert numpy.array_equal(connected, counts[::-1] > 0)
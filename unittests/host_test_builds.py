@@ -0,0 +1,68 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Building and loading the host tests of the C code in\
+    neural_modelling/host_tests
+"""
+
+import os
+import subprocess
+import pytest
+try:
+    from shutil import which
+except ImportError:
+    # Python 2
+    from distutils.spawn import find_executable as which
+
+HOST_TESTS_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "neural_modelling", "host_tests")
+
+
+def build_host_test(tmpdir_factory, host_test):
+    """ Build a host test in a temporary directory, skipping the test if it\
+        can't be built here
+
+    :param tmpdir_factory: The pytest factory of temporary directories
+    :param str host_test: The directory of the host test in host_tests
+    :return: The directory the host test was built in
+    :rtype: str
+    """
+    if not which("gcc") or not which("make"):
+        pytest.skip("gcc and make are needed to build the host test")
+    build_dir = str(tmpdir_factory.mktemp("build"))
+    subprocess.check_call([
+        "make", "-s", "-C", os.path.join(HOST_TESTS_DIR, host_test),
+        "BUILD_DIR=" + build_dir])
+    return build_dir
+
+
+def load_host_test_module(host_test, module_name):
+    """ Load a Python module that comes with a host test
+
+    :param str host_test: The directory of the host test in host_tests
+    :param str module_name: The name of the module in that directory
+    :return: The module
+    """
+    path = os.path.join(HOST_TESTS_DIR, host_test, module_name + ".py")
+    try:
+        from importlib.util import module_from_spec, spec_from_file_location
+    except ImportError:
+        # Python 2
+        from imp import load_source
+        return load_source(module_name, path)
+    spec = spec_from_file_location(module_name, path)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
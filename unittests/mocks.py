@@ -16,6 +16,8 @@
 import configparser
 import numpy
 from spinn_front_end_common.utilities import globals_variables
+from spynnaker.pyNN.models.neuron.synaptic_block_cache import (
+    SynapticBlockCache)
 from spynnaker.pyNN.utilities.spynnaker_failed_state import (
     SpynnakerFailedState)
 from builtins import property
@@ -92,7 +94,9 @@ class MockSimulator(object):
             {"spikes_per_second": "30",
              "incoming_spike_buffer_size": "256",
              "ring_buffer_sigma": "5",
-             "one_to_one_connection_dtcm_max_bytes": "0"}
+             "one_to_one_connection_dtcm_max_bytes": "0",
+             "expand_synapses_on_host": "False",
+             "synaptic_block_cache_bytes": "16777216"}
         self.config["Buffers"] = {"time_between_requests": "10",
                                   "minimum_buffer_sdram": "10",
                                   "use_auto_pause_and_resume": "True",
@@ -101,6 +105,8 @@ class MockSimulator(object):
                                   "enable_buffered_recording": "False"}
         self.config["MasterPopTable"] = {"generator": "BinarySearch"}
         self.config["Reports"] = {"n_profile_samples": 0}
+        self.__synaptic_block_cache = SynapticBlockCache(self.config.getint(
+            "Simulation", "synaptic_block_cache_bytes"))
 
     def add_population(self, pop):
         pass
@@ -139,3 +145,11 @@ class MockSimulator(object):
     @property
     def use_virtual_board(self):
         return True
+
+    @property
+    def reference_engine(self):
+        return None
+
+    @property
+    def synaptic_block_cache(self):
+        return self.__synaptic_block_cache
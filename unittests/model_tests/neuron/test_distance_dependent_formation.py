@@ -0,0 +1,68 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from spynnaker.pyNN.models.neuron.structural_plasticity.synaptogenesis.\
+    formation import DistanceDependentFormation
+
+
+def _reference_probabilities(formation, grid, probability, sigma):
+    """ The probability LUT found from the distance between each pair of\
+        neurons in turn
+    """
+    grid = numpy.asarray(grid)
+    distances = numpy.ones(grid ** 2) * numpy.nan
+    for row in range(distances.shape[0]):
+        for column in range(distances.shape[1]):
+            if grid[0] > 1:
+                pre = (row // grid[0], row % grid[1])
+                post = (column // grid[0], column % grid[1])
+            else:
+                pre = (0, row % grid[1])
+                post = (0, column % grid[1])
+            distances[row, column] = formation.distance(
+                pre, post, metric='euclidian')
+    squared_distances = numpy.arange(numpy.max(distances ** 2) + 1)
+    probabilities = (probability * numpy.exp(
+        -squared_distances / (2 * sigma ** 2)) * ((2 ** 16) - 1)).astype(
+            "uint16")
+    probabilities = probabilities[probabilities > 0]
+    if probabilities.size % 2 != 0:
+        probabilities = numpy.concatenate(
+            (probabilities, numpy.zeros(1, dtype="uint16")))
+    return probabilities
+
+
+@pytest.mark.parametrize("grid", [
+    [16, 16], [7, 7], [1, 10], [3, 5], [5, 3], [8, 4], [1, 1]])
+@pytest.mark.parametrize("probability,sigma", [(0.16, 2.5), (1.0, 1.0)])
+def test_probabilities_match_pairwise(grid, probability, sigma):
+    formation = DistanceDependentFormation(
+        grid, probability, sigma, probability, sigma)
+    assert numpy.array_equal(
+        formation.generate_distance_probability_array(probability, sigma),
+        _reference_probabilities(formation, grid, probability, sigma))
+
+
+def test_probabilities_shared():
+    first = DistanceDependentFormation([12, 12], 0.2, 2.0, 0.3, 1.5)
+    second = DistanceDependentFormation(
+        numpy.array([12, 12]), 0.2, 2.0, 0.5, 1.5)
+    shared = first.generate_distance_probability_array(0.2, 2.0)
+    assert second.generate_distance_probability_array(0.2, 2.0) is shared
+    assert not shared.flags.writeable
+    assert first.generate_distance_probability_array(0.3, 1.5) is not \
+        second.generate_distance_probability_array(0.5, 1.5)
@@ -0,0 +1,100 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from spynnaker.pyNN.exceptions import SpynnakerException
+from spynnaker.pyNN.models.neuron.host_synapse_expander import (
+    MarsKiss64, expand_synapses)
+
+_ONE = 1 << 15
+_NO_MATRIX = 0xFFFFFFFF
+_SEED = [1234, 5678, 9012, 3456]
+
+
+def _kiss(seed, n):
+    x, y, z, c = seed
+    values = list()
+    for _ in range(n):
+        x = (314527869 * x + 1234567) % (1 << 32)
+        y ^= (y << 5) % (1 << 32)
+        y ^= y >> 7
+        y ^= (y << 22) % (1 << 32)
+        t = 4294584393 * z + c
+        c = t >> 32
+        z = t % (1 << 32)
+        values.append((x + y + z) % (1 << 32))
+    return values
+
+
+def _region(connector_id, connector_params, weight_params, delay_params,
+            n_pre=4, n_post=3, delayed_offset=_NO_MATRIX, max_stage=1,
+            max_row_n_words=10):
+    header = [
+        0, delayed_offset, max_row_n_words, 10, max_row_n_words, 10, 0,
+        n_pre, max_stage, _ONE, 0, 0, connector_id, weight_params[0],
+        delay_params[0]]
+    return numpy.array(
+        [1, 0, n_post, 2, 1, 8, 2 * _ONE, _ONE] + header +
+        connector_params + weight_params[1:] + delay_params[1:],
+        dtype="uint32")
+
+
+def test_rng():
+    rng = MarsKiss64(_SEED)
+    values = list(rng.next_n(5)) + [rng.next()]
+    assert values == _kiss(_SEED, 6)
+
+
+def test_all_to_all_uniform():
+    # uniform weights from 0 to 1, constant delay of 2 steps
+    data = _region(
+        1, [0, 3, 0, 2, 0], [1, 0, _ONE] + _SEED, [0, 2 * _ONE])
+    [(connections, exact)] = expand_synapses(data)
+    assert exact
+
+    # Self connections are left out
+    pairs = [(s, t) for s in range(4) for t in range(3) if s != t]
+    assert list(zip(connections["source"], connections["target"])) == pairs
+    assert numpy.all(connections["delay"] == 2.0)
+
+    # The weights use the same random numbers as the machine
+    raw = [(u * _ONE) >> 32 for u in _kiss(_SEED, len(pairs))]
+    expected = [((w * 2 * _ONE) >> 15) >> 15 for w in raw]
+    assert list(connections["weight"]) == [w / 2.0 for w in expected]
+
+
+def test_one_to_one_delay_stages():
+    # Delays beyond the first stage go to the delayed matrix
+    data = _region(
+        0, [0, 3, 0, 2], [0, _ONE], [0, 20 * _ONE], delayed_offset=100,
+        max_stage=2)
+    [(connections, _)] = expand_synapses(data, weight_scales=[1.0, 1.0])
+    assert list(connections["source"]) == [0, 1, 2]
+    assert list(connections["target"]) == [0, 1, 2]
+    assert numpy.all(connections["weight"] == 2.0)
+    assert numpy.all(connections["delay"] == 20.0)
+
+    # Without a delayed matrix, the delayed synapses cannot be written
+    data = _region(0, [0, 3, 0, 2], [0, _ONE], [0, 20 * _ONE], max_stage=2)
+    with pytest.raises(SpynnakerException):
+        expand_synapses(data)
+
+
+def test_full_rows_are_truncated():
+    data = _region(
+        1, [0, 3, 0, 2, 1], [0, _ONE], [0, _ONE], max_row_n_words=2)
+    [(connections, _)] = expand_synapses(data)
+    assert list(connections["target"]) == [0, 1] * 4
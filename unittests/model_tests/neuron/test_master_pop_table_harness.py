@@ -0,0 +1,159 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import subprocess
+import numpy
+import pytest
+from pacman.model.routing_info import BaseKeyAndMask
+from spynnaker.pyNN.models.neuron.master_pop_table import (
+    MasterPopTableAsBinarySearch)
+from unittests.host_test_builds import build_host_test
+
+
+@pytest.fixture(scope="module")
+def harness(tmpdir_factory):
+    build_dir = build_host_test(tmpdir_factory, "master_pop_table")
+    return os.path.join(build_dir, "master_pop_table_harness")
+
+
+def _run(harness, tmpdir, table_data, keys, n_repeats=1,
+         bit_field_data=None):
+    table_file = str(tmpdir.join("table.bin"))
+    keys_file = str(tmpdir.join("keys.bin"))
+    table_data.tofile(table_file)
+    numpy.array(keys, dtype="<u4").tofile(keys_file)
+    args = [harness, table_file, keys_file, str(n_repeats)]
+    if bit_field_data is not None:
+        args.append(str(tmpdir.join("bit_fields.bin")))
+        bit_field_data.tofile(args[-1])
+    output = subprocess.check_output(args)
+    return dict(
+        line.split(": ") for line in output.decode("ascii").splitlines())
+
+
+def test_table_data():
+    table = MasterPopTableAsBinarySearch()
+    table.initialise_table()
+    table.update_master_population_table(
+        0x100, 10, BaseKeyAndMask(0x2000, 0xFFFFFF00))
+    table.update_master_population_table(
+        0x20, 1, BaseKeyAndMask(0x1000, 0xFFFFFF00), is_single=True)
+    data = table.get_master_population_table_data()
+    entries = data[2:8].view(
+        MasterPopTableAsBinarySearch.MASTER_POP_ENTRY_DTYPE)
+    assert data[:2].tolist() == [2, 2]
+    assert entries["key"].tolist() == [0x1000, 0x2000]
+    assert table.get_synaptic_matrix_data_locations(
+        0x2005, entries, data[8:]) == [(10, 0x100, False)]
+    assert table.get_synaptic_matrix_data_locations(
+        0x1001, entries, data[8:]) == [(1, 0x20, True)]
+
+
+def test_harness_matches_table(harness, tmpdir):
+    table = MasterPopTableAsBinarySearch()
+    table.initialise_table()
+    address = 0
+    row_lengths = [[5], [0, 12], [0], [], [3, 0, 255]]
+    for source, lengths in enumerate(row_lengths):
+        key_and_mask = BaseKeyAndMask(source << 8, 0xFFFFFF00)
+        for row_length in lengths:
+            table.update_master_population_table(
+                address, row_length, key_and_mask)
+            address = table.get_next_allowed_address(
+                address + 256 * (row_length + 3) * 4)
+    table.update_master_population_table(
+        0x40, 1, BaseKeyAndMask(0x500, 0xFFFFFF00), is_single=True)
+    data = table.get_master_population_table_data()
+    entries = data[2:2 + data[0] * 3].view(
+        MasterPopTableAsBinarySearch.MASTER_POP_ENTRY_DTYPE)
+    addresses = data[2 + data[0] * 3:]
+
+    rng = numpy.random.RandomState(1)
+    keys = (rng.randint(0, 8, 1000) << 8) | rng.randint(0, 256, 1000)
+    results = _run(harness, tmpdir, data, keys, n_repeats=3)
+
+    locations = [
+        table.get_synaptic_matrix_data_locations(int(key), entries, addresses)
+        for key in keys]
+    n_rows = sum(
+        1 for found in locations for row_length, _, is_single in found
+        if row_length or is_single)
+    n_not_in_table = sum(1 for key in keys if (key >> 8) in (3, 6, 7))
+    n_no_valid_rows = sum(1 for key in keys if (key >> 8) == 2)
+    assert int(results["lookups"]) == 3000
+    assert int(results["rows_per_replay"]) == n_rows
+    assert int(results["not_in_table"]) == n_not_in_table
+    assert int(results["no_valid_rows"]) == n_no_valid_rows
+    assert int(results["empty_lookups_per_replay"]) == (
+        n_not_in_table + n_no_valid_rows)
+    assert float(results["lookups_per_second"]) > 0
+
+
+def test_bit_field_data():
+    table = MasterPopTableAsBinarySearch()
+    table.initialise_table()
+    mask = 0xFFFFFFC0
+    rows = numpy.zeros(64, dtype="bool")
+    rows[[0, 33, 63]] = True
+    table.update_master_population_table(
+        0, 4, BaseKeyAndMask(0x000, mask), rows_with_synapses=rows)
+    more_rows = numpy.zeros(40, dtype="bool")
+    more_rows[1] = True
+    table.update_master_population_table(
+        0x100, 4, BaseKeyAndMask(0x000, mask), rows_with_synapses=more_rows)
+
+    # Rows not written by the host are not filtered, unless there are none
+    table.update_master_population_table(0x200, 4, BaseKeyAndMask(0x40, mask))
+    table.update_master_population_table(0, 0, BaseKeyAndMask(0x80, mask))
+
+    # Too many neurons are not filtered
+    table.update_master_population_table(
+        0x300, 4, BaseKeyAndMask(0x1000000, 0xFF000000),
+        rows_with_synapses=rows)
+
+    data = table.get_bit_field_filter_data()
+    assert data.tolist() == [
+        4, 2, (1 << 0) | (1 << 1), (1 << 1) | (1 << 31), 0, 2, 0, 0, 0]
+
+
+def test_harness_filters(harness, tmpdir):
+    table = MasterPopTableAsBinarySearch()
+    table.initialise_table()
+    rng = numpy.random.RandomState(2)
+    rows = rng.uniform(size=(3, 256)) < 0.3
+    for source in range(3):
+        table.update_master_population_table(
+            source * 0x10000, 10, BaseKeyAndMask(source << 8, 0xFFFFFF00),
+            rows_with_synapses=rows[source])
+    keys = (rng.randint(0, 4, 1000) << 8) | rng.randint(0, 256, 1000)
+    table_data = table.get_master_population_table_data()
+    unfiltered = _run(harness, tmpdir, table_data, keys)
+    results = _run(
+        harness, tmpdir, table_data, keys, n_repeats=2,
+        bit_field_data=table.get_bit_field_filter_data())
+
+    sources = keys >> 8
+    in_table = sources < 3
+    has_row = numpy.zeros(len(keys), dtype="bool")
+    has_row[in_table] = rows[sources[in_table], keys[in_table] & 0xFF]
+    assert int(unfiltered["filtered"]) == 0
+    assert int(unfiltered["rows_per_replay"]) == numpy.count_nonzero(
+        in_table)
+    assert int(results["filtered"]) == numpy.count_nonzero(
+        in_table & ~has_row)
+    assert int(results["rows_per_replay"]) == numpy.count_nonzero(has_row)
+    assert int(results["bytes_per_replay"]) < int(
+        unfiltered["bytes_per_replay"])
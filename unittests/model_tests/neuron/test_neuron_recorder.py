@@ -12,7 +12,10 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import numpy
+import pytest
 from data_specification.enums import DataType
+from pacman.model.graphs.common import Slice
 from unittests.mocks import MockSimulator
 from spinn_front_end_common.utilities import globals_variables
 from spynnaker.pyNN.models.common import NeuronRecorder
@@ -60,3 +63,57 @@ def test_recording_variables():
     nr.set_recording("gsyn_inh", True)
     assert(["v", "gsyn_inh"] == nr.recording_variables)
     assert([0, 2] == nr.recorded_region_ids)
+
+
+class _MockRecording(object):
+    """ Bit fields of random spikes recorded by each of two cores
+    """
+
+    def __init__(self, recorder, slices, n_steps):
+        rng = numpy.random.RandomState(2)
+        self.slices = slices
+        self.raw = list()
+        for vertex_slice in slices:
+            n_recording = len(recorder._neurons_recording(
+                NeuronRecorder.SPIKES, vertex_slice))
+            n_words = (n_recording + 31) // 32
+            bits = numpy.zeros((n_steps, n_words * 32), dtype="uint64")
+            bits[:, :n_recording] = rng.uniform(
+                size=(n_steps, n_recording)) < 0.1
+            # Bit b of word w is the neuron at index w * 32 + b
+            words = (bits.reshape(n_steps, n_words, 32) << numpy.arange(
+                32, dtype="uint64")).sum(axis=2)
+            self.raw.append(numpy.column_stack((
+                numpy.arange(n_steps), words)).astype("<u4").tobytes())
+
+    def get_machine_vertices(self, application_vertex):
+        return range(len(self.slices))
+
+    def get_slice(self, vertex):
+        return self.slices[vertex]
+
+    def get_placement_of_vertex(self, vertex):
+        return vertex
+
+    def get_data_by_placement(self, placement, region):
+        return bytearray(self.raw[placement]), False
+
+
+@pytest.mark.parametrize("indexes", [None, [1, 3, 40, 64, 65, 99]])
+def test_spike_counts_match_spikes(indexes):
+    simulator = MockSimulator()
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(simulator)
+
+    nr = NeuronRecorder([], {}, [NeuronRecorder.SPIKES], 100)
+    nr.set_recording(NeuronRecorder.SPIKES, True, indexes=indexes)
+    recording = _MockRecording(nr, [Slice(0, 63), Slice(64, 99)], 200)
+    spikes = nr.get_spikes(
+        "pop", recording, 0, recording, recording, None,
+        NeuronRecorder.SPIKES, 1000)
+    counts = nr.get_spike_counts(
+        "pop", recording, 0, recording, recording, None,
+        NeuronRecorder.SPIKES)
+    assert len(spikes)
+    assert numpy.array_equal(
+        counts, numpy.bincount(spikes[:, 0].astype("int64"), minlength=100))
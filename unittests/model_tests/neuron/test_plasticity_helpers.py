@@ -0,0 +1,60 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import math
+import numpy
+import pytest
+from spynnaker.pyNN.models.neuron.plasticity.stdp.common.plasticity_helpers \
+    import (STDP_FIXED_POINT_ONE, get_exp_dist_lut_array, get_exp_lut_array)
+from spynnaker.pyNN.models.neuron.plasticity.stdp.timing_dependence import (
+    TimingDependenceSpikePair)
+from unittests.mocks import MockSimulator
+
+
+@pytest.mark.parametrize("time_constant,shift", [
+    (20.0, 0), (16.7, 0), (33.7, 2), (1.0, 0)])
+def test_exp_lut_values(time_constant, shift):
+    lut = get_exp_lut_array(1.0, time_constant, shift)
+    header = lut[:1].view("uint16")
+    values = lut[1:].view("uint16")
+    assert header[0] == len(values) and header[1] == shift
+    assert len(values) % 2 == 0
+    assert len(values) * (1 << shift) >= (
+        math.log(STDP_FIXED_POINT_ONE) * time_constant)
+    expected = numpy.floor(numpy.exp(
+        -(numpy.arange(len(values)) << shift) / time_constant) *
+        STDP_FIXED_POINT_ONE)
+    assert numpy.array_equal(values, expected)
+
+
+def test_exp_lut_shared():
+    MockSimulator.setup()
+    first = TimingDependenceSpikePair(tau_plus=20.0, tau_minus=21.5)
+    second = TimingDependenceSpikePair(tau_plus=20, tau_minus=20.0)
+    shared = get_exp_lut_array(1.0, 20.0)
+    assert get_exp_lut_array(1, 20) is shared
+    assert not shared.flags.writeable
+    assert get_exp_lut_array(1.0, 20.0, shift=2) is not shared
+    assert first.get_parameters_sdram_usage_in_bytes() == \
+        second.get_parameters_sdram_usage_in_bytes() + (
+            len(get_exp_lut_array(1.0, 21.5)) - len(shared)) * 4
+
+
+def test_exp_dist_lut_shared():
+    lut = get_exp_dist_lut_array(35.0)
+    assert get_exp_dist_lut_array(35) is lut
+    assert not lut.flags.writeable
+    assert len(lut) == STDP_FIXED_POINT_ONE
+    assert lut[0] == 0 and numpy.all(numpy.diff(lut.astype("int64")) >= 0)
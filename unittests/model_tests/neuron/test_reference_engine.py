@@ -0,0 +1,73 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from spynnaker.pyNN.exceptions import SpynnakerException
+from spynnaker.pyNN.models.neuron.neuron_models import (
+    NeuronModelLeakyIntegrateAndFire)
+from spynnaker.pyNN.models.neuron.synapse_types import SynapseTypeExponential
+from spynnaker.pyNN.utilities.reference_engine.neuron_components import (
+    get_neuron_model, get_synapse_type, get_threshold_type)
+from spynnaker.pyNN.utilities.reference_engine.reference_engine import (
+    _Projection)
+
+
+class _Post(object):
+    def __init__(self, n_delays, n_atoms):
+        self.ring_buffers = numpy.zeros((n_delays, 2, n_atoms))
+
+
+def test_lif_exponential():
+    model = get_neuron_model(NeuronModelLeakyIntegrateAndFire(
+        -65.0, -65.0, 10.0, 1.0, 0.0, -65.0, 2.0))
+    synapse = get_synapse_type(SynapseTypeExponential(5.0, 5.0, 0.0, 0.0))
+    n = 3
+    # v, v_rest, r_membrane, exp_tc, i_offset, count_refrac, v_reset,
+    # tau_refrac
+    lif = [numpy.full(n, value) for value in (
+        -65.0, -65.0, 10.0, 0.9, 0.0, 0.0, -70.0, 2.0)]
+    lif[5][2] = 1.0
+    syn = [numpy.full(n, value) for value in (
+        0.8, 1.0, 0.0, 0.8, 1.0, 0.0)]
+    synapse.add_input(syn, 0, numpy.array([1.0, 0.0, 1.0]))
+    exc, inh = synapse.inputs(syn)
+    v = model.update(lif, exc, inh, 0.0, 1.0)
+    assert numpy.allclose(v, [-64.0, -65.0, -65.0])
+    assert numpy.array_equal(lif[5], [0.0, 0.0, 0.0])
+    synapse.shape(syn)
+    assert numpy.allclose(syn[2], [0.8, 0.0, 0.8])
+    model.has_spiked(lif, numpy.array([True, False, False]), 1.0)
+    assert numpy.allclose(lif[0], [-70.0, -65.0, -65.0])
+    assert numpy.allclose(lif[5], [2.0, 0.0, 0.0])
+
+
+def test_unsupported_component():
+    with pytest.raises(SpynnakerException):
+        get_threshold_type(object())
+
+
+def test_projection_delivery():
+    connections = numpy.array(
+        [(1, 0, -0.5, 2.0), (0, 1, 1.0, 1.0), (1, 2, 2.0, 1.0)],
+        dtype=[("source", "uint32"), ("target", "uint16"),
+               ("weight", "float64"), ("delay", "float64")])
+    post = _Post(3, 3)
+    projection = _Projection(connections, 2, post, 1, 1000)
+    assert projection.max_delay_steps == 2
+    projection.deliver(1, numpy.array([0, 2]))
+    assert numpy.allclose(post.ring_buffers[0, 1], [1.0, 0.0, 0.0])
+    assert numpy.allclose(post.ring_buffers[2, 1], [0.0, 0.0, 4.0])
+    assert not numpy.any(post.ring_buffers[:, 0])
@@ -0,0 +1,251 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import subprocess
+import numpy
+import pytest
+from pacman.model.routing_info import BaseKeyAndMask
+from spynnaker.pyNN.models.neuron.master_pop_table import (
+    MasterPopTableAsBinarySearch)
+from spynnaker.pyNN.utilities.constants import POPULATION_BASED_REGIONS
+from unittests.host_test_builds import (
+    build_host_test, load_host_test_module)
+
+_N_NEURONS = 256
+_ROW_LENGTH = 16
+
+
+@pytest.fixture(scope="module")
+def sim(tmpdir_factory):
+    build_dir = build_host_test(tmpdir_factory, "spike_processing")
+    return os.path.join(build_dir, "spike_processing_sim")
+
+
+class _Region(object):
+    def __init__(self, data):
+        self.region_data = bytearray(data.tobytes()) + bytearray(64)
+        self.max_write_pointer = data.nbytes
+
+
+class _Executor(object):
+    def __init__(self, regions):
+        self.__regions = regions
+
+    def get_region(self, region_id):
+        return self.__regions.get(region_id)
+
+
+def _make_regions(n_sources, rows_with_synapses, seed=1, n_plastic_words=0):
+    """ Make a matrix of rows of fixed synapses for each source, of which\
+        only those given have any synapses, and the table to find them; any\
+        plastic words make the rows be written back
+
+    :return: the regions, the number of synapses in each row and the\
+        synapse words of each row
+    """
+    rng = numpy.random.RandomState(seed)
+    table = MasterPopTableAsBinarySearch()
+    table.initialise_table()
+    matrix = list()
+    n_synapses = numpy.zeros((n_sources, _N_NEURONS), dtype="uint32")
+    synapses = rng.randint(
+        0, 0xFFFFFFFF, (n_sources, _N_NEURONS, _ROW_LENGTH), dtype="uint32")
+    address = 0
+    for source in range(n_sources):
+        row_length = _ROW_LENGTH + n_plastic_words
+        rows = numpy.zeros((_N_NEURONS, row_length + 3), dtype="uint32")
+        n_synapses[source, rows_with_synapses[source]] = rng.randint(
+            1, _ROW_LENGTH + 1, numpy.count_nonzero(
+                rows_with_synapses[source]))
+        rows[:, 0] = n_plastic_words
+        rows[:, n_plastic_words + 1] = n_synapses[source]
+        for neuron in range(_N_NEURONS):
+            n = n_synapses[source, neuron]
+            rows[neuron, n_plastic_words + 3:n_plastic_words + 3 + n] = \
+                synapses[source, neuron, :n]
+        table.update_master_population_table(
+            address, row_length, BaseKeyAndMask(source << 8, 0xFFFFFF00),
+            rows_with_synapses=rows_with_synapses[source])
+        matrix.append(rows.ravel())
+        address += rows.nbytes
+    regions = {
+        POPULATION_BASED_REGIONS.POPULATION_TABLE.value: _Region(
+            table.get_master_population_table_data()),
+        POPULATION_BASED_REGIONS.SYNAPTIC_MATRIX.value: _Region(
+            numpy.concatenate(matrix)),
+        POPULATION_BASED_REGIONS.BIT_FIELD_FILTER.value: _Region(
+            table.get_bit_field_filter_data())}
+    return _Executor(regions), n_synapses, synapses
+
+
+def _run(sim, tmpdir, executor, times_us, keys, use_bit_fields=True,
+         **parameters):
+    """ Run the simulator on the regions and spikes given, returning the\
+        results it prints
+    """
+    exporter = load_host_test_module("spike_processing", "export_images")
+    prefix = str(tmpdir.join("core_"))
+    files = exporter.write_images(executor, prefix)
+    trace_file = str(tmpdir.join("trace.bin"))
+    exporter.write_spike_trace(trace_file, times_us, keys)
+    args = [
+        sim, files[POPULATION_BASED_REGIONS.POPULATION_TABLE],
+        files[POPULATION_BASED_REGIONS.SYNAPTIC_MATRIX],
+        files[POPULATION_BASED_REGIONS.DIRECT_MATRIX],
+        files[POPULATION_BASED_REGIONS.BIT_FIELD_FILTER]
+        if use_bit_fields else "-", trace_file]
+    args.extend(
+        "{}={}".format(name, value) for name, value in parameters.items())
+    output = subprocess.check_output(args)
+    return dict(
+        line.split(": ") for line in output.decode("ascii").splitlines())
+
+
+def test_images_written(tmpdir):
+    executor, _, _ = _make_regions(
+        1, numpy.ones((1, _N_NEURONS), dtype=bool))
+    exporter = load_host_test_module("spike_processing", "export_images")
+    files = exporter.write_images(executor, str(tmpdir.join("core_")))
+    table = executor.get_region(
+        POPULATION_BASED_REGIONS.POPULATION_TABLE.value)
+    with open(files[POPULATION_BASED_REGIONS.POPULATION_TABLE], "rb") as f:
+        assert f.read() == table.region_data[:table.max_write_pointer]
+    assert os.path.getsize(files[POPULATION_BASED_REGIONS.DIRECT_MATRIX]) == 0
+
+    trace_file = str(tmpdir.join("trace.bin"))
+    exporter.write_spike_trace(trace_file, [30, 10, 20, 10], [1, 2, 3, 4])
+    assert numpy.fromfile(trace_file, dtype="<u4").tolist() == [
+        10, 2, 10, 4, 20, 3, 30, 1]
+
+
+def test_low_rate_is_all_processed(sim, tmpdir):
+    rng = numpy.random.RandomState(2)
+    rows_with_synapses = rng.uniform(size=(4, _N_NEURONS)) < 0.5
+    executor, n_synapses, _ = _make_regions(4, rows_with_synapses)
+
+    # A spike every 20us from a different neuron each time
+    n_spikes = 400
+    times = numpy.arange(n_spikes) * 20
+    sources = rng.randint(0, 5, n_spikes)
+    neurons = rng.permutation(_N_NEURONS * 2)[:n_spikes] % _N_NEURONS
+    keys = (sources << 8) | neurons
+    ticks_file = str(tmpdir.join("ticks.csv"))
+    results = _run(sim, tmpdir, executor, times, keys, ticks_file=ticks_file)
+
+    in_table = sources < 4
+    has_row = numpy.zeros(n_spikes, dtype=bool)
+    has_row[in_table] = rows_with_synapses[
+        sources[in_table], neurons[in_table]]
+    assert int(results["packets_received"]) == n_spikes
+    assert int(results["packets_dropped"]) == 0
+    assert int(results["first_overflow_us"]) == -1
+    assert int(results["filtered_packets"]) == numpy.count_nonzero(
+        in_table & ~has_row)
+    assert int(results["rows_processed"]) == numpy.count_nonzero(has_row)
+    assert int(results["synapses_processed"]) == numpy.sum(
+        n_synapses[sources[has_row], neurons[has_row]])
+    assert int(results["dma_reads"]) == numpy.count_nonzero(has_row)
+    assert int(results["dma_writes"]) == 0
+    assert int(results["dma_bytes"]) == (
+        numpy.count_nonzero(has_row) * (_ROW_LENGTH + 3) * 4)
+    assert 0 < float(results["mean_cpu_utilisation"]) < 1
+    assert int(results["timer_overruns"]) == 0
+    with open(ticks_file) as f:
+        assert len(f.readlines()) == int(results["ticks"]) + 1
+
+    # Without the bit fields, the rows with no synapses are read too
+    unfiltered = _run(
+        sim, tmpdir, executor, times, keys, use_bit_fields=False)
+    assert int(unfiltered["filtered_packets"]) == 0
+    assert int(unfiltered["dma_reads"]) == numpy.count_nonzero(in_table)
+    assert int(unfiltered["rows_processed"]) == numpy.count_nonzero(in_table)
+
+
+def test_burst_overflows(sim, tmpdir):
+    executor, _, _ = _make_regions(
+        1, numpy.ones((1, _N_NEURONS), dtype=bool))
+
+    # Quiet, then a burst of a spike from every neuron at once, then quiet
+    times = numpy.concatenate((
+        numpy.arange(10) * 100, numpy.full(_N_NEURONS, 2000),
+        4000 + numpy.arange(10) * 100))
+    keys = numpy.concatenate((
+        numpy.arange(10), numpy.arange(_N_NEURONS), numpy.arange(10)))
+    results = _run(sim, tmpdir, executor, times, keys, in_spikes_size=64)
+
+    n_dropped = int(results["packets_dropped"])
+    assert int(results["in_spikes_capacity"]) == 63
+    assert int(results["max_in_spikes"]) == 63
+    assert n_dropped > 0
+    assert int(results["first_overflow_us"]) == 2000
+    assert int(results["overflow_ticks"]) == 1
+    assert int(results["rows_processed"]) == len(keys) - n_dropped
+
+    # A big enough buffer doesn't overflow
+    results = _run(sim, tmpdir, executor, times, keys, in_spikes_size=512)
+    assert int(results["packets_dropped"]) == 0
+    assert int(results["rows_processed"]) == len(keys)
+
+
+@pytest.mark.parametrize("n_plastic_words", [0, 2])
+def test_coalesced_rows_give_same_input(sim, tmpdir, n_plastic_words):
+    rng = numpy.random.RandomState(3)
+    rows_with_synapses = rng.uniform(size=(2, _N_NEURONS)) < 0.8
+    executor, n_synapses, synapses = _make_regions(
+        2, rows_with_synapses, n_plastic_words=n_plastic_words)
+
+    # Bursts of spikes from each source in neuron order, as a source core
+    # sends them, with some neurons left out and some spiking twice
+    times = list()
+    keys = list()
+    for tick in range(10):
+        for source in range(2):
+            neurons = numpy.sort(rng.choice(
+                _N_NEURONS, rng.randint(20, 100), replace=False))
+            neurons = numpy.concatenate((neurons, neurons[:5]))
+            times.append(numpy.full(len(neurons), tick * 1000 + source * 100))
+            keys.append((source << 8) | neurons)
+    times = numpy.concatenate(times)
+    keys = numpy.concatenate(keys)
+    sources = keys >> 8
+    neurons = keys & 0xFF
+
+    expected = numpy.zeros(1 << 16, dtype="uint32")
+    for source, neuron in zip(sources, neurons):
+        for synapse in synapses[source, neuron, :n_synapses[source, neuron]]:
+            expected[synapse & 0xFFFF] += synapse >> 16
+
+    results = dict()
+    for name in ("spike_processing_sim", "spike_processing_sim_single"):
+        input_file = str(tmpdir.join(name + ".bin"))
+        results[name] = _run(
+            os.path.join(os.path.dirname(sim), name), tmpdir, executor,
+            times, keys, in_spikes_size=1024, input_file=input_file)
+        assert int(results[name]["packets_dropped"]) == 0
+        assert int(results[name]["rows_processed"]) == numpy.count_nonzero(
+            rows_with_synapses[sources, neurons])
+        assert numpy.array_equal(
+            numpy.fromfile(input_file, dtype="<u4"), expected)
+
+    coalesced = results["spike_processing_sim"]
+    single = results["spike_processing_sim_single"]
+    assert int(single["coalesced_transfers"]) == 0
+    assert int(coalesced["coalesced_transfers"]) > 0
+    assert int(coalesced["dma_reads"]) < int(single["dma_reads"])
+    if n_plastic_words:
+        assert int(coalesced["dma_writes"]) > 0
+    else:
+        assert int(coalesced["dma_writes"]) == 0
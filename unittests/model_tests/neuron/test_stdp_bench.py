@@ -0,0 +1,116 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import subprocess
+import numpy
+import pytest
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
+from spynnaker.pyNN.models.neuron.plasticity.stdp.timing_dependence import (
+    TimingDependenceSpikeNearestPair, TimingDependenceSpikePair)
+from spynnaker.pyNN.models.neuron.plasticity.stdp.weight_dependence import (
+    WeightDependenceAdditive, WeightDependenceMultiplicative)
+from spynnaker.pyNN.models.neuron.synapse_dynamics import SynapseDynamicsSTDP
+from unittests.host_test_builds import (
+    build_host_test, load_host_test_module)
+from unittests.mocks import MockSimulator
+
+_N_ROWS = 32
+_N_NEURONS = 64
+_N_SYNAPSE_TYPES = 2
+_LEFT_SHIFT = 3
+_N_STEPS = 4000
+
+_TIMING = {
+    "pair": TimingDependenceSpikePair,
+    "nearest_pair": TimingDependenceSpikeNearestPair}
+_WEIGHT = {
+    "additive": WeightDependenceAdditive,
+    "multiplicative": WeightDependenceMultiplicative}
+
+
+@pytest.fixture(scope="module")
+def build_dir(tmpdir_factory):
+    return build_host_test(tmpdir_factory, "stdp")
+
+
+def _poisson_train(rng, n_trains, rate):
+    """ Spikes from 1 to _N_STEPS at a rate in spikes per time step
+    """
+    spikes = rng.uniform(size=(_N_STEPS, n_trains)) < rate
+    spikes[0] = False
+    times, ids = numpy.nonzero(spikes)
+    return times, ids
+
+
+@pytest.mark.parametrize("timing", ["pair", "nearest_pair"])
+@pytest.mark.parametrize("weight", ["additive", "multiplicative"])
+def test_weights_match_reference(build_dir, tmpdir, timing, weight):
+    MockSimulator.setup()
+    data = load_host_test_module("stdp", "stdp_data")
+    dynamics = SynapseDynamicsSTDP(
+        _TIMING[timing](tau_plus=16.7, tau_minus=33.7),
+        _WEIGHT[weight](w_min=0.0, w_max=2.0))
+    dynamics.weight_dependence.set_a_plus_a_minus(0.05, 0.06)
+    weight_scales = [float(1 << (15 - _LEFT_SHIFT))] * _N_SYNAPSE_TYPES
+
+    rng = numpy.random.RandomState(1)
+    n_connections = _N_ROWS * 16
+    connections = numpy.zeros(
+        n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    connections["source"] = rng.randint(0, _N_ROWS, n_connections)
+    connections["target"] = rng.randint(0, _N_NEURONS, n_connections)
+    connections["synapse_type"] = rng.randint(
+        0, _N_SYNAPSE_TYPES, n_connections)
+    connections["weight"] = numpy.rint(rng.uniform(
+        0.5, 1.5, n_connections) * weight_scales[0])
+    connections["delay"] = rng.randint(1, 5, n_connections)
+    pre_times, pre_rows = _poisson_train(rng, _N_ROWS, 0.02)
+    post_times, post_neurons = _poisson_train(rng, _N_NEURONS, 0.02)
+
+    parameters_file = str(tmpdir.join("parameters.bin"))
+    rows_file = str(tmpdir.join("rows.bin"))
+    spikes_file = str(tmpdir.join("spikes.bin"))
+    output_file = str(tmpdir.join("output.bin"))
+    data.write_parameters(parameters_file, dynamics, weight_scales)
+    data.write_rows(
+        rows_file, dynamics, connections, _N_ROWS, _N_NEURONS,
+        _N_SYNAPSE_TYPES)
+    data.write_spikes(
+        spikes_file, pre_times, pre_rows, post_times, post_neurons)
+    output = subprocess.check_output([
+        os.path.join(build_dir, "stdp_bench_{}_{}".format(timing, weight)),
+        parameters_file, rows_file, spikes_file, output_file,
+        str(_N_NEURONS), str(_N_SYNAPSE_TYPES), str(_LEFT_SHIFT)])
+    results = dict(
+        line.split(": ") for line in output.decode("ascii").splitlines())
+    assert int(results["pre_spikes"]) == len(pre_times)
+    assert int(results["post_spikes"]) == len(post_times)
+    assert int(results["synapses_processed"]) == numpy.sum(
+        numpy.bincount(connections["source"], minlength=_N_ROWS)[pre_rows])
+    assert float(results["synapses_per_second"]) > 0
+
+    weights = data.read_weights(
+        output_file, dynamics, connections, _N_NEURONS, _N_SYNAPSE_TYPES)
+    expected = data.reference_weights(
+        dynamics, weight_scales, _LEFT_SHIFT, connections, pre_times,
+        pre_rows, post_times, post_neurons)
+
+    # The weights have changed, but only by as much as the fixed-point
+    # rounding of each update could add up to
+    assert numpy.any(numpy.abs(expected - connections["weight"]) > 100)
+    error = numpy.abs(weights - expected)
+    assert numpy.max(error) <= 0.01 * 2.0 * weight_scales[0]
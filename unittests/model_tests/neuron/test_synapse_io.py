@@ -13,15 +13,20 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy
 import pytest
+from pacman.model.graphs.common import Slice
 from spynnaker.pyNN.exceptions import SynapseRowTooBigException
 from spynnaker.pyNN.models.neural_projections import (
     ProjectionApplicationEdge, SynapseInformation)
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     SynapseDynamicsStatic, SynapseDynamicsSTDP)
 from spynnaker.pyNN.models.neuron.master_pop_table import (
     MasterPopTableAsBinarySearch)
-from spynnaker.pyNN.models.neuron.synapse_io import SynapseIORowBased
+from spynnaker.pyNN.models.neuron.synapse_io import (
+    SynapseIORowBased, SynapticRows)
 from spynnaker.pyNN.models.neuron.plasticity.stdp.weight_dependence import (
     WeightDependenceAdditive)
 from spynnaker.pyNN.models.neuron.plasticity.stdp.timing_dependence import (
@@ -69,3 +74,55 @@ def test_get_max_row_length(dynamics_class, timing, weight, size, exception,
         actual_size = io._get_max_row_length(
             size, dynamics, population_table, in_edge, size)
         assert actual_size == max_size
+
+
+@pytest.mark.parametrize("plastic", [False, True])
+def test_synaptic_rows_in_chunks(plastic):
+    MockSimulator.setup()
+    if plastic:
+        dynamics = SynapseDynamicsSTDP(
+            TimingDependenceSpikePair(), WeightDependenceAdditive())
+    else:
+        dynamics = SynapseDynamicsStatic()
+    n_rows = 10
+    post_vertex_slice = Slice(0, 99)
+    rng = numpy.random.RandomState(1)
+    n_connections = 200
+    connections = numpy.zeros(
+        n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    # Row 3 is empty, and row 5 is the longest
+    connections["source"] = rng.choice(
+        [0, 1, 2, 4, 5, 5, 5, 6, 7, 8, 9], n_connections)
+    connections["target"] = rng.randint(0, 100, n_connections)
+    connections["weight"] = rng.randint(1, 100, n_connections)
+    connections["delay"] = rng.randint(1, 16, n_connections)
+
+    def make_rows(rows_per_chunk):
+        return SynapticRows(
+            connections, connections["source"], n_rows, post_vertex_slice,
+            2, MasterPopTableAsBinarySearch(), dynamics, rows_per_chunk)
+
+    # Encoding all the rows at once is the reference
+    all_rows = make_rows(n_rows)
+    expected = all_rows.get_all()
+    assert len(expected) == all_rows.n_words
+    assert all_rows.n_words == n_rows * (all_rows.max_row_length + 3)
+    longest = numpy.count_nonzero(connections["source"] == 5)
+    assert all_rows.max_row_length >= longest
+
+    for rows_per_chunk in (1, 3, 7):
+        rows = make_rows(rows_per_chunk)
+        assert rows.max_row_length == all_rows.max_row_length
+        chunks = list(rows)
+        assert len(chunks) == -(-n_rows // rows_per_chunk)
+        assert all(
+            len(chunk) <= rows_per_chunk * (rows.max_row_length + 3)
+            for chunk in chunks)
+        assert numpy.array_equal(numpy.concatenate(chunks), expected)
+
+
+def test_empty_synaptic_rows():
+    assert SynapticRows.EMPTY.n_words == 0
+    assert SynapticRows.EMPTY.max_row_length == 0
+    assert list(SynapticRows.EMPTY) == []
+    assert SynapticRows.EMPTY.get_all().size == 0
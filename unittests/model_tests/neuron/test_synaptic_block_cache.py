@@ -0,0 +1,165 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neural_projections import SynapseInformation
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
+from spynnaker.pyNN.models.neuron.master_pop_table import (
+    MasterPopTableAsBinarySearch)
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    SynapseDynamicsStatic)
+from spynnaker.pyNN.models.neuron.synapse_io import SynapseIORowBased
+from spynnaker.pyNN.models.neuron.synaptic_block_cache import (
+    SynapticBlockCache)
+from unittests.mocks import MockSimulator
+
+
+class _CountingConnector(object):
+    """ Makes random blocks of a fixed number of connections, counting how\
+        many it has made
+    """
+
+    def __init__(self, n_connections):
+        self.n_connections = n_connections
+        self.n_blocks = 0
+        self.__rng = numpy.random.RandomState(1)
+
+    def create_synaptic_block(
+            self, pre_slices, pre_slice_index, post_slices, post_slice_index,
+            pre_vertex_slice, post_vertex_slice, synapse_type, synapse_info):
+        # pylint: disable=unused-argument
+        self.n_blocks += 1
+        block = numpy.zeros(
+            self.n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+        block["source"] = self.__rng.randint(
+            pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom + 1,
+            self.n_connections)
+        block["target"] = self.__rng.randint(
+            post_vertex_slice.lo_atom, post_vertex_slice.hi_atom + 1,
+            self.n_connections)
+        block["weight"] = self.__rng.uniform(-2.0, 2.0, self.n_connections)
+        block["delay"] = self.__rng.uniform(1.0, 15.0, self.n_connections)
+        block["synapse_type"] = synapse_type
+        return block
+
+
+def _synapse_info(connector):
+    return SynapseInformation(
+        connector, None, None, False, False, None, SynapseDynamicsStatic(), 0)
+
+
+def _get_block(cache, synapse_info, pre_slice, post_slice):
+    return cache.get_block(
+        synapse_info, [pre_slice], 0, [post_slice], 0, pre_slice, post_slice)
+
+
+def test_blocks_are_kept():
+    connector = _CountingConnector(100)
+    info = _synapse_info(connector)
+    cache = SynapticBlockCache(1024 * 1024)
+    pre_slice = Slice(0, 9)
+    post_slice = Slice(0, 19)
+    block = _get_block(cache, info, pre_slice, post_slice)
+    assert not block.flags.writeable
+    assert _get_block(cache, info, Slice(0, 9), Slice(0, 19)) is block
+    assert connector.n_blocks == 1
+    assert (cache.n_hits, cache.n_misses) == (1, 1)
+    assert cache.n_bytes == block.nbytes
+
+    # Another slice or projection is another block
+    _get_block(cache, info, pre_slice, Slice(20, 39))
+    _get_block(cache, _synapse_info(connector), pre_slice, post_slice)
+    assert connector.n_blocks == 3
+    assert cache.n_blocks == 3
+
+    cache.clear()
+    assert cache.n_blocks == 0
+    assert cache.n_bytes == 0
+    assert _get_block(cache, info, pre_slice, post_slice) is not block
+
+
+def test_least_recently_used_evicted():
+    connector = _CountingConnector(100)
+    info = _synapse_info(connector)
+    block_bytes = 100 * numpy.dtype(
+        AbstractConnector.NUMPY_SYNAPSES_DTYPE).itemsize
+    cache = SynapticBlockCache(2 * block_bytes)
+    slices = [Slice(i * 10, i * 10 + 9) for i in range(3)]
+    pre_slice = Slice(0, 9)
+    first = _get_block(cache, info, pre_slice, slices[0])
+    _get_block(cache, info, pre_slice, slices[1])
+
+    # Using the first block makes the second the least recently used
+    _get_block(cache, info, pre_slice, slices[0])
+    _get_block(cache, info, pre_slice, slices[2])
+    assert cache.n_blocks == 2
+    assert cache.n_bytes == 2 * block_bytes
+    assert _get_block(cache, info, pre_slice, slices[0]) is first
+    assert connector.n_blocks == 3
+    _get_block(cache, info, pre_slice, slices[1])
+    assert connector.n_blocks == 4
+
+
+@pytest.mark.parametrize("max_bytes", [0, 100])
+def test_block_too_big_not_kept(max_bytes):
+    connector = _CountingConnector(100)
+    info = _synapse_info(connector)
+    cache = SynapticBlockCache(max_bytes)
+    block = _get_block(cache, info, Slice(0, 9), Slice(0, 9))
+    assert len(block) == 100
+    assert cache.n_blocks == 0
+    assert cache.n_bytes == 0
+    _get_block(cache, info, Slice(0, 9), Slice(0, 9))
+    assert connector.n_blocks == 2
+
+
+def test_block_connections_match_rows():
+    MockSimulator.setup()
+    connector = _CountingConnector(500)
+    info = _synapse_info(connector)
+    pre_slice = Slice(10, 29)
+    post_slice = Slice(100, 149)
+    weight_scales = [256.0, 256.0]
+    machine_time_step = 1000
+    io = SynapseIORowBased()
+    block = _get_block(SynapticBlockCache(0), info, pre_slice, post_slice)
+    rows, delayed_rows, _, _ = io.get_synapse_rows(
+        info, [pre_slice], 0, [post_slice], 0, pre_slice, post_slice, 0,
+        MasterPopTableAsBinarySearch(), 2, weight_scales, machine_time_step,
+        None, None, connections=block)
+
+    # The block is copied rather than changed
+    assert not block.flags.writeable
+    assert numpy.all(block["weight"] < 2.0)
+
+    expected = io.read_synapses(
+        info, pre_slice, post_slice, rows.max_row_length,
+        delayed_rows.max_row_length, 2, weight_scales, rows.get_all(),
+        delayed_rows.get_all(), machine_time_step)
+    connections = io.get_block_connections(
+        info, block, weight_scales, machine_time_step)
+
+    def in_order(conns):
+        return conns[numpy.lexsort((
+            conns["delay"], conns["weight"], conns["target"],
+            conns["source"]))]
+
+    expected = in_order(expected)
+    connections = in_order(connections)
+    for name in ("source", "target", "weight", "delay"):
+        assert numpy.array_equal(connections[name], expected[name])
@@ -17,6 +17,8 @@ import os
 import struct
 import tempfile
 import unittest
+import numpy
+from pyNN.random import NumpyRNG, RandomDistribution
 import spinn_utilities.conf_loader as conf_loader
 from spinn_utilities.overrides import overrides
 from spinn_machine import SDRAM
@@ -26,15 +28,18 @@ from pacman.model.graphs.common import GraphMapper, Slice
 from pacman.model.graphs.machine import MachineGraph, SimpleMachineVertex
 from pacman.model.routing_info import (
     RoutingInfo, PartitionRoutingInfo, BaseKeyAndMask)
-from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.graphs.application import (
+    ApplicationGraph, ApplicationVertex)
 from spinn_storage_handlers import FileDataWriter, FileDataReader
 from data_specification import (
     DataSpecificationGenerator, DataSpecificationExecutor)
+from data_specification.constants import MAX_MEM_REGIONS
 from spynnaker.pyNN.models.neuron import SynapticManager
 from spynnaker.pyNN.abstract_spinnaker_common import AbstractSpiNNakerCommon
 import spynnaker.pyNN.abstract_spinnaker_common as abstract_spinnaker_common
 from spynnaker.pyNN.models.neural_projections import (
-    ProjectionApplicationEdge, ProjectionMachineEdge, SynapseInformation)
+    DelayedApplicationEdge, DelayedMachineEdge, ProjectionApplicationEdge,
+    ProjectionMachineEdge, SynapseInformation)
 from spynnaker.pyNN.models.neural_projections.connectors import (
     AbstractGenerateConnectorOnMachine, AllToAllConnector, OneToOneConnector)
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
@@ -50,6 +55,7 @@ from spynnaker.pyNN.models.neuron.structural_plasticity.synaptogenesis\
     .formation import DistanceDependentFormation
 from spynnaker.pyNN.models.neuron.structural_plasticity.synaptogenesis\
     .elimination import RandomByWeightElimination
+from spynnaker.pyNN.models.utility_models.delays import DelayExtensionVertex
 from spynnaker.pyNN.exceptions import SynapticConfigurationException
 from unittests.mocks import MockSimulator
 
@@ -79,6 +85,31 @@ class MockTransceiverRawData(object):
         return self._data_to_read[base_address:base_address + length]
 
 
+class _MockCPUInfo(object):
+
+    def __init__(self, user_0):
+        self.user = [user_0, 0, 0, 0]
+
+
+class MockTransceiverLoadedCore(MockTransceiverRawData):
+    """ The memory of a core loaded with the data of an executed data\
+        specification, as it would be by the host data loading
+    """
+
+    def __init__(self, executor):
+        data = bytearray()
+        data.extend(executor.get_header().tobytes())
+        data.extend(executor.get_pointer_table(0).tobytes())
+        for region_id in range(MAX_MEM_REGIONS):
+            region = executor.get_region(region_id)
+            if region is not None:
+                data.extend(region.region_data)
+        super(MockTransceiverLoadedCore, self).__init__(data)
+
+    def get_cpu_information_from_core(self, x, y, p):
+        return _MockCPUInfo(0)
+
+
 class SimpleApplicationVertex(ApplicationVertex):
 
     def __init__(self, n_atoms):
@@ -394,6 +425,144 @@ class TestSynapticManager(unittest.TestCase):
         assert all([conn["weight"] == 4.5 for conn in connections_3])
         assert all([conn["delay"] == 4.0 for conn in connections_3])
 
+    def test_read_synaptic_blocks_round_trip(self):
+        simulator = MockSimulator.setup()
+        SDRAM(10000)
+        AbstractGenerateConnectorOnMachine.generate_on_machine = self.say_false
+        default_config_paths = os.path.join(
+            os.path.dirname(abstract_spinnaker_common.__file__),
+            AbstractSpiNNakerCommon.CONFIG_FILE_NAME)
+        config = conf_loader.load_config(
+            AbstractSpiNNakerCommon.CONFIG_FILE_NAME, default_config_paths)
+        config.set("Simulation", "one_to_one_connection_dtcm_max_bytes", 40)
+        machine_time_step = 1000.0
+
+        pre_app_vertex = SimpleApplicationVertex(10)
+        pre_vertex = SimpleMachineVertex(resources=None)
+        post_app_vertex = SimpleApplicationVertex(10)
+        post_vertex = SimpleMachineVertex(resources=None)
+        delay_app_vertex = DelayExtensionVertex(
+            10, 16, pre_app_vertex, machine_time_step, 1)
+        delay_app_vertex.n_delay_stages = 2
+        delay_vertex = SimpleMachineVertex(resources=None)
+        vertex_slice = Slice(0, 9)
+
+        # A one-to-one projection that is direct, and an all-to-all one
+        # with delays that need both undelayed and delayed rows
+        direct_connector = OneToOneConnector(None)
+        direct_info = SynapseInformation(
+            direct_connector, pre_app_vertex, post_app_vertex, False,
+            False, None, SynapseDynamicsStatic(), 0, 1.5, 1.0)
+        direct_connector.set_projection_information(
+            machine_time_step, direct_info)
+        delayed_connector = AllToAllConnector(None)
+        delayed_info = SynapseInformation(
+            delayed_connector, pre_app_vertex, post_app_vertex, False,
+            False, None, SynapseDynamicsStatic(), 1, 2.5,
+            RandomDistribution(
+                "uniform", low=1.0, high=40.0, rng=NumpyRNG(seed=1)))
+        delayed_connector.set_projection_information(
+            machine_time_step, delayed_info)
+
+        app_edge = ProjectionApplicationEdge(
+            pre_app_vertex, post_app_vertex, direct_info)
+        app_edge.add_synapse_information(delayed_info)
+        delay_app_edge = DelayedApplicationEdge(
+            delay_app_vertex, post_app_vertex, delayed_info)
+        app_edge.delay_edge = delay_app_edge
+        machine_edge = ProjectionMachineEdge(
+            app_edge.synapse_information, pre_vertex, post_vertex)
+        delay_machine_edge = DelayedMachineEdge(
+            delay_app_edge.synapse_information, delay_vertex, post_vertex)
+
+        app_graph = ApplicationGraph("Test")
+        for vertex in (pre_app_vertex, post_app_vertex, delay_app_vertex):
+            app_graph.add_vertex(vertex)
+        app_graph.add_edge(app_edge, "SPIKES")
+        app_graph.add_edge(delay_app_edge, "DELAYS")
+        graph = MachineGraph("Test")
+        for vertex in (pre_vertex, post_vertex, delay_vertex):
+            graph.add_vertex(vertex)
+        graph.add_edge(machine_edge, "SPIKES")
+        graph.add_edge(delay_machine_edge, "DELAYS")
+
+        graph_mapper = GraphMapper()
+        graph_mapper.add_vertex_mapping(
+            pre_vertex, vertex_slice, pre_app_vertex)
+        graph_mapper.add_vertex_mapping(
+            post_vertex, vertex_slice, post_app_vertex)
+        graph_mapper.add_vertex_mapping(
+            delay_vertex, vertex_slice, delay_app_vertex)
+        graph_mapper.add_edge_mapping(machine_edge, app_edge)
+        graph_mapper.add_edge_mapping(delay_machine_edge, delay_app_edge)
+
+        routing_info = RoutingInfo()
+        routing_info.add_partition_info(PartitionRoutingInfo(
+            [BaseKeyAndMask(0, 0xFFFFFFF0)],
+            graph.get_outgoing_edge_partition_starting_at_vertex(
+                pre_vertex, "SPIKES")))
+        routing_info.add_partition_info(PartitionRoutingInfo(
+            [BaseKeyAndMask(0x100, 0xFFFFFFE0)],
+            graph.get_outgoing_edge_partition_starting_at_vertex(
+                delay_vertex, "DELAYS")))
+
+        temp_spec = tempfile.mktemp()
+        spec_writer = FileDataWriter(temp_spec)
+        spec = DataSpecificationGenerator(spec_writer, None)
+        placement = Placement(post_vertex, 0, 0, 1)
+        synaptic_manager = SynapticManager(
+            n_synapse_types=2, ring_buffer_sigma=5.0,
+            spikes_per_second=100.0, config=config)
+        synaptic_manager.synapse_dynamics = SynapseDynamicsStatic()
+        synaptic_manager.write_data_spec(
+            spec, post_app_vertex, vertex_slice, post_vertex, placement,
+            graph, app_graph, routing_info, graph_mapper, 1.0,
+            machine_time_step)
+        spec.end_specification()
+        spec_writer.close()
+        executor = DataSpecificationExecutor(
+            FileDataReader(temp_spec), 100000)
+        executor.execute()
+
+        # Read both projections back with one read of the table
+        transceiver = MockTransceiverLoadedCore(executor)
+        edges_and_infos = [
+            (machine_edge, direct_info), (machine_edge, delayed_info)]
+        blocks = synaptic_manager.read_synaptic_blocks_from_machine(
+            transceiver, placement, edges_and_infos, graph_mapper,
+            routing_info, False)
+        assert len(blocks[machine_edge, delayed_info]) == 2
+
+        direct = synaptic_manager.get_connections_from_blocks(
+            placement, machine_edge, graph_mapper, direct_info,
+            blocks[machine_edge, direct_info], machine_time_step)
+        assert list(direct["source"]) == list(range(10))
+        assert list(direct["target"]) == list(range(10))
+        assert all(direct["weight"] == 1.5)
+        assert all(direct["delay"] == 1.0)
+
+        # The connections read match those generated and written
+        delayed = synaptic_manager.get_connections_from_blocks(
+            placement, machine_edge, graph_mapper, delayed_info,
+            blocks[machine_edge, delayed_info], machine_time_step)
+        expected = simulator.synaptic_block_cache.get_block(
+            delayed_info, [vertex_slice], 0, [vertex_slice], 0,
+            vertex_slice, vertex_slice)
+        assert numpy.any(expected["delay"] > 16)
+        assert numpy.any(expected["delay"] <= 16)
+
+        def in_order(conns):
+            return conns[numpy.lexsort((
+                conns["delay"], conns["target"], conns["source"]))]
+        delayed = in_order(delayed)
+        expected = in_order(expected)
+        assert len(delayed) == len(expected)
+        assert numpy.array_equal(delayed["source"], expected["source"])
+        assert numpy.array_equal(delayed["target"], expected["target"])
+        assert numpy.allclose(delayed["weight"], 2.5)
+        assert numpy.array_equal(
+            delayed["delay"], numpy.rint(expected["delay"]))
+
     def test_set_synapse_dynamics(self):
         MockSimulator.setup()
         default_config_paths = os.path.join(
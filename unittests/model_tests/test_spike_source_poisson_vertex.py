@@ -0,0 +1,153 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import struct
+import tempfile
+import numpy
+import pytest
+from spinn_machine import SDRAM
+from pacman.executor.injection_decorator import injection_context
+from pacman.model.graphs.common import GraphMapper, Slice
+from pacman.model.graphs.machine import MachineGraph
+from pacman.model.placements import Placement
+from pacman.model.routing_info import RoutingInfo
+from spinn_storage_handlers import FileDataWriter, FileDataReader
+from data_specification import (
+    DataSpecificationGenerator, DataSpecificationExecutor)
+from data_specification.constants import MAX_MEM_REGIONS
+from spynnaker.pyNN.exceptions import MemReadException
+from spynnaker.pyNN.models.spike_source import SpikeSourcePoisson
+from spynnaker.pyNN.models.spike_source.spike_source_poisson_vertex import (
+    SpikeSourcePoissonVertex)
+from spynnaker.pyNN.models.spike_source.spike_source_poisson_machine_vertex \
+    import SpikeSourcePoissonMachineVertex
+from unittests.mocks import MockSimulator
+
+_REGIONS = SpikeSourcePoissonMachineVertex.POISSON_SPIKE_SOURCE_REGIONS
+
+
+class _MockCPUInfo(object):
+
+    def __init__(self, user_0):
+        self.user = [user_0, 0, 0, 0]
+
+
+class _MockTransceiver(object):
+    """ The memory of a core loaded with the data of an executed data\
+        specification, as it would be by the host data loading
+    """
+
+    def __init__(self, executor):
+        self.pointer_table = executor.get_pointer_table(0)
+        self.data = bytearray()
+        self.data.extend(executor.get_header().tobytes())
+        self.data.extend(self.pointer_table.tobytes())
+        for region_id in range(MAX_MEM_REGIONS):
+            region = executor.get_region(region_id)
+            if region is not None:
+                self.data.extend(region.region_data)
+
+    def get_cpu_information_from_core(self, x, y, p):
+        return _MockCPUInfo(0)
+
+    def read_memory(self, x, y, base_address, length):
+        return self.data[base_address:base_address + length]
+
+
+def _load(vertex, vertex_slice, machine_time_step=1000):
+    """ Generate the data of a vertex and load it into a mock transceiver
+    """
+    # Add an SDRAM so max SDRAM is high enough
+    SDRAM(10000)
+    machine_vertex = vertex.create_machine_vertex(vertex_slice, None)
+    graph = MachineGraph("Test")
+    graph.add_vertex(machine_vertex)
+    graph_mapper = GraphMapper()
+    graph_mapper.add_vertex_mapping(machine_vertex, vertex_slice, vertex)
+    placement = Placement(machine_vertex, 0, 0, 1)
+
+    temp_spec = tempfile.mktemp()
+    spec_writer = FileDataWriter(temp_spec)
+    spec = DataSpecificationGenerator(spec_writer, None)
+    with injection_context({
+            "MachineTimeStep": machine_time_step,
+            "TimeScaleFactor": 1,
+            "MemoryGraphMapper": graph_mapper,
+            "MemoryRoutingInfos": RoutingInfo(),
+            "DataNTimeSteps": 100,
+            "MemoryMachineGraph": graph,
+            "FirstMachineTimeStep": 0}):
+        vertex.generate_data_specification(spec, placement)
+    spec_writer.close()
+    executor = DataSpecificationExecutor(FileDataReader(temp_spec), 100000)
+    executor.execute()
+    return _MockTransceiver(executor), placement
+
+
+def _vertex(n_neurons, **kwargs):
+    MockSimulator.setup()
+    return SpikeSourcePoissonVertex(
+        n_neurons, None, "Test", 1, 256, SpikeSourcePoisson(), **kwargs)
+
+
+def test_read_rates_match_written():
+    # Slow, fast and faster sources, with more than one rate for some
+    rates = [[0.0], [1.0, 4.0], [10.0], [50.0, 200.0, 1.0], [20000.0],
+             [40000.0, 5.0]]
+    starts = [[0], [0, 100], [0], [0, 50, 100], [0], [0, 10]]
+    vertex_slice = Slice(0, len(rates) - 1)
+    transceiver, placement = _load(
+        _vertex(len(rates), rates=rates, starts=starts), vertex_slice)
+
+    # Read into a vertex with other rates, but as many of them
+    vertex = _vertex(len(rates), starts=starts, rates=[
+        [rate * 2 + 1 for rate in neuron_rates] for neuron_rates in rates])
+    _load(vertex, vertex_slice)
+    vertex.read_parameters_from_machine(
+        transceiver, placement, vertex_slice)
+    for neuron_rates, read_rates in zip(rates, vertex.rates):
+        assert numpy.allclose(read_rates, neuron_rates, rtol=1e-3)
+
+
+def test_read_slice_of_vertex():
+    rates = [float(rate) for rate in range(0, 100, 5)]
+    vertex = _vertex(len(rates), rate=rates, start=0)
+    vertex_slice = Slice(5, 14)
+    transceiver, placement = _load(vertex, vertex_slice)
+
+    # Only the rates of the slice are read back
+    vertex.rate = [rate * 2 + 1 for rate in rates]
+    vertex.read_parameters_from_machine(
+        transceiver, placement, vertex_slice)
+    read_rates = [r[0] for r in vertex.rates]
+    assert numpy.allclose(read_rates[5:15], rates[5:15], rtol=1e-3)
+    assert numpy.allclose(
+        read_rates[:5] + read_rates[15:],
+        [rate * 2 + 1 for rate in rates[:5] + rates[15:]])
+
+
+def test_read_count_mismatch():
+    vertex = _vertex(4, rates=[[1.0], [2.0, 3.0], [4.0], [5.0]],
+                     starts=[[0], [0, 10], [0], [0]])
+    vertex_slice = Slice(0, 3)
+    transceiver, placement = _load(vertex, vertex_slice)
+
+    # Make the second record say it has a different number of rates
+    rates_address = transceiver.pointer_table[_REGIONS.RATES_REGION.value]
+    second_record = rates_address + 4 * (2 + 8)
+    struct.pack_into("<I", transceiver.data, second_record, 3)
+    with pytest.raises(MemReadException):
+        vertex.read_parameters_from_machine(
+            transceiver, placement, vertex_slice)
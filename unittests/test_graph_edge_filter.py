@@ -0,0 +1,256 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from spinn_utilities.overrides import overrides
+from pacman.model.constraints.key_allocator_constraints import (
+    ContiguousKeyRangeContraint)
+from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.graphs.common import GraphMapper, Slice
+from pacman.model.graphs.machine import MachineGraph, SimpleMachineVertex
+from pacman.model.resources import ResourceContainer
+from spynnaker.pyNN.models.neural_projections import (
+    ProjectionApplicationEdge, SynapseInformation)
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AllToAllConnector, OneToOneConnector)
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    SynapseDynamicsStatic)
+from spynnaker.pyNN.overridden_pacman_functions.graph_edge_filter import (
+    GraphEdgeFilter)
+from unittests.mocks import MockPopulation, MockSimulator
+
+_PARTITION = "SPIKE"
+
+
+class _MockView(MockPopulation):
+    """ A view of a population, holding the indices of the neurons in it
+    """
+
+    def __init__(self, indexes, label):
+        super(_MockView, self).__init__(len(indexes), label)
+        self._indexes = list(indexes)
+
+
+class _SimpleApplicationVertex(ApplicationVertex):
+
+    def __init__(self, n_atoms, label):
+        super(_SimpleApplicationVertex, self).__init__(label=label)
+        self._n_atoms = n_atoms
+
+    @property
+    @overrides(ApplicationVertex.n_atoms)
+    def n_atoms(self):
+        return self._n_atoms
+
+    @overrides(ApplicationVertex.create_machine_vertex)
+    def create_machine_vertex(
+            self, vertex_slice, resources_required, label=None,
+            constraints=None):
+        return SimpleMachineVertex(resources_required, label, constraints)
+
+    @overrides(ApplicationVertex.get_resources_used_by_atoms)
+    def get_resources_used_by_atoms(self, vertex_slice):
+        return ResourceContainer()
+
+
+def _one_to_one_filtered(synapse_info, pre_slice, post_slice):
+    """ Whether a one-to-one connector leaves the slices unconnected, worked\
+        out for the single pair of slices of a machine edge, as the graph\
+        edge filter did before it worked on all the slices at once
+    """
+    # pylint: disable=protected-access
+    pre_lo = pre_slice.lo_atom
+    pre_hi = pre_slice.hi_atom
+    post_lo = post_slice.lo_atom
+    post_hi = post_slice.hi_atom
+    if synapse_info.prepop_is_view and synapse_info.postpop_is_view:
+        prepop_lo = synapse_info.pre_population._indexes[0]
+        prepop_hi = synapse_info.pre_population._indexes[-1]
+        postpop_lo = synapse_info.post_population._indexes[0]
+        postpop_hi = synapse_info.post_population._indexes[-1]
+        return ((pre_hi - prepop_lo < post_lo - postpop_lo) or
+                (pre_lo - prepop_lo > post_hi - postpop_lo) or
+                (pre_hi < prepop_lo) or (pre_lo > prepop_hi) or
+                (post_hi < postpop_lo) or (post_lo > postpop_hi))
+    if synapse_info.prepop_is_view:
+        prepop_lo = synapse_info.pre_population._indexes[0]
+        prepop_hi = synapse_info.pre_population._indexes[-1]
+        return ((pre_hi - prepop_lo < post_lo) or
+                (pre_lo - prepop_lo > post_hi) or
+                (pre_hi < prepop_lo) or (pre_lo > prepop_hi))
+    if synapse_info.postpop_is_view:
+        postpop_lo = synapse_info.post_population._indexes[0]
+        postpop_hi = synapse_info.post_population._indexes[-1]
+        return ((pre_hi < post_lo - postpop_lo) or
+                (pre_lo > post_hi - postpop_lo) or
+                (post_hi < postpop_lo) or (post_lo > postpop_hi))
+    return pre_hi < post_lo or pre_lo > post_hi
+
+
+def _edge_filtered(synapse_infos, pre_slice, post_slice):
+    """ Whether a machine edge was filtered, one edge at a time; only\
+        one-to-one connectors could be filtered, and the edge was filtered\
+        only if every connector on it was
+    """
+    return all(
+        isinstance(synapse_info.connector, OneToOneConnector) and
+        _one_to_one_filtered(synapse_info, pre_slice, post_slice)
+        for synapse_info in synapse_infos)
+
+
+def _slices(n_atoms, n_per_slice):
+    return [Slice(lo, min(lo + n_per_slice, n_atoms) - 1)
+            for lo in range(0, n_atoms, n_per_slice)]
+
+
+def _population(n_atoms, view):
+    if view is None:
+        return MockPopulation(n_atoms, "population"), False
+    return _MockView(range(*view), "view"), True
+
+
+def _synapse_info(connector, pre_view=None, post_view=None):
+    pre_population, prepop_is_view = _population(100, pre_view)
+    post_population, postpop_is_view = _population(80, post_view)
+    return SynapseInformation(
+        connector, pre_population, post_population, prepop_is_view,
+        postpop_is_view, None, SynapseDynamicsStatic(), 0)
+
+
+# The views as (first, last + 1) of the neurons, or None for no view
+_VIEWS = [
+    (None, None), ((20, 70), None), (None, (10, 60)), ((20, 70), (10, 60)),
+    ((85, 100), (0, 15)), ((0, 10), (70, 80))]
+
+
+@pytest.mark.parametrize("pre_view,post_view", _VIEWS)
+def test_one_to_one_slice_pairs(pre_view, post_view):
+    MockSimulator.setup()
+    synapse_info = _synapse_info(OneToOneConnector(None), pre_view, post_view)
+    pre_slices = _slices(100, 13)
+    post_slices = _slices(80, 7)
+    connected = synapse_info.connector.get_connected_slice_pairs(
+        pre_slices, post_slices, synapse_info)
+    assert connected.shape == (len(pre_slices), len(post_slices))
+    for i, pre_slice in enumerate(pre_slices):
+        for j, post_slice in enumerate(post_slices):
+            assert connected[i, j] != _one_to_one_filtered(
+                synapse_info, pre_slice, post_slice)
+
+    # The machine edges work out the same for a single pair of slices
+    for i, pre_slice in enumerate(pre_slices):
+        assert numpy.array_equal(
+            synapse_info.connector.get_connected_slice_pairs(
+                [pre_slice], post_slices, synapse_info)[0], connected[i])
+
+
+@pytest.mark.parametrize("pre_view,post_view", _VIEWS)
+def test_all_to_all_slice_pairs(pre_view, post_view):
+    MockSimulator.setup()
+    synapse_info = _synapse_info(AllToAllConnector(), pre_view, post_view)
+    app_edge = ProjectionApplicationEdge(
+        _SimpleApplicationVertex(100, "pre"),
+        _SimpleApplicationVertex(80, "post"), synapse_info)
+    assert not numpy.any(app_edge.filter_slice_pairs(
+        _slices(100, 13), _slices(80, 7)))
+
+
+def _make_graph(projections):
+    """ Make a machine graph with an edge between every pair of slices of\
+        each application edge
+
+    :param projections: lists of synapse information for each edge
+    """
+    machine_graph = MachineGraph("Test")
+    graph_mapper = GraphMapper()
+    pre_vertex = _SimpleApplicationVertex(100, "pre")
+    pre_machine_vertices = list()
+    for vertex_slice in _slices(100, 13):
+        machine_vertex = pre_vertex.create_machine_vertex(vertex_slice, None)
+        machine_graph.add_vertex(machine_vertex)
+        graph_mapper.add_vertex_mapping(
+            machine_vertex, vertex_slice, pre_vertex)
+        pre_machine_vertices.append(machine_vertex)
+
+    app_edges = list()
+    for i, synapse_infos in enumerate(projections):
+        post_vertex = _SimpleApplicationVertex(80, "post{}".format(i))
+        post_machine_vertices = list()
+        for vertex_slice in _slices(80, 7):
+            machine_vertex = post_vertex.create_machine_vertex(
+                vertex_slice, None)
+            machine_graph.add_vertex(machine_vertex)
+            graph_mapper.add_vertex_mapping(
+                machine_vertex, vertex_slice, post_vertex)
+            post_machine_vertices.append(machine_vertex)
+        app_edge = ProjectionApplicationEdge(
+            pre_vertex, post_vertex, synapse_infos[0])
+        for synapse_info in synapse_infos[1:]:
+            app_edge.add_synapse_information(synapse_info)
+        app_edges.append(app_edge)
+        for pre_machine_vertex in pre_machine_vertices:
+            for post_machine_vertex in post_machine_vertices:
+                edge = app_edge.create_machine_edge(
+                    pre_machine_vertex, post_machine_vertex, None)
+                machine_graph.add_edge(edge, _PARTITION)
+                graph_mapper.add_edge_mapping(edge, app_edge)
+
+    for machine_vertex in pre_machine_vertices:
+        machine_graph.get_outgoing_edge_partition_starting_at_vertex(
+            machine_vertex, _PARTITION).add_constraint(
+                ContiguousKeyRangeContraint())
+    return machine_graph, graph_mapper, app_edges
+
+
+def test_filter_matches_per_edge():
+    MockSimulator.setup()
+    projections = [
+        [_synapse_info(OneToOneConnector(None), pre_view, post_view)]
+        for pre_view, post_view in _VIEWS]
+
+    # An edge is only filtered if none of its connectors connect the slices
+    projections.append([
+        _synapse_info(OneToOneConnector(None), (20, 70), (10, 60)),
+        _synapse_info(OneToOneConnector(None), (85, 100), (0, 15))])
+    projections.append([
+        _synapse_info(OneToOneConnector(None), (20, 70), (10, 60)),
+        _synapse_info(AllToAllConnector(), (20, 70), (10, 60))])
+    machine_graph, graph_mapper, app_edges = _make_graph(projections)
+
+    new_graph, new_mapper = GraphEdgeFilter()(machine_graph, graph_mapper)
+
+    assert set(new_graph.vertices) == set(machine_graph.vertices)
+    kept = set(new_graph.edges)
+    n_filtered = {app_edge: 0 for app_edge in app_edges}
+    for edge in machine_graph.edges:
+        app_edge = graph_mapper.get_application_edge(edge)
+        filtered = _edge_filtered(
+            app_edge.synapse_information,
+            graph_mapper.get_slice(edge.pre_vertex),
+            graph_mapper.get_slice(edge.post_vertex))
+        assert (edge not in kept) == filtered
+        if filtered:
+            n_filtered[app_edge] += 1
+        else:
+            assert new_mapper.get_application_edge(edge) == app_edge
+    for app_edge in app_edges:
+        assert app_edge.n_filtered_machine_edges == n_filtered[app_edge]
+    assert 0 < len(kept) < len(list(machine_graph.edges))
+
+    # The partitions keep their constraints
+    for partition in new_graph.outgoing_edge_partitions:
+        assert any(isinstance(constraint, ContiguousKeyRangeContraint)
+                   for constraint in partition.constraints)
@@ -13,8 +13,15 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy
+import pytest
+from mock import patch
+from spinn_front_end_common.utilities import globals_variables
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
 from spynnaker.pyNN.models.neuron.builds import IFCurrExpBase
 from spynnaker.pyNN.models.pynn_population_common import PyNNPopulationCommon
+from spynnaker.pyNN.models.recording_common import RecordingCommon
 from unittests.mocks import MockSimulator
 
 
@@ -38,3 +45,108 @@ def test_selector():
     values = pop_1.get_by_selector([1, 3, 4], ["cm", "v_thresh"])
     assert [1.0, 1.0, 1.0] == values['cm']
     assert [-50.0, -50.0, -50.0] == values["v_thresh"]
+
+
+class _MockRanSimulator(MockSimulator):
+
+    def __init__(self, use_virtual_board, reference_engine=None,
+                 run_time=1000.0):
+        super(_MockRanSimulator, self).__init__()
+        self.__use_virtual_board = use_virtual_board
+        self.__reference_engine = reference_engine
+        self.__run_time = run_time
+        self.placements = object()
+        self.graph_mapper = object()
+        self.buffer_manager = object()
+
+    @property
+    def has_ran(self):
+        return True
+
+    @property
+    def use_virtual_board(self):
+        return self.__use_virtual_board
+
+    @property
+    def reference_engine(self):
+        return self.__reference_engine
+
+    def get_current_time(self):
+        return self.__run_time
+
+
+class _MockReferenceEngine(object):
+
+    def __init__(self, spikes):
+        self.spikes = spikes
+
+    def get_spikes(self, vertex):
+        # pylint: disable=unused-argument
+        return self.spikes
+
+
+def _spiking_population(simulator):
+    globals_variables.set_simulator(simulator)
+    pop = PyNNPopulationCommon(spinnaker_control=simulator, size=5,
+                               label="Test", constraints=None,
+                               model=IFCurrExpBase(), structure=None,
+                               initial_values=None)
+    pop._vertex.set_recording_spikes()
+    return pop
+
+
+def test_spike_counts_from_spikes():
+    pop = _spiking_population(MockSimulator.setup())
+    spikes = numpy.array([[0, 1.0], [3, 2.0], [0, 4.0], [4, 4.0]])
+    assert pop.get_spike_counts(spikes) == {0: 2, 1: 0, 2: 0, 3: 1, 4: 1}
+    assert list(pop.get_spike_counts(spikes, as_array=True)) == [
+        2, 0, 0, 1, 1]
+
+
+def test_spike_counts_from_vertex():
+    MockSimulator.setup()
+    simulator = _MockRanSimulator(use_virtual_board=False)
+    pop = _spiking_population(simulator)
+    counts = numpy.array([3, 0, 1, 0, 2])
+    with patch.object(
+            AbstractPopulationVertex, "get_spike_counts",
+            return_value=counts) as get_spike_counts:
+        assert pop.get_spike_counts() == {0: 3, 1: 0, 2: 1, 3: 0, 4: 2}
+
+    # The vertex counts the spikes itself, without getting them
+    get_spike_counts.assert_called_once_with(
+        simulator.placements, simulator.graph_mapper,
+        simulator.buffer_manager, simulator.machine_time_step)
+
+
+def test_spike_counts_from_reference_engine():
+    MockSimulator.setup()
+    engine = _MockReferenceEngine(numpy.array([[1, 1.0], [1, 2.0], [2, 3.0]]))
+    pop = _spiking_population(
+        _MockRanSimulator(use_virtual_board=True, reference_engine=engine))
+    assert list(pop.get_spike_counts(as_array=True)) == [0, 2, 1, 0, 0]
+
+    # Nothing is counted on a virtual board without a reference engine
+    pop = _spiking_population(_MockRanSimulator(use_virtual_board=True))
+    assert list(pop.get_spike_counts(as_array=True)) == [0, 0, 0, 0, 0]
+
+
+def test_spike_counts_not_recording():
+    pop = _spiking_population(MockSimulator.setup())
+    pop._vertex.set_recording_spikes(False)
+    with pytest.raises(ConfigurationException):
+        pop.get_spike_counts()
+
+
+def test_mean_rates():
+    MockSimulator.setup()
+    engine = _MockReferenceEngine(numpy.array([[1, 1.0], [1, 2.0], [2, 3.0]]))
+    pop = _spiking_population(_MockRanSimulator(
+        use_virtual_board=True, reference_engine=engine, run_time=2000.0))
+    assert list(pop.get_mean_rates(as_array=True)) == [0, 1.0, 0.5, 0, 0]
+    assert pop.get_mean_rates() == {0: 0.0, 1: 1.0, 2: 0.5, 3: 0.0, 4: 0.0}
+
+    # The recorder counts through the population
+    recorder = RecordingCommon(pop)
+    assert list(recorder._get_spike_counts()) == [0, 2, 1, 0, 0]
+    assert list(recorder._get_mean_rates()) == [0, 1.0, 0.5, 0, 0]
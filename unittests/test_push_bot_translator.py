@@ -0,0 +1,226 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from threading import Event, enumerate as enumerate_threads
+import time
+import numpy
+from spinn_front_end_common.utility_models import MultiCastCommand
+from spinn_front_end_common.utilities.connections import LiveEventConnection
+from spinn_front_end_common.utilities.database import DatabaseConnection
+from mock import patch
+from spynnaker.pyNN.connections import (
+    CoalescingCommandQueue, EthernetCommandConnection,
+    EthernetControlConnection)
+from spynnaker.pyNN.external_devices_models.push_bot.push_bot_ethernet \
+    import PushBotTranslator
+from spynnaker.pyNN.protocols import (
+    MunichIoEthernetProtocol, MunichIoSpiNNakerLinkProtocol)
+
+
+class _MockWIFIConnection(object):
+    def __init__(self):
+        self.sent = list()
+        self.can_send = Event()
+        self.can_send.set()
+        self.sending = Event()
+
+    def send(self, data):
+        self.sending.set()
+        self.can_send.wait()
+        self.sent.append(data)
+
+
+def _protocol():
+    return MunichIoSpiNNakerLinkProtocol(
+        MunichIoSpiNNakerLinkProtocol.MODES.PUSH_BOT)
+
+
+def _n_queue_threads():
+    return sum(1 for thread in enumerate_threads()
+               if thread.name == "Coalescing command queue thread")
+
+
+def test_queue_coalesces_commands():
+    connection = _MockWIFIConnection()
+    connection.can_send.clear()
+    queue = CoalescingCommandQueue(connection.send)
+    try:
+        queue.put("first", [b"1"])
+        assert connection.sending.wait(10.0)
+
+        # While the first is being sent, the others wait and are replaced
+        queue.put("a", [b"a1"])
+        queue.put("b", [b"b1", b"b2"])
+        queue.put(None, [b"n1"])
+        queue.put("a", [b"a2"])
+        queue.put(None, [b"n2"])
+        assert queue.n_pending == 5
+        connection.can_send.set()
+        assert queue.flush(10.0)
+        assert queue.n_pending == 0
+    finally:
+        connection.can_send.set()
+        queue.close()
+    assert connection.sent == [b"1", b"b1", b"b2", b"n1", b"a2", b"n2"]
+
+
+def test_translator_dispatch():
+    protocol = _protocol()
+    connection = _MockWIFIConnection()
+    translator = PushBotTranslator(protocol, connection)
+    try:
+        translator.translate_control_packet(MultiCastCommand(
+            protocol.push_bot_motor_0_permanent_key, (2 ** 32) - 10))
+        translator.translate_control_packet(MultiCastCommand(
+            protocol.push_bot_led_total_period_key, 1000))
+        translator.translate_control_packet(MultiCastCommand(
+            protocol.enable_disable_motor_key, 1))
+        translator.translate_control_packet(MultiCastCommand(
+            protocol.set_mode().key, protocol.set_mode().payload))
+        translator.translate_control_packet(MultiCastCommand(0xFFFFFFFF, 1))
+        assert translator.flush(10.0)
+    finally:
+        translator.close()
+    assert connection.sent == [
+        MunichIoEthernetProtocol.motor_0_permanent_velocity(-10),
+        MunichIoEthernetProtocol.led_total_period(1000),
+        MunichIoEthernetProtocol.enable_motor()]
+
+
+def test_translator_keeps_latest_speed():
+    protocol = _protocol()
+    connection = _MockWIFIConnection()
+    connection.can_send.clear()
+    translator = PushBotTranslator(protocol, connection)
+    try:
+        translator.translate_control_packet(MultiCastCommand(
+            protocol.push_bot_laser_set_frequency_key, 5))
+        assert connection.sending.wait(10.0)
+        translator.translate_control_packets([
+            MultiCastCommand(protocol.push_bot_motor_1_permanent_key, speed)
+            for speed in range(20)])
+        connection.can_send.set()
+        assert translator.flush(10.0)
+    finally:
+        connection.can_send.set()
+        translator.close()
+    assert connection.sent == [
+        MunichIoEthernetProtocol.laser_frequency(5),
+        MunichIoEthernetProtocol.motor_1_permanent_velocity(19)]
+
+
+def test_retina_disable_does_not_block():
+    protocol = _protocol()
+    connection = _MockWIFIConnection()
+    translator = PushBotTranslator(protocol, connection)
+    try:
+        start = time.time()
+        translator.translate_control_packet(MultiCastCommand(
+            protocol.disable_retina_key))
+        translator.translate_control_packet(MultiCastCommand(
+            protocol.push_bot_speaker_set_tone_key, 440))
+        assert time.time() - start < 0.05
+        assert translator.flush(10.0)
+        assert time.time() - start >= 0.1
+    finally:
+        translator.close()
+    assert connection.sent == [
+        MunichIoEthernetProtocol.disable_retina(),
+        MunichIoEthernetProtocol.speaker_frequency(440)]
+
+
+def test_translator_queue_started_when_needed():
+    protocol = _protocol()
+    connection = _MockWIFIConnection()
+    n_threads = _n_queue_threads()
+    translator = PushBotTranslator(protocol, connection)
+    try:
+        assert _n_queue_threads() == n_threads
+        assert translator.flush(10.0)
+        translator.translate_control_packet(MultiCastCommand(
+            protocol.push_bot_speaker_set_tone_key, 440))
+        assert _n_queue_threads() == n_threads + 1
+
+        # Closing sends what is waiting, and sending again starts again
+        translator.close()
+        assert _n_queue_threads() == n_threads
+        translator.translate_control_packet(MultiCastCommand(
+            protocol.push_bot_speaker_set_tone_key, 220))
+    finally:
+        translator.close()
+    assert _n_queue_threads() == n_threads
+    assert connection.sent == [
+        MunichIoEthernetProtocol.speaker_frequency(440),
+        MunichIoEthernetProtocol.speaker_frequency(220)]
+
+
+def test_command_connection_closes_translator():
+    protocol = _protocol()
+    wifi_connection = _MockWIFIConnection()
+    n_threads = _n_queue_threads()
+    translator = PushBotTranslator(protocol, wifi_connection)
+    with patch.object(DatabaseConnection, "__init__", return_value=None):
+        connection = EthernetCommandConnection(translator)
+    try:
+        translator.translate_control_packet(MultiCastCommand(
+            protocol.push_bot_led_total_period_key, 1000))
+
+        # The commands are sent and the queue stopped when the run stops
+        connection._stop_pause_callback()
+        assert _n_queue_threads() == n_threads
+        assert wifi_connection.sent == [
+            MunichIoEthernetProtocol.led_total_period(1000)]
+        translator.translate_control_packet(MultiCastCommand(
+            protocol.push_bot_led_total_period_key, 500))
+    finally:
+        with patch.object(DatabaseConnection, "close"):
+            connection.close()
+    assert _n_queue_threads() == n_threads
+    assert wifi_connection.sent[-1] == \
+        MunichIoEthernetProtocol.led_total_period(500)
+
+
+class _MockTranslator(object):
+    def __init__(self):
+        self.packets = list()
+        self.batches = list()
+        self.closed = False
+
+    def translate_control_packet(self, multicast_packet):
+        self.packets.append(
+            (multicast_packet.key, multicast_packet.payload))
+
+    def translate_control_packets(self, multicast_packets):
+        self.batches.append([packet.key for packet in multicast_packets])
+
+    def close(self):
+        self.closed = True
+
+
+def test_control_connection_batches():
+    translator = _MockTranslator()
+    with patch.object(LiveEventConnection, "add_receive_callback"):
+        connection = EthernetControlConnection(
+            translator, "robot", "gatherer", local_port=0)
+    try:
+        connection._translate("robot", 10, [1, 2, 3])
+        connection._translate("robot", 11, numpy.array([4]))
+        connection._translate("robot", 5)
+        connection._translate("robot", 6, 7)
+    finally:
+        connection.close()
+    assert translator.batches == [[1, 2, 3], [4]]
+    assert translator.packets == [(5, None), (6, 7)]
+    assert translator.closed
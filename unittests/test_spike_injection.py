@@ -0,0 +1,214 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+from threading import Event
+import numpy
+import pytest
+from mock import patch
+from six.moves.queue import Full
+from spinnman.messages.eieio import EIEIOType
+from spinnman.messages.eieio.data_messages import EIEIODataMessage
+from spinnman.messages.eieio.create_eieio_data import read_eieio_data_message
+from spinn_front_end_common.utilities.connections import LiveEventConnection
+from spynnaker.pyNN.connections import (
+    SpikeInjectionQueue, SpikeRingBuffer, SpynnakerLiveSpikesConnection)
+from spynnaker.pyNN.connections.spynnaker_live_spikes_connection import (
+    pack_spike_messages)
+
+
+def _unpack(messages):
+    keys = list()
+    payloads = list()
+    for message in messages:
+        packet = read_eieio_data_message(message.bytestring, 0)
+        while packet.is_next_element:
+            element = packet.next_element
+            keys.append(element.key)
+            payloads.append(getattr(element, "payload", None))
+    return keys, payloads
+
+
+@pytest.mark.parametrize("full_keys,eieio_type", [
+    (False, EIEIOType.KEY_16_BIT), (True, EIEIOType.KEY_32_BIT)])
+def test_pack_keys(full_keys, eieio_type):
+    keys = numpy.arange(1000) * (1001 if full_keys else 13)
+    messages = pack_spike_messages(keys, full_keys=full_keys)
+
+    # The packets are as full as possible
+    max_keys = EIEIODataMessage.create(eieio_type).max_n_elements
+    assert len(messages) == -(-len(keys) // max_keys)
+    assert _unpack(messages)[0] == keys.tolist()
+
+    # The same packets as adding the keys one at a time
+    expected = EIEIODataMessage.create(eieio_type)
+    for key in keys[:max_keys]:
+        expected.add_key(int(key))
+    assert messages[0].bytestring == expected.bytestring
+
+
+def test_pack_keys_and_payloads():
+    keys = numpy.arange(100) + 0x10000
+    payloads = numpy.arange(100) * 3
+    messages = pack_spike_messages(keys, payloads)
+    assert len(messages) == 4
+    unpacked_keys, unpacked_payloads = _unpack(messages)
+    assert unpacked_keys == keys.tolist()
+    assert unpacked_payloads == payloads.tolist()
+
+
+class _MockConnection(object):
+    def __init__(self):
+        self.sent = list()
+        self.can_send = Event()
+        self.can_send.set()
+
+    def send_spike_array(
+            self, label, neuron_ids, payloads=None, send_full_keys=False):
+        self.can_send.wait()
+        self.sent.append((label, neuron_ids.tolist(), payloads))
+
+
+def test_queue_batches_by_label():
+    connection = _MockConnection()
+    queue = SpikeInjectionQueue(connection, batch_window=60.0)
+    try:
+        queue.put("a", [1, 2])
+        queue.put("b", numpy.array([3]))
+        queue.put("a", [4])
+        queue.put("a", [5], payloads=[6])
+        assert queue.n_pending == 5
+        assert not connection.sent
+        assert queue.flush(10.0)
+        assert queue.n_pending == 0
+    finally:
+        queue.close()
+    sent = sorted(
+        (label, ids, None if payloads is None else payloads.tolist())
+        for label, ids, payloads in connection.sent)
+    assert sent == [
+        ("a", [1, 2, 4], None), ("a", [5], [6]), ("b", [3], None)]
+
+
+def test_queue_back_pressure():
+    connection = _MockConnection()
+    connection.can_send.clear()
+    queue = SpikeInjectionQueue(
+        connection, batch_window=0.0, max_pending_spikes=10)
+    try:
+        # Too many spikes are let in when nothing else is waiting
+        queue.put("a", numpy.arange(20))
+        with pytest.raises(Full):
+            queue.put_nowait("a", [1])
+        with pytest.raises(Full):
+            queue.put("a", [1], timeout=0.01)
+        connection.can_send.set()
+        queue.put("a", [1], timeout=10.0)
+        assert queue.flush(10.0)
+    finally:
+        connection.can_send.set()
+        queue.close()
+    assert [len(ids) for _, ids, _ in connection.sent] == [20, 1]
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 5), reason="asyncio needs Python 3.5")
+def test_queue_put_async():
+    # Only importable on Python 3
+    import asyncio
+    from spynnaker.pyNN.connections.spike_injection_async import (
+        put_spikes_async)
+    connection = _MockConnection()
+    queue = SpikeInjectionQueue(connection, batch_window=0.0)
+    try:
+        loop = asyncio.new_event_loop()
+        try:
+            for i in range(3):
+                loop.run_until_complete(put_spikes_async(
+                    queue, "a", [i], loop=loop))
+        finally:
+            loop.close()
+    finally:
+        queue.close()
+    assert sorted(
+        i for _, ids, _ in connection.sent for i in ids) == [0, 1, 2]
+
+
+def test_ring_buffer():
+    spike_buffer = SpikeRingBuffer(10)
+    times, ids = spike_buffer.get_since(0)
+    assert len(times) == 0 and len(ids) == 0
+    for time in range(6):
+        spike_buffer.add(time, [time * 10, time * 10 + 1])
+    assert spike_buffer.n_added == 12
+
+    # The oldest two spikes have been overwritten
+    times, ids = spike_buffer.get_since(0)
+    assert times.tolist() == [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+    assert ids.tolist() == [10, 11, 20, 21, 30, 31, 40, 41, 50, 51]
+    times, ids = spike_buffer.get_since(4)
+    assert times.tolist() == [4, 4, 5, 5]
+    assert ids.tolist() == [40, 41, 50, 51]
+    times, ids = spike_buffer.get_from_sequence(9)
+    assert ids.tolist() == [41, 50, 51]
+
+    # The results are views, not copies
+    assert numpy.shares_memory(
+        spike_buffer.get_since(0)[0], spike_buffer.get_since(3)[0])
+
+    # Only the last spikes fit when too many are added at once
+    spike_buffer.add(9, numpy.arange(25))
+    assert spike_buffer.n_added == 37
+    assert spike_buffer.get_since(0)[1].tolist() == list(range(15, 25))
+
+
+def test_ring_buffer_out_of_order():
+    spike_buffer = SpikeRingBuffer(10)
+    spike_buffer.add(5, [1])
+    spike_buffer.add(3, [2])
+    spike_buffer.add(6, [3])
+    assert spike_buffer.get_since(4)[1].tolist() == [1, 2, 3]
+    assert spike_buffer.get_since(6)[1].tolist() == [3]
+
+
+def test_receive_array_callbacks():
+    callbacks = dict()
+
+    def add_receive_callback(self, label, callback, translate_key=True):
+        callbacks[label] = callback
+
+    received = list()
+    connection = SpynnakerLiveSpikesConnection(
+        receive_labels=["pop"], local_port=0)
+    try:
+        with patch.object(
+                LiveEventConnection, "add_receive_callback",
+                add_receive_callback):
+            connection.add_receive_array_callback(
+                "pop", lambda label, times, ids: received.append(
+                    (label, times.tolist(), ids.tolist())), window=10)
+        receive = callbacks["pop"]
+        receive("pop", 1, [1, 2])
+        receive("pop", 9, [3])
+        assert not received
+        receive("pop", 12, [4])
+        assert received == [("pop", [1, 1, 9], [1, 2, 3])]
+        receive("pop", 25, [5])
+        assert received[-1] == ("pop", [12], [4])
+        times, ids = connection.get_spikes_since("pop", 9)
+        assert times.tolist() == [9, 12, 25]
+        assert ids.tolist() == [3, 4, 5]
+    finally:
+        connection.close()
@@ -0,0 +1,87 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import os
+from spynnaker.pyNN.utilities import host_profiler
+from spynnaker.pyNN.utilities.host_profiler import profile_phase
+
+
+def _profile(trace_memory):
+    host_profiler.clear()
+    host_profiler.enable(trace_memory)
+    try:
+        with profile_phase("outer", "vertex") as outer:
+            outer.add_bytes(4)
+            for _ in range(2):
+                with profile_phase("inner") as inner:
+                    data = bytearray(100000)
+                    inner.add_bytes(len(data))
+                    del data
+    finally:
+        host_profiler.disable()
+    return host_profiler.get_records()
+
+
+def test_disabled():
+    host_profiler.clear()
+    with profile_phase("ignored", "vertex") as phase:
+        phase.add_bytes(10)
+    assert not host_profiler.is_enabled()
+    assert host_profiler.get_records() == []
+
+
+def test_nested_phases():
+    records = _profile(trace_memory=False)
+    assert [r.name for r in records] == ["inner", "inner", "outer"]
+    inner, _, outer = records
+    assert inner.stack == ("outer(vertex)", )
+    assert outer.stack == ()
+    assert outer.frame == "outer(vertex)"
+    assert outer.n_bytes == 4
+    assert inner.n_bytes == 100000
+    assert inner.peak_bytes is None
+    assert outer.self_time <= outer.time
+    assert outer.time >= records[0].time + records[1].time
+
+    summary = host_profiler.summarise(records)
+    assert list(summary) == ["inner", "outer"]
+    assert summary["inner"]["count"] == 2
+    assert summary["inner"]["n_bytes"] == 200000
+
+
+def test_peak_memory():
+    records = _profile(trace_memory=True)
+    inner, _, outer = records
+    assert inner.peak_bytes >= 100000
+    assert outer.peak_bytes >= inner.peak_bytes
+
+
+def test_write_profile(tmpdir):
+    records = _profile(trace_memory=False)
+    folder = str(tmpdir)
+    host_profiler.write_profile(folder)
+
+    with open(os.path.join(folder, host_profiler.PROFILE_FILENAME)) as f:
+        profile = json.load(f)
+    assert profile["phases"]["outer"]["count"] == 1
+    assert [r["phase"] for r in profile["records"]] == [
+        r.name for r in records]
+
+    with open(os.path.join(folder, host_profiler.FOLDED_FILENAME)) as f:
+        lines = f.read().splitlines()
+    stacks = [line.rsplit(" ", 1)[0] for line in lines]
+    assert stacks == ["outer(vertex)", "outer(vertex);inner"]
+    assert all(int(line.rsplit(" ", 1)[1]) >= 0 for line in lines)
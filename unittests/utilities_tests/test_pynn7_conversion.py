@@ -0,0 +1,59 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import pytest
+from spynnaker.pyNN.utilities.utility_calls import (
+    iter_matrix_to_pynn7, matrix_to_pynn7)
+
+
+def _column_stacked(data, ids, sampling_interval):
+    """ The PyNN 0.7 format data made by stacking whole columns
+    """
+    n_times = len(data)
+    n_neurons = len(ids)
+    times = [i * sampling_interval for i in range(n_times)]
+    return numpy.column_stack((
+        numpy.repeat(ids, n_times, 0),
+        numpy.tile(times, n_neurons),
+        numpy.transpose(data).reshape(n_times * n_neurons)))
+
+
+@pytest.mark.parametrize("n_times,n_neurons", [(50, 7), (1, 3), (10, 1)])
+def test_matches_column_stack(n_times, n_neurons):
+    data = numpy.random.RandomState(0).uniform(-70, -50, (n_times, n_neurons))
+    ids = numpy.arange(n_neurons) * 3 + 2
+    expected = _column_stacked(data, ids, 0.1)
+    assert numpy.array_equal(matrix_to_pynn7(data, ids, 0.1), expected)
+
+    # The chunks hold whole neurons, and join up to the same rows
+    for max_rows in (1, n_times, n_times * 2 + 1, 10000):
+        chunks = list(iter_matrix_to_pynn7(data, ids, 0.1, max_rows=max_rows))
+        assert all(len(chunk) % n_times == 0 for chunk in chunks)
+        assert all(
+            len(chunk) <= max(max_rows, n_times) for chunk in chunks)
+        assert numpy.array_equal(numpy.concatenate(chunks), expected)
+
+
+def test_float32():
+    data = numpy.arange(12, dtype="float64").reshape((4, 3)) * 0.5
+    rows = matrix_to_pynn7(data, [0, 1, 2], 1.0, dtype=numpy.float32)
+    assert rows.dtype == numpy.float32
+    assert numpy.array_equal(rows, _column_stacked(data, [0, 1, 2], 1.0))
+
+
+def test_empty():
+    assert matrix_to_pynn7(numpy.zeros((0, 3)), [], 1.0).shape == (0, 3)
+    assert not list(iter_matrix_to_pynn7(numpy.zeros((0, 3)), [], 1.0))
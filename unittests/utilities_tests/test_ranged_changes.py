@@ -0,0 +1,52 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spynnaker.pyNN.utilities.ranged import (
+    SpynnakerRangeDictionary, SpynnakerRangedList)
+
+
+def test_list_tracks_changed_ranges():
+    ranged_list = SpynnakerRangedList(100, 1.0)
+    assert not ranged_list.has_changes()
+
+    ranged_list[10:20] = 2.0
+    ranged_list[20] = 3.0
+    ranged_list[[50, 52]] = 4.0
+    assert ranged_list.changed_ranges == [(10, 21), (50, 51), (52, 53)]
+    assert ranged_list.has_changes(0, 11)
+    assert not ranged_list.has_changes(21, 50)
+
+    ranged_list.clear_changes(0, 15)
+    assert ranged_list.changed_ranges == [(15, 21), (50, 51), (52, 53)]
+    ranged_list.clear_changes()
+    assert not ranged_list.has_changes()
+
+    # Values read back from the machine are not changes
+    ranged_list.set_values_by_slice(0, 3, [5.0, 6.0, 7.0])
+    assert not ranged_list.has_changes()
+
+
+def test_dict_tracks_changes_of_all_keys():
+    ranged_dict = SpynnakerRangeDictionary(10)
+    ranged_dict["a"] = 1.0
+    ranged_dict["b"] = 2.0
+    ranged_dict.clear_changes()
+    ranged_dict.get_list("b").set_value_by_slice(4, 6, 3.0)
+    assert ranged_dict.has_changes(5, 10)
+    assert not ranged_dict.has_changes(0, 4)
+    ranged_dict.clear_changes(0, 5)
+    assert ranged_dict.has_changes()
+    ranged_dict.set_value("a", 5.0)
+    assert ranged_dict.has_changes(0, 4)
@@ -16,6 +16,12 @@
 import os
 import sys
 import unittest
+import numpy
+from spinn_utilities.overrides import overrides
+from pacman.model.graphs.application import ApplicationEdge, ApplicationVertex
+from pacman.model.graphs.common import Slice
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.resources import ResourceContainer
 from spinn_front_end_common.interface.config_handler import CONFIG_FILE
 from spinn_front_end_common.interface.abstract_spinnaker_base import (
     AbstractSpinnakerBase)
@@ -23,6 +29,9 @@ from spinn_front_end_common.utilities import globals_variables
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utilities.utility_objs import ExecutableFinder
 from spynnaker.pyNN.abstract_spinnaker_common import AbstractSpiNNakerCommon
+from spynnaker.pyNN.models.neural_projections import SynapseInformation
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
 from spynnaker.pyNN.utilities.spynnaker_failed_state import (
     SpynnakerFailedState)
 
@@ -41,6 +50,37 @@ class Close_Once(object):
             self.closed = True
 
 
+class SimpleApplicationVertex(ApplicationVertex):
+
+    def __init__(self, n_atoms):
+        super(SimpleApplicationVertex, self).__init__()
+        self._n_atoms = n_atoms
+
+    @property
+    @overrides(ApplicationVertex.n_atoms)
+    def n_atoms(self):
+        return self._n_atoms
+
+    @overrides(ApplicationVertex.create_machine_vertex)
+    def create_machine_vertex(
+            self, vertex_slice, resources_required, label=None,
+            constraints=None):
+        return SimpleMachineVertex(resources_required, label, constraints)
+
+    @overrides(ApplicationVertex.get_resources_used_by_atoms)
+    def get_resources_used_by_atoms(self, vertex_slice):
+        return ResourceContainer()
+
+
+class _BlockConnector(object):
+
+    def create_synaptic_block(
+            self, pre_slices, pre_slice_index, post_slices, post_slice_index,
+            pre_vertex_slice, post_vertex_slice, synapse_type, synapse_info):
+        # pylint: disable=unused-argument
+        return numpy.zeros(10, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+
+
 class TestSpinnakerMainInterface(unittest.TestCase):
 
     @classmethod
@@ -101,6 +141,53 @@ class TestSpinnakerMainInterface(unittest.TestCase):
                 n_chips_required=None, n_boards_required=None, timestep=0.1,
                 max_delay=145.0, min_delay=1.0, hostname=None)
 
+    def test_edge_index(self):
+        interface = AbstractSpiNNakerCommon(
+            graph_label="Test", database_socket_addresses=[],
+            n_chips_required=None, n_boards_required=None, timestep=1.0,
+            max_delay=144.0, min_delay=1.0, hostname=None)
+        pre_vertex = SimpleApplicationVertex(10)
+        post_vertex = SimpleApplicationVertex(10)
+        interface.add_application_vertex(pre_vertex)
+        interface.add_application_vertex(post_vertex)
+        assert interface.get_application_edge_between(
+            pre_vertex, post_vertex) is None
+
+        edge = ApplicationEdge(pre_vertex, post_vertex)
+        interface.add_application_edge(edge, "SPIKE")
+        assert interface.get_application_edge_between(
+            pre_vertex, post_vertex) is edge
+        assert interface.get_application_edge_between(
+            post_vertex, pre_vertex) is None
+
+        # A second edge between the same vertices doesn't replace the first
+        interface.add_application_edge(
+            ApplicationEdge(pre_vertex, post_vertex), "OTHER")
+        assert interface.get_application_edge_between(
+            pre_vertex, post_vertex) is edge
+
+    def test_synaptic_block_cache_released(self):
+        interface = AbstractSpiNNakerCommon(
+            graph_label="Test", database_socket_addresses=[],
+            n_chips_required=None, n_boards_required=None, timestep=1.0,
+            max_delay=144.0, min_delay=1.0, hostname=None)
+        cache = interface.synaptic_block_cache
+        assert cache.max_bytes == interface.config.getint(
+            "Simulation", "synaptic_block_cache_bytes")
+        info = SynapseInformation(
+            _BlockConnector(), None, None, False, False, None, None, 0)
+        vertex_slice = Slice(0, 9)
+        cache.get_block(
+            info, [vertex_slice], 0, [vertex_slice], 0, vertex_slice,
+            vertex_slice)
+        assert cache.n_blocks == 1
+
+        # Stopping releases the blocks of all the populations
+        interface.stop(turn_off_machine=False, clear_routing_tables=False,
+                       clear_tags=False)
+        assert cache.n_blocks == 0
+        assert cache.n_bytes == 0
+
 
 if __name__ == "__main__":
     unittest.main()
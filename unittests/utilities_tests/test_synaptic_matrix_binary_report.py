@@ -0,0 +1,78 @@
+# Copyright (c) 2017-2019 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spynnaker.pyNN.models.neural_projections import (
+    ProjectionApplicationEdge)
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
+from spynnaker.pyNN.models.neuron import ConnectionHolder
+from spynnaker.pyNN.utilities.spynnaker_synaptic_matrix_binary_report import (
+    SpYNNakerSynapticMatrixBinaryReport, read_synaptic_matrix,
+    read_synaptic_matrix_index)
+
+
+class MockVertex(object):
+
+    def __init__(self, label):
+        self.label = label
+
+
+def _connections(sources, targets, weights, delays):
+    connections = numpy.zeros(
+        len(sources), dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    connections["source"] = sources
+    connections["target"] = targets
+    connections["weight"] = weights
+    connections["delay"] = delays
+    return connections
+
+
+def test_write_and_read(tmpdir):
+    edge = ProjectionApplicationEdge(
+        MockVertex("pre"), MockVertex("post"), "info_1", label="edge")
+    edge.add_synapse_information("info_2")
+    empty_edge = ProjectionApplicationEdge(
+        MockVertex("pre"), MockVertex("other"), "info_3", label="empty")
+
+    # The same holder is used for all the synapse information of an edge
+    holder = ConnectionHolder(None, True, 10, 10)
+    holder.add_connections(_connections([0, 1], [2, 3], [0.5, 1.5], [1, 2]))
+    holder.add_connections(_connections([4], [5], [2.5], [3]))
+    holders = {
+        (edge, "info_1"): holder, (edge, "info_2"): holder,
+        (empty_edge, "info_3"): ConnectionHolder(None, True, 10, 10)}
+
+    folder = str(tmpdir)
+    SpYNNakerSynapticMatrixBinaryReport()(folder, holders, dict())
+
+    index = {item["edge"]: item for item in read_synaptic_matrix_index(
+        folder)}
+    assert index["edge"]["n_connections"] == 3
+    assert index["edge"]["pre_vertex"] == "pre"
+    assert index["edge"]["post_vertex"] == "post"
+    assert index["edge"]["weight_min"] == 0.5
+    assert index["edge"]["weight_max"] == 2.5
+    assert index["edge"]["delay_min"] == 1
+    assert index["edge"]["delay_max"] == 3
+    assert index["empty"]["n_connections"] == 0
+    assert index["empty"]["weight_min"] is None
+
+    connections = read_synaptic_matrix(folder, "edge")
+    assert numpy.array_equal(connections["source"], [0, 1, 4])
+    assert numpy.array_equal(connections["target"], [2, 3, 5])
+    assert numpy.array_equal(connections["weight"], [0.5, 1.5, 2.5])
+    assert numpy.array_equal(connections["delay"], [1, 2, 3])
+    assert len(read_synaptic_matrix(folder, "empty")) == 0